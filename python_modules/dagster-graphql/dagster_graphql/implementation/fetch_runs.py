@@ -52,11 +52,11 @@ def get_run_by_id(graphene_info, run_id):
     from ..schema.pipelines.pipeline import GrapheneRun
 
     instance = graphene_info.context.instance
-    records = instance.get_run_records(RunsFilter(run_ids=[run_id]))
-    if not records:
+    record = instance.get_run_records_by_ids([run_id]).get(run_id)
+    if not record:
         return GrapheneRunNotFoundError(run_id)
     else:
-        return GrapheneRun(records[0])
+        return GrapheneRun(record)
 
 
 def get_run_tags(graphene_info):
@@ -83,10 +83,7 @@ def get_run_group(graphene_info, run_id):
         return GrapheneRunGroupNotFoundError(run_id)
     root_run_id, run_group = result
     run_group_run_ids = [run.run_id for run in run_group]
-    records_by_id = {
-        record.pipeline_run.run_id: record
-        for record in instance.get_run_records(RunsFilter(run_ids=run_group_run_ids))
-    }
+    records_by_id = instance.get_run_records_by_ids(run_group_run_ids)
     return GrapheneRunGroup(
         root_run_id=root_run_id,
         runs=[GrapheneRun(records_by_id.get(run_id)) for run_id in run_group_run_ids],
@@ -153,11 +150,10 @@ def get_assets_live_info(graphene_info, step_keys_by_asset: Mapping[AssetKey, Li
     in_progress_records = []
     run_ids = list(set(latest_run_ids_by_asset.values())) if latest_run_ids_by_asset else []
     if run_ids:
-        run_records = instance.get_run_records(RunsFilter(run_ids=run_ids))
-        for run_record in run_records:
+        run_records_by_run_id = instance.get_run_records_by_ids(run_ids)
+        for run_record in run_records_by_run_id.values():
             if run_record.pipeline_run.status in PENDING_STATUSES:
                 in_progress_records.append(run_record)
-            run_records_by_run_id[run_record.pipeline_run.run_id] = run_record
 
     in_progress_run_ids_by_asset, unstarted_run_ids_by_asset = _get_in_progress_runs_for_assets(
         graphene_info, in_progress_records, step_keys_by_asset
@@ -251,10 +247,7 @@ def get_run_groups(graphene_info, filters=None, cursor=None, limit=None):
     instance = graphene_info.context.instance
     run_groups = instance.get_run_groups(filters=filters, cursor=cursor, limit=limit)
     run_ids = {run.run_id for run_group in run_groups.values() for run in run_group.get("runs", [])}
-    records_by_ids = {
-        record.pipeline_run.run_id: record
-        for record in instance.get_run_records(RunsFilter(run_ids=list(run_ids)))
-    }
+    records_by_ids = instance.get_run_records_by_ids(list(run_ids))
 
     for root_run_id in run_groups:
         run_groups[root_run_id]["runs"] = [
@@ -247,55 +247,94 @@ class BatchRunLoader:
     A batch loader that fetches a set of runs by run_id. This loader is expected to be instantiated
     once with a set of run_ids. For example, for a particular asset, we can fetch a list of asset
     materializations, all of which may have been materialized from a different run.
+
+    All of the runs are fetched in a single batch the first time any of them is requested, and
+    runs that do not exist are not refetched. The fetched runs are memoized by the loader, and so
+    only for the request it was instantiated for, rather than by the run storage.
     """
 
     def __init__(self, instance: DagsterInstance, run_ids: Iterable[str]):
         self._instance = instance
         self._run_ids: Set[str] = set(run_ids)
-        self._records: Dict[str, RunRecord] = {}
+        self._records: Optional[Dict[str, RunRecord]] = None
 
     def get_run_record_by_run_id(self, run_id: str) -> Optional[RunRecord]:
         if run_id not in self._run_ids:
             check.failed(
                 f"Run id {run_id} not recognized for this loader.  Expected one of: {self._run_ids}"
             )
-        if self._records.get(run_id) is None:
+        if self._records is None:
             self._fetch()
-        return self._records.get(run_id)
+        return check.not_none(self._records).get(run_id)
 
     def _fetch(self):
-        records = self._instance.get_run_records(RunsFilter(run_ids=list(self._run_ids)))
-        for record in records:
-            self._records[record.pipeline_run.run_id] = record
+        self._records = self._instance.get_run_records_by_ids(list(self._run_ids))
+
+
+class AssetDataType(Enum):
+    LATEST_MATERIALIZATION = "latest_materialization"
+    LATEST_MATERIALIZATION_BY_PARTITION = "latest_materialization_by_partition"
+    MATERIALIZATION_COUNT_BY_PARTITION = "materialization_count_by_partition"
 
 
 class BatchMaterializationLoader:
     """
-    A batch loader that fetches materializations for asset keys.  This loader is expected to be
-    instantiated with a set of asset keys.
+    A batch loader that fetches materialization data for a set of asset keys.  This loader is
+    expected to be instantiated once with the asset keys of all of the asset nodes in a request,
+    and then passed to each of the graphene asset nodes.
+
+    Each type of data is fetched for all of the asset keys in a single bulk query, the first time
+    it is requested for any of them, so that resolving e.g. the latest materialization of every
+    node in the asset graph does not query the event log once per node.
     """
 
     def __init__(self, instance: DagsterInstance, asset_keys: Iterable[AssetKey]):
         self._instance = instance
-        self._asset_keys: List[AssetKey] = list(asset_keys)
-        self._fetched = False
-        self._materializations: Mapping[AssetKey, Optional[EventLogEntry]] = {}
+        self._asset_keys: List[AssetKey] = list(dict.fromkeys(asset_keys))
+        self._asset_key_set: Set[AssetKey] = set(self._asset_keys)
+        self._data: Dict[AssetDataType, Mapping[AssetKey, Any]] = {}
 
-    def get_latest_materialization_for_asset_key(
-        self, asset_key: AssetKey
-    ) -> Optional[EventLogEntry]:
-        if asset_key not in self._asset_keys:
+    def has_asset_keys(self, asset_keys: Iterable[AssetKey]) -> bool:
+        return self._asset_key_set.issuperset(asset_keys)
+
+    def _get(self, data_type: AssetDataType, asset_key: AssetKey) -> Any:
+        check.inst_param(data_type, "data_type", AssetDataType)
+        check.inst_param(asset_key, "asset_key", AssetKey)
+        if asset_key not in self._asset_key_set:
             check.failed(
                 f"Asset key {asset_key} not recognized for this loader.  Expected one of: {self._asset_keys}"
             )
 
-        if self._materializations.get(asset_key) is None:
-            self._fetch()
-        return self._materializations.get(asset_key)
+        if data_type not in self._data:
+            self._fetch(data_type)
+        return self._data[data_type].get(asset_key)
 
-    def _fetch(self):
-        self._fetched = True
-        self._materializations = self._instance.get_latest_materialization_events(self._asset_keys)
+    def _fetch(self, data_type: AssetDataType):
+        if data_type == AssetDataType.LATEST_MATERIALIZATION:
+            fetched = self._instance.get_latest_materialization_events(self._asset_keys)
+        elif data_type == AssetDataType.LATEST_MATERIALIZATION_BY_PARTITION:
+            fetched = self._instance.get_latest_materialization_events_by_partition(
+                self._asset_keys
+            )
+        elif data_type == AssetDataType.MATERIALIZATION_COUNT_BY_PARTITION:
+            fetched = self._instance.get_materialization_count_by_partition(self._asset_keys)
+        else:
+            check.failed(f"Unknown data type for {self.__class__.__name__}: {data_type}")
+
+        self._data[data_type] = fetched
+
+    def get_latest_materialization_for_asset_key(
+        self, asset_key: AssetKey
+    ) -> Optional[EventLogEntry]:
+        return self._get(AssetDataType.LATEST_MATERIALIZATION, asset_key)
+
+    def get_latest_materializations_by_partition(
+        self, asset_key: AssetKey
+    ) -> Mapping[str, EventLogEntry]:
+        return self._get(AssetDataType.LATEST_MATERIALIZATION_BY_PARTITION, asset_key) or {}
+
+    def get_materialization_count_by_partition(self, asset_key: AssetKey) -> Mapping[str, int]:
+        return self._get(AssetDataType.MATERIALIZATION_COUNT_BY_PARTITION, asset_key) or {}
 
 
 class CrossRepoAssetDependedByLoader:
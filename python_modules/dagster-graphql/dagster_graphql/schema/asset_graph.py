@@ -171,6 +171,20 @@ def external_repository(self) -> ExternalRepository:
     def external_asset_node(self) -> ExternalAssetNode:
         return self._external_asset_node
 
+    def _get_materialization_loader(
+        self, graphene_info, asset_keys: Sequence[AssetKey]
+    ) -> BatchMaterializationLoader:
+        # Share the loader of this node when it covers the given assets, e.g. the upstream assets
+        # of a node in a requested asset graph, so that they are not fetched once per node
+        if (
+            self._latest_materialization_loader
+            and self._latest_materialization_loader.has_asset_keys(asset_keys)
+        ):
+            return self._latest_materialization_loader
+        return BatchMaterializationLoader(
+            instance=graphene_info.context.instance, asset_keys=asset_keys
+        )
+
     def get_op_definition(
         self,
     ) -> Optional[Union[GrapheneSolidDefinition, GrapheneCompositeSolidDefinition]]:
@@ -271,9 +285,8 @@ def resolve_dependedBy(self, graphene_info) -> List[GrapheneAssetDependency]:
         if not depended_by_asset_nodes:
             return []
 
-        materialization_loader = BatchMaterializationLoader(
-            instance=graphene_info.context.instance,
-            asset_keys=[dep.downstream_asset_key for dep in depended_by_asset_nodes],
+        materialization_loader = self._get_materialization_loader(
+            graphene_info, [dep.downstream_asset_key for dep in depended_by_asset_nodes]
         )
 
         return [
@@ -318,9 +331,9 @@ def resolve_dependencies(self, graphene_info) -> Sequence[GrapheneAssetDependenc
         if not self._external_asset_node.dependencies:
             return []
 
-        materialization_loader = BatchMaterializationLoader(
-            instance=graphene_info.context.instance,
-            asset_keys=[dep.upstream_asset_key for dep in self._external_asset_node.dependencies],
+        materialization_loader = self._get_materialization_loader(
+            graphene_info,
+            [dep.upstream_asset_key for dep in self._external_asset_node.dependencies],
         )
         return [
             GrapheneAssetDependency(
@@ -347,37 +360,32 @@ def resolve_jobs(self, _graphene_info) -> Sequence[GraphenePipeline]:
     def resolve_latestMaterializationByPartition(
         self, graphene_info, **kwargs
     ) -> Sequence[Optional[GrapheneMaterializationEvent]]:
-        from ..implementation.fetch_assets import get_asset_materializations
-
-        get_partition = (
-            lambda event: event.dagster_event.step_materialization_data.materialization.partition
-        )
-
-        partitions = kwargs.get("partitions") or self.get_partition_keys()
-
-        events_for_partitions = get_asset_materializations(
-            graphene_info,
-            self._external_asset_node.asset_key,
-            partitions,
-        )
-
-        latest_materialization_by_partition = {}
-        for event in events_for_partitions:  # events are sorted in order of newest to oldest
-            event_partition = get_partition(event)
-            if event_partition not in latest_materialization_by_partition:
-                latest_materialization_by_partition[event_partition] = event
-            if len(latest_materialization_by_partition) == len(partitions):
-                break
+        asset_key = self._external_asset_node.asset_key
+        requested_partitions = kwargs.get("partitions")
+        partitions = requested_partitions or self.get_partition_keys()
+
+        # the batch loader fetches every partition of every asset in the request, so it is only
+        # used when all of the partitions of the asset are requested
+        if self._latest_materialization_loader and not requested_partitions:
+            latest_materialization_by_partition = (
+                self._latest_materialization_loader.get_latest_materializations_by_partition(
+                    asset_key
+                )
+            )
+        else:
+            latest_materialization_by_partition = (
+                graphene_info.context.instance.get_latest_materialization_events_by_partition(
+                    [asset_key], partitions=list(partitions)
+                )[asset_key]
+            )
 
         # return materializations in the same order as the provided partitions, None if
         # materialization does not exist
-        ordered_materializations = [
-            latest_materialization_by_partition.get(partition) for partition in partitions
-        ]
-
         return [
-            GrapheneMaterializationEvent(event=event) if event else None
-            for event in ordered_materializations
+            GrapheneMaterializationEvent(event=latest_materialization_by_partition[partition])
+            if partition in latest_materialization_by_partition
+            else None
+            for partition in partitions
         ]
 
     def resolve_materializationCountByPartition(
@@ -386,9 +394,18 @@ def resolve_materializationCountByPartition(
         asset_key = self._external_asset_node.asset_key
         partition_keys = self.get_partition_keys()
 
-        count_by_partition = graphene_info.context.instance.get_materialization_count_by_partition(
-            [self._external_asset_node.asset_key]
-        )[asset_key]
+        if self._latest_materialization_loader:
+            count_by_partition = (
+                self._latest_materialization_loader.get_materialization_count_by_partition(
+                    asset_key
+                )
+            )
+        else:
+            count_by_partition = (
+                graphene_info.context.instance.get_materialization_count_by_partition([asset_key])[
+                    asset_key
+                ]
+            )
 
         return [
             GrapheneMaterializationCount(partition_key, count_by_partition.get(partition_key, 0))
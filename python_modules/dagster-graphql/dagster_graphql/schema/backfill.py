@@ -2,7 +2,7 @@
 
 import dagster._check as check
 from dagster.core.execution.backfill import BulkActionStatus, PartitionBackfill
-from dagster.core.storage.pipeline_run import PipelineRunStatus, RunsFilter
+from dagster.core.storage.pipeline_run import PipelineRunStatus, RunsFilter, RunSummaryRecord
 from dagster.core.storage.tags import PARTITION_NAME_TAG
 
 from .errors import (
@@ -138,6 +138,7 @@ def __init__(self, backfill_job):
         self._backfill_job = check.opt_inst_param(backfill_job, "backfill_job", PartitionBackfill)
 
         self._records = None
+        self._summary_records = None
 
         super().__init__(
             backfillId=backfill_job.backfill_id,
@@ -157,6 +158,21 @@ def _get_records(self, graphene_info):
             )
         return self._records
 
+    def _get_summary_records(self, graphene_info):
+        # the status of the backfill only depends on the status and tags of its runs, which can be
+        # fetched without deserializing the runs
+        if self._summary_records is None:
+            if self._records is not None:
+                self._summary_records = [
+                    RunSummaryRecord.from_run_record(record) for record in self._records
+                ]
+            else:
+                filters = RunsFilter.for_backfill(self._backfill_job.backfill_id)
+                self._summary_records = graphene_info.context.instance.get_run_summary_records(
+                    filters=filters,
+                )
+        return self._summary_records
+
     def resolve_unfinishedRuns(self, graphene_info):
         from .pipelines.pipeline import GrapheneRun
 
@@ -171,18 +187,14 @@ def resolve_backfillStatus(self, graphene_info):
         if self._backfill_job.status == BulkActionStatus.FAILED:
             return GrapheneBackfillStatus.FAILED
         if self._backfill_job.status == BulkActionStatus.COMPLETED:
-            records = self._get_records(graphene_info)
+            records = self._get_summary_records(graphene_info)
 
-            is_done = all(record.pipeline_run.is_finished for record in records)
+            is_done = all(record.is_finished for record in records)
             if not is_done:
                 return GrapheneBackfillStatus.IN_PROGRESS
             else:
                 num_success = len(
-                    [
-                        record
-                        for record in records
-                        if record.pipeline_run.status == PipelineRunStatus.SUCCESS
-                    ]
+                    [record for record in records if record.status == PipelineRunStatus.SUCCESS]
                 )
                 if num_success == len(self._backfill_job.partition_names):
                     return GrapheneBackfillStatus.COMPLETED
@@ -190,12 +202,12 @@ def resolve_backfillStatus(self, graphene_info):
                     return GrapheneBackfillStatus.INCOMPLETE
 
     def resolve_partitionRunStats(self, graphene_info):
-        records = self._get_records(graphene_info)
+        records = self._get_summary_records(graphene_info)
 
         by_partition_records = {}
 
         for record in records:
-            partition = record.pipeline_run.tags.get(PARTITION_NAME_TAG)
+            partition = record.tags.get(PARTITION_NAME_TAG)
             if partition and partition not in by_partition_records:  # get latest for each partition
                 by_partition_records[partition] = record
 
@@ -205,10 +217,10 @@ def resolve_partitionRunStats(self, graphene_info):
         num_failed = 0
 
         for _partition, record in by_partition_records.items():
-            status = record.pipeline_run.status
+            status = record.status
             if status == PipelineRunStatus.QUEUED:
                 num_queued = num_queued + 1
-            elif not record.pipeline_run.is_finished:
+            elif not record.is_finished:
                 num_in_progress = num_in_progress + 1
             elif status == PipelineRunStatus.SUCCESS:
                 num_succeeded = num_succeeded + 1
@@ -239,16 +251,16 @@ def resolve_numRequested(self, graphene_info):
         if self._backfill_job.status == BulkActionStatus.COMPLETED:
             return len(self._backfill_job.partition_names)
 
-        records = self._get_records(graphene_info)
-
-        run_count = len(records)
-        checkpoint = self._backfill_job.last_submitted_partition_name
-        return max(
-            run_count,
-            self._backfill_job.partition_names.index(checkpoint) + 1
-            if checkpoint and checkpoint in self._backfill_job.partition_names
-            else 0,
-        )
+        # partitions up to the checkpoint have been submitted, along with the runs that have been
+        # submitted since the backfill was last checkpointed
+        if self._summary_records is not None:
+            run_count = len(self._summary_records)
+        else:
+            run_count = graphene_info.context.instance.get_runs_count(
+                RunsFilter.for_backfill(self._backfill_job.backfill_id)
+            )
+        checkpoint_index = self._backfill_job.partition_checkpoint_index
+        return max(run_count, checkpoint_index + 1 if checkpoint_index is not None else 0)
 
     def resolve_partitionSet(self, graphene_info):
         from ..schema.partition_sets import GraphenePartitionSet
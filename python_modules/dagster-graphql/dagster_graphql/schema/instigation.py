@@ -134,10 +134,7 @@ def resolve_runs(self, graphene_info):
         if not run_ids:
             return []
 
-        records_by_id = {
-            record.pipeline_run.run_id: record
-            for record in instance.get_run_records(RunsFilter(run_ids=run_ids))
-        }
+        records_by_id = instance.get_run_records_by_ids(run_ids)
 
         return [GrapheneRun(records_by_id[run_id]) for run_id in run_ids if run_id in records_by_id]
 
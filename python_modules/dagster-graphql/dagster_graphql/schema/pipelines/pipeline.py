@@ -405,7 +405,7 @@ def resolve_eventConnection(self, graphene_info, afterCursor=None):
 
     def _get_run_record(self, instance):
         if not self._run_record:
-            self._run_record = instance.get_run_records(RunsFilter(run_ids=[self.run_id]))[0]
+            self._run_record = instance.get_run_records_by_ids([self.run_id])[self.run_id]
         return self._run_record
 
     def resolve_startTime(self, graphene_info):
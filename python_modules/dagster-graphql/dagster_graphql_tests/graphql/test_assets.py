@@ -1,5 +1,6 @@
 import os
 import time
+from unittest import mock
 
 from dagster_graphql.client.query import (
     LAUNCH_PIPELINE_EXECUTION_MUTATION,
@@ -203,6 +204,34 @@
     }
 """
 
+GET_ASSET_GRAPH_MATERIALIZATIONS = """
+    query AssetGraphMaterializationsQuery {
+        assetNodes {
+            id
+            assetMaterializations(limit: 1) {
+                timestamp
+            }
+            latestMaterializationByPartition {
+                partition
+            }
+            materializationCountByPartition {
+                ... on MaterializationCountByPartition {
+                    partition
+                    materializationCount
+                }
+            }
+            dependencies {
+                asset {
+                    id
+                    assetMaterializations(limit: 1) {
+                        timestamp
+                    }
+                }
+            }
+        }
+    }
+"""
+
 GET_ASSET_MATERIALIZATION_AFTER_TIMESTAMP = """
     query AssetQuery($assetKey: AssetKeyInput!, $afterTimestamp: String) {
         assetOrError(assetKey: $assetKey) {
@@ -633,6 +662,33 @@ def test_latest_materialization_per_partition(self, graphql_context):
 
         assert asset_node["latestMaterializationByPartition"][1] == None
 
+    def test_latest_materialization_per_partition_filtered(self, graphql_context):
+        _create_run(graphql_context, "partition_materialization_job")
+        instance = graphql_context.instance
+
+        selector = infer_pipeline_selector(graphql_context, "partition_materialization_job")
+        with mock.patch.object(
+            instance,
+            "get_latest_materialization_events_by_partition",
+            wraps=instance.get_latest_materialization_events_by_partition,
+        ) as latest_materializations_by_partition:
+            result = execute_dagster_graphql(
+                graphql_context,
+                GET_LATEST_MATERIALIZATION_PER_PARTITION,
+                variables={"pipelineSelector": selector, "partitions": ["c", "a"]},
+            )
+
+        assert result.data and result.data["assetNodes"]
+        asset_node = result.data["assetNodes"][0]
+        assert [
+            materialization["partition"] if materialization else None
+            for materialization in asset_node["latestMaterializationByPartition"]
+        ] == ["c", None]
+
+        # only the requested partitions are fetched
+        assert latest_materializations_by_partition.call_count == 1
+        assert latest_materializations_by_partition.call_args[1]["partitions"] == ["c", "a"]
+
     def test_materialization_count_by_partition(self, graphql_context):
         # test for unpartitioned asset
         selector = infer_pipeline_selector(graphql_context, "two_assets_job")
@@ -707,6 +763,54 @@ def test_materialization_count_by_partition(self, graphql_context):
         assert materialization_count[2]["partition"] == "c"
         assert materialization_count[2]["materializationCount"] == 2
 
+    def test_asset_graph_materializations_batched(self, graphql_context):
+        _create_run(graphql_context, "partition_materialization_job")
+        instance = graphql_context.instance
+
+        with mock.patch.object(
+            instance,
+            "get_latest_materialization_events",
+            wraps=instance.get_latest_materialization_events,
+        ) as latest_materializations, mock.patch.object(
+            instance,
+            "get_latest_materialization_events_by_partition",
+            wraps=instance.get_latest_materialization_events_by_partition,
+        ) as latest_materializations_by_partition, mock.patch.object(
+            instance,
+            "get_materialization_count_by_partition",
+            wraps=instance.get_materialization_count_by_partition,
+        ) as materialization_counts:
+            result = execute_dagster_graphql(graphql_context, GET_ASSET_GRAPH_MATERIALIZATIONS)
+
+        assert result.data
+        asset_nodes = result.data["assetNodes"]
+        assert len(asset_nodes) > 1
+        assert any(asset_node["dependencies"] for asset_node in asset_nodes)
+
+        # each is fetched for all of the asset nodes at once, including their dependencies
+        assert latest_materializations.call_count == 1
+        assert latest_materializations_by_partition.call_count == 1
+        assert materialization_counts.call_count == 1
+
+        partitioned_node = next(
+            asset_node
+            for asset_node in asset_nodes
+            if any(
+                count["materializationCount"]
+                for count in asset_node["materializationCountByPartition"]
+            )
+        )
+        materialized_partitions = {
+            count["partition"]
+            for count in partitioned_node["materializationCountByPartition"]
+            if count["materializationCount"]
+        }
+        assert {
+            materialization["partition"]
+            for materialization in partitioned_node["latestMaterializationByPartition"]
+            if materialization
+        } == materialized_partitions
+
     def test_asset_observations(self, graphql_context):
         _create_run(graphql_context, "observation_job")
         result = execute_dagster_graphql(
@@ -1,48 +1,232 @@
-from typing import TYPE_CHECKING, Mapping
+import threading
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any, Dict, List, Mapping, Sequence
 
 import dagster._check as check
 from dagster.core.errors import DagsterUserCodeProcessError
 from dagster.core.host_representation.external_data import (
+    ExternalPipelineData,
     ExternalRepositoryData,
     ExternalRepositoryErrorData,
 )
-from dagster.serdes import deserialize_as
+from dagster.core.host_representation.origin import ExternalRepositoryOrigin
+from dagster.grpc.types import ExternalRepositorySnapshotArgs, ExternalRepositorySnapshotManifest
+from dagster.serdes import deserialize_as, deserialize_json_to_dagster_namedtuple
 
 if TYPE_CHECKING:
     from dagster.core.host_representation import RepositoryLocation
     from dagster.grpc.client import DagsterGrpcClient
 
+MAX_CACHED_REPOSITORY_SNAPSHOTS = 64
+
+
+class ExternalRepositorySnapshotPieceCache:
+    """The pieces of the latest snapshot of a repository, kept across reloads of its repository
+    location so that only the pieces that changed are transferred from the server.
+
+    Pieces are deserialized once, when they are fetched, and reused by later snapshots that still
+    contain them.
+    """
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._pieces: Dict[str, Any] = {}
+
+    @property
+    def lock(self) -> threading.RLock:
+        return self._lock
+
+    def piece_ids(self) -> List[str]:
+        with self._lock:
+            return list(self._pieces)
+
+    def update(self, manifest: ExternalRepositorySnapshotManifest):
+        check.inst_param(manifest, "manifest", ExternalRepositorySnapshotManifest)
+
+        with self._lock:
+            piece_ids = set(manifest.piece_ids)
+
+            # Only keep the pieces of the latest snapshot
+            pieces = {
+                piece_id: piece for piece_id, piece in self._pieces.items() if piece_id in piece_ids
+            }
+            for piece_id, serialized_piece in manifest.serialized_pieces.items():
+                if piece_id not in pieces:
+                    pieces[piece_id] = deserialize_json_to_dagster_namedtuple(serialized_piece)
+
+            missing_piece_ids = piece_ids.difference(pieces)
+            check.invariant(
+                not missing_piece_ids,
+                f"Snapshot of repository {manifest.name} is missing pieces: {missing_piece_ids}",
+            )
+            self._pieces = pieces
+
+    def get_piece(self, piece_id: str) -> Any:
+        check.str_param(piece_id, "piece_id")
+
+        with self._lock:
+            return self._pieces[piece_id]
+
+    def get_external_repository_data(
+        self, manifest: ExternalRepositorySnapshotManifest
+    ) -> ExternalRepositoryData:
+        check.inst_param(manifest, "manifest", ExternalRepositorySnapshotManifest)
+
+        with self._lock:
+            return ExternalRepositoryData(
+                name=manifest.name,
+                external_pipeline_datas=[
+                    self.get_piece(piece_id) for piece_id in manifest.pipeline_piece_ids
+                ],
+                external_schedule_datas=[
+                    self.get_piece(piece_id) for piece_id in manifest.schedule_piece_ids
+                ],
+                external_partition_set_datas=[
+                    self.get_piece(piece_id) for piece_id in manifest.partition_set_piece_ids
+                ],
+                external_sensor_datas=[
+                    self.get_piece(piece_id) for piece_id in manifest.sensor_piece_ids
+                ],
+                external_asset_graph_data=[
+                    self.get_piece(piece_id) for piece_id in manifest.asset_node_piece_ids
+                ],
+                external_pipeline_refs=manifest.pipeline_refs,
+            )
+
+
+_PIECE_CACHES_LOCK = threading.Lock()
+_PIECE_CACHES: Dict[str, ExternalRepositorySnapshotPieceCache] = OrderedDict()
+
+
+def get_external_repository_snapshot_piece_cache(
+    external_repository_origin: ExternalRepositoryOrigin,
+) -> ExternalRepositorySnapshotPieceCache:
+    check.inst_param(
+        external_repository_origin, "external_repository_origin", ExternalRepositoryOrigin
+    )
+
+    origin_id = external_repository_origin.get_id()
+    with _PIECE_CACHES_LOCK:
+        if origin_id not in _PIECE_CACHES:
+            _PIECE_CACHES[origin_id] = ExternalRepositorySnapshotPieceCache()
+        _PIECE_CACHES.move_to_end(origin_id)  # type: ignore
+        while len(_PIECE_CACHES) > MAX_CACHED_REPOSITORY_SNAPSHOTS:
+            _PIECE_CACHES.popitem(last=False)  # type: ignore
+        return _PIECE_CACHES[origin_id]
+
+
+def clear_external_repository_snapshot_piece_caches():
+    with _PIECE_CACHES_LOCK:
+        _PIECE_CACHES.clear()
+
+
+def _deserialize_external_repository_chunks(external_repository_chunks, as_type):
+    result = deserialize_as(
+        "".join(
+            [chunk["serialized_external_repository_chunk"] for chunk in external_repository_chunks]
+        ),
+        (as_type, ExternalRepositoryErrorData),
+    )
+
+    if isinstance(result, ExternalRepositoryErrorData):
+        raise DagsterUserCodeProcessError.from_error_info(result.error)
+
+    return result
+
+
+def _get_external_repository_data_from_snapshot_pieces(
+    api_client: "DagsterGrpcClient",
+    external_repository_origin: ExternalRepositoryOrigin,
+    lazy_load_pipelines: bool,
+) -> ExternalRepositoryData:
+    piece_cache = get_external_repository_snapshot_piece_cache(external_repository_origin)
+
+    # Hold the lock for the whole exchange, so that the pieces the server leaves out are not
+    # dropped by a concurrent update of the cache before they are used
+    with piece_cache.lock:
+        manifest = _deserialize_external_repository_chunks(
+            api_client.streaming_external_repository_snapshot_pieces(
+                ExternalRepositorySnapshotArgs(
+                    repository_origin=external_repository_origin,
+                    known_piece_ids=piece_cache.piece_ids(),
+                    lazy_load_pipelines=lazy_load_pipelines,
+                )
+            ),
+            ExternalRepositorySnapshotManifest,
+        )
+        piece_cache.update(manifest)
+        return piece_cache.get_external_repository_data(manifest)
+
+
+def sync_get_external_pipeline_datas_grpc(
+    api_client: "DagsterGrpcClient", external_repository_origin: ExternalRepositoryOrigin
+) -> Sequence[ExternalPipelineData]:
+    """Fetches the data of every pipeline in a repository in a single request, for when the
+    pipelines of a lazily loaded repository are all needed at once.
+    """
+    check.inst_param(
+        external_repository_origin, "external_repository_origin", ExternalRepositoryOrigin
+    )
+
+    piece_cache = get_external_repository_snapshot_piece_cache(external_repository_origin)
+
+    # The pipeline pieces are handed to the caller without being added to the piece cache, which
+    # only keeps the pieces of the lazily loaded snapshot, so that they are not held twice
+    with piece_cache.lock:
+        manifest = _deserialize_external_repository_chunks(
+            api_client.streaming_external_repository_snapshot_pieces(
+                ExternalRepositorySnapshotArgs(
+                    repository_origin=external_repository_origin,
+                    known_piece_ids=piece_cache.piece_ids(),
+                    lazy_load_pipelines=False,
+                )
+            ),
+            ExternalRepositorySnapshotManifest,
+        )
+        return [
+            deserialize_json_to_dagster_namedtuple(manifest.serialized_pieces[piece_id])
+            if piece_id in manifest.serialized_pieces
+            else piece_cache.get_piece(piece_id)
+            for piece_id in manifest.pipeline_piece_ids
+        ]
+
 
 def sync_get_streaming_external_repositories_data_grpc(
-    api_client: "DagsterGrpcClient", repository_location: "RepositoryLocation"
+    api_client: "DagsterGrpcClient",
+    repository_location: "RepositoryLocation",
+    use_snapshot_pieces: bool = False,
+    lazy_load_pipelines: bool = False,
 ) -> Mapping[str, ExternalRepositoryData]:
-    from dagster.core.host_representation import ExternalRepositoryOrigin, RepositoryLocation
+    """If lazy_load_pipelines is set, the returned repository data holds refs to its pipelines in
+    place of their data. Requires a server that supports snapshot pieces.
+    """
+    from dagster.core.host_representation import RepositoryLocation
 
     check.inst_param(repository_location, "repository_location", RepositoryLocation)
+    check.bool_param(use_snapshot_pieces, "use_snapshot_pieces")
+    check.bool_param(lazy_load_pipelines, "lazy_load_pipelines")
+    check.invariant(
+        use_snapshot_pieces or not lazy_load_pipelines,
+        "Pipelines can only be lazily loaded from snapshot pieces",
+    )
 
     repo_datas = {}
     for repository_name in repository_location.repository_names:  # type: ignore
-        external_repository_chunks = list(
-            api_client.streaming_external_repository(
-                external_repository_origin=ExternalRepositoryOrigin(
-                    repository_location.origin,
-                    repository_name,
-                )
-            )
-        )
-
-        result = deserialize_as(
-            "".join(
-                [
-                    chunk["serialized_external_repository_chunk"]
-                    for chunk in external_repository_chunks
-                ]
-            ),
-            (ExternalRepositoryData, ExternalRepositoryErrorData),
+        external_repository_origin = ExternalRepositoryOrigin(
+            repository_location.origin,
+            repository_name,
         )
 
-        if isinstance(result, ExternalRepositoryErrorData):
-            raise DagsterUserCodeProcessError.from_error_info(result.error)
+        if use_snapshot_pieces:
+            repo_datas[repository_name] = _get_external_repository_data_from_snapshot_pieces(
+                api_client, external_repository_origin, lazy_load_pipelines
+            )
+        else:
+            repo_datas[repository_name] = _deserialize_external_repository_chunks(
+                api_client.streaming_external_repository(
+                    external_repository_origin=external_repository_origin
+                ),
+                ExternalRepositoryData,
+            )
 
-        repo_datas[repository_name] = result
     return repo_datas
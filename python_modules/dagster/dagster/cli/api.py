@@ -383,6 +383,9 @@ def _execute_step_command_body(
             step_keys_to_execute=args.step_keys_to_execute,
             mode=pipeline_run.mode,
             known_state=args.known_state,
+            # every step of the run builds its plan from the same pipeline and run config
+            pipeline_snapshot_id=pipeline_run.pipeline_snapshot_id,
+            plan_cache_dir=instance.execution_plan_cache_dir,
         )
 
         yield from execute_plan_iterator(
@@ -0,0 +1,180 @@
+import threading
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Dict, Hashable, Optional
+
+import dagster._check as check
+
+from .config_type import ConfigType, ConfigTypeKind
+from .snap import ConfigSchemaSnapshot, snap_from_config_type
+
+if TYPE_CHECKING:
+    from .evaluate_value_result import EvaluateValueResult
+
+MAX_COMPILED_SCHEMAS = 128
+MAX_CACHED_RESULTS_PER_SCHEMA = 16
+
+_HASHABLE_SCALAR_TYPES = (str, int, float, bool, type(None))
+
+
+class _UnhashableConfigValue(Exception):
+    pass
+
+
+def _iterate_unique_config_types(
+    config_type: ConfigType, config_types_by_key: Dict[str, ConfigType]
+):
+    # Subtrees are skipped once their key has been seen. Type keys are derived from the keys of
+    # their children, so a repeated key means a repeated subtree -- e.g. the config of many ops
+    # that share a config schema.
+    if config_type.key in config_types_by_key:
+        return
+
+    if config_type.kind == ConfigTypeKind.MAP:
+        _iterate_unique_config_types(config_type.key_type, config_types_by_key)  # type: ignore
+        _iterate_unique_config_types(config_type.inner_type, config_types_by_key)  # type: ignore
+    elif config_type.kind in (ConfigTypeKind.ARRAY, ConfigTypeKind.NONEABLE):
+        _iterate_unique_config_types(config_type.inner_type, config_types_by_key)  # type: ignore
+    elif ConfigTypeKind.has_fields(config_type.kind):
+        for field in config_type.fields.values():  # type: ignore
+            _iterate_unique_config_types(field.config_type, config_types_by_key)
+    elif config_type.kind == ConfigTypeKind.SCALAR_UNION:
+        _iterate_unique_config_types(config_type.scalar_type, config_types_by_key)  # type: ignore
+        _iterate_unique_config_types(config_type.non_scalar_type, config_types_by_key)  # type: ignore
+
+    config_types_by_key[config_type.key] = config_type
+
+
+def _config_value_cache_key(config_value: object) -> Hashable:
+    # The types of values are part of the key, so that e.g. a tuple never shares a result with an
+    # equal list, since only the list is valid array config.
+    value_type = type(config_value)
+    if value_type in _HASHABLE_SCALAR_TYPES:
+        return (value_type, config_value)
+    if isinstance(config_value, dict):
+        return (
+            dict,
+            tuple(
+                (_config_value_cache_key(key), _config_value_cache_key(value))
+                for key, value in config_value.items()
+            ),
+        )
+    if isinstance(config_value, list):
+        return (list, tuple(_config_value_cache_key(value) for value in config_value))
+
+    # e.g. python objects passed as input values
+    raise _UnhashableConfigValue()
+
+
+def _copy_config_value(config_value: object) -> object:
+    # Only values that have a cache key are cached, so dicts, lists and immutable scalars are all
+    # there is to copy.
+    if isinstance(config_value, dict):
+        return {key: _copy_config_value(value) for key, value in config_value.items()}
+    if isinstance(config_value, list):
+        return [_copy_config_value(value) for value in config_value]
+    return config_value
+
+
+class CompiledConfigSchema:
+    """The parts of validating and processing config against a config type that only depend on
+    the config type -- its schema snapshot and all of the config types it contains -- computed
+    once per config type instead of on every call.
+
+    Also keeps a small LRU of validation results keyed on the config value, so that repeated
+    validation of the same config, e.g. on every tick of a schedule, is skipped. Validation does
+    not depend on anything but the schema and the value, unlike post processing, which may e.g.
+    read environment variables, and is never cached. Cached values are copied in and out, so that
+    changes that callers make to their config or to a validated value never reach other callers.
+    """
+
+    def __init__(self, config_type: ConfigType):
+        self._config_type = check.inst_param(config_type, "config_type", ConfigType)
+
+        config_types_by_key: Dict[str, ConfigType] = OrderedDict()
+        _iterate_unique_config_types(config_type, config_types_by_key)
+        self._config_types_by_key = config_types_by_key
+        self._snapshot = ConfigSchemaSnapshot(
+            {key: snap_from_config_type(ct) for key, ct in config_types_by_key.items()}
+        )
+
+        self._results_lock = threading.Lock()
+        self._results: Dict[Hashable, "EvaluateValueResult"] = OrderedDict()
+
+    @property
+    def config_type(self) -> ConfigType:
+        return self._config_type
+
+    @property
+    def snapshot(self) -> ConfigSchemaSnapshot:
+        return self._snapshot
+
+    @property
+    def config_types_by_key(self) -> Dict[str, ConfigType]:
+        return self._config_types_by_key
+
+    def get_validation_result_key(self, config_value: object) -> Optional[Hashable]:
+        """Returns None if the config value can not be used as a cache key."""
+        try:
+            return _config_value_cache_key(config_value)
+        except (_UnhashableConfigValue, RecursionError):
+            return None
+
+    def get_validation_result(self, key: Hashable) -> Optional["EvaluateValueResult"]:
+        from .evaluate_value_result import EvaluateValueResult
+
+        with self._results_lock:
+            result = self._results.get(key)
+            if result is None:
+                return None
+            self._results.move_to_end(key)  # type: ignore
+
+        if not result.success:
+            return result
+        return EvaluateValueResult.for_value(_copy_config_value(result.value))
+
+    def set_validation_result(self, key: Hashable, result: "EvaluateValueResult"):
+        from .evaluate_value_result import EvaluateValueResult
+
+        if result.success:
+            result = EvaluateValueResult.for_value(_copy_config_value(result.value))
+
+        with self._results_lock:
+            self._results[key] = result
+            self._results.move_to_end(key)  # type: ignore
+            while len(self._results) > MAX_CACHED_RESULTS_PER_SCHEMA:
+                self._results.popitem(last=False)  # type: ignore
+
+
+_COMPILED_SCHEMAS_LOCK = threading.Lock()
+_COMPILED_SCHEMAS: Dict[str, CompiledConfigSchema] = OrderedDict()
+
+
+def get_compiled_config_schema(config_type: ConfigType) -> CompiledConfigSchema:
+    """Returns the compiled schema for the config type, compiling it on first use.
+
+    Compiled schemas are cached by config type key. An entry is only used for the exact config type
+    it was compiled from, since types that are defined separately -- e.g. two enums with the same
+    name -- may share a key.
+    """
+    check.inst_param(config_type, "config_type", ConfigType)
+
+    with _COMPILED_SCHEMAS_LOCK:
+        compiled = _COMPILED_SCHEMAS.get(config_type.key)
+        if compiled is not None and compiled.config_type is config_type:
+            _COMPILED_SCHEMAS.move_to_end(config_type.key)  # type: ignore
+            return compiled
+
+    compiled = CompiledConfigSchema(config_type)
+
+    with _COMPILED_SCHEMAS_LOCK:
+        _COMPILED_SCHEMAS[config_type.key] = compiled
+        _COMPILED_SCHEMAS.move_to_end(config_type.key)  # type: ignore
+        while len(_COMPILED_SCHEMAS) > MAX_COMPILED_SCHEMAS:
+            _COMPILED_SCHEMAS.popitem(last=False)  # type: ignore
+
+    return compiled
+
+
+def clear_compiled_config_schemas():
+    with _COMPILED_SCHEMAS_LOCK:
+        _COMPILED_SCHEMAS.clear()
@@ -34,7 +34,7 @@ def iterate_config_types(config_type: ConfigType) -> Generator[ConfigType, None,
 def config_schema_snapshot_from_config_type(
     config_type: ConfigType,
 ) -> ConfigSchemaSnapshot:
+    from .compiled_schema import get_compiled_config_schema
+
     check.inst_param(config_type, "config_type", ConfigType)
-    return ConfigSchemaSnapshot(
-        {ct.key: snap_from_config_type(ct) for ct in iterate_config_types(config_type)}
-    )
+    return get_compiled_config_schema(config_type).snapshot
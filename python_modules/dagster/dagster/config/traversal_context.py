@@ -5,8 +5,8 @@
 
 from .config_type import ConfigType
 from .field import Field
-from .iterate_types import config_schema_snapshot_from_config_type, iterate_config_types
-from .snap import ConfigFieldSnap, ConfigSchemaSnapshot, ConfigTypeSnap, snap_from_config_type
+from .compiled_schema import get_compiled_config_schema
+from .snap import ConfigFieldSnap, ConfigSchemaSnapshot, ConfigTypeSnap
 from .stack import EvaluationStack
 
 
@@ -127,23 +127,22 @@ def __init__(
         )
         self._config_type = check.inst_param(config_type, "config_type", ConfigType)
         self._traversal_type = check.inst_param(traversal_type, "traversal_type", TraversalType)
-        self._all_config_types = check.dict_param(
-            all_config_types, "all_config_types", key_type=str, value_type=ConfigType
-        )
+        # the types are not checked, since all of the child contexts of a traversal share the
+        # same, possibly very large, dict of all config types
+        self._all_config_types = check.dict_param(all_config_types, "all_config_types")
 
     @staticmethod
     def from_config_type(
         config_type: ConfigType, stack: EvaluationStack, traversal_type: TraversalType
     ) -> "TraversalContext":
-        all_config_types = list(iterate_config_types(config_type))
-        config_schema_snapshot = config_schema_snapshot_from_config_type(config_type)
+        compiled_schema = get_compiled_config_schema(config_type)
         return TraversalContext(
-            config_schema_snapshot=config_schema_snapshot,
-            config_type_snap=snap_from_config_type(config_type),
+            config_schema_snapshot=compiled_schema.snapshot,
+            config_type_snap=compiled_schema.snapshot.get_config_snap(config_type.key),
             config_type=config_type,
             stack=stack,
             traversal_type=traversal_type,
-            all_config_types={ct.key: ct for ct in all_config_types},
+            all_config_types=compiled_schema.config_types_by_key,
         )
 
     @property
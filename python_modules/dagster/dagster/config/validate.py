@@ -3,6 +3,7 @@
 import dagster._check as check
 from dagster.utils import ensure_single_item, frozendict
 
+from .compiled_schema import get_compiled_config_schema
 from .config_type import ConfigScalarKind, ConfigType, ConfigTypeKind
 from .errors import (
     EvaluationError,
@@ -25,7 +26,6 @@
 )
 from .evaluate_value_result import EvaluateValueResult
 from .field import resolve_to_config_type
-from .iterate_types import config_schema_snapshot_from_config_type
 from .post_process import post_process_config
 from .snap import ConfigFieldSnap, ConfigSchemaSnapshot, ConfigTypeSnap
 from .stack import EvaluationStack
@@ -59,14 +59,23 @@ def validate_config(config_schema: object, config_value: object) -> EvaluateValu
     config_type = resolve_to_config_type(config_schema)
     config_type = check.inst(cast(ConfigType, config_type), ConfigType)
 
-    config_schema_snapshot = config_schema_snapshot_from_config_type(config_type)
+    compiled_schema = get_compiled_config_schema(config_type)
+    result_key = compiled_schema.get_validation_result_key(config_value)
+    if result_key is not None:
+        cached_result = compiled_schema.get_validation_result(result_key)
+        if cached_result is not None:
+            return cached_result
 
-    return validate_config_from_snap(
-        config_schema_snapshot=config_schema_snapshot,
+    result = validate_config_from_snap(
+        config_schema_snapshot=compiled_schema.snapshot,
         config_type_key=config_type.key,
         config_value=config_value,
     )
 
+    if result_key is not None:
+        compiled_schema.set_validation_result(result_key, result)
+    return result
+
 
 def validate_config_from_snap(
     config_schema_snapshot: ConfigSchemaSnapshot, config_type_key: str, config_value: T
@@ -1,14 +1,14 @@
-import operator
 from abc import ABC
-from functools import reduce
-from typing import AbstractSet, FrozenSet, Optional, Sequence
+from collections import defaultdict
+from typing import AbstractSet, Dict, FrozenSet, Mapping, Optional, Sequence, Set, Tuple
 
 import dagster._check as check
 from dagster.core.asset_defs.assets import AssetsDefinition
 from dagster.core.definitions.events import AssetKey, CoercibleToAssetKey
 from dagster.core.errors import DagsterInvalidSubsetError
 from dagster.core.selector.subset_selector import (
-    fetch_connected,
+    MAX_NUM,
+    Direction,
     generate_asset_dep_graph,
     generate_asset_name_to_definition_map,
 )
@@ -96,45 +96,79 @@ def __init__(self, child: AssetSelection, *, depth: Optional[int] = None):
 
 
 class Resolver:
+    """Resolves asset selections against a set of assets.
+
+    The dependency graph, the asset names and the asset names of each group are indexed once when
+    the resolver is created, and traversals of the graph are memoized, so that one resolver can be
+    shared by all of the selections that are resolved against the assets of a repository.
+    """
+
     def __init__(self, all_assets: Sequence[AssetsDefinition]):
         self.all_assets = all_assets
         self.asset_dep_graph = generate_asset_dep_graph(list(all_assets))
         self.all_assets_by_name = generate_asset_name_to_definition_map(all_assets)
+        self.all_asset_names = frozenset(self.all_assets_by_name.keys())
+        self.asset_names_by_group = _generate_group_to_asset_names_map(all_assets)
+
+        self._asset_keys_by_name: Dict[str, AssetKey] = {}
+        self._connected_cache: Dict[Tuple[Direction, int, FrozenSet[str]], FrozenSet[str]] = {}
 
     def resolve(self, root_node: AssetSelection) -> FrozenSet[AssetKey]:
         return frozenset(
-            {AssetKey.from_user_string(asset_name) for asset_name in self._resolve(root_node)}
+            {self._get_asset_key(asset_name) for asset_name in self._resolve(root_node)}
         )
 
+    def _get_asset_key(self, asset_name: str) -> AssetKey:
+        asset_key = self._asset_keys_by_name.get(asset_name)
+        if asset_key is None:
+            asset_key = AssetKey.from_user_string(asset_name)
+            self._asset_keys_by_name[asset_name] = asset_key
+        return asset_key
+
+    def _fetch_connected(
+        self, asset_names: AbstractSet[str], direction: Direction, depth: Optional[int]
+    ) -> FrozenSet[str]:
+        # Equivalent to the union of fetch_connected over the assets, each including itself, but
+        # traverses the graph once for all of them
+        depth = MAX_NUM if depth is None else depth
+        cache_key = (direction, depth, frozenset(asset_names))
+        if cache_key in self._connected_cache:
+            return self._connected_cache[cache_key]
+
+        dep_graph = self.asset_dep_graph[direction]
+        result = set(asset_names)
+        level = list(asset_names)
+        curr_depth = 0
+        while level and curr_depth < depth:
+            next_level = []
+            for asset_name in level:
+                for connected_name in dep_graph.get(asset_name, ()):
+                    if connected_name not in result:
+                        result.add(connected_name)
+                        next_level.append(connected_name)
+            level = next_level
+            curr_depth += 1
+
+        connected = frozenset(result)
+        self._connected_cache[cache_key] = connected
+        return connected
+
     def _resolve(self, node: AssetSelection) -> AbstractSet[str]:
         if isinstance(node, AllAssetSelection):
-            return set(self.all_assets_by_name.keys())
+            return self.all_asset_names
         elif isinstance(node, AndAssetSelection):
             child_1, child_2 = [self._resolve(child) for child in node.children]
             return child_1 & child_2
         elif isinstance(node, DownstreamAssetSelection):
             child = self._resolve(node.children[0])
-            return reduce(
-                operator.or_,
-                [
-                    {asset_name}
-                    | fetch_connected(
-                        item=asset_name,
-                        graph=self.asset_dep_graph,
-                        direction="downstream",
-                        depth=node.depth,
-                    )
-                    for asset_name in child
-                ],
-            )
+            return self._fetch_connected(child, "downstream", node.depth)
         elif isinstance(node, GroupsAssetSelection):
-            return reduce(
-                operator.or_,
-                [_match_groups(assets_def, set(node.children)) for assets_def in self.all_assets],
+            return frozenset().union(
+                *(self.asset_names_by_group.get(group, frozenset()) for group in node.children)
             )
         elif isinstance(node, KeysAssetSelection):
             specified_keys = set([child.to_user_string() for child in node.children])
-            invalid_keys = specified_keys - set(self.all_assets_by_name.keys())
+            invalid_keys = specified_keys - self.all_asset_names
             if invalid_keys:
                 raise DagsterInvalidSubsetError(
                     f"AssetKey(s) {invalid_keys} were selected, but no AssetDefinition objects supply "
@@ -147,26 +181,16 @@ def _resolve(self, node: AssetSelection) -> AbstractSet[str]:
             return child_1 | child_2
         elif isinstance(node, UpstreamAssetSelection):
             child = self._resolve(node.children[0])
-            return reduce(
-                operator.or_,
-                [
-                    {asset_name}
-                    | fetch_connected(
-                        item=asset_name,
-                        graph=self.asset_dep_graph,
-                        direction="upstream",
-                        depth=node.depth,
-                    )
-                    for asset_name in child
-                ],
-            )
+            return self._fetch_connected(child, "upstream", node.depth)
         else:
             check.failed(f"Unknown node type: {type(node)}")
 
 
-def _match_groups(assets_def: AssetsDefinition, groups: AbstractSet[str]) -> AbstractSet[str]:
-    return {
-        asset_key.to_user_string()
-        for asset_key, group in assets_def.group_names_by_key.items()
-        if group in groups
-    }
+def _generate_group_to_asset_names_map(
+    assets_defs: Sequence[AssetsDefinition],
+) -> Mapping[str, FrozenSet[str]]:
+    asset_names_by_group: Dict[str, Set[str]] = defaultdict(set)
+    for assets_def in assets_defs:
+        for asset_key, group in assets_def.group_names_by_key.items():
+            asset_names_by_group[group].add(asset_key.to_user_string())
+    return {group: frozenset(asset_names) for group, asset_names in asset_names_by_group.items()}
@@ -299,11 +299,16 @@ def _core_multiprocess_executor_creation(config: ExecutorConfig) -> "Multiproces
     if start_selector:
         start_method, start_cfg = list(start_selector.items())[0]
 
+    worker_pool_cfg = check.opt_dict_elem(config, "worker_pool")
+
     return MultiprocessExecutor(
         max_concurrent=check.int_elem(config, "max_concurrent"),
         retries=RetryMode.from_config(check.dict_elem(config, "retries")),  # type: ignore
         start_method=start_method,
         explicit_forkserver_preload=check.opt_list_elem(start_cfg, "preload_modules", of_type=str),
+        use_worker_pool="worker_pool" in config,
+        max_steps_per_worker=check.opt_int_elem(worker_pool_cfg, "max_steps_per_worker"),
+        max_worker_memory_mb=check.opt_int_elem(worker_pool_cfg, "max_worker_memory_mb"),
     )
 
 
@@ -333,6 +338,29 @@ def _core_multiprocess_executor_creation(config: ExecutorConfig) -> "Multiproces
             "https://docs.python.org/3/library/multiprocessing.html#contexts-and-start-methods"
         ),
     ),
+    "worker_pool": Field(
+        {
+            "max_steps_per_worker": Field(
+                Int,
+                is_required=False,
+                description="Replace a worker process after it has executed this many steps.",
+            ),
+            "max_worker_memory_mb": Field(
+                Int,
+                is_required=False,
+                description=(
+                    "Replace a worker process after a step once its peak resident memory exceeds "
+                    "this many megabytes. Not supported on Windows."
+                ),
+            ),
+        },
+        is_required=False,
+        description=(
+            "Execute steps in a pool of up to max_concurrent long-lived worker processes instead "
+            "of starting a new process for each step. Steps executed by the same worker share "
+            "its Python interpreter."
+        ),
+    ),
     "retries": get_retries_config(),
 }
 
@@ -360,6 +388,29 @@ def multiprocess_executor(init_context):
     concurrently. By default, or if you set ``max_concurrent`` to be 0, this is the return value of
     :py:func:`python:multiprocessing.cpu_count`.
 
+    Setting ``worker_pool`` makes the executor keep up to ``max_concurrent`` worker processes alive
+    for the duration of the run and dispatch steps to them, instead of starting a new process for
+    each step. This avoids re-importing user code and re-loading the job for every step, which can
+    dominate the run time of jobs with many short steps:
+
+    .. code-block:: yaml
+
+        execution:
+          config:
+            multiprocess:
+              max_concurrent: 4
+              worker_pool:
+                max_steps_per_worker: 100
+                max_worker_memory_mb: 2048
+
+    Steps are isolated from each other less strictly than without a pool. Each step still runs as
+    its own plan, so resources are initialized and torn down for every step, but steps executed by
+    the same worker share its interpreter: module-level state, caches, and changes to the
+    environment made by one step are visible to later steps. A worker is replaced after
+    ``max_steps_per_worker`` steps, once its peak resident memory exceeds ``max_worker_memory_mb``,
+    and after a step that hit a framework error or was interrupted. A worker that crashes fails its
+    step just like a step process would, and is replaced for subsequent steps.
+
     Execution priority can be configured using the ``dagster/priority`` tag via solid/op metadata,
     where the higher the number the higher the priority. 0 is the default and both positive
     and negative numbers can be used.
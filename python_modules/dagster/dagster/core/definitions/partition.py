@@ -3,7 +3,19 @@
 from abc import ABC, abstractmethod
 from datetime import datetime, time, timedelta
 from enum import Enum
-from typing import Any, Callable, Dict, Generic, List, NamedTuple, Optional, TypeVar, Union, cast
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Generic,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    TypeVar,
+    Union,
+    cast,
+)
 
 import pendulum
 from dateutil.relativedelta import relativedelta
@@ -52,7 +64,7 @@ class Partition(Generic[T]):
 
     def __init__(self, value: T, name: Optional[str] = None):
         self._value = value
-        self._name = cast(str, check.opt_str_param(name, "name", str(value)))
+        self._name = check.str_param(name, "name") if name is not None else str(value)
 
     @property
     def value(self) -> T:
@@ -168,7 +180,7 @@ def __lt__(self, other):
 
 class PartitionsDefinition(ABC, Generic[T]):
     @abstractmethod
-    def get_partitions(self, current_time: Optional[datetime] = None) -> List[Partition[T]]:
+    def get_partitions(self, current_time: Optional[datetime] = None) -> Sequence[Partition[T]]:
         ...
 
     def __str__(self) -> str:
@@ -502,7 +514,7 @@ def tags_for_partition(self, partition: Partition[T]) -> Dict[str, str]:
 
         return tags
 
-    def get_partitions(self, current_time: Optional[datetime] = None) -> List[Partition[T]]:
+    def get_partitions(self, current_time: Optional[datetime] = None) -> Sequence[Partition[T]]:
         """Return the set of known partitions.
 
         Arguments:
@@ -513,9 +525,17 @@ def get_partitions(self, current_time: Optional[datetime] = None) -> List[Partit
         return self._partitions_def.get_partitions(current_time)
 
     def get_partition(self, name: str) -> Partition[T]:
-        for partition in self.get_partitions():
-            if partition.name == name:
-                return partition
+        from .time_window_partitions import TimeWindowPartitions
+
+        partitions = self.get_partitions()
+        if isinstance(partitions, TimeWindowPartitions):
+            index = partitions.get_partition_index(name)
+            if index is not None:
+                return cast(Partition[T], partitions[index])
+        else:
+            for partition in partitions:
+                if partition.name == name:
+                    return partition
 
         raise DagsterUnknownPartitionError(f"Could not find a partition with key `{name}`")
 
@@ -781,8 +801,14 @@ def get_run_config_for_partition_key(self, partition_key: str) -> Dict[str, Any]
         Args:
             partition_key (str): the key for a partition that should be used to generate a run config.
         """
+        from .time_window_partitions import TimeWindowPartitions
+
         partitions = self.partitions_def.get_partitions()
-        partition = [p for p in partitions if p.name == partition_key]
+        if isinstance(partitions, TimeWindowPartitions):
+            index = partitions.get_partition_index(partition_key)
+            partition = [partitions[index]] if index is not None else []
+        else:
+            partition = [p for p in partitions if p.name == partition_key]
         if len(partition) == 0:
             raise DagsterInvalidInvocationError(f"No partition for partition key {partition_key}.")
         return self.run_config_for_partition_fn(partition[0])
@@ -262,6 +262,7 @@ def __init__(
         )
         self._cached_run_config_schemas: Dict[str, "RunConfigSchema"] = {}
         self._cached_external_pipeline = None
+        self._cached_pipeline_index: Optional["PipelineIndex"] = None
 
         self.version_strategy = check.opt_inst_param(
             version_strategy, "version_strategy", VersionStrategy
@@ -493,9 +494,13 @@ def get_pipeline_index(self) -> "PipelineIndex":
         from dagster.core.host_representation import PipelineIndex
         from dagster.core.snap import PipelineSnapshot
 
-        return PipelineIndex(
-            PipelineSnapshot.from_pipeline_def(self), self.get_parent_pipeline_snapshot()
-        )
+        # definitions do not change once constructed, so the snapshot (and its id, which is
+        # expensive to compute for large pipelines) only needs to be built once
+        if self._cached_pipeline_index is None:
+            self._cached_pipeline_index = PipelineIndex(
+                PipelineSnapshot.from_pipeline_def(self), self.get_parent_pipeline_snapshot()
+            )
+        return self._cached_pipeline_index
 
     def get_config_schema_snapshot(self) -> "ConfigSchemaSnapshot":
         return self.get_pipeline_snapshot().config_schema_snapshot
@@ -642,6 +642,7 @@ def from_list(
                 definitions.
         """
         from dagster.core.asset_defs import AssetGroup, AssetsDefinition
+        from dagster.core.asset_defs.asset_selection import Resolver
 
         pipelines_or_jobs: Dict[str, Union[PipelineDefinition, JobDefinition]] = {}
         coerced_graphs: Dict[str, JobDefinition] = {}
@@ -768,15 +769,19 @@ def from_list(
                 )
 
         # resolve all the UnresolvedAssetJobDefinitions using the full set of assets
+        asset_selection_resolver = None
         for name, unresolved_job_def in unresolved_jobs.items():
             if not combined_asset_group:
                 raise DagsterInvalidDefinitionError(
                     f"UnresolvedAssetJobDefinition {name} specified, but no AssetDefinitions exist "
                     "on the repository."
                 )
+            if asset_selection_resolver is None:
+                asset_selection_resolver = Resolver(combined_asset_group.assets)
             resolved_job = unresolved_job_def.resolve(
                 assets=combined_asset_group.assets,
                 source_assets=combined_asset_group.source_assets,
+                asset_selection_resolver=asset_selection_resolver,
             )
             pipelines_or_jobs[name] = resolved_job
 
@@ -1,7 +1,21 @@
-from datetime import datetime, time
-from typing import Any, Callable, Dict, List, NamedTuple, Optional, Union, cast
+from datetime import datetime, time, timedelta
+from functools import lru_cache
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Union,
+    cast,
+    overload,
+)
 
 import pendulum
+from pendulum.tz.timezone import FixedTimezone
 
 import dagster._check as check
 from dagster.utils.partitions import DEFAULT_HOURLY_FORMAT_WITHOUT_TIMEZONE
@@ -70,6 +84,36 @@ def __new__(  # pylint: disable=arguments-differ
 
     def get_partitions(
         self, current_time: Optional[datetime] = None
+    ) -> Sequence[Partition[TimeWindow]]:
+        if not self._has_regular_time_windows():
+            return self._iterate_partitions(current_time)
+
+        return _get_time_window_partitions(self, self.get_num_partitions(current_time))
+
+    def get_partition_keys(self, current_time: Optional[datetime] = None) -> List[str]:
+        partitions = self.get_partitions(current_time)
+        if isinstance(partitions, TimeWindowPartitions):
+            return list(partitions.partition_keys)
+        return [partition.name for partition in partitions]
+
+    def get_num_partitions(self, current_time: Optional[datetime] = None) -> int:
+        if not self._has_regular_time_windows():
+            return len(self._iterate_partitions(current_time))
+
+        current = (
+            pendulum.instance(current_time, tz=self.timezone)
+            if current_time
+            else pendulum.now(self.timezone)
+        ).in_tz(self.timezone)
+        first_window_start = self._first_window_start_at_or_after(
+            pendulum.instance(self.start, tz=self.timezone)
+        )
+        # the number of time windows that end before the current time
+        num_ended = max(self._num_periods_between(first_window_start, current) - 1, 0)
+        return max(num_ended + self.end_offset, 0)
+
+    def _iterate_partitions(
+        self, current_time: Optional[datetime] = None
     ) -> List[Partition[TimeWindow]]:
         current_timestamp = (
             pendulum.instance(current_time, tz=self.timezone)
@@ -130,6 +174,10 @@ def __str__(self) -> str:
 
     def time_window_for_partition_key(self, partition_key: str) -> TimeWindow:
         start = self.start_time_for_partition_key(partition_key)
+        if self._has_regular_time_windows():
+            window_start = self._first_window_start_at_or_after(start)
+            return TimeWindow(window_start, self._add_periods(window_start, 1))
+
         time_of_day = time(self.hour_offset, self.minute_offset)
         iterator = schedule_execution_time_iterator(
             start_timestamp=start.timestamp(),
@@ -146,12 +194,203 @@ def time_window_for_partition_key(self, partition_key: str) -> TimeWindow:
     def start_time_for_partition_key(self, partition_key: str) -> datetime:
         return pendulum.instance(datetime.strptime(partition_key, self.fmt), tz=self.timezone)
 
+    def _has_regular_time_windows(self) -> bool:
+        # Without changes in the UTC offset of the timezone, every time window spans the same period
+        # and starts at the same time of day, so partitions can be computed from their index. With
+        # DST transitions, time windows are skipped or repeated, and partitions are iterated.
+        if self.schedule_type == ScheduleType.MONTHLY and (
+            self.day_offset is not None and self.day_offset > 28
+        ):
+            return False
+        return _has_fixed_utc_offset(
+            self.timezone, pendulum.instance(self.start, tz=self.timezone).timestamp()
+        )
+
+    def _first_window_start_at_or_after(self, dt: datetime) -> pendulum.DateTime:
+        dt = pendulum.instance(dt).in_tz(self.timezone)
+        candidate = dt.replace(minute=self.minute_offset, second=0, microsecond=0)
+        if self.schedule_type == ScheduleType.HOURLY:
+            pass
+        elif self.schedule_type == ScheduleType.DAILY:
+            candidate = candidate.replace(hour=self.hour_offset)
+        elif self.schedule_type == ScheduleType.WEEKLY:
+            # cron days of the week start on Sunday, python weekdays on Monday
+            day_of_week = self.day_offset if self.day_offset is not None else 0
+            days_ahead = (day_of_week - (candidate.weekday() + 1)) % 7
+            candidate = candidate.replace(hour=self.hour_offset).add(days=days_ahead)
+        elif self.schedule_type == ScheduleType.MONTHLY:
+            candidate = candidate.replace(
+                day=self.day_offset if self.day_offset is not None else 1, hour=self.hour_offset
+            )
+        else:
+            check.assert_never(self.schedule_type)
+
+        if candidate < dt:
+            candidate = self._add_periods(candidate, 1)
+        return candidate
+
+    def _add_periods(self, dt: pendulum.DateTime, num_periods: int) -> pendulum.DateTime:
+        if self.schedule_type == ScheduleType.MONTHLY:
+            return dt.add(months=num_periods)
+
+        # Only used for timezones with a fixed UTC offset, so wall clock arithmetic is exact. Adding
+        # a timedelta with datetime's own __add__ is much faster than pendulum's add, and still
+        # returns a pendulum DateTime.
+        return datetime.__add__(dt, cast(timedelta, self.schedule_type.delta) * num_periods)
+
+    def _num_periods_between(self, window_start: pendulum.DateTime, dt: pendulum.DateTime) -> int:
+        """The number of time windows, starting from the given one, that start at or before dt."""
+        if dt < window_start:
+            return 0
+
+        if self.schedule_type == ScheduleType.MONTHLY:
+            num_periods = (dt.year - window_start.year) * 12 + dt.month - window_start.month
+            if self._add_periods(window_start, num_periods) > dt:
+                num_periods -= 1
+        else:
+            num_periods = int(
+                (dt.timestamp() - window_start.timestamp())
+                // cast(timedelta, self.schedule_type.delta).total_seconds()
+            )
+        return num_periods + 1
+
     def get_default_partition_mapping(self):
         from dagster.core.asset_defs.time_window_partition_mapping import TimeWindowPartitionMapping
 
         return TimeWindowPartitionMapping()
 
 
+class TimeWindowPartitions(Sequence[Partition[TimeWindow]]):
+    """The partitions of a TimeWindowPartitionsDefinition with regular time windows, as of some
+    time.
+
+    Each partition is computed from its index when it is first accessed, instead of computing all
+    of them up front.
+    """
+
+    def __init__(self, partitions_def: TimeWindowPartitionsDefinition, num_partitions: int):
+        self._partitions_def = check.inst_param(
+            partitions_def, "partitions_def", TimeWindowPartitionsDefinition
+        )
+        self._num_partitions = check.int_param(num_partitions, "num_partitions")
+        self._first_window_start = (
+            partitions_def._first_window_start_at_or_after(  # pylint: disable=protected-access
+                pendulum.instance(partitions_def.start, tz=partitions_def.timezone)
+            )
+        )
+        self._partitions: Dict[int, Partition[TimeWindow]] = {}
+        self._partition_keys: Optional[List[str]] = None
+
+    @property
+    def partitions_def(self) -> TimeWindowPartitionsDefinition:
+        return self._partitions_def
+
+    @property
+    def partition_keys(self) -> List[str]:
+        if self._partition_keys is None:
+            self._partition_keys = [partition.name for partition in self]
+        return self._partition_keys
+
+    def __len__(self) -> int:
+        return self._num_partitions
+
+    @overload
+    def __getitem__(self, index: int) -> Partition[TimeWindow]:
+        ...
+
+    @overload
+    def __getitem__(self, index: slice) -> List[Partition[TimeWindow]]:
+        ...
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self._num_partitions))]
+
+        check.int_param(index, "index")
+        if index < 0:
+            index += self._num_partitions
+        if index < 0 or index >= self._num_partitions:
+            raise IndexError("partition index out of range")
+
+        partition = self._partitions.get(index)
+        if partition is None:
+            window_start = self._add_periods(index)
+            partition = Partition(
+                value=TimeWindow(window_start, self._add_periods(index + 1)),
+                name=window_start.strftime(self._partitions_def.fmt),
+            )
+            self._partitions[index] = partition
+        return partition
+
+    def __iter__(self) -> Iterator[Partition[TimeWindow]]:
+        for index in range(self._num_partitions):
+            yield self[index]
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, TimeWindowPartitions):
+            return self._partitions_def == other.partitions_def and self._num_partitions == len(
+                other
+            )
+        return isinstance(other, (list, tuple)) and list(self) == list(other)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self._partitions_def!r}, num_partitions={len(self)})"
+
+    def get_partition_index(self, partition_key: str) -> Optional[int]:
+        """The index of the partition with the given key, or None if there is no such partition."""
+        check.str_param(partition_key, "partition_key")
+
+        try:
+            start = self._partitions_def.start_time_for_partition_key(partition_key)
+        except ValueError:
+            return None
+
+        window_start = self._partitions_def._first_window_start_at_or_after(  # pylint: disable=protected-access
+            start
+        )
+        index = (
+            self._partitions_def._num_periods_between(  # pylint: disable=protected-access
+                self._first_window_start, window_start
+            )
+            - 1
+        )
+        if index < 0 or index >= self._num_partitions or self[index].name != partition_key:
+            return None
+        return index
+
+    def _add_periods(self, num_periods: int) -> pendulum.DateTime:
+        return self._partitions_def._add_periods(  # pylint: disable=protected-access
+            self._first_window_start, num_periods
+        )
+
+
+@lru_cache(maxsize=128)
+def _get_time_window_partitions(
+    partitions_def: TimeWindowPartitionsDefinition, num_partitions: int
+) -> TimeWindowPartitions:
+    # The partitions as of any time are determined by their number, so they are shared by all
+    # evaluations of the partitions definition until another time window ends
+    return TimeWindowPartitions(partitions_def, num_partitions)
+
+
+@lru_cache(maxsize=128)
+def _has_fixed_utc_offset(timezone: str, since_timestamp: float) -> bool:
+    tz = pendulum.timezone(timezone)
+    if isinstance(tz, FixedTimezone):
+        return True
+
+    # Compare the UTC offset of the timezone across the time windows that can exist, from the given
+    # time until a year from now. UTC offset changes last for months, so weekly samples find them.
+    dt = datetime.fromtimestamp(since_timestamp, tz=pendulum.UTC)
+    end = max(dt, datetime.now(pendulum.UTC)) + timedelta(days=366)
+    offset = tz.utcoffset(dt.astimezone(tz))
+    while dt < end:
+        if tz.utcoffset(dt.astimezone(tz)) != offset:
+            return False
+        dt += timedelta(weeks=1)
+    return True
+
+
 class DailyPartitionsDefinition(TimeWindowPartitionsDefinition):
     def __new__(
         cls,
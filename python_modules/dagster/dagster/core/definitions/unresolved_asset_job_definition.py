@@ -9,7 +9,7 @@
 
 if TYPE_CHECKING:
     from dagster.core.asset_defs import AssetsDefinition, SourceAsset
-    from dagster.core.asset_defs.asset_selection import AssetSelection
+    from dagster.core.asset_defs.asset_selection import AssetSelection, Resolver
     from dagster.core.definitions import (
         JobDefinition,
         PartitionSetDefinition,
@@ -68,11 +68,23 @@ def get_partition_set_def(self):
         )
 
     def resolve(
-        self, assets: Sequence["AssetsDefinition"], source_assets: Sequence["SourceAsset"]
+        self,
+        assets: Sequence["AssetsDefinition"],
+        source_assets: Sequence["SourceAsset"],
+        asset_selection_resolver: Optional["Resolver"] = None,
     ) -> "JobDefinition":
         """
         Resolve this UnresolvedAssetJobDefinition into a JobDefinition.
+
+        A resolver that was created from the same assets may be passed in, to share its indexes
+        between all of the jobs that are resolved against them.
         """
+        from dagster.core.asset_defs.asset_selection import Resolver
+
+        resolver = check.opt_inst_param(
+            asset_selection_resolver, "asset_selection_resolver", Resolver
+        ) or Resolver(assets)
+
         return build_asset_selection_job(
             name=self.name,
             assets=assets,
@@ -80,7 +92,7 @@ def resolve(
             source_assets=source_assets,
             description=self.description,
             tags=self.tags,
-            asset_selection=self.selection.resolve(assets),
+            asset_selection=resolver.resolve(self.selection),
             partitions_def=self.partitions_def,
         )
 
@@ -202,12 +202,14 @@ class DagsterEventType(Enum):
 def _assert_type(
     method: str, expected_type: DagsterEventType, actual_type: DagsterEventType
 ) -> None:
-    check.invariant(
-        expected_type == actual_type,
-        (
-            "{method} only callable when event_type is {expected_type}, called on {actual_type}"
-        ).format(method=method, expected_type=expected_type, actual_type=actual_type),
-    )
+    # only build the message on failure, since this guards event accessors on hot paths
+    if expected_type != actual_type:
+        check.invariant(
+            False,
+            (
+                "{method} only callable when event_type is {expected_type}, called on {actual_type}"
+            ).format(method=method, expected_type=expected_type, actual_type=actual_type),
+        )
 
 
 def _validate_event_specific_data(
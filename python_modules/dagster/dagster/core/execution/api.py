@@ -771,6 +771,8 @@ def create_execution_plan(
     known_state: Optional[KnownExecutionState] = None,
     instance_ref: Optional[InstanceRef] = None,
     tags: Optional[Dict[str, str]] = None,
+    pipeline_snapshot_id: Optional[str] = None,
+    plan_cache_dir: Optional[str] = None,
 ) -> ExecutionPlan:
     pipeline = _check_pipeline(pipeline)
     pipeline_def = pipeline.get_definition()
@@ -786,6 +788,8 @@ def create_execution_plan(
         KnownExecutionState,
         default=KnownExecutionState(),
     )
+    check.opt_str_param(pipeline_snapshot_id, "pipeline_snapshot_id")
+    check.opt_str_param(plan_cache_dir, "plan_cache_dir")
 
     resolved_run_config = ResolvedRunConfig.build(pipeline_def, run_config, mode=mode)
 
@@ -796,6 +800,8 @@ def create_execution_plan(
         known_state=known_state,
         instance_ref=instance_ref,
         tags=tags,
+        pipeline_snapshot_id=pipeline_snapshot_id,
+        plan_cache_dir=plan_cache_dir,
     )
 
 
@@ -57,6 +57,7 @@ class PartitionBackfill(
             ("backfill_timestamp", float),
             ("last_submitted_partition_name", Optional[str]),
             ("error", Optional[SerializableErrorInfo]),
+            ("last_submitted_partition_index", Optional[int]),
         ],
     ),
 ):
@@ -72,6 +73,7 @@ def __new__(
         backfill_timestamp: float,
         last_submitted_partition_name: Optional[str] = None,
         error: Optional[SerializableErrorInfo] = None,
+        last_submitted_partition_index: Optional[int] = None,
     ):
         return super(PartitionBackfill, cls).__new__(
             cls,
@@ -87,6 +89,7 @@ def __new__(
             check.float_param(backfill_timestamp, "backfill_timestamp"),
             check.opt_str_param(last_submitted_partition_name, "last_submitted_partition_name"),
             check.opt_inst_param(error, "error", SerializableErrorInfo),
+            check.opt_int_param(last_submitted_partition_index, "last_submitted_partition_index"),
         )
 
     @property
@@ -106,10 +109,34 @@ def with_status(self, status):
             self.backfill_timestamp,
             self.last_submitted_partition_name,
             self.error,
+            self.last_submitted_partition_index,
         )
 
-    def with_partition_checkpoint(self, last_submitted_partition_name):
+    @property
+    def partition_checkpoint_index(self) -> Optional[int]:
+        """The index in ``partition_names`` of the last submitted partition, if any."""
+        if not self.last_submitted_partition_name:
+            return None
+
+        index = self.last_submitted_partition_index
+        if (
+            index is not None
+            and index < len(self.partition_names)
+            and self.partition_names[index] == self.last_submitted_partition_name
+        ):
+            return index
+
+        # backfills checkpointed before the index of the checkpoint was stored
+        if self.last_submitted_partition_name in self.partition_names:
+            return self.partition_names.index(self.last_submitted_partition_name)
+
+        return None
+
+    def with_partition_checkpoint(
+        self, last_submitted_partition_name, last_submitted_partition_index=None
+    ):
         check.str_param(last_submitted_partition_name, "last_submitted_partition_name")
+        check.opt_int_param(last_submitted_partition_index, "last_submitted_partition_index")
         return PartitionBackfill(
             self.backfill_id,
             self.partition_set_origin,
@@ -121,6 +148,7 @@ def with_partition_checkpoint(self, last_submitted_partition_name):
             self.backfill_timestamp,
             last_submitted_partition_name,
             self.error,
+            last_submitted_partition_index,
         )
 
     def with_error(self, error):
@@ -136,6 +164,7 @@ def with_error(self, error):
             self.backfill_timestamp,
             self.last_submitted_partition_name,
             error,
+            self.last_submitted_partition_index,
         )
 
 
@@ -50,6 +50,9 @@ def core_execute_in_process(
         run_config=run_config,
         mode=mode_def.name,
         instance_ref=instance.get_ref() if instance and instance.is_persistent else None,
+        # the snapshot is also needed to create the run, which then reuses the cached steps
+        pipeline_snapshot_id=job_def.get_pipeline_snapshot_id(),
+        plan_cache_dir=instance.execution_plan_cache_dir if instance else None,
     )
 
     output_capture: Dict[StepOutputHandle, Any] = {}
@@ -1,5 +1,7 @@
+import heapq
 import time
-from typing import Callable, Dict, Iterator, List, Optional, Set, cast
+from collections import defaultdict
+from typing import Callable, Dict, Iterator, List, Optional, Set, Tuple, cast
 
 import dagster._check as check
 from dagster.core.errors import (
@@ -51,8 +53,22 @@ def __init__(
         # We decide what steps to skip based on what outputs are yielded by upstream steps
         self._step_outputs: Set[StepOutputHandle] = set(self._plan.known_state.ready_outputs)
 
+        # The dependencies of every step known to the plan, extended as dynamic outputs resolve
+        self._step_deps: Dict[str, Set[str]] = self._plan.get_executable_step_deps()
+
         # All steps to be executed start out here in _pending
-        self._pending: Dict[str, Set[str]] = self._plan.get_executable_step_deps()
+        self._pending: Dict[str, Set[str]] = {}
+
+        # To avoid re-examining every pending step on each _update, _pending is indexed by the
+        # steps each pending step is waiting on. A pending step is only (re-)evaluated once all of
+        # its dependencies have succeeded or been skipped, or as soon as any of them has failed or
+        # been abandoned.
+        self._pending_order: Dict[str, int] = {}  # preserves the plan order of pending steps
+        self._pending_sequence: int = 0
+        self._dependents: Dict[str, Set[str]] = defaultdict(set)  # step -> waiting pending steps
+        self._unfinished_dep_counts: Dict[str, int] = {}
+        self._steps_to_evaluate: Set[str] = set()
+        self._newly_completed: List[str] = []  # steps that reached a terminal state since _update
 
         # track mapping keys from DynamicOutputs, step_key, output_name -> list of keys
         # to _gathering while in flight
@@ -63,8 +79,10 @@ def __init__(
         )
         self._new_dynamic_mappings: bool = False
 
-        # steps move in to these buckets as a result of _update calls
-        self._executable: List[str] = []
+        # steps move in to these buckets as a result of _update calls. _executable is a heap
+        # ordered by sort key, and then by the order in which steps became executable.
+        self._executable: List[Tuple[float, int, str]] = []
+        self._executable_sequence: int = 0
         self._pending_skip: List[str] = []
         self._pending_retry: List[str] = []
         self._pending_abandon: List[str] = []
@@ -84,6 +102,9 @@ def __init__(
 
         self._interrupted: bool = False
 
+        for step_key, deps in self._step_deps.items():
+            self._add_pending(step_key, deps)
+
         # Start the show by loading _executable with the set of _pending steps that have no deps
         self._update()
 
@@ -100,7 +121,10 @@ def __exit__(self, exc_type, exc_value, traceback):
 
         if not self.is_complete:
             pending_action = (
-                self._executable + self._pending_abandon + self._pending_retry + self._pending_skip
+                [step_key for _, _, step_key in sorted(self._executable)]
+                + self._pending_abandon
+                + self._pending_retry
+                + self._pending_skip
             )
             state_str = "{pending_str}{in_flight_str}{action_str}{retry_str}".format(
                 in_flight_str="\nSteps still in flight: {}".format(self._in_flight)
@@ -141,6 +165,41 @@ def __exit__(self, exc_type, exc_value, traceback):
                     )
                 )
 
+    def _add_pending(self, step_key: str, deps: Set[str]) -> None:
+        self._pending[step_key] = deps
+        self._pending_order[step_key] = self._pending_sequence
+        self._pending_sequence += 1
+
+        unfinished_dep_count = 0
+        for dep_key in deps:
+            if dep_key in self._success or dep_key in self._skipped:
+                continue
+            if dep_key in self._failed or dep_key in self._abandoned:
+                self._steps_to_evaluate.add(step_key)
+                continue
+            unfinished_dep_count += 1
+            self._dependents[dep_key].add(step_key)
+
+        self._unfinished_dep_counts[step_key] = unfinished_dep_count
+        if unfinished_dep_count == 0:
+            self._steps_to_evaluate.add(step_key)
+
+    def _remove_pending(self, step_key: str) -> None:
+        del self._pending[step_key]
+        del self._pending_order[step_key]
+        del self._unfinished_dep_counts[step_key]
+
+    def _push_executable(self, step_key: str) -> None:
+        heapq.heappush(
+            self._executable,
+            (
+                self._sort_key_fn(self.get_step_by_key(step_key)),
+                self._executable_sequence,
+                step_key,
+            ),
+        )
+        self._executable_sequence += 1
+
     def _update(self) -> None:
         """Moves steps from _pending to _executable / _pending_skip / _pending_retry
         as a function of what has been _completed
@@ -149,23 +208,47 @@ def _update(self) -> None:
         new_steps_to_skip = []
         new_steps_to_abandon = []
 
-        successful_or_skipped_steps = self._success | self._skipped
-        failed_or_abandoned_steps = self._failed | self._abandoned
-
         if self._new_dynamic_mappings:
             new_step_deps = self._plan.resolve(self._successful_dynamic_outputs)
             for step_key, deps in new_step_deps.items():
-                self._pending[step_key] = deps
+                self._step_deps[step_key] = deps
+                self._add_pending(step_key, deps)
 
             self._new_dynamic_mappings = False
 
-        for step_key, requirements in self._pending.items():
+        # only the pending steps waiting on steps that have completed since the last update can
+        # have become ready
+        for completed_key in self._newly_completed:
+            dependents = self._dependents.pop(completed_key, set())
+            if completed_key in self._failed or completed_key in self._abandoned:
+                self._steps_to_evaluate.update(dependents)
+                continue
+
+            for step_key in dependents:
+                if step_key not in self._unfinished_dep_counts:
+                    continue
+                self._unfinished_dep_counts[step_key] -= 1
+                if self._unfinished_dep_counts[step_key] == 0:
+                    self._steps_to_evaluate.add(step_key)
+        self._newly_completed = []
+
+        steps_to_evaluate = sorted(
+            [step_key for step_key in self._steps_to_evaluate if step_key in self._pending],
+            key=self._pending_order.__getitem__,
+        )
+        self._steps_to_evaluate = set()
+
+        for step_key in steps_to_evaluate:
+            requirements = self._pending[step_key]
+
             # If any upstream deps failed - this is not executable
-            if requirements.intersection(failed_or_abandoned_steps):
+            if not requirements.isdisjoint(self._failed) or not requirements.isdisjoint(
+                self._abandoned
+            ):
                 new_steps_to_abandon.append(step_key)
 
             # If all the upstream steps of a step are complete or skipped
-            elif requirements.issubset(successful_or_skipped_steps):
+            elif self._unfinished_dep_counts[step_key] == 0:
                 step = self.get_step_by_key(step_key)
 
                 # The base case is downstream step won't skip
@@ -193,16 +276,16 @@ def _update(self) -> None:
                     new_steps_to_execute.append(step_key)
 
         for key in new_steps_to_execute:
-            self._executable.append(key)
-            del self._pending[key]
+            self._push_executable(key)
+            self._remove_pending(key)
 
         for key in new_steps_to_skip:
             self._pending_skip.append(key)
-            del self._pending[key]
+            self._remove_pending(key)
 
         for key in new_steps_to_abandon:
             self._pending_abandon.append(key)
-            del self._pending[key]
+            self._remove_pending(key)
 
         ready_to_retry = []
         tick_time = time.time()
@@ -211,7 +294,7 @@ def _update(self) -> None:
                 ready_to_retry.append(key)
 
         for key in ready_to_retry:
-            self._executable.append(key)
+            self._push_executable(key)
             del self._waiting_to_retry[key]
 
     def sleep_til_ready(self) -> None:
@@ -247,17 +330,12 @@ def get_steps_to_execute(self, limit: Optional[int] = None) -> List[ExecutionSte
         check.opt_int_param(limit, "limit")
         self._update()
 
-        steps = sorted(
-            [self.get_step_by_key(key) for key in self._executable],
-            key=self._sort_key_fn,
-        )
-
-        if limit is not None:
-            steps = steps[:limit]
-
-        for step in steps:
-            self._in_flight.add(step.key)
-            self._executable.remove(step.key)
+        steps = []
+        while self._executable and (limit is None or len(steps) < limit):
+            _, _, step_key = heapq.heappop(self._executable)
+            step = self.get_step_by_key(step_key)
+            steps.append(step)
+            self._in_flight.add(step_key)
             self._prep_for_dynamic_outputs(step)
 
         return steps
@@ -339,20 +417,24 @@ def plan_events_iterator(self, pipeline_context) -> Iterator[DagsterEvent]:
 
     def mark_failed(self, step_key: str) -> None:
         self._failed.add(step_key)
+        self._newly_completed.append(step_key)
         self._mark_complete(step_key)
 
     def mark_success(self, step_key: str) -> None:
         self._success.add(step_key)
+        self._newly_completed.append(step_key)
         self._mark_complete(step_key)
         self._resolve_any_dynamic_outputs(step_key)
 
     def mark_skipped(self, step_key: str) -> None:
         self._skipped.add(step_key)
+        self._newly_completed.append(step_key)
         self._mark_complete(step_key)
         self._resolve_any_dynamic_outputs(step_key)
 
     def mark_abandoned(self, step_key: str) -> None:
         self._abandoned.add(step_key)
+        self._newly_completed.append(step_key)
         self._mark_complete(step_key)
 
     def mark_interrupted(self) -> None:
@@ -373,11 +455,12 @@ def mark_up_for_retry(self, step_key: str, at_time: Optional[float] = None) -> N
             if at_time:
                 self._waiting_to_retry[step_key] = at_time
             else:
-                self._pending[step_key] = self._plan.get_executable_step_deps()[step_key]
+                self._add_pending(step_key, self._step_deps[step_key])
 
         elif self._retry_mode.deferred:
             # do not attempt to execute again
             self._abandoned.add(step_key)
+            self._newly_completed.append(step_key)
 
         self._retry_state.mark_attempt(step_key)
 
@@ -414,11 +497,12 @@ def handle_event(self, dagster_event: DagsterEvent) -> None:
             )
         elif dagster_event.is_successful_output:
             event_specific_data = cast(StepOutputData, dagster_event.event_specific_data)
-            self.mark_step_produced_output(event_specific_data.step_output_handle)
-            if dagster_event.step_output_data.step_output_handle.mapping_key:
-                self._gathering_dynamic_outputs[step_key][
-                    dagster_event.step_output_data.step_output_handle.output_name
-                ].append(dagster_event.step_output_data.step_output_handle.mapping_key)
+            step_output_handle = event_specific_data.step_output_handle
+            self.mark_step_produced_output(step_output_handle)
+            if step_output_handle.mapping_key:
+                self._gathering_dynamic_outputs[step_key][step_output_handle.output_name].append(
+                    step_output_handle.mapping_key
+                )
 
     def verify_complete(self, pipeline_context: PlanOrchestrationContext, step_key: str) -> None:
         """Ensure that a step has reached a terminal state, if it has not mark it as an unexpected failure"""
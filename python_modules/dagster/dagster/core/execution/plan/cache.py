@@ -0,0 +1,214 @@
+import hashlib
+import logging
+import os
+import pickle
+import sys
+import threading
+from collections import OrderedDict
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import dagster._check as check
+import dagster.seven as seven
+from dagster.core.system_config.objects import ResolvedRunConfig
+from dagster.utils import mkdir_p
+from dagster.version import __version__
+
+from .step import IExecutionStep
+
+DEFAULT_MAX_CACHED_PLANS = 32
+
+# the least recently used entries beyond this many are removed from a cache directory on each write
+MAX_DISK_CACHED_PLANS = 256
+
+
+def get_execution_plan_cache_key(
+    pipeline_snapshot_id: str, resolved_run_config: ResolvedRunConfig
+) -> Optional[str]:
+    """The steps of an execution plan, before any step selection or known state is applied, are
+    determined by the pipeline and the resolved run config. The dagster and python versions are
+    included since they determine the layout of the cached steps.
+
+    Returns None if the run config can not be hashed, e.g. because it contains python objects
+    passed as input values.
+    """
+    check.str_param(pipeline_snapshot_id, "pipeline_snapshot_id")
+    check.inst_param(resolved_run_config, "resolved_run_config", ResolvedRunConfig)
+
+    try:
+        run_config_json = seven.json.dumps(resolved_run_config.to_dict(), sort_keys=True)
+    except (TypeError, ValueError):
+        return None
+
+    hash_obj = hashlib.sha1()
+    for part in [
+        __version__,
+        sys.version,
+        pipeline_snapshot_id,
+        resolved_run_config.mode or "",
+        run_config_json,
+    ]:
+        hash_obj.update(part.encode("utf-8"))
+        hash_obj.update(b"\0")
+    return hash_obj.hexdigest()
+
+
+class ExecutionPlanCache:
+    """Caches the steps built for execution plans, so that plans for the same pipeline and run
+    config -- e.g. the single-step plans built by each step worker of a run -- only pay for
+    building the steps of the full plan once.
+
+    Entries are kept in an in-process LRU. When a `cache_dir` is passed, entries are also pickled
+    to, and read from, that directory, so that they are shared across processes -- e.g. the step
+    subprocesses of a run. The directory is pruned to its MAX_DISK_CACHED_PLANS most recently used
+    entries.
+
+    Steps are immutable, so cached steps can be shared by any number of plans.
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_CACHED_PLANS):
+        self._max_entries = check.int_param(max_entries, "max_entries")
+        self._lock = threading.Lock()
+        self._entries: Dict[str, Tuple[IExecutionStep, ...]] = OrderedDict()
+
+    def get_steps(
+        self, key: str, cache_dir: Optional[str] = None
+    ) -> Optional[Sequence[IExecutionStep]]:
+        check.str_param(key, "key")
+        check.opt_str_param(cache_dir, "cache_dir")
+
+        with self._lock:
+            steps = self._entries.get(key)
+            if steps is not None:
+                self._entries.move_to_end(key)  # type: ignore
+                return steps
+
+        if not cache_dir:
+            return None
+
+        steps = _read_steps(cache_dir, key)
+        if steps is not None:
+            self._add_entry(key, steps)
+        return steps
+
+    def set_steps(self, key: str, steps: Sequence[IExecutionStep], cache_dir: Optional[str] = None):
+        check.str_param(key, "key")
+        check.opt_str_param(cache_dir, "cache_dir")
+
+        self._add_entry(key, steps)
+        if cache_dir:
+            _write_steps(cache_dir, key, steps)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def _add_entry(self, key: str, steps: Sequence[IExecutionStep]):
+        with self._lock:
+            self._entries[key] = tuple(steps)
+            self._entries.move_to_end(key)  # type: ignore
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)  # type: ignore
+
+
+def _get_cache_path(cache_dir: str, key: str) -> str:
+    return os.path.join(cache_dir, f"{key}.pkl")
+
+
+def _rebuild_namedtuple(cls, values):
+    return tuple.__new__(cls, values)
+
+
+def _reduce_namedtuple(obj):
+    return _rebuild_namedtuple, (type(obj), tuple(obj))
+
+
+class _NamedTupleDispatchTable:
+    """Pickles NamedTuples by their field values, and unpickles them without calling __new__.
+
+    Many of the NamedTuples that make up a step (e.g. ExecutionStep) transform their arguments in
+    __new__, so they can not be unpickled by calling __new__ with their fields. The values were
+    validated when the steps were first built, so they are safe to restore as they are. This is
+    also much faster than deserializing the steps from an ExecutionPlanSnapshot, which can take
+    longer than building them from definitions.
+    """
+
+    def __getitem__(self, cls):
+        if issubclass(cls, tuple) and hasattr(cls, "_fields"):
+            return _reduce_namedtuple
+        raise KeyError(cls)
+
+    def get(self, cls, default=None):
+        try:
+            return self[cls]
+        except KeyError:
+            return default
+
+
+def _read_steps(cache_dir: str, key: str) -> Optional[List[IExecutionStep]]:
+    path = _get_cache_path(cache_dir, key)
+    if not os.path.exists(path):
+        return None
+
+    try:
+        with open(path, "rb") as f:
+            steps = pickle.load(f)
+        # mark the entry as recently used
+        os.utime(path)
+        return steps
+    except Exception:
+        # a corrupt or incompatible entry is treated as a miss, and overwritten after the rebuild
+        logging.exception("Could not read cached execution plan %s", path)
+        return None
+
+
+def _write_steps(cache_dir: str, key: str, steps: Sequence[IExecutionStep]):
+    path = _get_cache_path(cache_dir, key)
+    temp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        mkdir_p(cache_dir)
+        with open(temp_path, "wb") as f:
+            pickler = pickle.Pickler(f, protocol=pickle.HIGHEST_PROTOCOL)
+            pickler.dispatch_table = _NamedTupleDispatchTable()  # type: ignore
+            pickler.dump(list(steps))
+        # atomic, so that concurrent readers never observe a partially written entry
+        os.replace(temp_path, path)
+        _prune_steps(cache_dir)
+    except Exception:
+        # the cache is optional, so a failure to write to it (e.g. steps holding objects that can
+        # not be pickled, which raise TypeError or AttributeError) must not fail the plan build
+        logging.exception("Could not write cached execution plan %s", path)
+        try:
+            os.unlink(temp_path)
+        except OSError:
+            pass
+
+
+def _prune_steps(cache_dir: str):
+    paths = [
+        os.path.join(cache_dir, file_name)
+        for file_name in os.listdir(cache_dir)
+        if file_name.endswith(".pkl")
+    ]
+    if len(paths) <= MAX_DISK_CACHED_PLANS:
+        return
+
+    for path in sorted(paths, key=_get_mtime)[:-MAX_DISK_CACHED_PLANS]:
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            # removed by a concurrent write
+            pass
+
+
+def _get_mtime(path: str) -> float:
+    try:
+        return os.path.getmtime(path)
+    except FileNotFoundError:
+        return 0
+
+
+_EXECUTION_PLAN_CACHE = ExecutionPlanCache()
+
+
+def get_execution_plan_cache() -> ExecutionPlanCache:
+    return _EXECUTION_PLAN_CACHE
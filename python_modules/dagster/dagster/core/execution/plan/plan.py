@@ -46,6 +46,7 @@
 
 from ..context.output import get_output_context
 from ..resolve_versions import resolve_step_output_versions
+from .cache import get_execution_plan_cache, get_execution_plan_cache_key
 from .compute import create_step_outputs
 from .inputs import (
     FromConfig,
@@ -105,6 +106,8 @@ def __init__(
         known_state: KnownExecutionState,
         instance_ref: Optional[InstanceRef],
         tags: Dict[str, str],
+        pipeline_snapshot_id: Optional[str] = None,
+        plan_cache_dir: Optional[str] = None,
     ):
         self.pipeline = check.inst_param(pipeline, "pipeline", IPipeline)
         self.resolved_run_config = check.inst_param(
@@ -125,6 +128,10 @@ def __init__(
         self._instance_ref = instance_ref
         self._seen_handles: Set[StepHandleUnion] = set()
         self._tags = check.dict_param(tags, "tags", key_type=str, value_type=str)
+        self._pipeline_snapshot_id = check.opt_str_param(
+            pipeline_snapshot_id, "pipeline_snapshot_id"
+        )
+        self._plan_cache_dir = check.opt_str_param(plan_cache_dir, "plan_cache_dir")
 
     @property
     def pipeline_name(self) -> str:
@@ -169,38 +176,29 @@ def build(self) -> "ExecutionPlan":
         )
 
         pipeline_def = self.pipeline.get_definition()
-        root_inputs: List[
-            Union[StepInput, UnresolvedMappedStepInput, UnresolvedCollectStepInput]
-        ] = []
-        # Recursively build the execution plan starting at the root pipeline
-        for input_def in pipeline_def.graph.input_defs:
-            input_name = input_def.name
 
-            input_source = get_root_graph_input_source(
-                plan_builder=self,
-                pipeline_def=pipeline_def,
-                input_name=input_name,
-                input_def=input_def,
-            )
-
-            # If an input with dagster_type "Nothing" doesn't have a value
-            # we don't create a StepInput
-            if input_source is None:
-                continue
+        cache_key = (
+            get_execution_plan_cache_key(self._pipeline_snapshot_id, self.resolved_run_config)
+            if self._pipeline_snapshot_id
+            # memoized plans depend on the versions stored in the io managers
+            and not pipeline_def.is_using_memoization(self._tags)
+            else None
+        )
+        cached_steps = (
+            get_execution_plan_cache().get_steps(cache_key, cache_dir=self._plan_cache_dir)
+            if cache_key
+            else None
+        )
 
-            root_inputs.append(
-                StepInput(
-                    name=input_name,
-                    dagster_type_key=input_def.dagster_type.key,
-                    source=input_source,
+        if cached_steps is not None:
+            for step in cached_steps:
+                self.add_step(step)
+        else:
+            self._build_steps(pipeline_def)
+            if cache_key:
+                get_execution_plan_cache().set_steps(
+                    cache_key, list(self._steps.values()), cache_dir=self._plan_cache_dir
                 )
-            )
-
-        self._build_from_sorted_solids(
-            pipeline_def.solids_in_topological_order,
-            pipeline_def.dependency_structure,
-            parent_step_inputs=root_inputs,
-        )
 
         step_dict = {step.handle: step for step in self._steps.values()}
         step_dict_by_key = {step.key: step for step in self._steps.values()}
@@ -253,6 +251,40 @@ def build(self) -> "ExecutionPlan":
 
         return plan
 
+    def _build_steps(self, pipeline_def: PipelineDefinition) -> None:
+        root_inputs: List[
+            Union[StepInput, UnresolvedMappedStepInput, UnresolvedCollectStepInput]
+        ] = []
+        # Recursively build the execution plan starting at the root pipeline
+        for input_def in pipeline_def.graph.input_defs:
+            input_name = input_def.name
+
+            input_source = get_root_graph_input_source(
+                plan_builder=self,
+                pipeline_def=pipeline_def,
+                input_name=input_name,
+                input_def=input_def,
+            )
+
+            # If an input with dagster_type "Nothing" doesn't have a value
+            # we don't create a StepInput
+            if input_source is None:
+                continue
+
+            root_inputs.append(
+                StepInput(
+                    name=input_name,
+                    dagster_type_key=input_def.dagster_type.key,
+                    source=input_source,
+                )
+            )
+
+        self._build_from_sorted_solids(
+            pipeline_def.solids_in_topological_order,
+            pipeline_def.dependency_structure,
+            parent_step_inputs=root_inputs,
+        )
+
     def _build_from_sorted_solids(
         self,
         solids: List[Node],
@@ -607,6 +639,7 @@ class ExecutionPlan(
             ("artifacts_persisted", bool),
             ("step_dict_by_key", Dict[str, IExecutionStep]),
             ("executor_name", Optional[str]),
+            ("step_output_versions", Dict[StepOutputHandle, str]),
         ],
     )
 ):
@@ -620,6 +653,7 @@ def __new__(
         artifacts_persisted: bool = False,
         step_dict_by_key: Optional[Dict[str, IExecutionStep]] = None,
         executor_name: Optional[str] = None,
+        step_output_versions: Optional[Dict[StepOutputHandle, str]] = None,
     ):
         return super(ExecutionPlan, cls).__new__(
             cls,
@@ -655,18 +689,24 @@ def __new__(
                 ),
             ),
             executor_name=check.opt_str_param(executor_name, "executor_name"),
+            # the versions in the known state are indexed once per plan, instead of on every lookup
+            # of the version of a step output
+            step_output_versions=StepOutputVersionData.get_version_dict_from_list(
+                known_state.step_output_versions
+            )
+            if step_output_versions is None
+            else check.dict_param(
+                step_output_versions,
+                "step_output_versions",
+                key_type=StepOutputHandle,
+                value_type=str,
+            ),
         )
 
     @property
     def steps(self) -> List[IExecutionStep]:
         return list(self.step_dict.values())
 
-    @property
-    def step_output_versions(self) -> Dict[StepOutputHandle, str]:
-        return StepOutputVersionData.get_version_dict_from_list(
-            self.known_state.step_output_versions if self.known_state else []
-        )
-
     @property
     def step_keys_to_execute(self) -> List[str]:
         return [handle.to_key() for handle in self.step_handles_to_execute]
@@ -884,6 +924,7 @@ def build_memoized_plan(
 
         resource_defs_to_init = {}
         io_manager_keys = {}  # Map step output handles to io manager keys
+        resource_deps = resolve_resource_dependencies(mode_def.resource_defs)
 
         for step in self.steps:
             for output_name in cast(ExecutionStepUnion, step).step_output_dict.keys():
@@ -892,7 +933,6 @@ def build_memoized_plan(
                 io_manager_key = self.get_manager_key(step_output_handle, pipeline_def)
                 io_manager_keys[step_output_handle] = io_manager_key
 
-                resource_deps = resolve_resource_dependencies(mode_def.resource_defs)
                 resource_keys_to_init = get_dependencies(io_manager_key, resource_deps)
                 for resource_key in resource_keys_to_init:
                     resource_defs_to_init[resource_key] = mode_def.resource_defs[resource_key]
@@ -985,6 +1025,8 @@ def build(
         known_state: Optional[KnownExecutionState] = None,
         instance_ref: Optional[InstanceRef] = None,
         tags: Optional[Dict[str, str]] = None,
+        pipeline_snapshot_id: Optional[str] = None,
+        plan_cache_dir: Optional[str] = None,
     ) -> "ExecutionPlan":
         """Here we build a new ExecutionPlan from a pipeline definition and the resolved run config.
 
@@ -993,6 +1035,11 @@ def build(
 
         Once we've processed the entire pipeline, we invoke _PlanBuilder.build() to construct the
         ExecutionPlan object.
+
+        If the id of the pipeline's snapshot is passed, the steps built for the pipeline and run
+        config are cached in-process, and in `plan_cache_dir` if set, and reused by later builds
+        with the same pipeline snapshot and run config. Step selection and known state are applied
+        to the cached steps as usual.
         """
         check.inst_param(pipeline, "pipeline", IPipeline)
         check.inst_param(resolved_run_config, "resolved_run_config", ResolvedRunConfig)
@@ -1013,6 +1060,8 @@ def build(
             known_state=known_state,
             instance_ref=instance_ref,
             tags=tags,
+            pipeline_snapshot_id=pipeline_snapshot_id,
+            plan_cache_dir=plan_cache_dir,
         )
 
         # Finally, we build and return the execution plan
@@ -1373,7 +1422,7 @@ def _get_executable_step_deps(
     # for things transitively downstream of unresolved collect steps
     unresolved_set = set()
 
-    step_keys_to_execute = [handle.to_key() for handle in step_handles_to_execute]
+    step_keys_to_execute = {handle.to_key() for handle in step_handles_to_execute}
 
     for key, handle in executable_map.items():
         step = cast(ExecutionStep, step_dict[handle])
@@ -73,6 +73,18 @@ def resolve_step_versions(pipeline_def, execution_plan, resolved_run_config):
     resource_versions = {}
     resource_defs = pipeline_def.get_mode_definition(resolved_run_config.mode).resource_defs
 
+    # Ops are often invoked many times with the same config, so versions are shared between the
+    # invocations of an op with the same definition, config and resources.
+    config_versions = {}  # id(config) -> (config, version)
+    solid_def_versions = {}  # (solid def name, config version) -> version
+    solid_versions = {}  # (solid def name, config version, resources version) -> version
+
+    def _resolve_config_version(config_value):
+        # keeps a reference to the config value, so that its id is not reused during resolution
+        if id(config_value) not in config_versions:
+            config_versions[id(config_value)] = (config_value, resolve_config_version(config_value))
+        return config_versions[id(config_value)][1]
+
     step_versions = {}  # step_key (str) -> version (str)
 
     for step in execution_plan.get_all_steps_in_topo_order():
@@ -99,31 +111,34 @@ def resolve_step_versions(pipeline_def, execution_plan, resolved_run_config):
         solid_name = str(step.solid_handle)
 
         solid_config = resolved_run_config.solids[solid_name].config
+        solid_config_version = _resolve_config_version(solid_config)
+
+        solid_def_version_key = (solid_def.name, solid_config_version)
+        if solid_def_version_key not in solid_def_versions:
+            solid_def_version = None
+            if solid_def.version is not None:
+                solid_def_version = solid_def.version
+            elif pipeline_def.version_strategy is not None:
+                version_context = OpVersionContext(op_def=solid_def, op_config=solid_config)
+                solid_def_version = pipeline_def.version_strategy.get_op_version(version_context)
+
+            if solid_def_version is None:
+                raise DagsterInvariantViolationError(
+                    f"While using memoization, version for {node_label} was None. Please "
+                    "either provide a versioning strategy for your job, or provide a version using the "
+                    f"{solid_def.node_type_str} decorator."
+                )
 
-        solid_def_version = None
-        if solid_def.version is not None:
-            solid_def_version = solid_def.version
-        elif pipeline_def.version_strategy is not None:
-            version_context = OpVersionContext(op_def=solid_def, op_config=solid_config)
-            solid_def_version = pipeline_def.version_strategy.get_op_version(version_context)
-
-        if solid_def_version is None:
-            raise DagsterInvariantViolationError(
-                f"While using memoization, version for {node_label} was None. Please "
-                "either provide a versioning strategy for your job, or provide a version using the "
-                f"{solid_def.node_type_str} decorator."
-            )
-
-        check_valid_version(solid_def_version)
-
-        solid_config_version = resolve_config_version(solid_config)
+            check_valid_version(solid_def_version)
+            solid_def_versions[solid_def_version_key] = solid_def_version
+        solid_def_version = solid_def_versions[solid_def_version_key]
 
         resource_versions_for_solid = []
         for resource_key in solid_def.required_resource_keys:
             if resource_key not in resource_versions:
 
                 resource_config = resolved_run_config.resources[resource_key].config
-                resource_config_version = resolve_config_version(resource_config)
+                resource_config_version = _resolve_config_version(resource_config)
 
                 resource_def = resource_defs[resource_key]
                 resource_def_version = None
@@ -150,9 +165,13 @@ def resolve_step_versions(pipeline_def, execution_plan, resolved_run_config):
             if resource_versions[resource_key] is not None:
                 resource_versions_for_solid.append(resource_versions[resource_key])
         solid_resources_version = join_and_hash(*resource_versions_for_solid)
-        solid_version = join_and_hash(
-            solid_def_version, solid_config_version, solid_resources_version
-        )
+
+        solid_version_key = (solid_def.name, solid_config_version, solid_resources_version)
+        if solid_version_key not in solid_versions:
+            solid_versions[solid_version_key] = join_and_hash(
+                solid_def_version, solid_config_version, solid_resources_version
+            )
+        solid_version = solid_versions[solid_version_key]
 
         from_versions = input_versions + [solid_version]
 
@@ -164,6 +183,15 @@ def resolve_step_versions(pipeline_def, execution_plan, resolved_run_config):
 
 
 def resolve_step_output_versions(pipeline_def, execution_plan, resolved_run_config):
+    """Resolves the version of each step output in an execution plan.
+
+    Memoized execution plans carry the versions of the step outputs of the full plan in their known
+    state, which is persisted in the execution plan snapshot, so that they are only resolved once
+    per run rather than again in each step worker and for each step output.
+    """
+    if execution_plan.known_state and execution_plan.known_state.step_output_versions:
+        return execution_plan.step_output_versions
+
     step_versions = resolve_step_versions(pipeline_def, execution_plan, resolved_run_config)
     return {
         StepOutputHandle(step.key, output_name): join_and_hash(output_name, step_versions[step.key])
@@ -85,80 +85,141 @@ class StepEventStatus(Enum):
     IN_PROGRESS = "IN_PROGRESS"
 
 
+class StepEventStatsRecord(
+    NamedTuple(
+        "_StepEventStatsRecord",
+        [
+            ("step_key", str),
+            ("event_type", DagsterEventType),
+            ("timestamp", float),
+            ("marker_start", Optional[str]),
+            ("marker_end", Optional[str]),
+            ("event", Optional[EventLogEntry]),
+        ],
+    )
+):
+    """The fields of a step event that step stats are derived from. The full event is only needed
+    for materialization and expectation result events, whose contents are part of the stats.
+    """
+
+    def __new__(
+        cls,
+        step_key: str,
+        event_type: DagsterEventType,
+        timestamp: float,
+        marker_start: Optional[str] = None,
+        marker_end: Optional[str] = None,
+        event: Optional[EventLogEntry] = None,
+    ):
+        return super(StepEventStatsRecord, cls).__new__(
+            cls, step_key, event_type, timestamp, marker_start, marker_end, event
+        )
+
+    @staticmethod
+    def from_event(event: EventLogEntry) -> Optional["StepEventStatsRecord"]:
+        if not event.is_dagster_event:
+            return None
+        dagster_event = event.get_dagster_event()
+
+        step_key = dagster_event.step_key
+        if not step_key:
+            return None
+
+        marker_start = None
+        marker_end = None
+        if dagster_event.event_type == DagsterEventType.ENGINE_EVENT:
+            marker_start = dagster_event.engine_event_data.marker_start
+            marker_end = dagster_event.engine_event_data.marker_end
+
+        return StepEventStatsRecord(
+            step_key=step_key,
+            event_type=dagster_event.event_type,
+            timestamp=event.timestamp,
+            marker_start=marker_start,
+            marker_end=marker_end,
+            event=event,
+        )
+
+
 def build_run_step_stats_from_events(
     run_id: str, records: Iterable[EventLogEntry]
+) -> List["RunStepKeyStatsSnapshot"]:
+    step_event_records = []
+    for event in records:
+        step_event_record = StepEventStatsRecord.from_event(event)
+        if step_event_record:
+            step_event_records.append(step_event_record)
+    return build_run_step_stats_from_step_event_records(run_id, step_event_records)
+
+
+def build_run_step_stats_from_step_event_records(
+    run_id: str, records: Iterable[StepEventStatsRecord]
 ) -> List["RunStepKeyStatsSnapshot"]:
     by_step_key: Dict[str, Dict[str, Any]] = defaultdict(dict)
     attempts = defaultdict(list)
-    attempt_events = defaultdict(list)
+    attempt_events: Dict[str, List[StepEventStatsRecord]] = defaultdict(list)
     markers: Dict[str, Dict[str, Any]] = defaultdict(dict)
-    for event in records:
-        if not event.is_dagster_event:
-            continue
-        dagster_event = event.get_dagster_event()
+    for record in records:
+        step_key = record.step_key
 
-        step_key = dagster_event.step_key
-        if not step_key:
-            continue
-
-        if dagster_event.event_type == DagsterEventType.STEP_START:
-            by_step_key[step_key]["start_time"] = event.timestamp
+        if record.event_type == DagsterEventType.STEP_START:
+            by_step_key[step_key]["start_time"] = record.timestamp
             by_step_key[step_key]["attempts"] = 1
-        if dagster_event.event_type == DagsterEventType.STEP_FAILURE:
-            by_step_key[step_key]["end_time"] = event.timestamp
+        if record.event_type == DagsterEventType.STEP_FAILURE:
+            by_step_key[step_key]["end_time"] = record.timestamp
             by_step_key[step_key]["status"] = StepEventStatus.FAILURE
-        if dagster_event.event_type == DagsterEventType.STEP_RESTARTED:
+        if record.event_type == DagsterEventType.STEP_RESTARTED:
             by_step_key[step_key]["attempts"] = int(by_step_key[step_key].get("attempts") or 0) + 1
-        if dagster_event.event_type == DagsterEventType.STEP_SUCCESS:
-            by_step_key[step_key]["end_time"] = event.timestamp
+        if record.event_type == DagsterEventType.STEP_SUCCESS:
+            by_step_key[step_key]["end_time"] = record.timestamp
             by_step_key[step_key]["status"] = StepEventStatus.SUCCESS
-        if dagster_event.event_type == DagsterEventType.STEP_SKIPPED:
-            by_step_key[step_key]["end_time"] = event.timestamp
+        if record.event_type == DagsterEventType.STEP_SKIPPED:
+            by_step_key[step_key]["end_time"] = record.timestamp
             by_step_key[step_key]["status"] = StepEventStatus.SKIPPED
-        if dagster_event.event_type == DagsterEventType.ASSET_MATERIALIZATION:
+        if record.event_type == DagsterEventType.ASSET_MATERIALIZATION:
             materialization_events = by_step_key[step_key].get("materialization_events", [])
-            materialization_events.append(event)
+            materialization_events.append(check.not_none(record.event))
             by_step_key[step_key]["materialization_events"] = materialization_events
-        if dagster_event.event_type == DagsterEventType.STEP_EXPECTATION_RESULT:
-            expectation_data = cast(StepExpectationResultData, dagster_event.event_specific_data)
+        if record.event_type == DagsterEventType.STEP_EXPECTATION_RESULT:
+            expectation_data = cast(
+                StepExpectationResultData,
+                check.not_none(record.event).get_dagster_event().event_specific_data,
+            )
             expectation_result = expectation_data.expectation_result
             step_expectation_results = by_step_key[step_key].get("expectation_results", [])
             step_expectation_results.append(expectation_result)
             by_step_key[step_key]["expectation_results"] = step_expectation_results
-        if dagster_event.event_type in (
+        if record.event_type in (
             DagsterEventType.STEP_UP_FOR_RETRY,
             DagsterEventType.STEP_RESTARTED,
         ):
-            attempt_events[step_key].append(event)
-        if dagster_event.event_type == DagsterEventType.ENGINE_EVENT:
-            if dagster_event.engine_event_data.marker_start:
-                key = dagster_event.engine_event_data.marker_start
+            attempt_events[step_key].append(record)
+        if record.event_type == DagsterEventType.ENGINE_EVENT:
+            if record.marker_start:
+                key = record.marker_start
                 if key not in markers[step_key]:
-                    markers[step_key][key] = {"key": key, "start": event.timestamp}
+                    markers[step_key][key] = {"key": key, "start": record.timestamp}
                 else:
-                    markers[step_key][key]["start"] = event.timestamp
+                    markers[step_key][key]["start"] = record.timestamp
 
-            if dagster_event.engine_event_data.marker_end:
-                key = dagster_event.engine_event_data.marker_end
+            if record.marker_end:
+                key = record.marker_end
                 if key not in markers[step_key]:
-                    markers[step_key][key] = {"key": key, "end": event.timestamp}
+                    markers[step_key][key] = {"key": key, "end": record.timestamp}
                 else:
-                    markers[step_key][key]["end"] = event.timestamp
+                    markers[step_key][key]["end"] = record.timestamp
 
     for step_key, step_stats in by_step_key.items():
-        events = attempt_events[step_key]
         step_attempts = []
         attempt_start = step_stats.get("start_time")
 
-        for event in events:
-            if not event.dagster_event:
-                continue
-            if event.dagster_event.event_type == DagsterEventType.STEP_UP_FOR_RETRY:
+        for record in attempt_events[step_key]:
+            if record.event_type == DagsterEventType.STEP_UP_FOR_RETRY:
                 step_attempts.append(
-                    RunStepMarker(start_time=attempt_start, end_time=event.timestamp)
+                    RunStepMarker(start_time=attempt_start, end_time=record.timestamp)
                 )
-            elif event.dagster_event.event_type == DagsterEventType.STEP_RESTARTED:
-                attempt_start = event.timestamp
+            elif record.event_type == DagsterEventType.STEP_RESTARTED:
+                attempt_start = record.timestamp
         if step_stats.get("end_time"):
             step_attempts.append(
                 RunStepMarker(start_time=attempt_start, end_time=step_stats["end_time"])
@@ -5,10 +5,12 @@
 import queue
 import sys
 from abc import ABC, abstractmethod
-from typing import NamedTuple
+from contextlib import ExitStack, contextmanager
+from typing import Any, Iterator, List, NamedTuple, Optional
 
 import dagster._check as check
 from dagster.core.errors import DagsterExecutionInterruptedError
+from dagster.utils import start_termination_thread
 from dagster.utils.error import SerializableErrorInfo, serializable_error_info_from_exc_info
 from dagster.utils.interrupts import capture_interrupts
 
@@ -36,6 +38,13 @@ class ChildProcessSystemErrorEvent(
     pass
 
 
+class ChildProcessWorkerRetiringEvent(
+    NamedTuple("ChildProcessWorkerRetiringEvent", [("pid", int)]), ChildProcessEvent
+):
+    """Sent by a worker process, ahead of the event that ends its current task, when the worker
+    will exit instead of accepting another task."""
+
+
 class ChildProcessCommand(ABC):  # pylint: disable=no-init
     """Inherit from this class in order to use this library.
 
@@ -165,3 +174,297 @@ def execute_child_process_command(multiprocessing_ctx, command):
         process.join()
     finally:
         event_queue.close()
+
+
+class ChildProcessWorkerCommand(ABC):
+    """Inherit from this class in order to execute a sequence of tasks in a long-lived child
+    process managed by a ChildProcessWorkerPool.
+
+    The object must be picklable. Each worker process receives its own copy, enters
+    `worker_scope` once, and then invokes `execute_task` for every task dispatched to it. Tasks
+    must be picklable as well.
+    """
+
+    @contextmanager
+    def worker_scope(self) -> Iterator[Any]:
+        """This context manager is entered once in each worker process, before its first task.
+
+        The yielded value is passed to every invocation of `execute_task` in that process."""
+        yield None
+
+    @abstractmethod
+    def execute_task(self, worker_state: Any, task: Any) -> Iterator[Any]:
+        """This method is invoked in the worker process once for each task.
+
+        Yields a sequence of events to be handled by the parent process."""
+
+
+WORKER_IDLE_TICK = 1.0
+"""The interval at which an idle worker process checks that its parent is still alive."""
+
+
+def _get_next_task(task_queue, parent_pid):
+    while True:
+        try:
+            return task_queue.get(block=True, timeout=WORKER_IDLE_TICK)
+        except queue.Empty:
+            if os.getppid() != parent_pid:
+                # the parent process exited without shutting the worker down
+                return None
+
+
+def _get_max_rss_bytes() -> Optional[int]:
+    try:
+        import resource  # not available on windows
+    except ImportError:
+        return None
+
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is reported in bytes on macOS and in kilobytes elsewhere
+    return max_rss if sys.platform == "darwin" else max_rss * 1024
+
+
+def _execute_tasks_in_worker_process(
+    task_queue,
+    event_queue,
+    term_event,
+    command,
+    parent_pid,
+    max_tasks,
+    max_memory_bytes,
+):
+    """Wraps the execution of a ChildProcessWorkerCommand.
+
+    Executes tasks from the task queue, one at a time, until the parent sends None or the worker
+    retires. Each task is bracketed by the same events as a ChildProcessCommand, so that the parent
+    can treat it like a child process of its own. The worker retires after `max_tasks` tasks, once
+    its peak resident set size exceeds `max_memory_bytes`, or after a task that raised or was
+    interrupted."""
+
+    check.inst_param(command, "command", ChildProcessWorkerCommand)
+
+    with capture_interrupts():
+        pid = os.getpid()
+        start_termination_thread(term_event)
+
+        with ExitStack() as stack:
+            setup_error_info = None
+            worker_state = None
+            try:
+                worker_state = stack.enter_context(command.worker_scope())
+            except (
+                Exception,
+                KeyboardInterrupt,
+                DagsterExecutionInterruptedError,
+            ):
+                # reported as the failure of the first task, after which the worker retires
+                setup_error_info = serializable_error_info_from_exc_info(sys.exc_info())
+
+            tasks_executed = 0
+            while True:
+                task = _get_next_task(task_queue, parent_pid)
+                if task is None:
+                    return
+
+                event_queue.put(ChildProcessStartEvent(pid=pid))
+                error_info = setup_error_info
+                if not error_info:
+                    try:
+                        for event in command.execute_task(worker_state, task):
+                            event_queue.put(event)
+                    except (
+                        Exception,
+                        KeyboardInterrupt,
+                        DagsterExecutionInterruptedError,
+                    ):
+                        error_info = serializable_error_info_from_exc_info(sys.exc_info())
+
+                tasks_executed += 1
+                max_rss_bytes = _get_max_rss_bytes() if max_memory_bytes else None
+                retiring = (
+                    error_info is not None
+                    or term_event.is_set()
+                    or bool(max_tasks and tasks_executed >= max_tasks)
+                    or bool(max_rss_bytes and max_rss_bytes > max_memory_bytes)
+                )
+
+                if retiring:
+                    event_queue.put(ChildProcessWorkerRetiringEvent(pid=pid))
+                if error_info:
+                    event_queue.put(ChildProcessSystemErrorEvent(pid=pid, error_info=error_info))
+                else:
+                    event_queue.put(ChildProcessDoneEvent(pid=pid))
+                if retiring:
+                    return
+
+
+class ChildProcessWorker:
+    """A long-lived child process that executes the tasks of a ChildProcessWorkerCommand, one at a
+    time. Created and recycled by ChildProcessWorkerPool."""
+
+    def __init__(
+        self,
+        multiprocessing_ctx,
+        command: ChildProcessWorkerCommand,
+        max_tasks: Optional[int],
+        max_memory_bytes: Optional[int],
+    ):
+        self.task_queue = multiprocessing_ctx.Queue()
+        self.event_queue = multiprocessing_ctx.Queue()
+        self.term_event = multiprocessing_ctx.Event()
+        self.retiring = False
+        self.process = multiprocessing_ctx.Process(
+            target=_execute_tasks_in_worker_process,
+            args=(
+                self.task_queue,
+                self.event_queue,
+                self.term_event,
+                command,
+                os.getpid(),
+                max_tasks,
+                max_memory_bytes,
+            ),
+        )
+        self.process.start()
+
+    @property
+    def pid(self) -> Optional[int]:
+        return self.process.pid
+
+    def request_shutdown(self):
+        if not self.retiring and self.process.is_alive():
+            self.task_queue.put(None)
+
+    def join(self, timeout: Optional[float]):
+        self.process.join(timeout)
+        if self.process.is_alive():
+            self.process.terminate()
+            self.process.join()
+        self.task_queue.close()
+        self.event_queue.close()
+
+
+class ChildProcessWorkerPool:
+    """Keeps up to `max_workers` worker processes alive, each executing one task at a time.
+
+    Unlike `execute_child_process_command`, which starts a new process for every command, a worker
+    pays the cost of starting a process and entering the command's `worker_scope` once, and is then
+    reused for subsequent tasks. Tasks executed by the same worker therefore share its interpreter
+    state. Workers are started lazily, and are replaced after they retire (see
+    `_execute_tasks_in_worker_process`) or crash.
+
+    Use as a context manager: all workers are shut down on exit.
+    """
+
+    def __init__(
+        self,
+        multiprocessing_ctx,
+        command: ChildProcessWorkerCommand,
+        max_workers: int,
+        max_tasks_per_worker: Optional[int] = None,
+        max_worker_memory_bytes: Optional[int] = None,
+        shutdown_timeout: float = 10.0,
+    ):
+        self._multiprocessing_ctx = multiprocessing_ctx
+        self._command = check.inst_param(command, "command", ChildProcessWorkerCommand)
+        self._max_workers = check.int_param(max_workers, "max_workers")
+        self._max_tasks_per_worker = check.opt_int_param(
+            max_tasks_per_worker, "max_tasks_per_worker"
+        )
+        self._max_worker_memory_bytes = check.opt_int_param(
+            max_worker_memory_bytes, "max_worker_memory_bytes"
+        )
+        self._shutdown_timeout = check.numeric_param(shutdown_timeout, "shutdown_timeout")
+        self._workers: List[ChildProcessWorker] = []
+        self._idle_workers: List[ChildProcessWorker] = []
+        self._closed = False
+
+    def __enter__(self) -> "ChildProcessWorkerPool":
+        return self
+
+    def __exit__(self, _exception_type, _exception_value, _traceback):
+        self.shutdown()
+
+    @property
+    def workers(self) -> List[ChildProcessWorker]:
+        return list(self._workers)
+
+    def acquire_worker(self) -> ChildProcessWorker:
+        """Returns an idle worker, starting a new one if there is none. The worker is returned to
+        the pool once the iterator returned by `execute_task` is exhausted."""
+        check.invariant(not self._closed, "Cannot acquire a worker from a closed pool")
+
+        while self._idle_workers:
+            worker = self._idle_workers.pop()
+            if worker.process.is_alive():
+                return worker
+            self._discard_worker(worker)
+
+        check.invariant(
+            len(self._workers) < self._max_workers,
+            f"All {self._max_workers} workers in the pool are busy",
+        )
+        worker = ChildProcessWorker(
+            self._multiprocessing_ctx,
+            self._command,
+            self._max_tasks_per_worker,
+            self._max_worker_memory_bytes,
+        )
+        self._workers.append(worker)
+        return worker
+
+    def execute_task(self, worker: ChildProcessWorker, task: Any) -> Iterator[Any]:
+        """Dispatch a task to a worker acquired from this pool.
+
+        Yields the same objects as `execute_child_process_command` for the task, and raises
+        ChildProcessCrashException if the worker dies before completing it.
+        """
+        check.invariant(worker in self._workers, "Worker does not belong to this pool")
+        try:
+            worker.task_queue.put(task)
+
+            completed_properly = False
+            while not completed_properly:
+                event = _poll_for_event(worker.process, worker.event_queue)
+
+                if event == PROCESS_DEAD_AND_QUEUE_EMPTY:
+                    break
+
+                if isinstance(event, ChildProcessWorkerRetiringEvent):
+                    worker.retiring = True
+                    continue
+
+                yield event
+
+                if isinstance(event, (ChildProcessDoneEvent, ChildProcessSystemErrorEvent)):
+                    completed_properly = True
+
+            if not completed_properly:
+                raise ChildProcessCrashException(exit_code=worker.process.exitcode)
+        finally:
+            self._release_worker(worker)
+
+    def _release_worker(self, worker: ChildProcessWorker):
+        if self._closed or worker.retiring or not worker.process.is_alive():
+            self._discard_worker(worker)
+        else:
+            self._idle_workers.append(worker)
+
+    def _discard_worker(self, worker: ChildProcessWorker):
+        if worker in self._workers:
+            self._workers.remove(worker)
+        worker.request_shutdown()
+        worker.join(self._shutdown_timeout)
+
+    def shutdown(self):
+        if self._closed:
+            return
+        self._closed = True
+
+        workers = self._workers
+        self._workers = []
+        self._idle_workers = []
+        for worker in workers:
+            worker.request_shutdown()
+        for worker in workers:
+            worker.join(self._shutdown_timeout)
@@ -1,7 +1,8 @@
 import multiprocessing
 import os
 import sys
-from typing import List, Optional
+from contextlib import contextmanager
+from typing import Iterator, List, NamedTuple, Optional
 
 from dagster import MetadataEntry
 from dagster import _check as check
@@ -13,6 +14,7 @@
 from dagster.core.events import DagsterEvent, EngineEventData
 from dagster.core.execution.api import create_execution_plan, execute_plan_iterator
 from dagster.core.execution.context.system import PlanOrchestrationContext
+from dagster.core.execution.plan.state import KnownExecutionState
 from dagster.core.execution.plan.objects import StepFailureData
 from dagster.core.execution.plan.plan import ExecutionPlan
 from dagster.core.execution.retries import RetryMode
@@ -27,6 +29,8 @@
     ChildProcessCrashException,
     ChildProcessEvent,
     ChildProcessSystemErrorEvent,
+    ChildProcessWorkerCommand,
+    ChildProcessWorkerPool,
     execute_child_process_command,
 )
 
@@ -64,6 +68,8 @@ def execute(self):
                 mode=self.pipeline_run.mode,
                 step_keys_to_execute=[self.step_key],
                 known_state=self.known_state,
+                pipeline_snapshot_id=self.pipeline_run.pipeline_snapshot_id,
+                plan_cache_dir=instance.execution_plan_cache_dir,
             )
 
             yield instance.report_engine_event(
@@ -90,6 +96,81 @@ def execute(self):
             )
 
 
+class MultiprocessExecutorWorkerTask(
+    NamedTuple(
+        "_MultiprocessExecutorWorkerTask",
+        [("step_key", str), ("known_state", Optional[KnownExecutionState])],
+    )
+):
+    pass
+
+
+class MultiprocessExecutorWorkerCommand(ChildProcessWorkerCommand):
+    """Executes steps of a single run in a long-lived worker process.
+
+    The pipeline definition is loaded and the instance is opened once per worker. Each step is
+    still executed as its own single-step plan, so resources are initialized for every step.
+    """
+
+    def __init__(
+        self,
+        run_config,
+        pipeline_run,
+        instance_ref,
+        recon_pipeline,
+        retry_mode,
+    ):
+        self.run_config = run_config
+        self.pipeline_run = pipeline_run
+        self.instance_ref = instance_ref
+        self.recon_pipeline = recon_pipeline
+        self.retry_mode = retry_mode
+
+    @contextmanager
+    def worker_scope(self) -> Iterator[DagsterInstance]:
+        with DagsterInstance.from_ref(self.instance_ref) as instance:
+            # load the pipeline definition up front, it is cached for subsequent steps
+            self.recon_pipeline.get_definition()
+            yield instance
+
+    def execute_task(self, worker_state, task):
+        instance = check.inst_param(worker_state, "worker_state", DagsterInstance)
+        task = check.inst_param(task, "task", MultiprocessExecutorWorkerTask)
+
+        execution_plan = create_execution_plan(
+            pipeline=self.recon_pipeline,
+            run_config=self.run_config,
+            mode=self.pipeline_run.mode,
+            step_keys_to_execute=[task.step_key],
+            known_state=task.known_state,
+            pipeline_snapshot_id=self.pipeline_run.pipeline_snapshot_id,
+            plan_cache_dir=instance.execution_plan_cache_dir,
+        )
+
+        yield instance.report_engine_event(
+            "Executing step {} in worker process".format(task.step_key),
+            self.pipeline_run,
+            EngineEventData(
+                [
+                    MetadataEntry("pid", value=str(os.getpid())),
+                    MetadataEntry("step_key", value=task.step_key),
+                ],
+                marker_end=DELEGATE_MARKER,
+            ),
+            MultiprocessExecutor,
+            task.step_key,
+        )
+
+        yield from execute_plan_iterator(
+            execution_plan,
+            self.recon_pipeline,
+            self.pipeline_run,
+            run_config=self.run_config,
+            retry_mode=self.retry_mode.for_inner_plan(),
+            instance=instance,
+        )
+
+
 class MultiprocessExecutor(Executor):
     def __init__(
         self,
@@ -97,6 +178,9 @@ def __init__(
         max_concurrent: int,
         start_method: Optional[str] = None,
         explicit_forkserver_preload: Optional[List[str]] = None,
+        use_worker_pool: bool = False,
+        max_steps_per_worker: Optional[int] = None,
+        max_worker_memory_mb: Optional[int] = None,
     ):
         self._retries = check.inst_param(retries, "retries", RetryMode)
         max_concurrent = max_concurrent if max_concurrent else multiprocessing.cpu_count()
@@ -114,11 +198,44 @@ def __init__(
             )
         self._start_method = start_method
         self._explicit_forkserver_preload = explicit_forkserver_preload
+        self._use_worker_pool = check.bool_param(use_worker_pool, "use_worker_pool")
+        self._max_steps_per_worker = check.opt_int_param(
+            max_steps_per_worker, "max_steps_per_worker"
+        )
+        self._max_worker_memory_mb = check.opt_int_param(
+            max_worker_memory_mb, "max_worker_memory_mb"
+        )
 
     @property
     def retries(self):
         return self._retries
 
+    @contextmanager
+    def _worker_pool_scope(
+        self, multiproc_ctx, plan_context: PlanOrchestrationContext
+    ) -> Iterator[Optional[ChildProcessWorkerPool]]:
+        if not self._use_worker_pool:
+            yield None
+            return
+
+        command = MultiprocessExecutorWorkerCommand(
+            run_config=plan_context.run_config,
+            pipeline_run=plan_context.pipeline_run,
+            instance_ref=plan_context.instance.get_ref(),
+            recon_pipeline=plan_context.reconstructable_pipeline,
+            retry_mode=self.retries,
+        )
+        with ChildProcessWorkerPool(
+            multiproc_ctx,
+            command,
+            max_workers=self._max_concurrent,
+            max_tasks_per_worker=self._max_steps_per_worker,
+            max_worker_memory_bytes=self._max_worker_memory_mb * 1024 * 1024
+            if self._max_worker_memory_mb
+            else None,
+        ) as worker_pool:
+            yield worker_pool
+
     def execute(self, plan_context, execution_plan):
         check.inst_param(plan_context, "plan_context", PlanOrchestrationContext)
         check.inst_param(execution_plan, "execution_plan", ExecutionPlan)
@@ -161,7 +278,9 @@ def execute(self, plan_context, execution_plan):
         # It would be good to implement a reference tracking algorithm here so we could
         # garbage collect results that are no longer needed by any steps
         # https://github.com/dagster-io/dagster/issues/811
-        with time_execution_scope() as timer_result:
+        with time_execution_scope() as timer_result, self._worker_pool_scope(
+            multiproc_ctx, plan_context
+        ) as worker_pool:
             with execution_plan.start(retry_mode=self.retries) as active_execution:
                 active_iters = {}
                 errors = {}
@@ -192,17 +311,29 @@ def execute(self, plan_context, execution_plan):
 
                         for step in steps:
                             step_context = plan_context.for_step(step)
-                            term_events[step.key] = multiproc_ctx.Event()
-                            active_iters[step.key] = execute_step_out_of_process(
-                                multiproc_ctx,
-                                pipeline,
-                                step_context,
-                                step,
-                                errors,
-                                term_events,
-                                self.retries,
-                                active_execution.get_known_state(),
-                            )
+                            if worker_pool:
+                                worker = worker_pool.acquire_worker()
+                                term_events[step.key] = worker.term_event
+                                active_iters[step.key] = execute_step_in_worker(
+                                    worker_pool,
+                                    worker,
+                                    step_context,
+                                    step,
+                                    errors,
+                                    active_execution.get_known_state(),
+                                )
+                            else:
+                                term_events[step.key] = multiproc_ctx.Event()
+                                active_iters[step.key] = execute_step_out_of_process(
+                                    multiproc_ctx,
+                                    pipeline,
+                                    step_context,
+                                    step,
+                                    errors,
+                                    term_events,
+                                    self.retries,
+                                    active_execution.get_known_state(),
+                                )
 
                     # process active iterators
                     empty_iters = []
@@ -329,3 +460,29 @@ def execute_step_out_of_process(
                 errors[ret.pid] = ret.error_info
         else:
             check.failed("Unexpected return value from child process {}".format(type(ret)))
+
+
+def execute_step_in_worker(
+    worker_pool,
+    worker,
+    step_context,
+    step,
+    errors,
+    known_state,
+):
+    yield DagsterEvent.engine_event(
+        step_context,
+        "Dispatching {} to worker process (pid: {})".format(step.key, worker.pid),
+        EngineEventData(marker_start=DELEGATE_MARKER),
+        step_handle=step.handle,
+    )
+
+    task = MultiprocessExecutorWorkerTask(step_key=step.key, known_state=known_state)
+    for ret in worker_pool.execute_task(worker, task):
+        if ret is None or isinstance(ret, DagsterEvent):
+            yield ret
+        elif isinstance(ret, ChildProcessEvent):
+            if isinstance(ret, ChildProcessSystemErrorEvent):
+                errors[ret.pid] = ret.error_info
+        else:
+            check.failed("Unexpected return value from worker process {}".format(type(ret)))
@@ -1,5 +1,6 @@
+import logging
 import os
-import time
+import threading
 from typing import Dict, List, Optional, cast
 
 import pendulum
@@ -60,12 +61,37 @@ def retries(self):
         return self._retries
 
     def _pop_events(self, instance, run_id) -> List[DagsterEvent]:
-        events = instance.logs_after(run_id, self._event_cursor, of_type=set(DagsterEventType))
-        self._event_cursor += len(events)
-        dagster_events = [event.dagster_event for event in events]
+        # The cursor returned by the storage is a storage id cursor for SQL storages, so that each
+        # poll only reads the new events instead of skipping past all of the earlier ones.
+        connection = instance.get_records_for_run(
+            run_id, self._event_cursor, of_type=set(DagsterEventType)
+        )
+        self._event_cursor = connection.cursor
+        dagster_events = [record.event_log_entry.dagster_event for record in connection.records]
         check.invariant(None not in dagster_events, "Query should not return a non dagster event")
         return dagster_events
 
+    def _watch_for_new_events(self, instance, run_id, new_events: threading.Event):
+        """Watch the event log of the run, so that the executor wakes up as soon as a new event
+        is stored instead of sleeping for the rest of its poll interval. Returns the watch
+        callback, or None if the event log storage can not be watched.
+        """
+
+        def _on_new_event(_event, _cursor):
+            new_events.set()
+
+        try:
+            instance.watch_event_logs(run_id, self._event_cursor, _on_new_event)
+        except Exception:
+            logging.getLogger("dagster").warning(
+                "Could not watch the event log of run %s, polling for new events instead.",
+                run_id,
+                exc_info=True,
+            )
+            return None
+
+        return _on_new_event
+
     def _get_step_handler_context(
         self, plan_context, steps, active_execution
     ) -> StepHandlerContext:
@@ -97,7 +123,7 @@ def execute(self, plan_context: PlanOrchestrationContext, execution_plan: Execut
         check.inst_param(plan_context, "plan_context", PlanOrchestrationContext)
         check.inst_param(execution_plan, "execution_plan", ExecutionPlan)
 
-        self._event_cursor = -1  # pylint: disable=attribute-defined-outside-init
+        self._event_cursor: Optional[str] = None  # pylint: disable=attribute-defined-outside-init
 
         yield DagsterEvent.engine_event(
             plan_context,
@@ -150,81 +176,37 @@ def execute(self, plan_context: PlanOrchestrationContext, execution_plan: Execut
 
                     running_steps[step.key] = step
 
-            last_check_step_health_time = pendulum.now("UTC")
-
-            # Order of events is important here. During an interation, we call handle_event, then get_steps_to_execute,
-            # then is_complete. get_steps_to_execute updates the state of ActiveExecution, and without it
-            # is_complete can return true when we're just between steps.
-            while not active_execution.is_complete:
-
-                if active_execution.check_for_interrupts():
-                    if not plan_context.instance.run_will_resume(plan_context.run_id):
-                        yield DagsterEvent.engine_event(
-                            plan_context,
-                            "Executor received termination signal, forwarding to steps",
-                            EngineEventData.interrupted(list(running_steps.keys())),
-                        )
-                        active_execution.mark_interrupted()
-                        for _, step in running_steps.items():
-                            self._log_new_events(
-                                self._step_handler.terminate_step(
-                                    self._get_step_handler_context(
-                                        plan_context, [step], active_execution
-                                    )
-                                ),
-                                plan_context,
-                                running_steps,
-                            )
-
-                    else:
-                        yield DagsterEvent.engine_event(
-                            plan_context,
-                            "Executor received termination signal, not forwarding to steps because "
-                            "run will be resumed",
-                            EngineEventData(
-                                metadata_entries=[
-                                    MetadataEntry(
-                                        "steps_in_flight", value=str(running_steps.keys())
-                                    )
-                                ]
-                            ),
-                        )
-                        active_execution.mark_interrupted()
-
-                    return
-
-                for dagster_event in self._pop_events(
-                    plan_context.instance,
-                    plan_context.run_id,
-                ):  # type: ignore
-
-                    # STEP_SKIPPED events are only emitted by ActiveExecution, which already handles
-                    # and yields them.
-                    if dagster_event.is_step_skipped:
-                        assert isinstance(dagster_event.step_key, str)
-                        active_execution.verify_complete(plan_context, dagster_event.step_key)
-
-                    else:
-                        yield dagster_event
-                        active_execution.handle_event(dagster_event)
+            new_events = threading.Event()
+            watch_callback = self._watch_for_new_events(
+                plan_context.instance, plan_context.run_id, new_events
+            )
+            try:
+                yield from self._execute_steps(
+                    plan_context, active_execution, running_steps, new_events
+                )
+            finally:
+                if watch_callback:
+                    plan_context.instance.end_watch_event_logs(plan_context.run_id, watch_callback)
 
-                        if dagster_event.is_step_success or dagster_event.is_step_failure:
-                            assert isinstance(dagster_event.step_key, str)
-                            del running_steps[dagster_event.step_key]
-                            active_execution.verify_complete(plan_context, dagster_event.step_key)
+    def _execute_steps(self, plan_context, active_execution, running_steps, new_events):
+        last_check_step_health_time = pendulum.now("UTC")
 
-                # process skips from failures or uncovered inputs
-                for event in active_execution.plan_events_iterator(plan_context):
-                    yield event
+        # Order of events is important here. During an interation, we call handle_event, then get_steps_to_execute,
+        # then is_complete. get_steps_to_execute updates the state of ActiveExecution, and without it
+        # is_complete can return true when we're just between steps.
+        while not active_execution.is_complete:
 
-                curr_time = pendulum.now("UTC")
-                if (
-                    curr_time - last_check_step_health_time
-                ).total_seconds() >= self._check_step_health_interval_seconds:
-                    last_check_step_health_time = curr_time
+            if active_execution.check_for_interrupts():
+                if not plan_context.instance.run_will_resume(plan_context.run_id):
+                    yield DagsterEvent.engine_event(
+                        plan_context,
+                        "Executor received termination signal, forwarding to steps",
+                        EngineEventData.interrupted(list(running_steps.keys())),
+                    )
+                    active_execution.mark_interrupted()
                     for _, step in running_steps.items():
                         self._log_new_events(
-                            self._step_handler.check_step_health(
+                            self._step_handler.terminate_step(
                                 self._get_step_handler_context(
                                     plan_context, [step], active_execution
                                 )
@@ -233,22 +215,79 @@ def execute(self, plan_context: PlanOrchestrationContext, execution_plan: Execut
                             running_steps,
                         )
 
-                if self._max_concurrent is not None:
-                    max_steps_to_run = self._max_concurrent - len(running_steps)
-                    check.invariant(
-                        max_steps_to_run >= 0, "More steps are active than max_concurrent"
+                else:
+                    yield DagsterEvent.engine_event(
+                        plan_context,
+                        "Executor received termination signal, not forwarding to steps because "
+                        "run will be resumed",
+                        EngineEventData(
+                            metadata_entries=[
+                                MetadataEntry("steps_in_flight", value=str(running_steps.keys()))
+                            ]
+                        ),
                     )
+                    active_execution.mark_interrupted()
+
+                return
+
+            for dagster_event in self._pop_events(
+                plan_context.instance,
+                plan_context.run_id,
+            ):  # type: ignore
+
+                # STEP_SKIPPED events are only emitted by ActiveExecution, which already handles
+                # and yields them.
+                if dagster_event.is_step_skipped:
+                    assert isinstance(dagster_event.step_key, str)
+                    active_execution.verify_complete(plan_context, dagster_event.step_key)
+
                 else:
-                    max_steps_to_run = None  # disables limit
+                    yield dagster_event
+                    active_execution.handle_event(dagster_event)
 
-                for step in active_execution.get_steps_to_execute(max_steps_to_run):
-                    running_steps[step.key] = step
+                    if dagster_event.is_step_success or dagster_event.is_step_failure:
+                        assert isinstance(dagster_event.step_key, str)
+                        del running_steps[dagster_event.step_key]
+                        active_execution.verify_complete(plan_context, dagster_event.step_key)
+
+            # process skips from failures or uncovered inputs
+            for event in active_execution.plan_events_iterator(plan_context):
+                yield event
+
+            curr_time = pendulum.now("UTC")
+            if (
+                curr_time - last_check_step_health_time
+            ).total_seconds() >= self._check_step_health_interval_seconds:
+                last_check_step_health_time = curr_time
+                for _, step in running_steps.items():
                     self._log_new_events(
-                        self._step_handler.launch_step(
+                        self._step_handler.check_step_health(
                             self._get_step_handler_context(plan_context, [step], active_execution)
                         ),
                         plan_context,
                         running_steps,
                     )
 
-                time.sleep(self._sleep_seconds)
+            if self._max_concurrent is not None:
+                max_steps_to_run = self._max_concurrent - len(running_steps)
+                check.invariant(max_steps_to_run >= 0, "More steps are active than max_concurrent")
+            else:
+                max_steps_to_run = None  # disables limit
+
+            for step in active_execution.get_steps_to_execute(max_steps_to_run):
+                running_steps[step.key] = step
+                self._log_new_events(
+                    self._step_handler.launch_step(
+                        self._get_step_handler_context(plan_context, [step], active_execution)
+                    ),
+                    plan_context,
+                    running_steps,
+                )
+
+            # wait until new events are stored, or for at most sleep_seconds, since steps may also
+            # be ready to launch or in need of a health check without any new events. The events
+            # that completed the execution may have been popped after the watch signaled them, so
+            # there is nothing left to wait for once it is complete.
+            if not active_execution.is_complete:
+                new_events.wait(self._sleep_seconds)
+                new_events.clear()
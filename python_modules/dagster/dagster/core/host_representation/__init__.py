@@ -24,6 +24,7 @@
     ExternalPartitionSetExecutionParamData,
     ExternalPartitionTagsData,
     ExternalPipelineData,
+    ExternalPipelineRef,
     ExternalPipelineSubsetResult,
     ExternalPresetData,
     ExternalRepositoryData,
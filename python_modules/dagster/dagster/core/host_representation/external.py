@@ -1,6 +1,7 @@
+import threading
 import warnings
 from collections import OrderedDict
-from typing import TYPE_CHECKING, List, Optional, Sequence, Union
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional, Sequence, Tuple, Union
 
 import dagster._check as check
 from dagster.core.definitions.events import AssetKey
@@ -21,6 +22,7 @@
     ExternalAssetNode,
     ExternalPartitionSetData,
     ExternalPipelineData,
+    ExternalPipelineRef,
     ExternalRepositoryData,
     ExternalScheduleData,
     ExternalSensorData,
@@ -33,6 +35,20 @@
 if TYPE_CHECKING:
     from dagster.core.scheduler.instigation import InstigatorState
 
+DEFAULT_MAX_CACHED_PIPELINES = 64
+
+
+def _data_and_index(
+    external_pipeline_data: ExternalPipelineData,
+) -> Tuple[ExternalPipelineData, PipelineIndex]:
+    return (
+        external_pipeline_data,
+        PipelineIndex(
+            external_pipeline_data.pipeline_snapshot,
+            external_pipeline_data.parent_pipeline_snapshot,
+        ),
+    )
+
 
 class ExternalRepository:
     """
@@ -42,22 +58,56 @@ class ExternalRepository:
     """
 
     def __init__(
-        self, external_repository_data: ExternalRepositoryData, repository_handle: RepositoryHandle
+        self,
+        external_repository_data: ExternalRepositoryData,
+        repository_handle: RepositoryHandle,
+        ref_to_data_fn: Optional[Callable[[ExternalPipelineRef], ExternalPipelineData]] = None,
+        max_cached_pipelines: int = DEFAULT_MAX_CACHED_PIPELINES,
+        all_pipeline_datas_fn: Optional[Callable[[], Sequence[ExternalPipelineData]]] = None,
     ):
         self.external_repository_data = check.inst_param(
             external_repository_data, "external_repository_data", ExternalRepositoryData
         )
+
+        # If the repository data only has refs to its pipelines, the data of each pipeline is
+        # loaded with ref_to_data_fn on first access and kept in a size-bounded LRU. When every
+        # pipeline is needed and they all fit in the LRU, all of them are loaded at once with
+        # all_pipeline_datas_fn instead.
+        self._ref_to_data_fn = check.opt_callable_param(ref_to_data_fn, "ref_to_data_fn")
+        self._all_pipeline_datas_fn = check.opt_callable_param(
+            all_pipeline_datas_fn, "all_pipeline_datas_fn"
+        )
+        self._max_cached_pipelines = check.int_param(max_cached_pipelines, "max_cached_pipelines")
         self._pipeline_index_map = OrderedDict()
-        self._job_index_map = OrderedDict()
-        for external_pipeline_data in external_repository_data.external_pipeline_datas:
-            key = external_pipeline_data.pipeline_snapshot.name
-            index = PipelineIndex(
-                external_pipeline_data.pipeline_snapshot,
-                external_pipeline_data.parent_pipeline_snapshot,
+        self._pipeline_ref_map = OrderedDict()
+        self._job_names = set()
+
+        if external_repository_data.external_pipeline_refs is not None:
+            check.invariant(
+                self._ref_to_data_fn is not None,
+                "ref_to_data_fn is required for repository data with external pipeline refs",
             )
-            self._pipeline_index_map[key] = index
-            if external_pipeline_data.is_job:
-                self._job_index_map[key] = index
+            for external_pipeline_ref in external_repository_data.external_pipeline_refs:
+                self._pipeline_ref_map[external_pipeline_ref.name] = external_pipeline_ref
+                if external_pipeline_ref.is_job:
+                    self._job_names.add(external_pipeline_ref.name)
+        else:
+            for external_pipeline_data in external_repository_data.external_pipeline_datas:
+                key = external_pipeline_data.pipeline_snapshot.name
+                self._pipeline_index_map[key] = PipelineIndex(
+                    external_pipeline_data.pipeline_snapshot,
+                    external_pipeline_data.parent_pipeline_snapshot,
+                )
+                if external_pipeline_data.is_job:
+                    self._job_names.add(key)
+
+        self._pipeline_names = list(self._pipeline_ref_map or self._pipeline_index_map)
+
+        # pylint: disable=unsubscriptable-object
+        self._loaded_pipelines: OrderedDict[
+            str, Tuple[ExternalPipelineData, PipelineIndex]
+        ] = OrderedDict()
+        self._loaded_pipelines_lock = threading.Lock()
 
         self._handle = check.inst_param(repository_handle, "repository_handle", RepositoryHandle)
 
@@ -89,17 +139,67 @@ def __init__(
     def name(self):
         return self.external_repository_data.name
 
+    def _get_external_pipeline_data_and_index(
+        self, pipeline_name: str, load_all: bool = False
+    ) -> Tuple[ExternalPipelineData, PipelineIndex]:
+        if not self._pipeline_ref_map:
+            return (
+                self.external_repository_data.get_external_pipeline_data(pipeline_name),
+                self._pipeline_index_map[pipeline_name],
+            )
+
+        with self._loaded_pipelines_lock:
+            if pipeline_name in self._loaded_pipelines:
+                self._loaded_pipelines.move_to_end(pipeline_name)
+                return self._loaded_pipelines[pipeline_name]
+
+        # a bulk load is only worth it if the LRU can keep every pipeline it loads, otherwise the
+        # pipelines evicted by it would be loaded again one by one
+        if (
+            load_all
+            and self._all_pipeline_datas_fn
+            and len(self._pipeline_names) <= self._max_cached_pipelines
+        ):
+            return self._load_all_pipelines()[pipeline_name]
+
+        loaded_pipeline = _data_and_index(
+            self._ref_to_data_fn(self._pipeline_ref_map[pipeline_name])  # type: ignore
+        )
+        self._cache_loaded_pipelines({pipeline_name: loaded_pipeline})
+        return loaded_pipeline
+
+    def _load_all_pipelines(self) -> Dict[str, Tuple[ExternalPipelineData, PipelineIndex]]:
+        all_loaded_pipelines = {
+            external_pipeline_data.name: _data_and_index(external_pipeline_data)
+            for external_pipeline_data in self._all_pipeline_datas_fn()  # type: ignore
+        }
+        self._cache_loaded_pipelines(all_loaded_pipelines)
+        return all_loaded_pipelines
+
+    def _cache_loaded_pipelines(
+        self, loaded_pipelines: Dict[str, Tuple[ExternalPipelineData, PipelineIndex]]
+    ):
+        with self._loaded_pipelines_lock:
+            for pipeline_name, loaded_pipeline in loaded_pipelines.items():
+                self._loaded_pipelines[pipeline_name] = loaded_pipeline
+                self._loaded_pipelines.move_to_end(pipeline_name)
+            while len(self._loaded_pipelines) > self._max_cached_pipelines:
+                self._loaded_pipelines.popitem(last=False)
+
     def get_pipeline_index(self, pipeline_name):
-        return self._pipeline_index_map[pipeline_name]
+        return self._get_external_pipeline_data_and_index(pipeline_name)[1]
 
     def has_pipeline(self, pipeline_name):
-        return pipeline_name in self._pipeline_index_map
+        return pipeline_name in self._pipeline_index_map or pipeline_name in self._pipeline_ref_map
 
     def get_pipeline_indices(self):
-        return self._pipeline_index_map.values()
+        return [
+            self._get_external_pipeline_data_and_index(pipeline_name, load_all=True)[1]
+            for pipeline_name in self._pipeline_names
+        ]
 
     def has_external_pipeline(self, pipeline_name):
-        return pipeline_name in self._pipeline_index_map
+        return self.has_pipeline(pipeline_name)
 
     def get_external_schedule(self, schedule_name):
         return ExternalSchedule(
@@ -144,19 +244,36 @@ def get_external_partition_sets(self):
             for external_partition_set_data in self.external_repository_data.external_partition_set_datas
         ]
 
-    def get_full_external_pipeline(self, pipeline_name: str) -> "ExternalPipeline":
-        check.str_param(pipeline_name, "pipeline_name")
+    def _get_external_pipeline(
+        self, pipeline_name: str, load_all: bool = False
+    ) -> "ExternalPipeline":
+        # Pipelines listed together are likely to all be used, so loading the data of any of them
+        # loads the data of every pipeline in one request rather than one request per pipeline
+        if pipeline_name in self._pipeline_ref_map:
+            return ExternalPipeline(
+                external_pipeline_data=None,
+                repository_handle=self.handle,
+                external_pipeline_ref=self._pipeline_ref_map[pipeline_name],
+                ref_to_data_and_index_fn=lambda ref: self._get_external_pipeline_data_and_index(
+                    ref.name, load_all
+                ),
+            )
+
         return ExternalPipeline(
             self.external_repository_data.get_external_pipeline_data(pipeline_name),
             repository_handle=self.handle,
             pipeline_index=self.get_pipeline_index(pipeline_name),
         )
 
+    def get_full_external_pipeline(self, pipeline_name: str) -> "ExternalPipeline":
+        check.str_param(pipeline_name, "pipeline_name")
+        return self._get_external_pipeline(pipeline_name)
+
     def get_all_external_pipelines(self):
-        return [self.get_full_external_pipeline(pn) for pn in self._pipeline_index_map]
+        return [self._get_external_pipeline(pn, load_all=True) for pn in self._pipeline_names]
 
     def has_external_job(self, job_name):
-        return job_name in self._job_index_map
+        return job_name in self._job_names
 
     def get_external_job(self, job_name) -> "ExternalPipeline":
         check.str_param(job_name, "job_name")
@@ -164,14 +281,14 @@ def get_external_job(self, job_name) -> "ExternalPipeline":
         if not self.has_external_job(job_name):
             check.failed(f"Could not find job data for {job_name}")
 
-        return ExternalPipeline(
-            self.external_repository_data.get_external_pipeline_data(job_name),
-            repository_handle=self.handle,
-            pipeline_index=self.get_pipeline_index(job_name),
-        )
+        return self._get_external_pipeline(job_name)
 
     def get_external_jobs(self) -> List["ExternalPipeline"]:
-        return [self.get_external_job(pn) for pn in self._job_index_map]
+        return [
+            self._get_external_pipeline(pn, load_all=True)
+            for pn in self._pipeline_names
+            if pn in self._job_names
+        ]
 
     @property
     def handle(self):
@@ -222,29 +339,80 @@ class ExternalPipeline(RepresentedPipeline):
     objects such as these to interact with user-defined artifacts.
     """
 
-    def __init__(self, external_pipeline_data, repository_handle, pipeline_index=None):
+    def __init__(
+        self,
+        external_pipeline_data: Optional[ExternalPipelineData],
+        repository_handle: RepositoryHandle,
+        pipeline_index: Optional[PipelineIndex] = None,
+        external_pipeline_ref: Optional[ExternalPipelineRef] = None,
+        ref_to_data_and_index_fn: Optional[
+            Callable[[ExternalPipelineRef], Tuple[ExternalPipelineData, PipelineIndex]]
+        ] = None,
+    ):
         check.inst_param(repository_handle, "repository_handle", RepositoryHandle)
-        check.inst_param(external_pipeline_data, "external_pipeline_data", ExternalPipelineData)
+        check.opt_inst_param(external_pipeline_data, "external_pipeline_data", ExternalPipelineData)
         check.opt_inst_param(pipeline_index, "pipeline_index", PipelineIndex)
+        check.opt_inst_param(external_pipeline_ref, "external_pipeline_ref", ExternalPipelineRef)
+        check.opt_callable_param(ref_to_data_and_index_fn, "ref_to_data_and_index_fn")
 
-        if pipeline_index is None:
-            pipeline_index = PipelineIndex(
-                external_pipeline_data.pipeline_snapshot,
-                external_pipeline_data.parent_pipeline_snapshot,
+        # The pipeline is either built from its data, or from a ref to it, in which case only the
+        # fields of the ref are available until the rest of its data is loaded on first access
+        if external_pipeline_data is not None:
+            self._name = external_pipeline_data.name
+        else:
+            check.invariant(
+                external_pipeline_ref is not None and ref_to_data_and_index_fn is not None,
+                "external_pipeline_ref and ref_to_data_and_index_fn are required when "
+                "external_pipeline_data is not provided",
             )
+            self._name = external_pipeline_ref.name  # type: ignore
 
         super(ExternalPipeline, self).__init__(pipeline_index=pipeline_index)
-        self._external_pipeline_data = external_pipeline_data
+        self._data = external_pipeline_data
+        self._external_pipeline_ref = external_pipeline_ref
+        self._ref_to_data_and_index_fn = ref_to_data_and_index_fn
+        self._active_preset_dict_cache = None
         self._repository_handle = repository_handle
-        self._active_preset_dict = {ap.name: ap for ap in external_pipeline_data.active_presets}
-        self._handle = PipelineHandle(self._pipeline_index.name, repository_handle)
+        self._handle = PipelineHandle(self._name, repository_handle)
+
+    def _load(self):
+        self._data, self._index = self._ref_to_data_and_index_fn(  # type: ignore
+            self._external_pipeline_ref
+        )
+
+    @property
+    def _external_pipeline_data(self) -> ExternalPipelineData:
+        if self._data is None:
+            self._load()
+        return self._data  # type: ignore
+
+    @property
+    def _pipeline_index(self) -> PipelineIndex:
+        if self._index is None:
+            if self._data is None:
+                self._load()
+            else:
+                self._index = PipelineIndex(
+                    self._data.pipeline_snapshot, self._data.parent_pipeline_snapshot
+                )
+        return self._index  # type: ignore
+
+    @property
+    def _active_preset_dict(self):
+        if self._active_preset_dict_cache is None:
+            self._active_preset_dict_cache = {
+                ap.name: ap for ap in self._external_pipeline_data.active_presets
+            }
+        return self._active_preset_dict_cache
 
     @property
     def name(self):
-        return self._pipeline_index.pipeline_snapshot.name
+        return self._name
 
     @property
     def description(self):
+        if self._data is None:
+            return self._external_pipeline_ref.description  # type: ignore
         return self._pipeline_index.pipeline_snapshot.description
 
     @property
@@ -322,6 +490,8 @@ def get_default_mode_name(self) -> str:
 
     @property
     def tags(self):
+        if self._data is None:
+            return self._external_pipeline_ref.tags  # type: ignore
         return self._pipeline_index.pipeline_snapshot.tags
 
     @property
@@ -330,11 +500,13 @@ def metadata(self):
 
     @property
     def computed_pipeline_snapshot_id(self):
+        if self._data is None:
+            return self._external_pipeline_ref.snapshot_id  # type: ignore
         return self._pipeline_index.pipeline_snapshot_id
 
     @property
     def identifying_pipeline_snapshot_id(self):
-        return self._pipeline_index.pipeline_snapshot_id
+        return self.computed_pipeline_snapshot_id
 
     @property
     def handle(self):
@@ -366,7 +538,9 @@ def pipeline_snapshot(self):
 
     @property
     def is_job(self):
-        return self._external_pipeline_data.is_job
+        if self._data is None:
+            return self._external_pipeline_ref.is_job  # type: ignore
+        return self._data.is_job
 
 
 class ExternalExecutionPlan:
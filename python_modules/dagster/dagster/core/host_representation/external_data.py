@@ -36,7 +36,7 @@
 from dagster.core.definitions.time_window_partitions import TimeWindowPartitionsDefinition
 from dagster.core.definitions.utils import DEFAULT_GROUP_NAME
 from dagster.core.errors import DagsterInvalidDefinitionError
-from dagster.core.snap import PipelineSnapshot
+from dagster.core.snap import PipelineSnapshot, create_pipeline_snapshot_id
 from dagster.serdes import DefaultNamedTupleSerializer, whitelist_for_serdes
 from dagster.utils.error import SerializableErrorInfo
 
@@ -52,6 +52,7 @@ class ExternalRepositoryData(
             ("external_partition_set_datas", Sequence["ExternalPartitionSetData"]),
             ("external_sensor_datas", Sequence["ExternalSensorData"]),
             ("external_asset_graph_data", Sequence["ExternalAssetNode"]),
+            ("external_pipeline_refs", Optional[Sequence["ExternalPipelineRef"]]),
         ],
     )
 ):
@@ -63,6 +64,7 @@ def __new__(
         external_partition_set_datas: Sequence["ExternalPartitionSetData"],
         external_sensor_datas: Optional[Sequence["ExternalSensorData"]] = None,
         external_asset_graph_data: Optional[Sequence["ExternalAssetNode"]] = None,
+        external_pipeline_refs: Optional[Sequence["ExternalPipelineRef"]] = None,
     ):
         return super(ExternalRepositoryData, cls).__new__(
             cls,
@@ -88,6 +90,11 @@ def __new__(
                 "external_asset_graph_dats",
                 of_type=ExternalAssetNode,
             ),
+            # When set, external_pipeline_datas is empty and the data of each pipeline is loaded
+            # on demand
+            external_pipeline_refs=check.opt_nullable_sequence_param(
+                external_pipeline_refs, "external_pipeline_refs", of_type=ExternalPipelineRef
+            ),
         )
 
     def get_pipeline_snapshot(self, name):
@@ -200,6 +207,41 @@ def __new__(
         )
 
 
+@whitelist_for_serdes
+class ExternalPipelineRef(
+    NamedTuple(
+        "_ExternalPipelineRef",
+        [
+            ("name", str),
+            ("snapshot_id", str),
+            ("is_job", bool),
+            ("description", Optional[str]),
+            ("tags", Mapping[str, object]),
+        ],
+    )
+):
+    """The parts of an ExternalPipelineData that are needed without loading the full pipeline
+    snapshot, e.g. to list the pipelines of a repository.
+    """
+
+    def __new__(
+        cls,
+        name: str,
+        snapshot_id: str,
+        is_job: bool,
+        description: Optional[str],
+        tags: Mapping[str, object],
+    ):
+        return super(ExternalPipelineRef, cls).__new__(
+            cls,
+            name=check.str_param(name, "name"),
+            snapshot_id=check.str_param(snapshot_id, "snapshot_id"),
+            is_job=check.bool_param(is_job, "is_job"),
+            description=check.opt_str_param(description, "description"),
+            tags=check.mapping_param(tags, "tags", key_type=str),
+        )
+
+
 @whitelist_for_serdes
 class ExternalPresetData(
     NamedTuple(
@@ -943,6 +985,18 @@ def external_pipeline_data_from_def(pipeline_def: PipelineDefinition) -> Externa
     )
 
 
+def external_pipeline_ref_from_data(external_pipeline_data: ExternalPipelineData):
+    check.inst_param(external_pipeline_data, "external_pipeline_data", ExternalPipelineData)
+    pipeline_snapshot = external_pipeline_data.pipeline_snapshot
+    return ExternalPipelineRef(
+        name=external_pipeline_data.name,
+        snapshot_id=create_pipeline_snapshot_id(pipeline_snapshot),
+        is_job=external_pipeline_data.is_job,
+        description=pipeline_snapshot.description,
+        tags=pipeline_snapshot.tags,
+    )
+
+
 def external_schedule_data_from_def(schedule_def: ScheduleDefinition) -> ExternalScheduleData:
     check.inst_param(schedule_def, "schedule_def", ScheduleDefinition)
     return ExternalScheduleData(
@@ -269,6 +269,8 @@ def create_single_location(
                 heartbeat=True,
                 watch_server=False,
                 grpc_server_registry=grpc_server_registry,
+                lazy_load_pipelines=instance.code_server_lazy_load_pipelines,
+                max_cached_pipelines=instance.code_server_max_cached_pipelines,
             ) as location:
                 yield location
 
@@ -2,7 +2,18 @@
 import threading
 from abc import abstractmethod
 from contextlib import AbstractContextManager
-from typing import TYPE_CHECKING, Any, Dict, List, Mapping, Optional, Union, cast
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Union,
+    cast,
+)
 
 import dagster._check as check
 from dagster.api.get_server_id import sync_get_server_id
@@ -16,23 +27,30 @@
     sync_get_external_partition_tags_grpc,
 )
 from dagster.api.snapshot_pipeline import sync_get_external_pipeline_subset_grpc
-from dagster.api.snapshot_repository import sync_get_streaming_external_repositories_data_grpc
+from dagster.api.snapshot_repository import (
+    sync_get_external_pipeline_datas_grpc,
+    sync_get_streaming_external_repositories_data_grpc,
+)
 from dagster.api.snapshot_schedule import sync_get_external_schedule_execution_data_grpc
 from dagster.api.snapshot_sensor import sync_get_external_sensor_execution_data_grpc
 from dagster.core.code_pointer import CodePointer
 from dagster.core.definitions.reconstruct import ReconstructablePipeline
-from dagster.core.errors import DagsterInvariantViolationError
+from dagster.core.errors import DagsterInvariantViolationError, DagsterUserCodeProcessError
 from dagster.core.execution.api import create_execution_plan
 from dagster.core.execution.plan.state import KnownExecutionState
 from dagster.core.host_representation import ExternalPipelineSubsetResult
 from dagster.core.host_representation.external import (
+    DEFAULT_MAX_CACHED_PIPELINES,
     ExternalExecutionPlan,
     ExternalPipeline,
     ExternalRepository,
 )
+from dagster.core.host_representation.external_data import ExternalPipelineData, ExternalPipelineRef
 from dagster.core.host_representation.grpc_server_registry import GrpcServerRegistry
 from dagster.core.host_representation.handle import PipelineHandle, RepositoryHandle
 from dagster.core.host_representation.origin import (
+    ExternalPipelineOrigin,
+    ExternalRepositoryOrigin,
     GrpcServerRepositoryLocationOrigin,
     InProcessRepositoryLocationOrigin,
     RepositoryLocationOrigin,
@@ -192,6 +210,7 @@ def get_external_sensor_execution_data(
         last_completion_time: Optional[float],
         last_run_key: Optional[str],
         cursor: Optional[str],
+        timeout: Optional[int] = None,
     ) -> Union["SensorExecutionData", "ExternalSensorExecutionErrorData"]:
         pass
 
@@ -379,6 +398,8 @@ def get_external_execution_plan(
             step_keys_to_execute=step_keys_to_execute,
             known_state=known_state,
             instance_ref=instance.get_ref() if instance and instance.is_persistent else None,
+            pipeline_snapshot_id=external_pipeline.identifying_pipeline_snapshot_id,
+            plan_cache_dir=instance.execution_plan_cache_dir if instance else None,
         )
         return ExternalExecutionPlan(
             execution_plan_snapshot=snapshot_from_execution_plan(
@@ -456,7 +477,9 @@ def get_external_sensor_execution_data(
         last_completion_time: Optional[float],
         last_run_key: Optional[str],
         cursor: Optional[str],
+        timeout: Optional[int] = None,
     ) -> Union["SensorExecutionData", "ExternalSensorExecutionErrorData"]:
+        # sensors run in this process, so there is no call to time out
         return get_external_sensor_execution(
             self._recon_repos[repository_handle.repository_name],
             instance.get_ref(),
@@ -498,6 +521,8 @@ def __init__(
         heartbeat: Optional[bool] = False,
         watch_server: Optional[bool] = True,
         grpc_server_registry: Optional[GrpcServerRegistry] = None,
+        lazy_load_pipelines: bool = False,
+        max_cached_pipelines: int = DEFAULT_MAX_CACHED_PIPELINES,
     ):
         from dagster.grpc.client import DagsterGrpcClient, client_heartbeat_thread
 
@@ -527,6 +552,9 @@ def __init__(
         self._heartbeat = check.bool_param(heartbeat, "heartbeat")
         self._watch_server = check.bool_param(watch_server, "watch_server")
 
+        check.bool_param(lazy_load_pipelines, "lazy_load_pipelines")
+        check.int_param(max_cached_pipelines, "max_cached_pipelines")
+
         self.server_id = None
         self._external_repositories_data = None
 
@@ -577,9 +605,13 @@ def __init__(
 
             self._container_context = list_repositories_response.container_context
 
+            # Pipelines can only be lazily loaded from servers that support snapshot pieces
+            use_snapshot_pieces = list_repositories_response.supports_snapshot_pieces
             self._external_repositories_data = sync_get_streaming_external_repositories_data_grpc(
                 self.client,
                 self,
+                use_snapshot_pieces=use_snapshot_pieces,
+                lazy_load_pipelines=use_snapshot_pieces and lazy_load_pipelines,
             )
 
             self.external_repositories = {
@@ -589,6 +621,9 @@ def __init__(
                         repository_name=repo_name,
                         repository_location=self,
                     ),
+                    ref_to_data_fn=self._get_external_pipeline_data_fn(repo_name),
+                    all_pipeline_datas_fn=self._get_all_external_pipeline_datas_fn(repo_name),
+                    max_cached_pipelines=max_cached_pipelines,
                 )
                 for repo_name, repo_data in self._external_repositories_data.items()
             }
@@ -704,6 +739,34 @@ def get_external_execution_plan(
 
         return ExternalExecutionPlan(execution_plan_snapshot=execution_plan_snapshot_or_error)
 
+    def _get_external_pipeline_data_fn(
+        self, repository_name: str
+    ) -> Callable[[ExternalPipelineRef], ExternalPipelineData]:
+        def _get_external_pipeline_data(external_pipeline_ref):
+            result = sync_get_external_pipeline_subset_grpc(
+                self.client,
+                ExternalPipelineOrigin(
+                    ExternalRepositoryOrigin(self.origin, repository_name),
+                    external_pipeline_ref.name,
+                ),
+            )
+            if not result.success:
+                raise DagsterUserCodeProcessError.from_error_info(result.error)
+
+            return result.external_pipeline_data
+
+        return _get_external_pipeline_data
+
+    def _get_all_external_pipeline_datas_fn(
+        self, repository_name: str
+    ) -> Callable[[], Sequence[ExternalPipelineData]]:
+        def _get_all_external_pipeline_datas():
+            return sync_get_external_pipeline_datas_grpc(
+                self.client, ExternalRepositoryOrigin(self.origin, repository_name)
+            )
+
+        return _get_all_external_pipeline_datas
+
     def get_subset_external_pipeline_result(
         self, selector: PipelineSelector
     ) -> "ExternalPipelineSubsetResult":
@@ -784,6 +847,7 @@ def get_external_sensor_execution_data(
         last_completion_time: Optional[float],
         last_run_key: Optional[str],
         cursor: Optional[str],
+        timeout: Optional[int] = None,
     ) -> "SensorExecutionData":
         return sync_get_external_sensor_execution_data_grpc(
             self.client,
@@ -793,6 +857,7 @@ def get_external_sensor_execution_data(
             last_completion_time,
             last_run_key,
             cursor,
+            timeout=timeout,
         )
 
     def get_external_partition_set_execution_param_data(
@@ -21,10 +21,13 @@ class RepresentedPipeline(ABC):
     another process *or* could be referring to a historical view of the pipeline.
     """
 
-    _pipeline_index: PipelineIndex
+    def __init__(self, pipeline_index: Optional[PipelineIndex]):
+        # Subclasses that load their pipeline lazily pass no index and override _pipeline_index
+        self._index = check.opt_inst_param(pipeline_index, "pipeline_index", PipelineIndex)
 
-    def __init__(self, pipeline_index):
-        self._pipeline_index = check.inst_param(pipeline_index, "pipeline_index", PipelineIndex)
+    @property
+    def _pipeline_index(self) -> PipelineIndex:
+        return check.not_none(self._index)
 
     # Temporary method to allow for incrementally
     # replacing pipeline index with the representation hierarchy
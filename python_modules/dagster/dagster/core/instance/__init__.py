@@ -52,6 +52,7 @@
     RunPartitionData,
     RunRecord,
     RunsFilter,
+    RunSummaryRecord,
     TagBucket,
 )
 from dagster.core.storage.tags import PARENT_RUN_ID_TAG, RESUME_RETRY_TAG, ROOT_RUN_ID_TAG
@@ -287,7 +288,11 @@ def __init__(
         from dagster.core.run_coordinator import RunCoordinator
         from dagster.core.scheduler import Scheduler
         from dagster.core.storage.compute_log_manager import ComputeLogManager
-        from dagster.core.storage.event_log import EventLogStorage
+        from dagster.core.storage.event_log import EventLogStorage, EventLogWriteBuffer
+        from dagster.core.storage.event_log.write_buffer import (
+            DEFAULT_FLUSH_INTERVAL_SECONDS,
+            DEFAULT_MAX_BUFFERED_EVENTS,
+        )
         from dagster.core.storage.root import LocalArtifactStorage
         from dagster.core.storage.runs import RunStorage
         from dagster.core.storage.schedules import ScheduleStorage
@@ -326,6 +331,24 @@ def __init__(
 
         self._subscribers: Dict[str, List[Callable]] = defaultdict(list)
 
+        self._event_log_write_buffer: Optional[EventLogWriteBuffer] = None
+        if self.event_log_buffering_enabled:
+            self._event_log_write_buffer = EventLogWriteBuffer(
+                self._event_storage,
+                max_buffered_events=self.event_log_buffering_settings.get(
+                    "max_buffered_events", DEFAULT_MAX_BUFFERED_EVENTS
+                ),
+                flush_interval_seconds=self.event_log_buffering_settings.get(
+                    "flush_interval_seconds", DEFAULT_FLUSH_INTERVAL_SECONDS
+                ),
+                asynchronous=self.event_log_buffering_asynchronous,
+                # listeners are notified from the writer thread of an asynchronous buffer, off of
+                # the thread that emits the events
+                on_events_written=(
+                    self._notify_event_listeners if self.event_log_buffering_asynchronous else None
+                ),
+            )
+
         run_monitoring_enabled = self.run_monitoring_settings.get("enabled", False)
         if run_monitoring_enabled and not self.run_launcher.supports_check_run_worker_health:
             run_monitoring_enabled = False
@@ -662,6 +685,16 @@ def code_server_process_startup_timeout(self) -> int:
             "local_startup_timeout", DEFAULT_LOCAL_CODE_SERVER_STARTUP_TIMEOUT
         )
 
+    @property
+    def code_server_lazy_load_pipelines(self) -> bool:
+        return self.code_server_settings.get("lazy_load_pipelines", False)
+
+    @property
+    def code_server_max_cached_pipelines(self) -> int:
+        from dagster.core.host_representation.external import DEFAULT_MAX_CACHED_PIPELINES
+
+        return self.code_server_settings.get("max_cached_pipelines", DEFAULT_MAX_CACHED_PIPELINES)
+
     @property
     def run_monitoring_max_resume_run_attempts(self) -> int:
         default_max_resume_run_attempts = 3 if self.run_launcher.supports_resume_run else 0
@@ -687,6 +720,54 @@ def run_retries_enabled(self) -> bool:
     def run_retries_max_retries(self) -> int:
         return self.get_settings("run_retries").get("max_retries")
 
+    # sensors
+
+    @property
+    def sensor_settings(self) -> Dict:
+        return self.get_settings("sensors")
+
+    @property
+    def sensor_use_threads(self) -> bool:
+        return self.sensor_settings.get("use_threads", False)
+
+    @property
+    def sensor_num_workers(self) -> Optional[int]:
+        return self.sensor_settings.get("num_workers")
+
+    @property
+    def sensor_num_workers_per_location(self) -> Optional[int]:
+        return self.sensor_settings.get("num_workers_per_location")
+
+    @property
+    def sensor_evaluation_timeout_seconds(self) -> Optional[int]:
+        return self.sensor_settings.get("evaluation_timeout_seconds")
+
+    # event log buffering
+
+    @property
+    def event_log_buffering_settings(self) -> Dict:
+        return self.get_settings("event_log_buffering")
+
+    @property
+    def event_log_buffering_enabled(self) -> bool:
+        return self.event_log_buffering_settings.get("enabled", False)
+
+    @property
+    def event_log_buffering_asynchronous(self) -> bool:
+        return self.event_log_buffering_settings.get("asynchronous", False)
+
+    # execution plan cache
+
+    @property
+    def execution_plan_cache_settings(self) -> Dict:
+        return self.get_settings("execution_plan_cache")
+
+    @property
+    def execution_plan_cache_dir(self) -> Optional[str]:
+        if not self.execution_plan_cache_settings.get("local_disk", False):
+            return None
+        return self._local_artifact_storage.execution_plan_cache_dir
+
     # python logs
 
     @property
@@ -734,10 +815,14 @@ def reindex(self, print_fn=lambda _: None):
         print_fn("Done.")
 
     def dispose(self):
+        if self._event_log_write_buffer:
+            self._event_log_write_buffer.close()
         self._run_storage.dispose()
         self.run_coordinator.dispose()
         self._run_launcher.dispose()
         self._event_storage.dispose()
+        if self._schedule_storage:
+            self._schedule_storage.dispose()
         self._compute_log_manager.dispose()
 
     # run storage
@@ -855,6 +940,8 @@ def create_run_for_pipeline(
                 mode=mode,
                 instance_ref=self.get_ref() if self.is_persistent else None,
                 tags=tags,
+                pipeline_snapshot_id=pipeline_def.get_pipeline_snapshot_id(),
+                plan_cache_dir=self.execution_plan_cache_dir,
             )
 
         return self.create_run(
@@ -1257,6 +1344,12 @@ def add_run_tags(self, run_id: str, new_tags: Dict[str, str]):
     def has_run(self, run_id: str) -> bool:
         return self._run_storage.has_run(run_id)
 
+    @traced
+    def claim_queued_run(self, run_id: str) -> bool:
+        """Claim a queued run for launching. Returns False if the run is no longer queued, e.g.
+        because it was claimed by another process."""
+        return self._run_storage.claim_queued_run(run_id)
+
     @traced
     def get_runs(
         self,
@@ -1306,6 +1399,36 @@ def get_run_records(
             filters, limit, order_by, ascending, cursor, bucket_by
         )
 
+    @traced
+    def get_runs_by_ids(self, run_ids: Sequence[str]) -> Dict[str, PipelineRun]:
+        """Get the runs with the given ids in a single batch, keyed by run id. Ids that do not
+        correspond to a run are ignored."""
+        return self._run_storage.get_runs_by_ids(run_ids)
+
+    @traced
+    def get_run_records_by_ids(self, run_ids: Sequence[str]) -> Dict[str, RunRecord]:
+        """Get the run records for the runs with the given ids in a single batch, keyed by run id.
+        Ids that do not correspond to a run are ignored."""
+        return self._run_storage.get_run_records_by_ids(run_ids)
+
+    @traced
+    def get_run_summary_records(
+        self,
+        filters: Optional[RunsFilter] = None,
+        limit: Optional[int] = None,
+        order_by: Optional[str] = None,
+        ascending: bool = False,
+        cursor: Optional[str] = None,
+    ) -> List[RunSummaryRecord]:
+        """Return a list of run summary records, with the same arguments as `get_run_records`.
+
+        Summary records contain the status, tags and timestamps of runs, but not the runs
+        themselves, so that storages can skip deserializing the full runs.
+        """
+        return self._run_storage.get_run_summary_records(
+            filters, limit, order_by, ascending, cursor
+        )
+
     @property
     def supports_bucket_queries(self):
         return self._run_storage.supports_bucket_queries
@@ -1337,6 +1460,7 @@ def logs_after(
         of_type: Optional["DagsterEventType"] = None,
         limit: Optional[int] = None,
     ):
+        self.flush_event_log_buffer()
         return self._event_storage.get_logs_for_run(
             run_id,
             cursor=cursor,
@@ -1348,6 +1472,7 @@ def logs_after(
     def all_logs(
         self, run_id, of_type: Optional[Union["DagsterEventType", Set["DagsterEventType"]]] = None
     ):
+        self.flush_event_log_buffer()
         return self._event_storage.get_logs_for_run(run_id, of_type=of_type)
 
     @traced
@@ -1358,6 +1483,7 @@ def get_records_for_run(
         of_type: Optional[Union["DagsterEventType", Set["DagsterEventType"]]] = None,
         limit: Optional[int] = None,
     ):
+        self.flush_event_log_buffer()
         return self._event_storage.get_records_for_run(run_id, cursor, of_type, limit)
 
     def watch_event_logs(self, run_id, cursor, cb):
@@ -1430,6 +1556,14 @@ def get_materialization_count_by_partition(
     ) -> Mapping[AssetKey, Mapping[str, int]]:
         return self._event_storage.get_materialization_count_by_partition(asset_keys)
 
+    @traced
+    def get_latest_materialization_events_by_partition(
+        self, asset_keys: Sequence[AssetKey], partitions: Optional[Sequence[str]] = None
+    ) -> Mapping[AssetKey, Mapping[str, "EventLogEntry"]]:
+        return self._event_storage.get_latest_materialization_events_by_partition(
+            asset_keys, partitions
+        )
+
     # event subscriptions
 
     def _get_yaml_python_handlers(self):
@@ -1475,13 +1609,26 @@ def store_event(self, event):
     def handle_new_event(self, event):
         run_id = event.run_id
 
-        self._event_storage.store_event(event)
+        if self._event_log_write_buffer:
+            self._event_log_write_buffer.write(event)
+        else:
+            self._event_storage.store_event(event)
 
         if event.is_dagster_event and event.dagster_event.is_pipeline_event:
             self._run_storage.handle_run_event(run_id, event.dagster_event)
 
-        for sub in self._subscribers[run_id]:
-            sub(event)
+        if not (self._event_log_write_buffer and self._event_log_write_buffer.asynchronous):
+            self._notify_event_listeners([event])
+
+    def _notify_event_listeners(self, events):
+        for event in events:
+            for sub in self._subscribers[event.run_id]:
+                sub(event)
+
+    def flush_event_log_buffer(self):
+        """Persist any events held in the write buffer, if event log buffering is enabled."""
+        if self._event_log_write_buffer:
+            self._event_log_write_buffer.flush()
 
     def add_event_listener(self, run_id, cb):
         self._subscribers[run_id].append(cb)
@@ -175,6 +175,35 @@ def dagster_instance_config_schema():
             }
         ),
         "code_servers": Field(
-            {"local_startup_timeout": Field(int, is_required=False)}, is_required=False
+            {
+                "local_startup_timeout": Field(int, is_required=False),
+                "lazy_load_pipelines": Field(bool, is_required=False, default_value=False),
+                "max_cached_pipelines": Field(int, is_required=False),
+            },
+            is_required=False,
+        ),
+        "sensors": Field(
+            {
+                "use_threads": Field(bool, is_required=False, default_value=False),
+                "num_workers": Field(int, is_required=False),
+                "num_workers_per_location": Field(int, is_required=False),
+                "evaluation_timeout_seconds": Field(int, is_required=False),
+            },
+            is_required=False,
+        ),
+        "event_log_buffering": Field(
+            {
+                "enabled": Field(bool, is_required=False, default_value=False),
+                "max_buffered_events": Field(int, is_required=False),
+                "flush_interval_seconds": Field(float, is_required=False),
+                "asynchronous": Field(bool, is_required=False, default_value=False),
+            },
+            is_required=False,
+        ),
+        "execution_plan_cache": Field(
+            {
+                "local_disk": Field(bool, is_required=False, default_value=False),
+            },
+            is_required=False,
         ),
     }
@@ -374,6 +374,9 @@ def from_dir(base_dir, config_filename=DAGSTER_CONFIG_YAML_FILENAME, overrides=N
             "run_monitoring",
             "run_retries",
             "code_servers",
+            "sensors",
+            "event_log_buffering",
+            "execution_plan_cache",
         }
         settings = {key: config_value.get(key) for key in settings_keys if config_value.get(key)}
 
@@ -35,6 +35,8 @@ def __init__(
         max_concurrent_runs=None,
         tag_concurrency_limits=None,
         dequeue_interval_seconds=None,
+        dequeue_use_threads=None,
+        dequeue_num_workers=None,
         inst_data=None,
     ):
         self._inst_data = check.opt_inst_param(inst_data, "inst_data", ConfigurableClassData)
@@ -52,6 +54,13 @@ def __init__(
         self._dequeue_interval_seconds = check.opt_int_param(
             dequeue_interval_seconds, "dequeue_interval_seconds", 5
         )
+        self._dequeue_use_threads = check.opt_bool_param(
+            dequeue_use_threads, "dequeue_use_threads", False
+        )
+        self._dequeue_num_workers = check.opt_int_param(
+            dequeue_num_workers, "dequeue_num_workers", 4
+        )
+        check.invariant(self._dequeue_num_workers > 0, "dequeue_num_workers must be positive.")
 
         super().__init__()
 
@@ -69,6 +78,14 @@ def get_run_queue_config(self):
     def dequeue_interval_seconds(self):
         return self._dequeue_interval_seconds
 
+    @property
+    def dequeue_use_threads(self):
+        return self._dequeue_use_threads
+
+    @property
+    def dequeue_num_workers(self):
+        return self._dequeue_num_workers
+
     @classmethod
     def config_type(cls):
         return {
@@ -110,6 +127,19 @@ def config_type(cls):
                 description="The interval in seconds at which the Dagster Daemon "
                 "should periodically check the run queue for new runs to launch.",
             ),
+            "dequeue_use_threads": Field(
+                config=Bool,
+                is_required=False,
+                description="Whether or not to launch runs from the queue in parallel, on a pool "
+                "of threads. Useful when launching a run is slow, e.g. with run launchers that "
+                "create a Kubernetes job or an ECS task for each run. Defaults to False.",
+            ),
+            "dequeue_num_workers": Field(
+                config=IntSource,
+                is_required=False,
+                description="The maximum number of runs to launch at once when "
+                "`dequeue_use_threads` is set. Defaults to 4.",
+            ),
         }
 
     @classmethod
@@ -119,6 +149,8 @@ def from_config_value(cls, inst_data, config_value):
             max_concurrent_runs=config_value.get("max_concurrent_runs"),
             tag_concurrency_limits=config_value.get("tag_concurrency_limits"),
             dequeue_interval_seconds=config_value.get("dequeue_interval_seconds"),
+            dequeue_use_threads=config_value.get("dequeue_use_threads"),
+            dequeue_num_workers=config_value.get("dequeue_num_workers"),
         )
 
     def submit_run(self, context: SubmitRunContext) -> PipelineRun:
@@ -106,13 +106,13 @@ def generate_asset_dep_graph(assets_defs: Iterable["AssetsDefinition"]) -> Depen
         for asset_key in assets_def.keys:
             asset_name = asset_key.to_user_string()
             upstream[asset_name] = set()
-            downstream[asset_name] = downstream.get(asset_name, set())
+            downstream.setdefault(asset_name, set())
             # for each asset upstream of this one, set that as upstream, and this downstream of it
             upstream_asset_keys = assets_def.asset_deps[asset_key]
             for upstream_key in upstream_asset_keys:
                 upstream_name = upstream_key.to_user_string()
                 upstream[asset_name].add(upstream_name)
-                downstream[upstream_name] = downstream.get(upstream_name, set()) | {asset_name}
+                downstream.setdefault(upstream_name, set()).add(asset_name)
     return freeze_graph({"upstream": upstream, "downstream": downstream})
 
 
@@ -0,0 +1,69 @@
+"""add run_stats and step_stats tables
+
+Revision ID: 9c5b1d3f7a2e
+Revises: 5e139331e376
+Create Date: 2022-06-14 11:32:07.418215
+
+"""
+import sqlalchemy as db
+from alembic import op
+
+from dagster.core.storage.migration.utils import has_index, has_table
+
+# revision identifiers, used by Alembic.
+revision = "9c5b1d3f7a2e"
+down_revision = "5e139331e376"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    if not has_table("event_logs"):
+        return
+
+    if not has_table("run_stats"):
+        op.create_table(
+            "run_stats",
+            db.Column("id", db.Integer, primary_key=True, autoincrement=True),
+            db.Column("run_id", db.String(255), nullable=False),
+            db.Column("dagster_event_type", db.String(255), nullable=False),
+            db.Column("event_count", db.Integer, nullable=False),
+            db.Column("last_event_timestamp", db.types.TIMESTAMP),
+        )
+
+    if not has_index("run_stats", "idx_run_stats_run_id_event_type"):
+        op.create_index(
+            "idx_run_stats_run_id_event_type",
+            "run_stats",
+            ["run_id", "dagster_event_type"],
+            unique=True,
+        )
+
+    if not has_table("step_stats"):
+        op.create_table(
+            "step_stats",
+            db.Column("id", db.Integer, primary_key=True, autoincrement=True),
+            db.Column("run_id", db.String(255), nullable=False),
+            db.Column("step_key", db.Text, nullable=False),
+            db.Column("dagster_event_type", db.String(255), nullable=False),
+            db.Column("timestamp", db.Float),
+            db.Column("marker_start", db.Text),
+            db.Column("marker_end", db.Text),
+        )
+
+    if not has_index("step_stats", "idx_step_stats_run_id"):
+        op.create_index("idx_step_stats_run_id", "step_stats", ["run_id"])
+
+
+def downgrade():
+    if has_index("step_stats", "idx_step_stats_run_id"):
+        op.drop_index("idx_step_stats_run_id")
+
+    if has_table("step_stats"):
+        op.drop_table("step_stats")
+
+    if has_index("run_stats", "idx_run_stats_run_id_event_type"):
+        op.drop_index("idx_run_stats_run_id_event_type")
+
+    if has_table("run_stats"):
+        op.drop_table("run_stats")
@@ -1,20 +1,39 @@
-from dagster.config import Field, Permissive, Selector
+from dagster.config import Field, Permissive
 from dagster.config.source import IntSource, StringSource
 
 
-def mysql_config():
-    return Selector(
+def pool_config():
+    """Pooling of the connections of a SQL storage, which opens a new connection for every use if
+    this is not set. A ``pool_recycle`` of -1 keeps connections open indefinitely.
+    """
+    return Field(
         {
-            "mysql_url": StringSource,
-            "mysql_db": {
+            "pool_size": Field(IntSource, is_required=False, default_value=5),
+            "max_overflow": Field(IntSource, is_required=False, default_value=10),
+            "pool_pre_ping": Field(bool, is_required=False, default_value=True),
+            "pool_recycle": Field(IntSource, is_required=False, default_value=3600),
+        },
+        is_required=False,
+    )
+
+
+def mysql_config():
+    # exactly one of mysql_url and mysql_db is required, as for the postgres config, which is checked
+    # when the storage is created because a Selector cannot carry the pool next to them
+    return {
+        "mysql_url": Field(StringSource, is_required=False),
+        "mysql_db": Field(
+            {
                 "username": StringSource,
                 "password": StringSource,
                 "hostname": StringSource,
                 "db_name": StringSource,
                 "port": Field(IntSource, is_required=False, default_value=3306),
             },
-        }
-    )
+            is_required=False,
+        ),
+        "pool": pool_config(),
+    }
 
 
 def pg_config():
@@ -33,4 +52,5 @@ def pg_config():
             is_required=False,
         ),
         "should_autocreate_tables": Field(bool, is_required=False, default_value=True),
+        "pool": pool_config(),
     }
@@ -2,7 +2,18 @@
 from abc import ABC, abstractmethod
 from datetime import datetime
 from enum import Enum
-from typing import Callable, Iterable, List, Mapping, NamedTuple, Optional, Sequence, Set, Union
+from typing import (
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Set,
+    Union,
+)
 
 import dagster._check as check
 from dagster.core.assets import AssetDetails
@@ -266,6 +277,17 @@ def store_event(self, event: EventLogEntry):
             event (EventLogEntry): The event to store.
         """
 
+    def store_events(self, events: List[EventLogEntry]):
+        """Store a batch of events, in order. Storages that can write several rows in a single
+        round-trip should override this; the default implementation stores each event in turn.
+
+        Args:
+            events (List[EventLogEntry]): The events to store.
+        """
+        check.list_param(events, "events", of_type=EventLogEntry)
+        for event in events:
+            self.store_event(event)
+
     @abstractmethod
     def delete_events(self, run_id: str):
         """Remove events for a given run id"""
@@ -388,5 +410,41 @@ def get_materialization_count_by_partition(
     ) -> Mapping[AssetKey, Mapping[str, int]]:
         pass
 
+    def get_latest_materialization_events_by_partition(
+        self, asset_keys: Sequence[AssetKey], partitions: Optional[Sequence[str]] = None
+    ) -> Mapping[AssetKey, Mapping[str, EventLogEntry]]:
+        """Get the latest materialization event of each partition of each of the given assets.
+
+        The base implementation fetches the materializations of each asset in turn. Storages that
+        can, should override it to fetch the events for all of the assets at once.
+
+        Args:
+            asset_keys (List[AssetKey]): The assets to fetch materializations for.
+            partitions (Optional[List[str]]): If provided, only the materializations of these
+                partitions are fetched.
+        """
+        check.list_param(asset_keys, "asset_keys", of_type=AssetKey)
+        check.opt_list_param(partitions, "partitions", of_type=str)
+
+        latest_by_partition: Dict[AssetKey, Dict[str, EventLogEntry]] = {
+            asset_key: {} for asset_key in asset_keys
+        }
+        for asset_key in asset_keys:
+            records = self.get_event_records(
+                EventRecordsFilter(
+                    event_type=DagsterEventType.ASSET_MATERIALIZATION,
+                    asset_key=asset_key,
+                    asset_partitions=partitions,
+                )
+            )
+            # records are sorted from newest to oldest
+            for record in records:
+                dagster_event = record.event_log_entry.dagster_event
+                partition = dagster_event.partition if dagster_event else None
+                if partition is not None and partition not in latest_by_partition[asset_key]:
+                    latest_by_partition[asset_key][partition] = record.event_log_entry
+
+        return latest_by_partition
+
     def alembic_version(self):
         return None
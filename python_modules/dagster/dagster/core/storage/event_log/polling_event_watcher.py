@@ -1,5 +1,6 @@
+import logging
 import threading
-from typing import Callable, List, MutableMapping, NamedTuple, Optional
+from typing import Callable, Dict, List, NamedTuple, Optional
 
 import dagster._check as check
 from dagster.core.events.log import EventLogEntry
@@ -8,28 +9,42 @@
 from .sql_event_log import SqlEventLogStorage
 
 POLLING_CADENCE = 0.1  # 100 ms
+MAX_POLLING_CADENCE = 0.5  # polling backs off to this interval while all watched runs are idle
 
 
 class CallbackAfterCursor(NamedTuple):
     """Callback passed from Observer class in event polling
 
-    cursor (str): Only process EventLogEntrys after the given cursor
+    storage_id (int): Only process EventLogEntrys with a storage id greater than this value. The
+        string cursor passed by the observer is parsed once, when the callback is registered.
     callback (Callable[[EventLogEntry], None]): callback passed from Observer
         to call on new EventLogEntrys, with a string cursor
     """
 
-    cursor: Optional[str]
+    storage_id: int
     callback: Callable[[EventLogEntry, str], None]
 
+    @staticmethod
+    def from_cursor(
+        cursor: Optional[str], callback: Callable[[EventLogEntry, str], None]
+    ) -> "CallbackAfterCursor":
+        # rely on the fact that all storage ids will be positive integers
+        storage_id = EventLogCursor.parse(cursor).storage_id() if cursor else -1
+        return CallbackAfterCursor(storage_id, callback)
+
 
 class SqlPollingEventWatcher:
-    """Event Log Watcher that uses a multithreaded polling approach to retrieving new events for run_ids
-    This class' job is to manage a collection of threads that each poll the event log for a given run_id
-    Uses one thread (SqlPollingRunIdEventWatcherThread) per watched run_id
+    """Event Log Watcher that uses a polling approach to retrieving new events for run_ids
+
+    A single thread serves every watched run_id. On each tick it fetches the new records for all
+    watched runs with one batched query (see `SqlEventLogStorage.get_records_for_runs`), which
+    filters each run by the lowest cursor among its own callbacks, and fires each callback on the
+    records past its own cursor. The polling interval starts at POLLING_CADENCE and backs off exponentially up to
+    MAX_POLLING_CADENCE while no new records arrive for any watched run.
 
     LOCKING INFO:
-        ORDER: _dict_lock -> run_id_thread.callback_fn_list_lock
-        INVARIANTS: _dict_lock protects _run_id_to_watcher_dict
+        INVARIANTS: _callback_lock protects _callbacks_by_run_id. Callbacks are fired without
+            holding the lock, so that they may call back into `unwatch_run`.
     """
 
     def __init__(self, event_log_storage: SqlEventLogStorage):
@@ -37,15 +52,19 @@ def __init__(self, event_log_storage: SqlEventLogStorage):
             event_log_storage, "event_log_storage", SqlEventLogStorage
         )
 
-        # INVARIANT: dict_lock protects _run_id_to_watcher_dict
-        self._dict_lock: threading.Lock = threading.Lock()
-        self._run_id_to_watcher_dict: MutableMapping[str, SqlPollingRunIdEventWatcherThread] = {}
+        # INVARIANT: _callback_lock protects _callbacks_by_run_id
+        self._callback_lock: threading.Lock = threading.Lock()
+        self._callbacks_by_run_id: Dict[str, List[CallbackAfterCursor]] = {}
+
+        self._should_thread_exit = threading.Event()
+        self._wake_event = threading.Event()
+        self._watcher_thread: Optional[threading.Thread] = None
         self._disposed = False
 
     def has_run_id(self, run_id: str) -> bool:
         run_id = check.str_param(run_id, "run_id")
-        with self._dict_lock:
-            _has_run_id = run_id in self._run_id_to_watcher_dict
+        with self._callback_lock:
+            _has_run_id = run_id in self._callbacks_by_run_id
         return _has_run_id
 
     def watch_run(
@@ -54,23 +73,31 @@ def watch_run(
         run_id = check.str_param(run_id, "run_id")
         cursor = check.opt_str_param(cursor, "cursor")
         callback = check.callable_param(callback, "callback")
-        with self._dict_lock:
-            if run_id not in self._run_id_to_watcher_dict:
-                self._run_id_to_watcher_dict[run_id] = SqlPollingRunIdEventWatcherThread(
-                    self._event_log_storage, run_id
+        with self._callback_lock:
+            self._callbacks_by_run_id.setdefault(run_id, []).append(
+                CallbackAfterCursor.from_cursor(cursor, callback)
+            )
+            if not self._watcher_thread:
+                self._watcher_thread = threading.Thread(
+                    target=self._run, name="sql-event-watch", daemon=True
                 )
-                self._run_id_to_watcher_dict[run_id].daemon = True
-                self._run_id_to_watcher_dict[run_id].start()
-            self._run_id_to_watcher_dict[run_id].add_callback(cursor, callback)
+                self._watcher_thread.start()
+
+        # reset any backoff so that the new watcher receives events promptly
+        self._wake_event.set()
 
     def unwatch_run(self, run_id: str, handler: Callable[[EventLogEntry, str], None]):
         run_id = check.str_param(run_id, "run_id")
         handler = check.callable_param(handler, "handler")
-        with self._dict_lock:
-            if run_id in self._run_id_to_watcher_dict:
-                self._run_id_to_watcher_dict[run_id].remove_callback(handler)
-                if self._run_id_to_watcher_dict[run_id].should_thread_exit.is_set():
-                    del self._run_id_to_watcher_dict[run_id]
+        with self._callback_lock:
+            if run_id in self._callbacks_by_run_id:
+                self._callbacks_by_run_id[run_id] = [
+                    callback_with_cursor
+                    for callback_with_cursor in self._callbacks_by_run_id[run_id]
+                    if callback_with_cursor.callback != handler
+                ]
+                if not self._callbacks_by_run_id[run_id]:
+                    del self._callbacks_by_run_id[run_id]
 
     def __del__(self):
         self.close()
@@ -78,95 +105,79 @@ def __del__(self):
     def close(self):
         if not self._disposed:
             self._disposed = True
-            with self._dict_lock:
-                for watcher_thread in self._run_id_to_watcher_dict.values():
-                    if not watcher_thread.should_thread_exit.is_set():
-                        watcher_thread.should_thread_exit.set()
-                for run_id in self._run_id_to_watcher_dict:
-                    self._run_id_to_watcher_dict[run_id].join()
-                del self._run_id_to_watcher_dict
-
-
-class SqlPollingRunIdEventWatcherThread(threading.Thread):
-    """subclass of Thread that watches a given run_id for new Events by polling every POLLING_CADENCE
-
-    Holds a list of callbacks (_callback_fn_list) each passed in by an `Observer`. Note that
-        the callbacks have a cursor associated; this means that the callbacks should be
-        only executed on EventLogEntrys with an associated id >= callback.cursor
-    Exits when `self.should_thread_exit` is set.
-
-    LOCKING INFO:
-        INVARIANTS: _callback_fn_list_lock protects _callback_fn_list
-
-    """
-
-    def __init__(self, event_log_storage: SqlEventLogStorage, run_id: str):
-        super(SqlPollingRunIdEventWatcherThread, self).__init__()
-        self._event_log_storage = check.inst_param(
-            event_log_storage, "event_log_storage", SqlEventLogStorage
-        )
-        self._run_id = check.str_param(run_id, "run_id")
-        self._callback_fn_list_lock: threading.Lock = threading.Lock()
-        self._callback_fn_list: List[CallbackAfterCursor] = []
-        self._should_thread_exit = threading.Event()
-        self.name = f"mysql-event-watch-run-id-{self._run_id}"
-
-    @property
-    def should_thread_exit(self) -> threading.Event:
-        return self._should_thread_exit
-
-    def add_callback(self, cursor: Optional[str], callback: Callable[[EventLogEntry, str], None]):
-        """Observer has started watching this run.
-            Add a callback to execute on new EventLogEntrys after the given cursor
-
-        Args:
-            cursor (Optional[str]): event log cursor for the callback to execute
-            callback (Callable[[EventLogEntry, str], None]): callback to update the Dagster UI
+            self._should_thread_exit.set()
+            self._wake_event.set()
+            if self._watcher_thread:
+                self._watcher_thread.join()
+                self._watcher_thread = None
+
+    def _run(self):
+        interval = POLLING_CADENCE
+        while not self._should_thread_exit.is_set():
+            woken = self._wake_event.wait(interval)
+            self._wake_event.clear()
+            if self._should_thread_exit.is_set():
+                break
+
+            try:
+                has_new_records = self._poll()
+            except Exception:
+                logging.exception("Exception while polling the event log for watched runs.")
+                has_new_records = False
+
+            if has_new_records or woken:
+                interval = POLLING_CADENCE
+            else:
+                interval = min(interval * 2, MAX_POLLING_CADENCE)
+
+    def _poll(self) -> bool:
+        """Fetches new records for every watched run and fires the callbacks. Returns whether any
+        new records were found.
         """
-        cursor = check.opt_str_param(cursor, "cursor")
-        callback = check.callable_param(callback, "callback")
-        with self._callback_fn_list_lock:
-            self._callback_fn_list.append(CallbackAfterCursor(cursor, callback))
-
-    def remove_callback(self, callback: Callable[[EventLogEntry, str], None]):
-        """Observer has stopped watching this run;
-            Remove a callback from the list of callbacks to execute on new EventLogEntrys
-
-            Also kill thread if no callbacks remaining (i.e. no Observers are watching this run_id)
-
-        Args:
-            callback (Callable[[EventLogEntry, str], None]): callback to remove from list of callbacks
-        """
-        callback = check.callable_param(callback, "callback")
-        with self._callback_fn_list_lock:
-            self._callback_fn_list = [
-                callback_with_cursor
-                for callback_with_cursor in self._callback_fn_list
-                if callback_with_cursor.callback != callback
-            ]
-            if not self._callback_fn_list:
-                self._should_thread_exit.set()
-
-    def run(self):
-        """Polling function to update Observers with EventLogEntrys from Event Log DB.
-        Wakes every POLLING_CADENCE &
-            1. executes a SELECT query to get new EventLogEntrys
-            2. fires each callback (taking into account the callback.cursor) on the new EventLogEntrys
-        Uses max_index_so_far as a cursor in the DB to make sure that only new records are retrieved
-        """
-        cursor = None
-        while not self._should_thread_exit.wait(POLLING_CADENCE):
-            conn = self._event_log_storage.get_records_for_run(self._run_id, cursor=cursor)
-            cursor = conn.cursor if conn.cursor else cursor
-            for event_record in conn.records:
-                with self._callback_fn_list_lock:
-                    for callback_with_cursor in self._callback_fn_list:
-                        if (
-                            callback_with_cursor.cursor is None
-                            or EventLogCursor.parse(callback_with_cursor.cursor).storage_id()
-                            < event_record.storage_id
-                        ):
+        with self._callback_lock:
+            cursors_by_run_id = {
+                run_id: min(callback_with_cursor.storage_id for callback_with_cursor in callbacks)
+                for run_id, callbacks in self._callbacks_by_run_id.items()
+            }
+
+        if not cursors_by_run_id:
+            return False
+
+        records_by_run_id = self._event_log_storage.get_records_for_runs(cursors_by_run_id)
+
+        has_new_records = False
+        for run_id, records in records_by_run_id.items():
+            if not records:
+                continue
+            has_new_records = True
+
+            with self._callback_lock:
+                callbacks = list(self._callbacks_by_run_id.get(run_id, []))
+
+            for record in records:
+                for callback_with_cursor in callbacks:
+                    if callback_with_cursor.storage_id < record.storage_id:
+                        try:
                             callback_with_cursor.callback(
-                                event_record.event_log_entry,
-                                str(EventLogCursor.from_storage_id(event_record.storage_id)),
+                                record.event_log_entry,
+                                str(EventLogCursor.from_storage_id(record.storage_id)),
+                            )
+                        except Exception:
+                            logging.exception(
+                                "Exception in callback for event watch on run %s.", run_id
                             )
+
+            # advance the cursor of every callback that was just fired
+            last_storage_id = records[-1].storage_id
+            with self._callback_lock:
+                if run_id in self._callbacks_by_run_id:
+                    self._callbacks_by_run_id[run_id] = [
+                        callback_with_cursor._replace(
+                            storage_id=max(callback_with_cursor.storage_id, last_storage_id)
+                        )
+                        if callback_with_cursor in callbacks
+                        else callback_with_cursor
+                        for callback_with_cursor in self._callbacks_by_run_id[run_id]
+                    ]
+
+        return has_new_records
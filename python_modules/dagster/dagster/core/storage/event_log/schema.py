@@ -52,6 +52,37 @@
     db.Column("create_timestamp", db.DateTime, server_default=get_current_timestamp()),
 )
 
+# The RunStatsTable and StepStatsTable are summaries of the event_logs table, maintained as events
+# are stored so that run stats and step stats can be read without scanning a run's events.  Both
+# are guarded by a secondary index check, and are backfilled from the event_logs table by
+# `reindex_events`.
+
+# One row per run and dagster event type, holding the number of events of that type in the run and
+# the timestamp of the latest one.
+RunStatsTable = db.Table(
+    "run_stats",
+    SqlEventLogStorageMetadata,
+    db.Column("id", db.Integer, primary_key=True, autoincrement=True),
+    db.Column("run_id", db.String(255), nullable=False),
+    db.Column("dagster_event_type", db.String(255), nullable=False),
+    db.Column("event_count", db.Integer, nullable=False),
+    db.Column("last_event_timestamp", db.types.TIMESTAMP),
+)
+
+# One row per step lifecycle event (start, success, failure, skip, retry, restart) and per step
+# engine event carrying a marker, projecting only the fields that step stats are derived from.
+StepStatsTable = db.Table(
+    "step_stats",
+    SqlEventLogStorageMetadata,
+    db.Column("id", db.Integer, primary_key=True, autoincrement=True),
+    db.Column("run_id", db.String(255), nullable=False),
+    db.Column("step_key", db.Text, nullable=False),
+    db.Column("dagster_event_type", db.String(255), nullable=False),
+    db.Column("timestamp", db.Float),
+    db.Column("marker_start", db.Text),
+    db.Column("marker_end", db.Text),
+)
+
 db.Index("idx_run_id", SqlEventLogStorageTable.c.run_id)
 db.Index(
     "idx_step_key",
@@ -75,3 +106,10 @@
     SqlEventLogStorageTable.c.id,
     mysql_length={"dagster_event_type": 64},
 )
+db.Index(
+    "idx_run_stats_run_id_event_type",
+    RunStatsTable.c.run_id,
+    RunStatsTable.c.dagster_event_type,
+    unique=True,
+)
+db.Index("idx_step_stats_run_id", StepStatsTable.c.run_id)
@@ -1,8 +1,22 @@
 import logging
+import time
 from abc import abstractmethod
-from collections import OrderedDict
+from collections import OrderedDict, defaultdict
 from datetime import datetime
-from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence, Set, Union, cast
+from itertools import groupby
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Union,
+    cast,
+)
 
 import pendulum
 import sqlalchemy as db
@@ -14,7 +28,11 @@
 from dagster.core.errors import DagsterEventLogInvalidForRun
 from dagster.core.events import DagsterEventType
 from dagster.core.events.log import EventLogEntry
-from dagster.core.execution.stats import build_run_step_stats_from_events
+from dagster.core.execution.stats import (
+    StepEventStatsRecord,
+    build_run_step_stats_from_events,
+    build_run_step_stats_from_step_event_records,
+)
 from dagster.serdes import (
     deserialize_as,
     deserialize_json_to_dagster_namedtuple,
@@ -34,11 +52,41 @@
     EventRecordsFilter,
     RunShardedEventsCursor,
 )
-from .migration import ASSET_DATA_MIGRATIONS, ASSET_KEY_INDEX_COLS, EVENT_LOG_DATA_MIGRATIONS
-from .schema import AssetKeyTable, SecondaryIndexMigrationTable, SqlEventLogStorageTable
+from .migration import (
+    ASSET_DATA_MIGRATIONS,
+    ASSET_KEY_INDEX_COLS,
+    EVENT_LOG_DATA_MIGRATIONS,
+    SECONDARY_INDEX_RUN_STATS,
+)
+from .schema import (
+    AssetKeyTable,
+    RunStatsTable,
+    SecondaryIndexMigrationTable,
+    SqlEventLogStorageTable,
+    StepStatsTable,
+)
 
 MIN_ASSET_ROWS = 25
 
+# step events that are projected into the step stats table, along with engine events carrying markers
+STEP_STATS_EVENT_TYPES = [
+    DagsterEventType.STEP_START,
+    DagsterEventType.STEP_SUCCESS,
+    DagsterEventType.STEP_SKIPPED,
+    DagsterEventType.STEP_FAILURE,
+    DagsterEventType.STEP_RESTARTED,
+    DagsterEventType.STEP_UP_FOR_RETRY,
+]
+
+
+# How long a storage trusts a cached check that a secondary index has not been built
+SECONDARY_INDEX_RECHECK_INTERVAL_SECONDS = 30
+
+
+def _has_run_stats_tables(conn) -> bool:
+    inspector = db.inspect(conn)
+    return inspector.has_table(RunStatsTable.name) and inspector.has_table(StepStatsTable.name)
+
 
 class SqlEventLogStorage(EventLogStorage):
     """Base class for SQL backed event log storages.
@@ -47,6 +95,8 @@ class SqlEventLogStorage(EventLogStorage):
     sharding, while maintaining the ability to do cross-run queries
     """
 
+    _run_stats_tables_found = False
+
     @abstractmethod
     def run_connection(self, run_id):
         """Context manager yielding a connection to access the event logs for a specific run.
@@ -78,7 +128,14 @@ def prepare_insert_event(self, event):
         the `dagster-postgres` implementation which overrides the generic SQL implementation of
         `store_event`.
         """
+        # https://stackoverflow.com/a/54386260/324449
+        return SqlEventLogStorageTable.insert().values(  # pylint: disable=no-value-for-parameter
+            **self._get_event_insert_values(event)
+        )
 
+    def _get_event_insert_values(self, event):
+        # column values for a single event log row, shared between the single-row insert statement
+        # and the multi-row inserts issued by `store_events`
         dagster_event_type = None
         asset_key_str = None
         partition = None
@@ -93,8 +150,7 @@ def prepare_insert_event(self, event):
             if event.dagster_event.partition:
                 partition = event.dagster_event.partition
 
-        # https://stackoverflow.com/a/54386260/324449
-        return SqlEventLogStorageTable.insert().values(  # pylint: disable=no-value-for-parameter
+        return dict(
             run_id=event.run_id,
             event=serialize_dagster_namedtuple(event),
             dagster_event_type=dagster_event_type,
@@ -213,7 +269,10 @@ def store_event(self, event):
         run_id = event.run_id
 
         with self.run_connection(run_id) as conn:
-            conn.execute(insert_event_statement)
+            with conn.begin():
+                conn.execute(insert_event_statement)
+                if self.has_run_stats_tables(conn):
+                    self.update_stats_for_run(conn, run_id, [event])
 
         if (
             event.is_dagster_event
@@ -226,6 +285,208 @@ def store_event(self, event):
         ):
             self.store_asset_event(event)
 
+    def store_events(self, events):
+        """Store a batch of events, issuing one multi-row insert per contiguous run of events that
+        share a run id, instead of one insert per event.
+
+        Args:
+            events (List[EventLogEntry]): The events to store.
+        """
+        check.list_param(events, "events", of_type=EventLogEntry)
+
+        for run_id, run_events in groupby(events, key=lambda event: event.run_id):
+            run_events = list(run_events)
+            values = [self._get_event_insert_values(event) for event in run_events]
+            with self.run_connection(run_id) as conn:
+                with conn.begin():
+                    conn.execute(
+                        SqlEventLogStorageTable.insert(),  # pylint: disable=no-value-for-parameter
+                        values,
+                    )
+                    if self.has_run_stats_tables(conn):
+                        self.update_stats_for_run(conn, run_id, run_events)
+
+        for event in events:
+            if (
+                event.is_dagster_event
+                and (
+                    event.dagster_event.is_step_materialization
+                    or event.dagster_event.is_asset_observation
+                    or event.dagster_event.is_asset_materialization_planned
+                )
+                and event.dagster_event.asset_key
+            ):
+                self.store_asset_event(event)
+
+    def has_run_stats_tables(self, conn):
+        """Whether the run stats and step stats tables exist in the database behind `conn`.
+
+        Stats are written whenever the tables exist rather than only once the run stats secondary
+        index is marked as built, so that events stored while `migrate_run_stats_data` is running in
+        another process are counted, no matter how long this process trusts a cached answer to
+        `has_secondary_index`. Only a positive answer is cached, since the tables are created by a
+        schema migration that may happen after this storage is instantiated.
+        """
+        if not self._run_stats_tables_found:
+            self._run_stats_tables_found = _has_run_stats_tables(conn)
+        return self._run_stats_tables_found
+
+    def update_stats_for_run(self, conn, run_id, events):
+        """Updates the run stats and step stats tables for a batch of newly stored events belonging
+        to a single run. Called with the connection the events were inserted with, so that the
+        stats are written in the same transaction as the events where the connection supports it.
+
+        Args:
+            conn: The connection for the run's event log.
+            run_id (str): The run id of the events.
+            events (List[EventLogEntry]): The newly stored events.
+        """
+        counts = {}
+        last_timestamps = {}
+        step_stats_values = []
+        for event in events:
+            if not event.is_dagster_event:
+                continue
+
+            event_type = event.dagster_event.event_type_value
+            timestamp = datetime.utcfromtimestamp(event.timestamp)
+            counts[event_type] = counts.get(event_type, 0) + 1
+            last_timestamps[event_type] = max(last_timestamps.get(event_type, timestamp), timestamp)
+
+            step_stats_entry = self._get_step_stats_insert_values(event)
+            if step_stats_entry:
+                step_stats_values.append(step_stats_entry)
+
+        for event_type, count in counts.items():
+            self._increment_run_stats(conn, run_id, event_type, count, last_timestamps[event_type])
+
+        if step_stats_values:
+            conn.execute(
+                StepStatsTable.insert(), step_stats_values  # pylint: disable=no-value-for-parameter
+            )
+
+    def _increment_run_stats(self, conn, run_id, event_type, count, last_timestamp):
+        update_statement = (
+            RunStatsTable.update()  # pylint: disable=no-value-for-parameter
+            .where(
+                db.and_(
+                    RunStatsTable.c.run_id == run_id,
+                    RunStatsTable.c.dagster_event_type == event_type,
+                )
+            )
+            .values(
+                event_count=RunStatsTable.c.event_count + count,
+                last_event_timestamp=db.case(
+                    [(RunStatsTable.c.last_event_timestamp < last_timestamp, last_timestamp)],
+                    else_=RunStatsTable.c.last_event_timestamp,
+                ),
+            )
+        )
+        if conn.execute(update_statement).rowcount > 0:
+            return
+
+        try:
+            conn.execute(
+                RunStatsTable.insert().values(  # pylint: disable=no-value-for-parameter
+                    run_id=run_id,
+                    dagster_event_type=event_type,
+                    event_count=count,
+                    last_event_timestamp=last_timestamp,
+                )
+            )
+        except db.exc.IntegrityError:
+            # the row for this event type was inserted by a concurrent writer
+            conn.execute(update_statement)
+
+    def _get_step_stats_insert_values(self, event):
+        record = StepEventStatsRecord.from_event(event)
+        if not record:
+            return None
+
+        if record.event_type == DagsterEventType.ENGINE_EVENT:
+            if not record.marker_start and not record.marker_end:
+                return None
+        elif record.event_type not in STEP_STATS_EVENT_TYPES:
+            return None
+
+        return dict(
+            run_id=event.run_id,
+            step_key=record.step_key,
+            dagster_event_type=record.event_type.value,
+            timestamp=record.timestamp,
+            marker_start=record.marker_start,
+            marker_end=record.marker_end,
+        )
+
+    def rebuild_stats_for_run(self, run_id, batch_size=1000):
+        """Replaces the run stats and step stats stored for a run with stats computed from the run's
+        events in the event_logs table.
+
+        Args:
+            run_id (str): The run id to rebuild stats for.
+            batch_size (int): The number of events to read from the event log at a time.
+        """
+        check.str_param(run_id, "run_id")
+        check.int_param(batch_size, "batch_size")
+
+        with self.run_connection(run_id) as conn:
+            with conn.begin():
+                self._delete_stats_for_run(conn, run_id)
+
+                # only the serialized events are read, since the extracted columns may not have
+                # been populated for events stored by older versions
+                cursor = -1
+                while True:
+                    rows = conn.execute(
+                        db.select([SqlEventLogStorageTable.c.id, SqlEventLogStorageTable.c.event])
+                        .where(SqlEventLogStorageTable.c.run_id == run_id)
+                        .where(SqlEventLogStorageTable.c.id > cursor)
+                        .order_by(SqlEventLogStorageTable.c.id.asc())
+                        .limit(batch_size)
+                    ).fetchall()
+                    if not rows:
+                        break
+
+                    events = []
+                    for record_id, json_str in rows:
+                        cursor = record_id
+                        try:
+                            event = deserialize_json_to_dagster_namedtuple(json_str)
+                        except (seven.JSONDecodeError, DeserializationError):
+                            logging.warning(
+                                "Could not parse event record id `%s` while rebuilding the stats "
+                                "for run %s.",
+                                record_id,
+                                run_id,
+                            )
+                            continue
+                        if isinstance(event, EventLogEntry):
+                            events.append(event)
+
+                    self.update_stats_for_run(conn, run_id, events)
+
+    def _delete_stats_for_run(self, conn, run_id):
+        conn.execute(
+            RunStatsTable.delete().where(  # pylint: disable=no-value-for-parameter
+                RunStatsTable.c.run_id == run_id
+            )
+        )
+        conn.execute(
+            StepStatsTable.delete().where(  # pylint: disable=no-value-for-parameter
+                StepStatsTable.c.run_id == run_id
+            )
+        )
+
+    def get_all_run_ids(self):
+        """Returns the ids of every run with events in the event log."""
+        with self.index_connection() as conn:
+            return [
+                run_id
+                for (run_id,) in conn.execute(
+                    db.select([SqlEventLogStorageTable.c.run_id]).distinct()
+                ).fetchall()
+            ]
+
     def get_records_for_run(
         self,
         run_id,
@@ -315,10 +576,39 @@ def get_records_for_run(
             has_more=bool(limit and len(results) == limit),
         )
 
-    def get_stats_for_run(self, run_id):
-        check.str_param(run_id, "run_id")
+    def get_records_for_runs(
+        self, cursors_by_run_id: Mapping[str, int]
+    ) -> Mapping[str, List[EventLogRecord]]:
+        """Get the event log records stored after a storage id cursor, for each of a set of runs.
+        Used by event watchers to fetch new records for all watched runs in a single query.
+
+        Args:
+            cursors_by_run_id (Mapping[str, int]): Mapping of run id to the storage id after which
+                records should be returned for that run.
+        """
+        check.dict_param(cursors_by_run_id, "cursors_by_run_id", key_type=str, value_type=int)
+        if not cursors_by_run_id:
+            return {}
 
         query = (
+            db.select(
+                [
+                    SqlEventLogStorageTable.c.id,
+                    SqlEventLogStorageTable.c.run_id,
+                    SqlEventLogStorageTable.c.event,
+                ]
+            )
+            .where(_records_after_cursors_clause(cursors_by_run_id))
+            .order_by(SqlEventLogStorageTable.c.id.asc())
+        )
+
+        with self.index_connection() as conn:
+            results = conn.execute(query).fetchall()
+
+        return _records_by_run_id(results, cursors_by_run_id)
+
+    def _run_stats_scan_query(self, run_id):
+        return (
             db.select(
                 [
                     SqlEventLogStorageTable.c.dagster_event_type,
@@ -335,6 +625,21 @@ def get_stats_for_run(self, run_id):
             .group_by("dagster_event_type")
         )
 
+    def get_stats_for_run(self, run_id):
+        check.str_param(run_id, "run_id")
+
+        if self.has_secondary_index(SECONDARY_INDEX_RUN_STATS):
+            # read the per-event-type summary rows maintained as events are stored
+            query = db.select(
+                [
+                    RunStatsTable.c.dagster_event_type,
+                    RunStatsTable.c.event_count,
+                    RunStatsTable.c.last_event_timestamp,
+                ]
+            ).where(RunStatsTable.c.run_id == run_id)
+        else:
+            query = self._run_stats_scan_query(run_id)
+
         with self.run_connection(run_id) as conn:
             results = conn.execute(query).fetchall()
 
@@ -376,6 +681,9 @@ def get_step_stats_for_run(self, run_id, step_keys=None):
         check.str_param(run_id, "run_id")
         check.opt_list_param(step_keys, "step_keys", of_type=str)
 
+        if self.has_secondary_index(SECONDARY_INDEX_RUN_STATS):
+            return self._get_step_stats_from_index(run_id, step_keys)
+
         # Originally, this was two different queries:
         # 1) one query which aggregated top-level step stats by grouping by event type / step_key in
         #    a single query, using pure SQL (e.g. start_time, end_time, status, attempt counts).
@@ -429,6 +737,72 @@ def get_step_stats_for_run(self, run_id, step_keys=None):
         except (seven.JSONDecodeError, DeserializationError) as err:
             raise DagsterEventLogInvalidForRun(run_id=run_id) from err
 
+    def _get_step_stats_from_index(self, run_id, step_keys=None):
+        # Step lifecycle and marker events are read from their projection in the step stats table,
+        # so only the materialization and expectation result events, whose contents are part of the
+        # stats, need to be fetched from the event log and deserialized.
+        step_stats_query = (
+            db.select(
+                [
+                    StepStatsTable.c.step_key,
+                    StepStatsTable.c.dagster_event_type,
+                    StepStatsTable.c.timestamp,
+                    StepStatsTable.c.marker_start,
+                    StepStatsTable.c.marker_end,
+                ]
+            )
+            .where(StepStatsTable.c.run_id == run_id)
+            .order_by(StepStatsTable.c.id.asc())
+        )
+        raw_event_query = (
+            db.select([SqlEventLogStorageTable.c.event])
+            .where(SqlEventLogStorageTable.c.run_id == run_id)
+            .where(SqlEventLogStorageTable.c.step_key != None)
+            .where(
+                SqlEventLogStorageTable.c.dagster_event_type.in_(
+                    [
+                        DagsterEventType.ASSET_MATERIALIZATION.value,
+                        DagsterEventType.STEP_EXPECTATION_RESULT.value,
+                    ]
+                )
+            )
+            .order_by(SqlEventLogStorageTable.c.id.asc())
+        )
+        if step_keys:
+            step_stats_query = step_stats_query.where(StepStatsTable.c.step_key.in_(step_keys))
+            raw_event_query = raw_event_query.where(
+                SqlEventLogStorageTable.c.step_key.in_(step_keys)
+            )
+
+        with self.run_connection(run_id) as conn:
+            step_stats_rows = conn.execute(step_stats_query).fetchall()
+            raw_event_rows = conn.execute(raw_event_query).fetchall()
+
+        try:
+            records = [
+                StepEventStatsRecord(
+                    step_key=step_key,
+                    event_type=DagsterEventType(dagster_event_type),
+                    timestamp=timestamp,
+                    marker_start=marker_start,
+                    marker_end=marker_end,
+                )
+                for step_key, dagster_event_type, timestamp, marker_start, marker_end in (
+                    step_stats_rows
+                )
+            ]
+            for (json_str,) in raw_event_rows:
+                record = StepEventStatsRecord.from_event(
+                    check.inst_param(
+                        deserialize_json_to_dagster_namedtuple(json_str), "event", EventLogEntry
+                    )
+                )
+                if record:
+                    records.append(record)
+            return build_run_step_stats_from_step_event_records(run_id, records)
+        except (seven.JSONDecodeError, DeserializationError) as err:
+            raise DagsterEventLogInvalidForRun(run_id=run_id) from err
+
     def _apply_migration(self, migration_name, migration_fn, print_fn, force):
         if self.has_secondary_index(migration_name):
             if not force:
@@ -461,6 +835,9 @@ def wipe(self):
         with self.run_connection(run_id=None) as conn:
             conn.execute(SqlEventLogStorageTable.delete())  # pylint: disable=no-value-for-parameter
             conn.execute(AssetKeyTable.delete())  # pylint: disable=no-value-for-parameter
+            if self.has_run_stats_tables(conn):
+                conn.execute(RunStatsTable.delete())  # pylint: disable=no-value-for-parameter
+                conn.execute(StepStatsTable.delete())  # pylint: disable=no-value-for-parameter
 
         with self.index_connection() as conn:
             conn.execute(SqlEventLogStorageTable.delete())  # pylint: disable=no-value-for-parameter
@@ -469,6 +846,8 @@ def wipe(self):
     def delete_events(self, run_id):
         with self.run_connection(run_id) as conn:
             self.delete_events_for_run(conn, run_id)
+            if self.has_run_stats_tables(conn):
+                self._delete_stats_for_run(conn, run_id)
 
     def delete_events_for_run(self, conn, run_id):
         check.str_param(run_id, "run_id")
@@ -570,6 +949,21 @@ def has_secondary_index(self, name):
 
         return len(results) > 0
 
+    def _has_cached_secondary_index(self, cache: Dict[str, Tuple[bool, float]], name: str) -> bool:
+        """Caches the results of `has_secondary_index` in `cache`. A secondary index that has not
+        been built is checked for again every SECONDARY_INDEX_RECHECK_INTERVAL_SECONDS, so that a
+        long-lived process starts using and maintaining it once a reindex in another process has
+        built it.
+        """
+        cached = cache.get(name)
+        now = time.time()
+        if cached is None or (
+            not cached[0] and now - cached[1] >= SECONDARY_INDEX_RECHECK_INTERVAL_SECONDS
+        ):
+            cached = (SqlEventLogStorage.has_secondary_index(self, name), now)
+            cache[name] = cached
+        return cached[0]
+
     def enable_secondary_index(self, name):
         """This method marks an event_log data migration as complete, to indicate that a summary
         data migration is complete.
@@ -1269,6 +1663,82 @@ def get_materialization_count_by_partition(
 
         return materialization_count_by_partition
 
+    def get_latest_materialization_events_by_partition(
+        self, asset_keys: Sequence[AssetKey], partitions: Optional[Sequence[str]] = None
+    ) -> Mapping[AssetKey, Mapping[str, EventLogEntry]]:
+        check.list_param(asset_keys, "asset_keys", AssetKey)
+        check.opt_list_param(partitions, "partitions", of_type=str)
+
+        latest_event_ids_query = (
+            db.select(
+                [
+                    SqlEventLogStorageTable.c.asset_key,
+                    SqlEventLogStorageTable.c.partition,
+                    db.func.max(SqlEventLogStorageTable.c.id).label("id"),
+                ]
+            )
+            .where(
+                db.and_(
+                    db.or_(
+                        SqlEventLogStorageTable.c.asset_key.in_(
+                            [asset_key.to_string() for asset_key in asset_keys]
+                        ),
+                        SqlEventLogStorageTable.c.asset_key.in_(
+                            [asset_key.to_string(legacy=True) for asset_key in asset_keys]
+                        ),
+                    ),
+                    SqlEventLogStorageTable.c.partition != None,
+                    SqlEventLogStorageTable.c.dagster_event_type
+                    == DagsterEventType.ASSET_MATERIALIZATION.value,
+                )
+            )
+            .group_by(SqlEventLogStorageTable.c.asset_key, SqlEventLogStorageTable.c.partition)
+        )
+        if partitions is not None:
+            latest_event_ids_query = latest_event_ids_query.where(
+                SqlEventLogStorageTable.c.partition.in_(partitions)
+            )
+
+        assets_details = self._get_assets_details(asset_keys)
+        latest_event_ids_subquery = self._add_assets_wipe_filter_to_query(
+            latest_event_ids_query, assets_details, asset_keys
+        ).alias("latest_event_ids")
+
+        # an asset's events may be stored under both the legacy and the current asset key string, so
+        # each partition can have a latest event per format. The rows are ordered by id, so that the
+        # newest of them is the one that is kept.
+        query = (
+            db.select(
+                [
+                    SqlEventLogStorageTable.c.asset_key,
+                    SqlEventLogStorageTable.c.partition,
+                    SqlEventLogStorageTable.c.event,
+                ]
+            )
+            .select_from(
+                latest_event_ids_subquery.join(
+                    SqlEventLogStorageTable,
+                    SqlEventLogStorageTable.c.id == latest_event_ids_subquery.c.id,
+                )
+            )
+            .order_by(SqlEventLogStorageTable.c.id.asc())
+        )
+
+        with self.index_connection() as conn:
+            results = conn.execute(query).fetchall()
+
+        latest_by_partition: Dict[AssetKey, Dict[str, EventLogEntry]] = {
+            asset_key: {} for asset_key in asset_keys
+        }
+        for asset_key_str, partition, json_str in results:
+            asset_key = AssetKey.from_db_string(asset_key_str)
+            if asset_key in latest_by_partition:
+                latest_by_partition[asset_key][partition] = cast(
+                    EventLogEntry, deserialize_json_to_dagster_namedtuple(json_str)
+                )
+
+        return latest_by_partition
+
 
 def _get_from_row(row, column):
     """utility function for extracting a column from a sqlalchemy row proxy, since '_asdict' is not
@@ -1276,3 +1746,47 @@ def _get_from_row(row, column):
     if not row.has_key(column):
         return None
     return row[column]
+
+
+def _records_after_cursors_clause(cursors_by_run_id):
+    """utility function for filtering to the rows after each run's own cursor, so that runs with
+    no new records (e.g. finished runs that are still watched) never pull in the records of other
+    runs. Runs that share a cursor share a clause."""
+    run_ids_by_cursor: Dict[int, List[str]] = defaultdict(list)
+    for run_id, cursor in cursors_by_run_id.items():
+        run_ids_by_cursor[cursor].append(run_id)
+
+    return db.or_(
+        *[
+            db.and_(
+                SqlEventLogStorageTable.c.run_id.in_(run_ids),
+                SqlEventLogStorageTable.c.id > cursor,
+            )
+            for cursor, run_ids in run_ids_by_cursor.items()
+        ]
+    )
+
+
+def _records_by_run_id(rows, cursors_by_run_id):
+    """utility function for grouping (id, run_id, event) rows into event log records per run,
+    dropping any rows at or before the run's cursor"""
+    records_by_run_id: Dict[str, List[EventLogRecord]] = {
+        run_id: [] for run_id in cursors_by_run_id
+    }
+    for record_id, run_id, json_str in rows:
+        if record_id <= cursors_by_run_id[run_id]:
+            continue
+        try:
+            event_record = deserialize_json_to_dagster_namedtuple(json_str)
+        except (seven.JSONDecodeError, DeserializationError):
+            logging.warning("Could not parse event record id `%s`.", record_id)
+            continue
+        if not isinstance(event_record, EventLogEntry):
+            logging.warning(
+                "Could not resolve event record as EventLogEntry for id `%s`.", record_id
+            )
+            continue
+        records_by_run_id[run_id].append(
+            EventLogRecord(storage_id=record_id, event_log_entry=event_record)
+        )
+    return records_by_run_id
@@ -117,11 +117,7 @@ def upgrade(self):
             run_alembic_upgrade(alembic_config, conn)
 
     def has_secondary_index(self, name):
-        if name not in self._secondary_index_cache:
-            self._secondary_index_cache[name] = super(
-                ConsolidatedSqliteEventLogStorage, self
-            ).has_secondary_index(name)
-        return self._secondary_index_cache[name]
+        return self._has_cached_secondary_index(self._secondary_index_cache, name)
 
     def enable_secondary_index(self, name):
         super(ConsolidatedSqliteEventLogStorage, self).enable_secondary_index(name)
@@ -145,6 +141,9 @@ def on_modified(self):
             for callback, _ in callback_dict.items()
         ]
         for run_id, callback in keys:
+            if callback not in self._watchers[run_id]:
+                # the watch was ended from another thread, e.g. by an executor finishing its run
+                continue
             cursor = self._watchers[run_id][callback]
 
             # fetch events
@@ -6,6 +6,7 @@
 import time
 from collections import defaultdict
 from contextlib import contextmanager
+from itertools import groupby
 from typing import Iterable, Optional
 
 import sqlalchemy as db
@@ -36,8 +37,18 @@
 )
 from dagster.utils import mkdir_p
 
-from ..schema import SqlEventLogStorageMetadata, SqlEventLogStorageTable
-from ..sql_event_log import RunShardedEventsCursor, SqlEventLogStorage
+from ..schema import (
+    RunStatsTable,
+    SqlEventLogStorageMetadata,
+    SqlEventLogStorageTable,
+    StepStatsTable,
+)
+from ..sql_event_log import (
+    RunShardedEventsCursor,
+    SqlEventLogStorage,
+    _has_run_stats_tables,
+    _records_by_run_id,
+)
 
 INDEX_SHARD_NAME = "index"
 
@@ -85,6 +96,8 @@ def __init__(self, base_dir, inst_data=None):
         # Ensure that multiple threads (like the event log watcher) interact safely with each other
         self._db_lock = threading.Lock()
 
+        self._secondary_index_cache = {}
+
         if not os.path.exists(self.path_for_shard(INDEX_SHARD_NAME)):
             conn_string = self.conn_string_for_shard(INDEX_SHARD_NAME)
             engine = create_engine(conn_string, poolclass=NullPool)
@@ -153,6 +166,12 @@ def _initdb(self, engine):
                         SqlEventLogStorageMetadata.create_all(engine)
                         engine.execute("PRAGMA journal_mode=WAL;")
                         stamp_alembic_rev(alembic_config, connection)
+                    elif db.inspect(connection).has_table(SqlEventLogStorageTable.name):
+                        # Shards created by older versions are only migrated by `upgrade`, but are
+                        # written to as soon as the stats index is built, so make sure that they
+                        # have the stats tables
+                        RunStatsTable.create(engine, checkfirst=True)
+                        StepStatsTable.create(engine, checkfirst=True)
 
                 break
             except (db.exc.DatabaseError, sqlite3.DatabaseError, sqlite3.OperationalError) as exc:
@@ -166,6 +185,8 @@ def _initdb(self, engine):
                     "table asset_keys already exists" in err_msg
                     or "table secondary_indexes already exists" in err_msg
                     or "table event_logs already exists" in err_msg
+                    or "table run_stats already exists" in err_msg
+                    or "table step_stats already exists" in err_msg
                     or "database is locked" in err_msg
                     or "table alembic_version already exists" in err_msg
                     or "UNIQUE constraint failed: alembic_version.version_num" in err_msg
@@ -223,7 +244,10 @@ def store_event(self, event):
         run_id = event.run_id
 
         with self.run_connection(run_id) as conn:
-            conn.execute(insert_event_statement)
+            with conn.begin():
+                conn.execute(insert_event_statement)
+                if self.has_run_stats_tables(conn):
+                    self.update_stats_for_run(conn, run_id, [event])
 
         if event.is_dagster_event and event.dagster_event.asset_key:
             check.invariant(
@@ -244,6 +268,85 @@ def store_event(self, event):
             ):
                 self.store_asset_event(event)
 
+    def store_events(self, events):
+        """
+        Overridden method to write each run's events to its shard in a single multi-row insert,
+        mirroring any asset events into the index shard as a second batch.
+
+        Args:
+            events (List[EventLogEntry]): The events to store.
+        """
+        check.list_param(events, "events", of_type=EventLogEntry)
+
+        for run_id, run_events in groupby(events, key=lambda event: event.run_id):
+            run_events = list(run_events)
+            values = [self._get_event_insert_values(event) for event in run_events]
+            with self.run_connection(run_id) as conn:
+                with conn.begin():
+                    conn.execute(
+                        SqlEventLogStorageTable.insert(),  # pylint: disable=no-value-for-parameter
+                        values,
+                    )
+                    if self.has_run_stats_tables(conn):
+                        self.update_stats_for_run(conn, run_id, run_events)
+
+        asset_events = [
+            event for event in events if event.is_dagster_event and event.dagster_event.asset_key
+        ]
+        if not asset_events:
+            return
+
+        for event in asset_events:
+            check.invariant(
+                event.dagster_event_type == DagsterEventType.ASSET_MATERIALIZATION
+                or event.dagster_event_type == DagsterEventType.ASSET_OBSERVATION
+                or event.dagster_event_type == DagsterEventType.ASSET_MATERIALIZATION_PLANNED,
+                "Can only store asset materializations, materialization_planned, and observations in index database",
+            )
+
+        # mirror the events in the cross-run index database
+        with self.index_connection() as conn:
+            conn.execute(
+                SqlEventLogStorageTable.insert(),  # pylint: disable=no-value-for-parameter
+                [self._get_event_insert_values(event) for event in asset_events],
+            )
+
+        for event in asset_events:
+            self.store_asset_event(event)
+
+    def rebuild_stats_for_run(self, run_id, batch_size=1000):
+        # the base directory may be shared with the databases of other sqlite storages, which are
+        # not event log shards
+        with self.run_connection(run_id) as conn:
+            if not db.inspect(conn).has_table(SqlEventLogStorageTable.name):
+                return
+        super().rebuild_stats_for_run(run_id, batch_size)
+
+    def get_records_for_runs(self, cursors_by_run_id):
+        """Overridden method to query each run's shard in turn, since storage ids are not unique
+        across run shards.
+        """
+        check.dict_param(cursors_by_run_id, "cursors_by_run_id", key_type=str, value_type=int)
+
+        results = []
+        for run_id, cursor in cursors_by_run_id.items():
+            query = (
+                db.select(
+                    [
+                        SqlEventLogStorageTable.c.id,
+                        SqlEventLogStorageTable.c.run_id,
+                        SqlEventLogStorageTable.c.event,
+                    ]
+                )
+                .where(SqlEventLogStorageTable.c.run_id == run_id)
+                .where(SqlEventLogStorageTable.c.id > cursor)
+                .order_by(SqlEventLogStorageTable.c.id.asc())
+            )
+            with self.run_connection(run_id) as conn:
+                results.extend(conn.execute(query).fetchall())
+
+        return _records_by_run_id(results, cursors_by_run_id)
+
     def get_event_records(
         self,
         event_records_filter: EventRecordsFilter,
@@ -348,6 +451,8 @@ def supports_event_consumer_queries(self):
     def delete_events(self, run_id):
         with self.run_connection(run_id) as conn:
             self.delete_events_for_run(conn, run_id)
+            if self.has_run_stats_tables(conn):
+                self._delete_stats_for_run(conn, run_id)
 
         # delete the mirrored event in the cross-run index database
         with self.index_connection() as conn:
@@ -363,6 +468,19 @@ def wipe(self):
             os.unlink(filename)
 
         self._initialized_dbs = set()
+        self._secondary_index_cache = {}
+
+    def has_run_stats_tables(self, conn):
+        # each run shard is its own database, so the answer is not cached across shards
+        return _has_run_stats_tables(conn)
+
+    def has_secondary_index(self, name):
+        return self._has_cached_secondary_index(self._secondary_index_cache, name)
+
+    def enable_secondary_index(self, name):
+        super(SqliteEventLogStorage, self).enable_secondary_index(name)
+        if name in self._secondary_index_cache:
+            del self._secondary_index_cache[name]
 
     def _delete_mirrored_events_for_asset_key(self, asset_key):
         with self.index_connection() as conn:
@@ -0,0 +1,330 @@
+import itertools
+import logging
+import os
+import threading
+import time
+from collections import deque
+from typing import Callable, Deque, List, Optional
+
+import dagster._check as check
+from dagster.core.events import DagsterEventType
+from dagster.core.events.log import EventLogEntry
+
+from .base import EventLogStorage
+
+DEFAULT_MAX_BUFFERED_EVENTS = 100
+DEFAULT_FLUSH_INTERVAL_SECONDS = 1.0
+
+# The most events an asynchronous buffer holds before writers wait for the writer thread to catch up
+MAX_QUEUED_BATCHES = 10
+
+# Writing any of these events flushes the buffer synchronously, so that by the time a step (or run)
+# is observed to have started or finished, every event that preceded it has been persisted.
+STEP_BOUNDARY_EVENT_TYPES = {
+    DagsterEventType.STEP_START,
+    DagsterEventType.STEP_SUCCESS,
+    DagsterEventType.STEP_FAILURE,
+    DagsterEventType.STEP_SKIPPED,
+    DagsterEventType.STEP_UP_FOR_RETRY,
+    DagsterEventType.STEP_RESTARTED,
+}
+
+
+def is_flush_barrier_event(event: EventLogEntry) -> bool:
+    return event.is_dagster_event and (
+        event.dagster_event.is_pipeline_event
+        or event.dagster_event_type in STEP_BOUNDARY_EVENT_TYPES
+    )
+
+
+class EventLogWriteBuffer:
+    """Per-process write-behind buffer in front of an :py:class:`EventLogStorage`.
+
+    Events are accumulated in memory and handed to ``EventLogStorage.store_events`` in batches.
+    The buffer is flushed when it holds ``max_buffered_events`` events, when its oldest event has
+    been buffered for ``flush_interval_seconds``, and synchronously whenever a step boundary or
+    run lifecycle event is written.
+
+    If ``asynchronous`` is set, batches are stored by a dedicated writer thread instead of the
+    thread that writes the events, which only enqueues them. Step boundary and run lifecycle events
+    act as flush barriers: writing one blocks until it, and every event before it, has been stored.
+    A batch that fails to be stored stays queued and is retried after the flush interval, or on the
+    next flush. The error is raised by the flushes and flush barriers that were waiting for it.
+
+    ``on_events_written`` is called with each batch of events after it has been stored, in the
+    order the events were written, e.g. to notify listeners of the events off of the thread that
+    wrote them.
+    """
+
+    def __init__(
+        self,
+        event_log_storage: EventLogStorage,
+        max_buffered_events: int = DEFAULT_MAX_BUFFERED_EVENTS,
+        flush_interval_seconds: float = DEFAULT_FLUSH_INTERVAL_SECONDS,
+        asynchronous: bool = False,
+        on_events_written: Optional[Callable[[List[EventLogEntry]], None]] = None,
+    ):
+        self._event_log_storage = check.inst_param(
+            event_log_storage, "event_log_storage", EventLogStorage
+        )
+        self._max_buffered_events = check.int_param(max_buffered_events, "max_buffered_events")
+        check.invariant(self._max_buffered_events > 0, "max_buffered_events must be positive")
+        self._flush_interval_seconds = check.numeric_param(
+            flush_interval_seconds, "flush_interval_seconds"
+        )
+        self._asynchronous = check.bool_param(asynchronous, "asynchronous")
+        self._on_events_written = check.opt_callable_param(on_events_written, "on_events_written")
+
+        self._lock = threading.RLock()
+        self._events: List[EventLogEntry] = []
+        self._first_buffered_time: Optional[float] = None
+        self._flush_timer: Optional[threading.Timer] = None
+
+        # state of the asynchronous writer thread, guarded by _condition
+        self._condition = threading.Condition(self._lock)
+        self._queue: Deque[EventLogEntry] = deque()
+        self._queued_count = 0
+        self._written_count = 0
+        self._flush_requested_count = 0
+        self._writer_error: Optional[Exception] = None
+        self._retry_requested = False
+        self._writer_thread: Optional[threading.Thread] = None
+        self._writer_pid: Optional[int] = None
+        self._closed = False
+
+    @property
+    def asynchronous(self) -> bool:
+        return self._asynchronous
+
+    @property
+    def buffered_event_count(self) -> int:
+        with self._lock:
+            if self._asynchronous:
+                return self._queued_count - self._written_count
+            return len(self._events)
+
+    def write(self, event: EventLogEntry):
+        check.inst_param(event, "event", EventLogEntry)
+
+        if self._asynchronous:
+            self._enqueue(event)
+            return
+
+        with self._lock:
+            self._events.append(event)
+            if self._first_buffered_time is None:
+                self._first_buffered_time = time.time()
+                self._schedule_flush()
+
+            if self._should_flush(event):
+                self._flush()
+
+    def flush(self):
+        """Persist all buffered events."""
+        if self._asynchronous:
+            if threading.current_thread() is self._writer_thread:
+                # e.g. a listener of written events reading the event log, which can not wait for
+                # the batch that it is handling to be written
+                return
+            with self._condition:
+                self._wait_for_written(self._queued_count)
+            return
+
+        with self._lock:
+            self._flush()
+
+    def close(self):
+        """Persist all buffered events, and stop the writer thread of an asynchronous buffer."""
+        self.flush()
+        if not self._asynchronous:
+            return
+
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+            writer_thread = self._writer_thread
+            self._writer_thread = None
+
+        if writer_thread and writer_thread is not threading.current_thread():
+            writer_thread.join()
+
+        # events written after the buffer is closed start a new writer thread
+        with self._condition:
+            self._closed = False
+
+    def _should_flush(self, event: EventLogEntry) -> bool:
+        if len(self._events) >= self._max_buffered_events:
+            return True
+
+        if (
+            self._first_buffered_time is not None
+            and time.time() - self._first_buffered_time >= self._flush_interval_seconds
+        ):
+            return True
+
+        return is_flush_barrier_event(event)
+
+    def _schedule_flush(self):
+        # bounds the latency of events written by a quiet process, which might otherwise sit in the
+        # buffer until the next write
+        if self._flush_interval_seconds <= 0:
+            return
+        self._flush_timer = threading.Timer(self._flush_interval_seconds, self._flush_on_timer)
+        self._flush_timer.daemon = True
+        self._flush_timer.start()
+
+    def _flush_on_timer(self):
+        with self._lock:
+            try:
+                self._flush()
+            except Exception:  # pylint: disable=broad-except
+                # there is no caller to raise to. The events stay buffered, and the flush is retried.
+                logging.exception("Exception while flushing buffered events to the event log.")
+
+    def _flush(self):
+        if self._flush_timer:
+            self._flush_timer.cancel()
+            self._flush_timer = None
+
+        if not self._events:
+            return
+
+        events = self._events
+        try:
+            self._event_log_storage.store_events(events)
+        except Exception:
+            # keep the events buffered until they are stored, and retry them on the next flush, or
+            # after the flush interval if nothing else is written
+            self._schedule_flush()
+            raise
+        self._events = []
+        self._first_buffered_time = None
+        if self._on_events_written:
+            self._on_events_written(events)
+
+    # asynchronous writes
+
+    def _enqueue(self, event: EventLogEntry):
+        with self._condition:
+            self._ensure_writer_thread()
+
+            # apply back pressure if the writer thread falls behind. While it fails to store the
+            # events, they are kept queued instead.
+            while (
+                len(self._queue) >= self._max_buffered_events * MAX_QUEUED_BATCHES
+                and self._writer_error is None
+            ):
+                self._condition.wait()
+
+            self._queue.append(event)
+            self._queued_count += 1
+            if len(self._queue) >= self._max_buffered_events or is_flush_barrier_event(event):
+                self._flush_requested_count = self._queued_count
+            self._condition.notify_all()
+
+            if is_flush_barrier_event(event):
+                self._wait_for_written(self._queued_count)
+
+    def _ensure_writer_thread(self):
+        # a forked process does not inherit the writer thread of its parent
+        if (
+            self._writer_thread is not None
+            and self._writer_thread.is_alive()
+            and self._writer_pid == os.getpid()
+        ):
+            return
+
+        self._writer_pid = os.getpid()
+        self._writer_thread = threading.Thread(
+            target=self._write_loop, name="event-log-writer", daemon=True
+        )
+        self._writer_thread.start()
+
+    def _wait_for_written(self, count: int):
+        if count <= self._written_count:
+            return
+
+        self._flush_requested_count = max(self._flush_requested_count, count)
+        if self._writer_error is not None:
+            # retry the batch that failed to be stored before the flush was requested
+            self._writer_error = None
+            self._retry_requested = True
+        self._condition.notify_all()
+
+        while self._written_count < count and self._writer_error is None:
+            self._condition.wait()
+
+        # the error stays set for any other flush waiting for the failed batch, until it is retried
+        if self._written_count < count:
+            raise self._writer_error  # type: ignore
+
+    def _next_batch(self) -> Optional[List[EventLogEntry]]:
+        with self._condition:
+            while not self._queue:
+                if self._closed:
+                    # later writes start a new writer thread
+                    if self._writer_thread is threading.current_thread():
+                        self._writer_thread = None
+                    return None
+                self._condition.wait()
+
+            # wait for a full batch, a flush, or for the oldest queued event to be buffered for the
+            # flush interval
+            deadline = time.time() + self._flush_interval_seconds
+            while (
+                len(self._queue) < self._max_buffered_events
+                and self._flush_requested_count <= self._written_count
+                and not self._closed
+            ):
+                remaining = deadline - time.time()
+                if remaining <= 0:
+                    break
+                self._condition.wait(remaining)
+
+            # the batch is only removed from the queue once it has been stored
+            return list(itertools.islice(self._queue, self._max_buffered_events))
+
+    def _wait_to_retry(self):
+        retry_interval = (
+            self._flush_interval_seconds
+            if self._flush_interval_seconds > 0
+            else DEFAULT_FLUSH_INTERVAL_SECONDS
+        )
+        deadline = time.time() + retry_interval
+        with self._condition:
+            while not self._retry_requested and not self._closed:
+                remaining = deadline - time.time()
+                if remaining <= 0:
+                    break
+                self._condition.wait(remaining)
+            self._retry_requested = False
+
+    def _write_loop(self):
+        while True:
+            batch = self._next_batch()
+            if batch is None:
+                return
+
+            try:
+                self._event_log_storage.store_events(batch)
+            except Exception as e:  # pylint: disable=broad-except
+                with self._condition:
+                    self._writer_error = e
+                    self._condition.notify_all()
+                self._wait_to_retry()
+                continue
+
+            if self._on_events_written:
+                try:
+                    self._on_events_written(batch)
+                except Exception:  # pylint: disable=broad-except
+                    # the events are stored, so they are not retried, and there is no caller to
+                    # raise to
+                    logging.exception("Exception while handling events written to the event log.")
+
+            with self._condition:
+                for _ in range(len(batch)):
+                    self._queue.popleft()
+                self._written_count += len(batch)
+                self._writer_error = None
+                self._condition.notify_all()
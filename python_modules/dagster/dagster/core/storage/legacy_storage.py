@@ -440,6 +440,13 @@ def get_materialization_count_by_partition(
     ) -> Mapping["AssetKey", Mapping[str, int]]:
         return self._storage.event_storage.get_materialization_count_by_partition(asset_keys)
 
+    def get_latest_materialization_events_by_partition(
+        self, asset_keys: Sequence["AssetKey"], partitions: Optional[Sequence[str]] = None
+    ) -> Mapping["AssetKey", Mapping[str, "EventLogEntry"]]:
+        return self._storage.event_storage.get_latest_materialization_events_by_partition(
+            asset_keys, partitions
+        )
+
 
 class LegacyScheduleStorage(ScheduleStorage, ConfigurableClass):
     def __init__(self, storage, inst_data=None):
@@ -538,5 +545,8 @@ def migrate(self, print_fn: Optional[Callable] = None, force_rebuild_all: bool =
     def optimize(self, print_fn: Optional[Callable] = None, force_rebuild_all: bool = False):
         return self._storage.schedule_storage.optimize(print_fn, force_rebuild_all)
 
+    def dispose(self):
+        return self._storage.schedule_storage.dispose()
+
     def optimize_for_dagit(self, statement_timeout: int):
         return self._storage.schedule_storage.optimize_for_dagit(statement_timeout)
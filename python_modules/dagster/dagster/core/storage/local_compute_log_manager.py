@@ -1,13 +1,16 @@
 import hashlib
 import os
 import sys
+import threading
 from collections import defaultdict
 from contextlib import contextmanager
+from typing import IO, Dict, Optional, Tuple
 
 from watchdog.events import PatternMatchingEventHandler
+from watchdog.observers import Observer
 from watchdog.observers.polling import PollingObserver
 
-from dagster import Field, Float, StringSource
+from dagster import Bool, Field, Float, StringSource
 from dagster import _check as check
 from dagster.core.execution.compute_logs import mirror_stream_to_file
 from dagster.core.storage.pipeline_run import PipelineRun
@@ -15,6 +18,7 @@
 from dagster.utils import ensure_dir, touch_file
 
 from .compute_log_manager import (
+    MAX_BYTES_CHUNK_READ,
     MAX_BYTES_FILE_READ,
     ComputeIOType,
     ComputeLogFileData,
@@ -24,6 +28,9 @@
 
 DEFAULT_WATCHDOG_POLLING_TIMEOUT = 2.5
 
+# The most bytes from the end of each watched log file that are kept in memory for its subscriptions
+MAX_BYTES_TAIL_BUFFER = MAX_BYTES_CHUNK_READ
+
 IO_TYPE_EXTENSION = {ComputeIOType.STDOUT: "out", ComputeIOType.STDERR: "err"}
 
 MAX_FILENAME_LENGTH = 255
@@ -32,11 +39,12 @@
 class LocalComputeLogManager(ComputeLogManager, ConfigurableClass):
     """Stores copies of stdout & stderr for each compute step locally on disk."""
 
-    def __init__(self, base_dir, polling_timeout=None, inst_data=None):
+    def __init__(self, base_dir, polling_timeout=None, use_polling=False, inst_data=None):
         self._base_dir = base_dir
         self._polling_timeout = check.opt_float_param(
             polling_timeout, "polling_timeout", DEFAULT_WATCHDOG_POLLING_TIMEOUT
         )
+        self._use_polling = check.bool_param(use_polling, "use_polling")
         self._subscription_manager = LocalComputeLogSubscriptionManager(self)
         self._inst_data = check.opt_inst_param(inst_data, "inst_data", ConfigurableClassData)
 
@@ -60,11 +68,21 @@ def inst_data(self):
     def polling_timeout(self):
         return self._polling_timeout
 
+    @property
+    def use_polling(self):
+        return self._use_polling
+
     @classmethod
     def config_type(cls):
         return {
             "base_dir": StringSource,
             "polling_timeout": Field(Float, is_required=False),
+            "use_polling": Field(
+                Bool,
+                is_required=False,
+                description="Poll log files for changes instead of being notified of them by the "
+                "operating system, e.g. for network filesystems that do not notify of changes.",
+            ),
         }
 
     @staticmethod
@@ -90,6 +108,20 @@ def _get_local_path(self, run_id, key, extension):
     def read_logs_file(self, run_id, key, io_type, cursor=0, max_bytes=MAX_BYTES_FILE_READ):
         path = self.get_local_path(run_id, key, io_type)
 
+        # Serve subscriptions that are caught up from the end of the file that is kept in memory,
+        # instead of opening the file again for each of them
+        tail = self._subscription_manager.get_tail(path)
+        tail_data = tail.read(cursor, max_bytes) if tail else None
+        if tail_data is not None:
+            data, size = tail_data
+            return ComputeLogFileData(
+                path=path,
+                data=data.decode("utf-8"),
+                cursor=cursor + len(data),
+                size=size,
+                download_url=self.download_url(run_id, key, io_type),
+            )
+
         if not os.path.exists(path) or not os.path.isfile(path):
             return ComputeLogFileData(path=path, data=None, cursor=0, size=0, download_url=None)
 
@@ -148,6 +180,8 @@ def __init__(self, manager):
         self._subscriptions = defaultdict(list)
         self._watchers = {}
         self._observer = None
+        self._tails_lock = threading.Lock()
+        self._tails: Dict[str, LocalComputeLogFileTail] = {}
 
     def _watch_key(self, run_id, key):
         return "{}:{}".format(run_id, key)
@@ -168,29 +202,52 @@ def remove_subscription(self, subscription):
         if subscription in self._subscriptions[watch_key]:
             self._subscriptions[watch_key].remove(subscription)
             subscription.complete()
+        if not self._subscriptions[watch_key]:
+            self._close_tails(subscription.run_id, subscription.key)
 
     def remove_all_subscriptions(self, run_id, step_key):
         watch_key = self._watch_key(run_id, step_key)
         for subscription in self._subscriptions.pop(watch_key, []):
             subscription.complete()
+        self._close_tails(run_id, step_key)
+
+    def _log_paths(self, run_id, step_key):
+        return [
+            self._manager.get_local_path(run_id, step_key, ComputeIOType.STDOUT),
+            self._manager.get_local_path(run_id, step_key, ComputeIOType.STDERR),
+        ]
+
+    def get_tail(self, path):
+        with self._tails_lock:
+            return self._tails.get(path)
+
+    def _open_tails(self, run_id, step_key):
+        with self._tails_lock:
+            for path in self._log_paths(run_id, step_key):
+                if path not in self._tails:
+                    self._tails[path] = LocalComputeLogFileTail(path, MAX_BYTES_TAIL_BUFFER)
+
+    def _close_tails(self, run_id, step_key):
+        with self._tails_lock:
+            for path in self._log_paths(run_id, step_key):
+                tail = self._tails.pop(path, None)
+                if tail:
+                    tail.close()
 
     def watch(self, run_id, step_key):
         watch_key = self._watch_key(run_id, step_key)
+        self._open_tails(run_id, step_key)
         if watch_key in self._watchers:
             return
 
-        update_paths = [
-            self._manager.get_local_path(run_id, step_key, ComputeIOType.STDOUT),
-            self._manager.get_local_path(run_id, step_key, ComputeIOType.STDERR),
-        ]
+        update_paths = self._log_paths(run_id, step_key)
         complete_paths = [self._manager.complete_artifact_path(run_id, step_key)]
         directory = os.path.dirname(
             self._manager.get_local_path(run_id, step_key, ComputeIOType.STDERR)
         )
 
         if not self._observer:
-            self._observer = PollingObserver(self._manager.polling_timeout)
-            self._observer.start()
+            self._observer = self._start_observer()
 
         ensure_dir(directory)
 
@@ -201,9 +258,23 @@ def watch(self, run_id, step_key):
             str(directory),
         )
 
+    def _start_observer(self):
+        if not self._manager.use_polling:
+            try:
+                observer = Observer()
+                observer.start()
+                return observer
+            except OSError:
+                # e.g. the limit on the number of inotify instances was reached
+                pass
+
+        observer = PollingObserver(timeout=self._manager.polling_timeout)
+        observer.start()
+        return observer
+
     def notify_subscriptions(self, run_id, step_key):
         watch_key = self._watch_key(run_id, step_key)
-        for subscription in self._subscriptions[watch_key]:
+        for subscription in list(self._subscriptions[watch_key]):
             subscription.fetch()
 
     def unwatch(self, run_id, step_key, handler):
@@ -217,6 +288,89 @@ def dispose(self):
             self._observer.stop()
             self._observer.join(15)
 
+        with self._tails_lock:
+            for tail in self._tails.values():
+                tail.close()
+            self._tails = {}
+
+
+class LocalComputeLogFileTail:
+    """The end of a watched compute log file, shared by all subscriptions to the file.
+
+    Bytes written to the file are read from a single open file handle once, and kept in a buffer of
+    bounded size from which the subscriptions that are caught up with the end of the file are
+    served. Reads of earlier parts of the file are left to range reads of the file.
+    """
+
+    def __init__(self, path: str, max_bytes: int):
+        self._path = check.str_param(path, "path")
+        self._max_bytes = check.int_param(max_bytes, "max_bytes")
+        self._lock = threading.Lock()
+        self._file: Optional[IO[bytes]] = None
+        self._buffer = bytearray()
+        self._buffer_start = 0
+        self._closed = False
+
+    @property
+    def path(self) -> str:
+        return self._path
+
+    def _update(self):
+        if self._file is None:
+            if not os.path.isfile(self._path):
+                return
+            self._file = open(self._path, "rb")  # pylint: disable=consider-using-with
+            # Start from the current end of the file, earlier bytes are read from the file
+            self._buffer_start = os.fstat(self._file.fileno()).st_size
+
+        size = os.fstat(self._file.fileno()).st_size
+        buffer_end = self._buffer_start + len(self._buffer)
+        if size < buffer_end:
+            # the file was truncated
+            self._buffer = bytearray()
+            self._buffer_start = size
+        elif size > buffer_end:
+            if size - buffer_end >= self._max_bytes:
+                # skip the bytes that would be dropped from the buffer right away
+                self._buffer = bytearray()
+                self._buffer_start = size - self._max_bytes
+            self._file.seek(self._buffer_start + len(self._buffer), os.SEEK_SET)
+            self._buffer += self._file.read(size - self._buffer_start - len(self._buffer))
+
+            overflow = len(self._buffer) - self._max_bytes
+            if overflow > 0:
+                del self._buffer[:overflow]
+                self._buffer_start += overflow
+
+    def read(self, cursor: int, max_bytes: int) -> Optional[Tuple[bytes, int]]:
+        """Returns up to max_bytes of the file starting at the cursor, and the size of the file, or
+        None if the cursor is not within the buffered end of the file.
+        """
+        with self._lock:
+            if self._closed:
+                return None
+
+            self._update()
+            if self._file is None:
+                return None
+
+            buffer_offset = cursor - self._buffer_start
+            if buffer_offset < 0 or buffer_offset > len(self._buffer):
+                return None
+
+            return (
+                bytes(self._buffer[buffer_offset : buffer_offset + max_bytes]),
+                self._buffer_start + len(self._buffer),
+            )
+
+    def close(self):
+        with self._lock:
+            self._closed = True
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+            self._buffer = bytearray()
+
 
 class LocalComputeLogFilesystemEventHandler(PatternMatchingEventHandler):
     def __init__(self, manager, run_id, key, update_paths, complete_paths):
@@ -667,6 +667,77 @@ def __new__(
         )
 
 
+class RunSummaryRecord(
+    NamedTuple(
+        "_RunSummaryRecord",
+        [
+            ("storage_id", int),
+            ("run_id", str),
+            ("pipeline_name", str),
+            ("status", DagsterRunStatus),
+            ("tags", Mapping[str, str]),
+            ("create_timestamp", datetime),
+            ("update_timestamp", datetime),
+            ("start_time", Optional[float]),
+            ("end_time", Optional[float]),
+        ],
+    )
+):
+    """Internal representation of the indexed columns of a run record, as stored in a
+    :py:class:`~dagster.core.storage.runs.RunStorage`. Can be fetched without deserializing the
+    full :py:class:`PipelineRun`, for views that only need the status, tags and timestamps of runs.
+    """
+
+    def __new__(
+        cls,
+        storage_id: int,
+        run_id: str,
+        pipeline_name: str,
+        status: DagsterRunStatus,
+        tags: Mapping[str, str],
+        create_timestamp: datetime,
+        update_timestamp: datetime,
+        start_time: Optional[float] = None,
+        end_time: Optional[float] = None,
+    ):
+        return super(RunSummaryRecord, cls).__new__(
+            cls,
+            storage_id=check.int_param(storage_id, "storage_id"),
+            run_id=check.str_param(run_id, "run_id"),
+            pipeline_name=check.str_param(pipeline_name, "pipeline_name"),
+            status=check.inst_param(status, "status", DagsterRunStatus),
+            tags=check.mapping_param(tags, "tags", key_type=str, value_type=str),
+            create_timestamp=check.inst_param(create_timestamp, "create_timestamp", datetime),
+            update_timestamp=check.inst_param(update_timestamp, "update_timestamp", datetime),
+            start_time=check.opt_float_param(start_time, "start_time"),
+            end_time=check.opt_float_param(end_time, "end_time"),
+        )
+
+    @staticmethod
+    def from_run_record(run_record: RunRecord) -> "RunSummaryRecord":
+        check.inst_param(run_record, "run_record", RunRecord)
+        pipeline_run = run_record.pipeline_run
+        return RunSummaryRecord(
+            storage_id=run_record.storage_id,
+            run_id=pipeline_run.run_id,
+            pipeline_name=pipeline_run.pipeline_name,
+            status=pipeline_run.status,
+            tags=pipeline_run.tags,
+            create_timestamp=run_record.create_timestamp,
+            update_timestamp=run_record.update_timestamp,
+            start_time=run_record.start_time,
+            end_time=run_record.end_time,
+        )
+
+    @property
+    def is_finished(self) -> bool:
+        return (
+            self.status == PipelineRunStatus.SUCCESS
+            or self.status == PipelineRunStatus.FAILURE
+            or self.status == PipelineRunStatus.CANCELED
+        )
+
+
 @whitelist_for_serdes
 class RunPartitionData(
     NamedTuple(
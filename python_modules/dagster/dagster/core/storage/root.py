@@ -30,6 +30,10 @@ def storage_dir(self):
     def schedules_dir(self):
         return os.path.join(self.base_dir, "schedules")
 
+    @property
+    def execution_plan_cache_dir(self):
+        return os.path.join(self.base_dir, "execution_plans")
+
     @staticmethod
     def from_config_value(inst_data, config_value):
         return LocalArtifactStorage(inst_data=inst_data, **config_value)
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple, Union
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Set, Tuple, Union
 
 from dagster.core.events import DagsterEvent
 from dagster.core.execution.backfill import BulkActionStatus, PartitionBackfill
@@ -8,9 +8,11 @@
 from dagster.core.storage.pipeline_run import (
     JobBucket,
     PipelineRun,
+    PipelineRunStatus,
     RunPartitionData,
     RunRecord,
     RunsFilter,
+    RunSummaryRecord,
     TagBucket,
 )
 from dagster.daemon.types import DaemonHeartbeat
@@ -171,6 +173,59 @@ def get_run_records(
             List[RunRecord]: List of run records stored in the run storage.
         """
 
+    def get_runs_by_ids(self, run_ids: Sequence[str]) -> Dict[str, PipelineRun]:
+        """Get the runs with the given ids, in a single batch.
+
+        Args:
+            run_ids (Sequence[str]): The ids of the runs. Ids that do not correspond to a run are
+                ignored.
+
+        Returns:
+            Dict[str, PipelineRun]: The runs, keyed by run id.
+        """
+        if not run_ids:
+            return {}
+        return {run.run_id: run for run in self.get_runs(RunsFilter(run_ids=list(run_ids)))}
+
+    def get_run_records_by_ids(self, run_ids: Sequence[str]) -> Dict[str, RunRecord]:
+        """Get the run records for the runs with the given ids, in a single batch.
+
+        Args:
+            run_ids (Sequence[str]): The ids of the runs. Ids that do not correspond to a run are
+                ignored.
+
+        Returns:
+            Dict[str, RunRecord]: The run records, keyed by run id.
+        """
+        if not run_ids:
+            return {}
+        return {
+            record.pipeline_run.run_id: record
+            for record in self.get_run_records(RunsFilter(run_ids=list(run_ids)))
+        }
+
+    def get_run_summary_records(
+        self,
+        filters: Optional[RunsFilter] = None,
+        limit: Optional[int] = None,
+        order_by: Optional[str] = None,
+        ascending: bool = False,
+        cursor: Optional[str] = None,
+    ) -> List[RunSummaryRecord]:
+        """Return a list of run summary records, with the same arguments as
+        :py:meth:`get_run_records`. Summary records only contain the status, tags and timestamps
+        of runs, which storages can fetch without deserializing the full runs.
+
+        Returns:
+            List[RunSummaryRecord]
+        """
+        return [
+            RunSummaryRecord.from_run_record(record)
+            for record in self.get_run_records(
+                filters=filters, limit=limit, order_by=order_by, ascending=ascending, cursor=cursor
+            )
+        ]
+
     @abstractmethod
     def get_run_tags(self) -> List[Tuple[str, Set[str]]]:
         """Get a list of tag keys and the values that have been associated with them.
@@ -199,6 +254,24 @@ def has_run(self, run_id: str) -> bool:
             bool
         """
 
+    def claim_queued_run(self, run_id: str) -> bool:
+        """Claim a queued run for launching, by moving it from QUEUED to STARTING. Claimed runs
+        count as in progress immediately, so they are included in the concurrency limits of any
+        other process that is dequeuing runs.
+
+        Storages that are shared between processes should claim runs atomically, so that a run
+        can only be claimed once, e.g. when several daemons dequeue runs at the same time. The
+        default implementation only checks that the run is still queued, without claiming it.
+
+        Args:
+            run_id (str): The id of the run
+
+        Returns:
+            bool: Whether the run was claimed.
+        """
+        run = self.get_run_by_id(run_id)
+        return bool(run) and run.status == PipelineRunStatus.QUEUED
+
     def add_snapshot(
         self,
         snapshot: Union[PipelineSnapshot, ExecutionPlanSnapshot],
@@ -1,3 +1,4 @@
+import threading
 from collections import OrderedDict, defaultdict
 from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple, Union, cast
 
@@ -22,6 +23,7 @@
 from ..pipeline_run import (
     JobBucket,
     PipelineRun,
+    PipelineRunStatus,
     RunPartitionData,
     RunRecord,
     RunsFilter,
@@ -63,6 +65,7 @@ def _filter(run: PipelineRun) -> bool:
 
 class InMemoryRunStorage(RunStorage):
     def __init__(self, preload=None):
+        self._claim_lock = threading.Lock()
         self._init_storage()
         if preload:
             for payload in preload:
@@ -109,6 +112,8 @@ def handle_run_event(self, run_id: str, event: DagsterEvent):
         check.inst_param(event, "event", DagsterEvent)
         if run_id not in self._runs:
             return
+        if event.event_type not in EVENT_TYPE_TO_PIPELINE_RUN_STATUS:
+            return
         run = self._runs[run_id]
 
         if event.event_type in [DagsterEventType.PIPELINE_START, DagsterEventType.PIPELINE_SUCCESS]:
@@ -235,6 +240,15 @@ def has_run(self, run_id: str) -> bool:
         check.str_param(run_id, "run_id")
         return run_id in self._runs
 
+    def claim_queued_run(self, run_id: str) -> bool:
+        check.str_param(run_id, "run_id")
+        with self._claim_lock:
+            run = self._runs.get(run_id)
+            if not run or run.status != PipelineRunStatus.QUEUED:
+                return False
+            self._runs[run_id] = run.with_status(PipelineRunStatus.STARTING)
+            return True
+
     def delete_run(self, run_id: str):
         check.str_param(run_id, "run_id")
         del self._runs[run_id]
@@ -5,7 +5,7 @@
 from collections import defaultdict
 from datetime import datetime
 from enum import Enum
-from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple, Union
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Set, Tuple, Union
 
 import pendulum
 import sqlalchemy as db
@@ -40,9 +40,11 @@
     DagsterRunStatus,
     JobBucket,
     PipelineRun,
+    PipelineRunStatus,
     RunPartitionData,
     RunRecord,
     RunsFilter,
+    RunSummaryRecord,
     TagBucket,
 )
 from .base import RunStorage
@@ -59,6 +61,16 @@
 )
 
 
+# the number of run ids included in a single `IN` clause, well below the limits on the number of
+# bound parameters in sqlite (999 before 3.32) and in other databases
+RUN_ID_BATCH_SIZE = 500
+
+
+def _chunks(values: Sequence[str], size: int) -> Iterable[Sequence[str]]:
+    for start in range(0, len(values), size):
+        yield values[start : start + size]
+
+
 class SnapshotType(Enum):
     PIPELINE = "PIPELINE"
     EXECUTION_PLAN = "EXECUTION_PLAN"
@@ -377,6 +389,30 @@ def _bucketed_runs_query(
 
         return query
 
+    def claim_queued_run(self, run_id: str) -> bool:
+        check.str_param(run_id, "run_id")
+
+        run = self.get_run_by_id(run_id)
+        if not run or run.status != PipelineRunStatus.QUEUED:
+            return False
+
+        with self.connect() as conn:
+            # the status condition makes the claim atomic: of several concurrent claims, only one
+            # can match the row
+            result = conn.execute(
+                RunsTable.update()  # pylint: disable=no-value-for-parameter
+                .where(RunsTable.c.run_id == run_id)
+                .where(RunsTable.c.status == PipelineRunStatus.QUEUED.value)
+                .values(
+                    status=PipelineRunStatus.STARTING.value,
+                    run_body=serialize_dagster_namedtuple(
+                        run.with_status(PipelineRunStatus.STARTING)
+                    ),
+                    update_timestamp=pendulum.now("UTC"),
+                )
+            )
+            return result.rowcount == 1
+
     def get_runs(
         self,
         filters: Optional[RunsFilter] = None,
@@ -413,7 +449,7 @@ def get_run_by_id(self, run_id: str) -> Optional[PipelineRun]:
 
         query = db.select([RunsTable.c.run_body]).where(RunsTable.c.run_id == run_id)
         rows = self.fetchall(query)
-        return deserialize_as(rows[0][0], PipelineRun) if len(rows) else None
+        return self._row_to_run(rows[0]) if len(rows) else None
 
     def get_run_records(
         self,
@@ -427,11 +463,82 @@ def get_run_records(
         filters = check.opt_inst_param(filters, "filters", RunsFilter, default=RunsFilter())
         check.opt_int_param(limit, "limit")
 
+        # only fetch columns we use to build RunRecord
+        query = self._runs_query(
+            filters=filters,
+            limit=limit,
+            columns=self._run_record_columns(),
+            order_by=order_by,
+            ascending=ascending,
+            cursor=cursor,
+            bucket_by=bucket_by,
+        )
+
+        rows = self.fetchall(query)
+        return [self._row_to_run_record(row) for row in rows]
+
+    def _run_record_columns(self) -> List[str]:
         columns = ["id", "run_body", "create_timestamp", "update_timestamp"]
+        if self.has_run_stats_index_cols():
+            columns += ["start_time", "end_time"]
+        return columns
+
+    def _row_to_run_record(self, row) -> RunRecord:
+        return RunRecord(
+            storage_id=check.int_param(row["id"], "id"),
+            pipeline_run=deserialize_as(check.str_param(row["run_body"], "run_body"), PipelineRun),
+            create_timestamp=check.inst(row["create_timestamp"], datetime),
+            update_timestamp=check.inst(row["update_timestamp"], datetime),
+            start_time=check.opt_inst(row["start_time"], float) if "start_time" in row else None,
+            end_time=check.opt_inst(row["end_time"], float) if "end_time" in row else None,
+        )
+
+    def get_runs_by_ids(self, run_ids: Sequence[str]) -> Dict[str, PipelineRun]:
+        check.sequence_param(run_ids, "run_ids", of_type=str)
 
+        runs = {}
+        for run_ids_chunk in _chunks(list(dict.fromkeys(run_ids)), RUN_ID_BATCH_SIZE):
+            query = db.select([RunsTable.c.run_body]).where(RunsTable.c.run_id.in_(run_ids_chunk))
+            for row in self.fetchall(query):
+                run = self._row_to_run(row)
+                runs[run.run_id] = run
+        return runs
+
+    def get_run_records_by_ids(self, run_ids: Sequence[str]) -> Dict[str, RunRecord]:
+        check.sequence_param(run_ids, "run_ids", of_type=str)
+
+        query_columns = [getattr(RunsTable.c, column) for column in self._run_record_columns()]
+        records = {}
+        for run_ids_chunk in _chunks(list(dict.fromkeys(run_ids)), RUN_ID_BATCH_SIZE):
+            query = db.select(query_columns).where(RunsTable.c.run_id.in_(run_ids_chunk))
+            for row in self.fetchall(query):
+                record = self._row_to_run_record(row)
+                records[record.pipeline_run.run_id] = record
+        return records
+
+    def get_run_summary_records(
+        self,
+        filters: Optional[RunsFilter] = None,
+        limit: Optional[int] = None,
+        order_by: Optional[str] = None,
+        ascending: bool = False,
+        cursor: Optional[str] = None,
+    ) -> List[RunSummaryRecord]:
+        filters = check.opt_inst_param(filters, "filters", RunsFilter, default=RunsFilter())
+        check.opt_int_param(limit, "limit")
+
+        # only fetch the indexed columns, skipping the run body
+        columns = [
+            "id",
+            "run_id",
+            "pipeline_name",
+            "status",
+            "create_timestamp",
+            "update_timestamp",
+        ]
         if self.has_run_stats_index_cols():
             columns += ["start_time", "end_time"]
-        # only fetch columns we use to build RunRecord
+
         query = self._runs_query(
             filters=filters,
             limit=limit,
@@ -439,16 +546,17 @@ def get_run_records(
             order_by=order_by,
             ascending=ascending,
             cursor=cursor,
-            bucket_by=bucket_by,
         )
-
         rows = self.fetchall(query)
+        tags_by_run_id = self._get_tags_by_run_id([row["run_id"] for row in rows])
+
         return [
-            RunRecord(
+            RunSummaryRecord(
                 storage_id=check.int_param(row["id"], "id"),
-                pipeline_run=deserialize_as(
-                    check.str_param(row["run_body"], "run_body"), PipelineRun
-                ),
+                run_id=row["run_id"],
+                pipeline_name=row["pipeline_name"],
+                status=DagsterRunStatus[row["status"]],
+                tags=tags_by_run_id.get(row["run_id"], {}),
                 create_timestamp=check.inst(row["create_timestamp"], datetime),
                 update_timestamp=check.inst(row["update_timestamp"], datetime),
                 start_time=check.opt_inst(row["start_time"], float)
@@ -459,6 +567,16 @@ def get_run_records(
             for row in rows
         ]
 
+    def _get_tags_by_run_id(self, run_ids: Sequence[str]) -> Dict[str, Dict[str, str]]:
+        tags_by_run_id: Dict[str, Dict[str, str]] = defaultdict(dict)
+        for run_ids_chunk in _chunks(run_ids, RUN_ID_BATCH_SIZE):
+            query = db.select(
+                [RunTagsTable.c.run_id, RunTagsTable.c.key, RunTagsTable.c.value]
+            ).where(RunTagsTable.c.run_id.in_(run_ids_chunk))
+            for run_id, key, value in self.fetchall(query):
+                tags_by_run_id[run_id][key] = value
+        return tags_by_run_id
+
     def get_run_tags(self) -> List[Tuple[str, Set[str]]]:
         result = defaultdict(set)
         query = db.select([RunTagsTable.c.key, RunTagsTable.c.value]).distinct(
@@ -778,7 +896,12 @@ def _add_snapshot(self, snapshot_id: str, snapshot_obj, snapshot_type: SnapshotT
                     snapshot_type=snapshot_type.value,
                 )
             )
-            conn.execute(snapshot_insert)
+            try:
+                conn.execute(snapshot_insert)
+            except db.exc.IntegrityError:
+                # snapshot ids are content hashes, so a concurrent writer that got here first has
+                # stored the same snapshot
+                pass
             return snapshot_id
 
     def get_run_storage_id(self) -> str:
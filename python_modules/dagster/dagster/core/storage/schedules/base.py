@@ -128,6 +128,9 @@ def migrate(self, print_fn: Optional[Callable] = None, force_rebuild_all: bool =
     def optimize(self, print_fn: Optional[Callable] = None, force_rebuild_all: bool = False):
         """Call this method to run any optional data migrations for optimized reads"""
 
+    def dispose(self):
+        """Explicit lifecycle management."""
+
     def optimize_for_dagit(self, statement_timeout: int):
         """Allows for optimizing database connection / use in the context of a long lived dagit process"""
 
@@ -1,6 +1,9 @@
 # pylint chokes on the perfectly ok import from alembic.migration
+import os
 import threading
+import weakref
 from functools import lru_cache
+from typing import Any, Mapping, Optional
 
 import sqlalchemy as db
 from alembic.command import downgrade, stamp, upgrade
@@ -14,6 +17,45 @@
 
 create_engine = db.create_engine  # exported
 
+# Engines that hold pooled connections, which are not shared with forked processes
+_pooled_engines: "weakref.WeakSet[db.engine.Engine]" = weakref.WeakSet()
+
+
+def _reset_pooled_engines():
+    # The connections of the parent are still in use by it, so the pools of the child process are
+    # replaced without closing them
+    for engine in list(_pooled_engines):
+        engine.pool = engine.pool.recreate()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_pooled_engines)
+
+
+def create_pooled_engine(
+    url: str, pool_config: Optional[Mapping[str, Any]] = None, **kwargs
+) -> db.engine.Engine:
+    """Create an engine that pools its connections as configured by ``pool_config`` (see
+    :py:func:`~dagster.core.storage.config.pool_config`), or that opens a new connection for
+    every use if it is not set.
+
+    Engines with pools are safe to use across forks: a forked process starts with empty pools.
+    """
+    if not pool_config:
+        return create_engine(url, poolclass=db.pool.NullPool, **kwargs)
+
+    engine = create_engine(
+        url,
+        poolclass=db.pool.QueuePool,
+        pool_size=pool_config.get("pool_size", 5),
+        max_overflow=pool_config.get("max_overflow", 10),
+        pool_pre_ping=pool_config.get("pool_pre_ping", True),
+        pool_recycle=pool_config.get("pool_recycle", 3600),
+        **kwargs,
+    )
+    _pooled_engines.add(engine)
+    return engine
+
 
 ALEMBIC_SCRIPTS_LOCATION = "dagster:core/storage/alembic"
 
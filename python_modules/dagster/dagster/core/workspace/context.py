@@ -473,7 +473,13 @@ def _load_workspace(self):
     def _create_location_from_origin(
         self, origin: RepositoryLocationOrigin
     ) -> Optional[RepositoryLocation]:
-        if not self._grpc_server_registry.supports_origin(origin):
+        if isinstance(origin, GrpcServerRepositoryLocationOrigin):
+            return GrpcServerRepositoryLocation(
+                origin,
+                lazy_load_pipelines=self._instance.code_server_lazy_load_pipelines,
+                max_cached_pipelines=self._instance.code_server_max_cached_pipelines,
+            )
+        elif not self._grpc_server_registry.supports_origin(origin):
             return origin.create_location()
         else:
             endpoint = (
@@ -491,6 +497,8 @@ def _create_location_from_origin(
                 heartbeat=True,
                 watch_server=False,
                 grpc_server_registry=self._grpc_server_registry,
+                lazy_load_pipelines=self._instance.code_server_lazy_load_pipelines,
+                max_cached_pipelines=self._instance.code_server_max_cached_pipelines,
             )
 
     @property
@@ -82,7 +82,7 @@ def execute_backfill_iteration(instance, workspace, logger, debug_crash_flags=No
                 if backfill_job.status != BulkActionStatus.REQUESTED:
                     break
 
-                chunk, checkpoint, has_more = _get_partitions_chunk(
+                chunk, checkpoint, checkpoint_index, has_more = _get_partitions_chunk(
                     instance, logger, backfill_job, CHECKPOINT_COUNT
                 )
                 _check_for_debug_crash(debug_crash_flags, "BEFORE_SUBMIT")
@@ -102,7 +102,9 @@ def execute_backfill_iteration(instance, workspace, logger, debug_crash_flags=No
                 if has_more:
                     # refetch, in case the backfill was updated in the meantime
                     backfill_job = instance.get_backfill(backfill_job.backfill_id)
-                    instance.update_backfill(backfill_job.with_partition_checkpoint(checkpoint))
+                    instance.update_backfill(
+                        backfill_job.with_partition_checkpoint(checkpoint, checkpoint_index)
+                    )
                     yield
                     time.sleep(CHECKPOINT_INTERVAL)
                 else:
@@ -123,27 +125,27 @@ def execute_backfill_iteration(instance, workspace, logger, debug_crash_flags=No
 def _get_partitions_chunk(instance, logger, backfill_job, chunk_size):
     check.inst_param(backfill_job, "backfill_job", PartitionBackfill)
     partition_names = backfill_job.partition_names
-    checkpoint = backfill_job.last_submitted_partition_name
-
-    if (
-        backfill_job.last_submitted_partition_name
-        and backfill_job.last_submitted_partition_name in partition_names
-    ):
-        index = partition_names.index(backfill_job.last_submitted_partition_name)
-        partition_names = partition_names[index + 1 :]
-
-    # for idempotence, fetch all runs with the current backfill id
-    backfill_runs = instance.get_runs(
-        RunsFilter(tags=PipelineRun.tags_for_backfill_id(backfill_job.backfill_id))
-    )
-    completed_partitions = set([run.tags.get(PARTITION_NAME_TAG) for run in backfill_runs])
-    initial_checkpoint = (
-        partition_names.index(checkpoint) + 1 if checkpoint and checkpoint in partition_names else 0
-    )
-    partition_names = partition_names[initial_checkpoint:]
-    has_more = chunk_size < len(partition_names)
-    partitions_chunk = partition_names[:chunk_size]
-    next_checkpoint = partitions_chunk[-1]
+    checkpoint_index = backfill_job.partition_checkpoint_index
+    start = checkpoint_index + 1 if checkpoint_index is not None else 0
+
+    has_more = start + chunk_size < len(partition_names)
+    partitions_chunk = partition_names[start : start + chunk_size]
+    next_checkpoint_index = start + len(partitions_chunk) - 1
+    next_checkpoint = partitions_chunk[-1] if partitions_chunk else None
+
+    # for idempotence, fetch the runs of the backfill for the partitions of this chunk, which may
+    # have been submitted before the backfill was interrupted
+    completed_partitions = set()
+    if partitions_chunk:
+        backfill_runs = instance.get_run_summary_records(
+            RunsFilter(
+                tags={
+                    **PipelineRun.tags_for_backfill_id(backfill_job.backfill_id),
+                    PARTITION_NAME_TAG: partitions_chunk,
+                }
+            )
+        )
+        completed_partitions = {record.tags.get(PARTITION_NAME_TAG) for record in backfill_runs}
 
     to_skip = set(partitions_chunk).intersection(completed_partitions)
     if to_skip:
@@ -155,4 +157,4 @@ def _get_partitions_chunk(instance, logger, backfill_job, chunk_size):
         for partition_name in partitions_chunk
         if partition_name not in completed_partitions
     ]
-    return to_submit, next_checkpoint, has_more
+    return to_submit, next_checkpoint, next_checkpoint_index, has_more
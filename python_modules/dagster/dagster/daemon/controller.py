@@ -94,7 +94,10 @@ def daemon_controller_from_instance(
             @contextmanager
             def _context_fn():
                 with DaemonWorkspace(
-                    grpc_server_registry, workspace_load_target
+                    grpc_server_registry,
+                    workspace_load_target,
+                    lazy_load_pipelines=instance.code_server_lazy_load_pipelines,
+                    max_cached_pipelines=instance.code_server_max_cached_pipelines,
                 ) as workspace, DagsterInstance.from_ref(  # clone instance object so each thread has its own
                     instance_ref
                 ) as thread_instance:
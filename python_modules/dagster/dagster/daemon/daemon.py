@@ -16,7 +16,7 @@
 from dagster.core.workspace import IWorkspace
 from dagster.daemon.backfill import execute_backfill_iteration
 from dagster.daemon.monitoring import execute_monitoring_iteration
-from dagster.daemon.sensor import execute_sensor_iteration_loop
+from dagster.daemon.sensor import SensorEvaluationPool, execute_sensor_iteration_loop
 from dagster.daemon.types import DaemonHeartbeat
 from dagster.scheduler.scheduler import execute_scheduler_iteration_loop
 from dagster.utils.error import SerializableErrorInfo, serializable_error_info_from_exc_info
@@ -27,6 +27,7 @@ def get_default_daemon_logger(daemon_name):
 
 
 DAEMON_HEARTBEAT_ERROR_LIMIT = 5  # Show at most 5 errors
+DEFAULT_SENSOR_NUM_WORKERS = 4  # Threads used to evaluate sensors when sensors.use_threads is set
 TELEMETRY_LOGGING_INTERVAL = 3600 * 24  # Interval (in seconds) at which to log that daemon is alive
 _telemetry_daemon_session_id = str(uuid.uuid4())
 
@@ -225,7 +226,20 @@ def daemon_type(cls):
         return "SENSOR"
 
     def core_loop(self, instance, workspace):
-        yield from execute_sensor_iteration_loop(instance, workspace, self._logger)
+        if not instance.sensor_use_threads:
+            yield from execute_sensor_iteration_loop(instance, workspace, self._logger)
+            return
+
+        with SensorEvaluationPool(
+            max_workers=instance.sensor_num_workers or DEFAULT_SENSOR_NUM_WORKERS,
+            max_workers_per_location=instance.sensor_num_workers_per_location,
+        ) as sensor_evaluation_pool:
+            yield from execute_sensor_iteration_loop(
+                instance,
+                workspace,
+                self._logger,
+                sensor_evaluation_pool=sensor_evaluation_pool,
+            )
 
 
 class BackfillDaemon(IntervalDaemon):
@@ -2,7 +2,8 @@
 import sys
 import time
 from collections import defaultdict
-from typing import Dict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Dict, NamedTuple, Optional
 
 from dagster import DagsterEvent, DagsterEventType
 from dagster import _check as check
@@ -13,6 +14,7 @@
     PipelineRun,
     PipelineRunStatus,
     RunsFilter,
+    RunSummaryRecord,
 )
 from dagster.core.storage.tags import PRIORITY_TAG
 from dagster.core.workspace import IWorkspace
@@ -27,7 +29,9 @@ class _TagConcurrencyLimitsCounter:
 
     def __init__(self, tag_concurrency_limits, in_progress_runs):
         check.opt_list_param(tag_concurrency_limits, "tag_concurrency_limits", of_type=dict)
-        check.list_param(in_progress_runs, "in_progress_runs", of_type=PipelineRun)
+        check.list_param(
+            in_progress_runs, "in_progress_runs", of_type=(PipelineRun, RunSummaryRecord)
+        )
 
         self._key_limits: Dict[str, int] = {}
         self._key_value_limits: Dict[(str, str), int] = {}
@@ -92,6 +96,24 @@ def update_counters_with_launched_run(self, run):
                 self._unique_value_counts[tag_tuple] += 1
 
 
+class DequeueIterationStats(
+    NamedTuple(
+        "_DequeueIterationStats",
+        [
+            ("num_queued", int),
+            ("num_launched", int),
+            ("num_skipped", int),
+            ("num_errors", int),
+            ("elapsed_seconds", float),
+        ],
+    )
+):
+    """
+    Throughput of a single iteration of the QueuedRunCoordinatorDaemon. Skipped runs are runs that
+    were no longer queued when they were claimed, e.g. because another daemon launched them.
+    """
+
+
 class QueuedRunCoordinatorDaemon(IntervalDaemon):
     """
     Used with the QueuedRunCoordinator on the instance. This process finds queued runs from the run
@@ -102,10 +124,19 @@ class QueuedRunCoordinatorDaemon(IntervalDaemon):
     def daemon_type(cls):
         return "QUEUED_RUN_COORDINATOR"
 
+    def __init__(self, interval_seconds):
+        super().__init__(interval_seconds)
+        self._last_iteration_stats = None
+
+    @property
+    def last_iteration_stats(self) -> Optional["DequeueIterationStats"]:
+        return self._last_iteration_stats
+
     def run_iteration(self, instance, workspace):
         check.inst_param(instance, "instance", DagsterInstance)
         check.inst_param(workspace, "workspace", IWorkspace)
 
+        start_time = time.perf_counter()
         run_queue_config = instance.run_coordinator.get_run_queue_config()
 
         max_concurrent_runs = run_queue_config.max_concurrent_runs
@@ -114,6 +145,7 @@ def run_iteration(self, instance, workspace):
         in_progress_runs = self._get_in_progress_runs(instance)
 
         max_concurrent_runs_enabled = max_concurrent_runs != -1  # setting to -1 disables the limit
+        max_runs_to_launch = None
         if max_concurrent_runs_enabled:
             max_runs_to_launch = max_concurrent_runs - len(in_progress_runs)
 
@@ -124,6 +156,13 @@ def run_iteration(self, instance, workspace):
                         len(in_progress_runs), max_concurrent_runs
                     )
                 )
+                self._last_iteration_stats = DequeueIterationStats(
+                    num_queued=0,
+                    num_launched=0,
+                    num_skipped=0,
+                    num_errors=0,
+                    elapsed_seconds=time.perf_counter() - start_time,
+                )
                 return
 
         queued_runs = self._get_queued_runs(instance)
@@ -136,46 +175,133 @@ def run_iteration(self, instance, workspace):
         # place in order
         sorted_runs = self._priority_sort(queued_runs)
 
-        # launch until blocked by limit rules
-        num_dequeued_runs = 0
         tag_concurrency_limits_counter = _TagConcurrencyLimitsCounter(
             tag_concurrency_limits, in_progress_runs
         )
 
+        if instance.run_coordinator.dequeue_use_threads:
+            results = self._dequeue_runs_in_parallel(
+                instance,
+                workspace,
+                sorted_runs,
+                tag_concurrency_limits_counter,
+                max_runs_to_launch,
+                instance.run_coordinator.dequeue_num_workers,
+            )
+        else:
+            results = self._dequeue_runs_serially(
+                instance,
+                workspace,
+                sorted_runs,
+                tag_concurrency_limits_counter,
+                max_runs_to_launch,
+            )
+
+        num_launched = 0
+        num_skipped = 0
+        num_errors = 0
+        for launched, error_info in results:
+            if error_info:
+                num_errors += 1
+            elif launched:
+                num_launched += 1
+            else:
+                num_skipped += 1
+
+            yield error_info
+
+        elapsed_seconds = time.perf_counter() - start_time
+        self._last_iteration_stats = DequeueIterationStats(
+            num_queued=len(queued_runs),
+            num_launched=num_launched,
+            num_skipped=num_skipped,
+            num_errors=num_errors,
+            elapsed_seconds=elapsed_seconds,
+        )
+
+        if num_launched > 0:
+            self._logger.info(
+                "Launched %d runs in %.2f seconds (%.1f runs/second).",
+                num_launched,
+                elapsed_seconds,
+                num_launched / elapsed_seconds if elapsed_seconds else 0.0,
+            )
+
+    def _dequeue_runs_serially(
+        self, instance, workspace, sorted_runs, tag_concurrency_limits_counter, max_runs_to_launch
+    ):
+        # launch until blocked by limit rules
+        num_dequeued_runs = 0
+
         for run in sorted_runs:
-            if max_concurrent_runs_enabled and num_dequeued_runs >= max_runs_to_launch:
+            if max_runs_to_launch is not None and num_dequeued_runs >= max_runs_to_launch:
                 break
 
             if tag_concurrency_limits_counter.is_run_blocked(run):
                 continue
 
-            error_info = None
+            launched, error_info = self._dequeue_run_with_error_handling(instance, run, workspace)
 
-            try:
-                self._dequeue_run(instance, run, workspace)
-            except Exception:
-                error_info = serializable_error_info_from_exc_info(sys.exc_info())
+            if not error_info:
+                tag_concurrency_limits_counter.update_counters_with_launched_run(run)
+                num_dequeued_runs += 1
 
-                message = (
-                    f"Caught an error for run {run.run_id} while removing it from the queue."
-                    " Marking the run as failed and dropping it from the queue"
-                )
-                message_with_full_error = f"{message}: {error_info.to_string()}"
+            yield launched, error_info
+
+    def _dequeue_runs_in_parallel(
+        self,
+        instance,
+        workspace,
+        sorted_runs,
+        tag_concurrency_limits_counter,
+        max_runs_to_launch,
+        num_workers,
+    ):
+        # The runs to launch are all picked before any of them are launched, so each run takes up
+        # its slot in the limits whether or not its launch succeeds. Slots of runs that fail to
+        # launch are freed up on the next iteration.
+        runs_to_launch = []
+        for run in sorted_runs:
+            if max_runs_to_launch is not None and len(runs_to_launch) >= max_runs_to_launch:
+                break
 
-                self._logger.error(message_with_full_error)
-                instance.report_run_failed(run, message_with_full_error)
+            if tag_concurrency_limits_counter.is_run_blocked(run):
+                continue
 
-                # modify the original error, so that the extra message appears in heartbeats
-                error_info = error_info._replace(message=f"{message}: {error_info.message}")
+            tag_concurrency_limits_counter.update_counters_with_launched_run(run)
+            runs_to_launch.append(run)
 
-            else:
-                tag_concurrency_limits_counter.update_counters_with_launched_run(run)
-                num_dequeued_runs += 1
+        if not runs_to_launch:
+            return
 
-            yield error_info
+        with ThreadPoolExecutor(
+            max_workers=min(num_workers, len(runs_to_launch)),
+            thread_name_prefix="run_dequeue_worker",
+        ) as executor:
+            futures = [
+                executor.submit(self._dequeue_run_with_error_handling, instance, run, workspace)
+                for run in runs_to_launch
+            ]
+            for future in as_completed(futures):
+                yield future.result()
+
+    def _dequeue_run_with_error_handling(self, instance, run, workspace):
+        try:
+            return self._dequeue_run(instance, run, workspace), None
+        except Exception:
+            error_info = serializable_error_info_from_exc_info(sys.exc_info())
+
+            message = (
+                f"Caught an error for run {run.run_id} while removing it from the queue."
+                " Marking the run as failed and dropping it from the queue"
+            )
+            message_with_full_error = f"{message}: {error_info.to_string()}"
+
+            self._logger.error(message_with_full_error)
+            instance.report_run_failed(run, message_with_full_error)
 
-        if num_dequeued_runs > 0:
-            self._logger.info("Launched %d runs.", num_dequeued_runs)
+            # modify the original error, so that the extra message appears in heartbeats
+            return False, error_info._replace(message=f"{message}: {error_info.message}")
 
     def _get_queued_runs(self, instance):
         queued_runs_filter = RunsFilter(statuses=[PipelineRunStatus.QUEUED])
@@ -186,8 +312,11 @@ def _get_queued_runs(self, instance):
         return runs
 
     def _get_in_progress_runs(self, instance):
+        # only the tags of in progress runs are needed, so their run bodies are not loaded
         # Note: should add a maximum fetch limit https://github.com/dagster-io/dagster/issues/3339
-        return instance.get_runs(filters=RunsFilter(statuses=IN_PROGRESS_RUN_STATUSES))
+        return instance.get_run_summary_records(
+            filters=RunsFilter(statuses=IN_PROGRESS_RUN_STATUSES)
+        )
 
     def _priority_sort(self, runs):
         def get_priority(run):
@@ -201,17 +330,14 @@ def get_priority(run):
         return sorted(runs, key=get_priority, reverse=True)
 
     def _dequeue_run(self, instance, run, workspace):
-        # double check that the run is still queued before dequeing
-        reloaded_run = instance.get_run_by_id(run.run_id)
-
-        if reloaded_run.status != PipelineRunStatus.QUEUED:
-            self._logger.info(
-                "Run %s is now %s instead of QUEUED, skipping",
-                reloaded_run.run_id,
-                reloaded_run.status,
-            )
-            return
-
+        # claim the run before dequeuing it, so that it is only launched once even if it is being
+        # dequeued by another process at the same time
+        if not instance.claim_queued_run(run.run_id):
+            self._logger.info("Run %s is no longer QUEUED, skipping", run.run_id)
+            return False
+
+        # the dequeued event does not change the status of the run, which stays STARTING, so that
+        # the run keeps counting toward the concurrency limits while it is being launched
         dequeued_event = DagsterEvent(
             event_type_value=DagsterEventType.PIPELINE_DEQUEUED.value,
             pipeline_name=run.pipeline_name,
@@ -228,3 +354,4 @@ def _dequeue_run(self, instance, run, workspace):
         instance.handle_new_event(event_record)
 
         instance.launch_run(run.run_id, workspace)
+        return True
@@ -1,7 +1,9 @@
 import os
 import sys
+import threading
 import time
-from typing import Dict, NamedTuple, Optional
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, List, NamedTuple, Optional
 
 import pendulum
 
@@ -24,13 +26,18 @@
 from dagster.core.storage.tags import RUN_KEY_TAG, SENSOR_NAME_TAG
 from dagster.core.telemetry import SENSOR_RUN_CREATED, hash_name, log_action
 from dagster.core.workspace import IWorkspace
+from dagster.grpc.client import DEFAULT_GRPC_TIMEOUT
 from dagster.utils import merge_dicts
-from dagster.utils.error import serializable_error_info_from_exc_info
+from dagster.utils.error import SerializableErrorInfo, serializable_error_info_from_exc_info
 
 MIN_INTERVAL_LOOP_TIME = 5
 
 FINISHED_TICK_STATES = [TickStatus.SKIPPED, TickStatus.SUCCESS, TickStatus.FAILURE]
 
+# Sensor evaluations that take longer than this fraction of the evaluation timeout are logged at
+# info level, so that sensors at risk of timing out show up in the daemon logs.
+SLOW_SENSOR_EVALUATION_TIMEOUT_FRACTION = 0.5
+
 
 class DagsterSensorDaemonError(DagsterError):
     """Error when running the SensorDaemon"""
@@ -166,15 +173,100 @@ def _check_for_debug_crash(debug_crash_flags, key):
     raise Exception("Process didn't terminate after sending crash signal")
 
 
+class SensorEvaluationPool:
+    """Evaluates sensor ticks on a pool of threads, so that a slow sensor does not hold up the
+    ticks of the other sensors.
+
+    A sensor is not submitted again while its previous tick is still being evaluated, and at most
+    `max_workers_per_location` ticks are evaluated at once against any one repository location.
+    Sensors that can't be submitted are picked up again on a later iteration. Errors raised while
+    evaluating a tick are collected so that the daemon can still report them from its main thread.
+    """
+
+    def __init__(self, max_workers: int, max_workers_per_location: Optional[int] = None):
+        self._max_workers_per_location = check.opt_int_param(
+            max_workers_per_location, "max_workers_per_location"
+        )
+        self._executor = ThreadPoolExecutor(
+            max_workers=check.int_param(max_workers, "max_workers"),
+            thread_name_prefix="sensor_daemon_worker",
+        )
+
+        # INVARIANT: _lock protects _futures and _errors
+        self._lock = threading.Lock()
+        self._futures: Dict[str, Future] = {}
+        self._location_names: Dict[str, str] = {}
+        self._errors: List[SerializableErrorInfo] = []
+
+    def can_submit(self, selector_id: str, location_name: str) -> bool:
+        with self._lock:
+            if selector_id in self._futures:
+                return False
+            if self._max_workers_per_location is None:
+                return True
+            in_flight_for_location = sum(
+                1 for name in self._location_names.values() if name == location_name
+            )
+            return in_flight_for_location < self._max_workers_per_location
+
+    def submit(self, selector_id: str, location_name: str, tick_generator_fn, *args):
+        def _evaluate():
+            errors = [error_info for error_info in tick_generator_fn(*args) if error_info]
+            with self._lock:
+                self._errors.extend(errors)
+
+        with self._lock:
+            future = self._executor.submit(_evaluate)
+            self._futures[selector_id] = future
+            self._location_names[selector_id] = location_name
+
+        future.add_done_callback(lambda _: self._on_done(selector_id))
+
+    def _on_done(self, selector_id: str):
+        with self._lock:
+            self._futures.pop(selector_id, None)
+            self._location_names.pop(selector_id, None)
+
+    @property
+    def in_flight_count(self) -> int:
+        with self._lock:
+            return len(self._futures)
+
+    def pop_errors(self) -> List[SerializableErrorInfo]:
+        with self._lock:
+            errors = self._errors
+            self._errors = []
+        return errors
+
+    def shutdown(self, wait: bool = True):
+        self._executor.shutdown(wait=wait)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, _exception_type, _exception_value, _traceback):
+        self.shutdown()
+
+
 RELOAD_WORKSPACE = 60
 
+# How often the daemon checks whether the ticks still in flight on its pool have finished, when it is
+# waiting for them before reloading the workspace
+IN_FLIGHT_POLL_INTERVAL = 0.5
 
-def execute_sensor_iteration_loop(instance, workspace, logger, until=None):
+
+def execute_sensor_iteration_loop(
+    instance, workspace, logger, until=None, sensor_evaluation_pool=None
+):
     """
     Helper function that performs sensor evaluations on a tighter loop, while reusing grpc locations
     within a given daemon interval.  Rather than relying on the daemon machinery to run the
     iteration loop every 30 seconds, sensors are continuously evaluated, every 5 seconds. We rely on
     each sensor definition's min_interval to check that sensor evaluations are spaced appropriately.
+
+    If a SensorEvaluationPool is passed in, sensor ticks are evaluated on its threads instead of
+    one after the other on the daemon thread. The ticks in flight on the pool share the workspace,
+    so it is only reloaded once they have all finished.
     """
     workspace_loaded_time = pendulum.now("UTC").timestamp()
 
@@ -187,12 +279,22 @@ def execute_sensor_iteration_loop(instance, workspace, logger, until=None):
             break
 
         if start_time - workspace_loaded_time > RELOAD_WORKSPACE:
+            if sensor_evaluation_pool:
+                # cleaning up the workspace tears down the locations that the ticks in flight are
+                # evaluated against, so stop submitting ticks until they have finished
+                while sensor_evaluation_pool.in_flight_count:
+                    time.sleep(IN_FLIGHT_POLL_INTERVAL)
+                    yield
             workspace.cleanup()
             workspace_loaded_time = pendulum.now("UTC").timestamp()
             workspace_iteration = 0
 
         yield from execute_sensor_iteration(
-            instance, logger, workspace, log_verbose_checks=(workspace_iteration == 0)
+            instance,
+            logger,
+            workspace,
+            log_verbose_checks=(workspace_iteration == 0),
+            sensor_evaluation_pool=sensor_evaluation_pool,
         )
 
         loop_duration = pendulum.now("UTC").timestamp() - start_time
@@ -203,10 +305,20 @@ def execute_sensor_iteration_loop(instance, workspace, logger, until=None):
 
 
 def execute_sensor_iteration(
-    instance, logger, workspace, log_verbose_checks=True, debug_crash_flags=None
+    instance,
+    logger,
+    workspace,
+    log_verbose_checks=True,
+    debug_crash_flags=None,
+    sensor_evaluation_pool=None,
 ):
     check.inst_param(workspace, "workspace", IWorkspace)
     check.inst_param(instance, "instance", DagsterInstance)
+    check.opt_inst_param(sensor_evaluation_pool, "sensor_evaluation_pool", SensorEvaluationPool)
+
+    if sensor_evaluation_pool:
+        # report errors from ticks that finished on the pool since the last iteration
+        yield from sensor_evaluation_pool.pop_errors()
 
     workspace_snapshot = {
         location_entry.origin.location_name: location_entry
@@ -282,55 +394,94 @@ def execute_sensor_iteration(
     now = pendulum.now("UTC")
 
     for external_sensor in sensors.values():
-        sensor_name = external_sensor.name
-        sensor_debug_crash_flags = debug_crash_flags.get(sensor_name) if debug_crash_flags else None
-        error_info = None
-        try:
-            sensor_state = all_sensor_states.get(external_sensor.selector_id)
-            if not sensor_state:
-                assert external_sensor.default_status == DefaultSensorStatus.RUNNING
-                sensor_state = InstigatorState(
-                    external_sensor.get_external_origin(),
-                    InstigatorType.SENSOR,
-                    InstigatorStatus.AUTOMATICALLY_RUNNING,
-                    SensorInstigatorData(min_interval=external_sensor.min_interval_seconds),
-                )
-                instance.add_instigator_state(sensor_state)
-            elif _is_under_min_interval(sensor_state, external_sensor, now):
+        sensor_debug_crash_flags = (
+            debug_crash_flags.get(external_sensor.name) if debug_crash_flags else None
+        )
+        sensor_state = all_sensor_states.get(external_sensor.selector_id)
+        if sensor_evaluation_pool:
+            location_name = external_sensor.handle.location_name
+            if not sensor_evaluation_pool.can_submit(external_sensor.selector_id, location_name):
                 continue
+            sensor_evaluation_pool.submit(
+                external_sensor.selector_id,
+                location_name,
+                _process_tick_generator,
+                instance,
+                logger,
+                workspace,
+                external_sensor,
+                sensor_state,
+                now,
+                sensor_debug_crash_flags,
+            )
+            yield
+        else:
+            yield from _process_tick_generator(
+                instance,
+                logger,
+                workspace,
+                external_sensor,
+                sensor_state,
+                now,
+                sensor_debug_crash_flags,
+            )
 
-            tick = instance.create_tick(
-                TickData(
-                    instigator_origin_id=sensor_state.instigator_origin_id,
-                    instigator_name=sensor_state.instigator_name,
-                    instigator_type=InstigatorType.SENSOR,
-                    status=TickStatus.STARTED,
-                    timestamp=now.timestamp(),
-                    selector_id=external_sensor.selector_id,
-                )
+
+def _process_tick_generator(
+    instance,
+    logger,
+    workspace,
+    external_sensor,
+    sensor_state,
+    now,
+    sensor_debug_crash_flags,
+):
+    error_info = None
+    try:
+        if not sensor_state:
+            assert external_sensor.default_status == DefaultSensorStatus.RUNNING
+            sensor_state = InstigatorState(
+                external_sensor.get_external_origin(),
+                InstigatorType.SENSOR,
+                InstigatorStatus.AUTOMATICALLY_RUNNING,
+                SensorInstigatorData(min_interval=external_sensor.min_interval_seconds),
             )
+            instance.add_instigator_state(sensor_state)
+        elif _is_under_min_interval(sensor_state, external_sensor, now):
+            return
 
-            _check_for_debug_crash(sensor_debug_crash_flags, "TICK_CREATED")
-
-            with SensorLaunchContext(external_sensor, tick, instance, logger) as tick_context:
-                _check_for_debug_crash(sensor_debug_crash_flags, "TICK_HELD")
-                yield from _evaluate_sensor(
-                    tick_context,
-                    instance,
-                    workspace,
-                    external_sensor,
-                    sensor_state,
-                    sensor_debug_crash_flags,
-                )
-        except Exception:
-            error_info = serializable_error_info_from_exc_info(sys.exc_info())
-            logger.error(
-                "Sensor daemon caught an error for sensor {sensor_name} : {error_info}".format(
-                    sensor_name=external_sensor.name,
-                    error_info=error_info.to_string(),
-                )
+        tick = instance.create_tick(
+            TickData(
+                instigator_origin_id=sensor_state.instigator_origin_id,
+                instigator_name=sensor_state.instigator_name,
+                instigator_type=InstigatorType.SENSOR,
+                status=TickStatus.STARTED,
+                timestamp=now.timestamp(),
+                selector_id=external_sensor.selector_id,
             )
-        yield error_info
+        )
+
+        _check_for_debug_crash(sensor_debug_crash_flags, "TICK_CREATED")
+
+        with SensorLaunchContext(external_sensor, tick, instance, logger) as tick_context:
+            _check_for_debug_crash(sensor_debug_crash_flags, "TICK_HELD")
+            yield from _evaluate_sensor(
+                tick_context,
+                instance,
+                workspace,
+                external_sensor,
+                sensor_state,
+                sensor_debug_crash_flags,
+            )
+    except Exception:
+        error_info = serializable_error_info_from_exc_info(sys.exc_info())
+        logger.error(
+            "Sensor daemon caught an error for sensor {sensor_name} : {error_info}".format(
+                sensor_name=external_sensor.name,
+                error_info=error_info.to_string(),
+            )
+        )
+    yield error_info
 
 
 def _evaluate_sensor(
@@ -349,6 +500,7 @@ def _evaluate_sensor(
         sensor_origin.external_repository_origin.repository_location_origin.location_name
     )
 
+    evaluation_start_time = time.perf_counter()
     sensor_runtime_data = repo_location.get_external_sensor_execution_data(
         instance,
         repository_handle,
@@ -356,7 +508,19 @@ def _evaluate_sensor(
         state.instigator_data.last_tick_timestamp if state.instigator_data else None,
         state.instigator_data.last_run_key if state.instigator_data else None,
         state.instigator_data.cursor if state.instigator_data else None,
+        timeout=instance.sensor_evaluation_timeout_seconds,
     )
+    evaluation_seconds = time.perf_counter() - evaluation_start_time
+    evaluation_timeout = instance.sensor_evaluation_timeout_seconds or DEFAULT_GRPC_TIMEOUT
+    if evaluation_seconds >= evaluation_timeout * SLOW_SENSOR_EVALUATION_TIMEOUT_FRACTION:
+        context.logger.info(
+            f"Evaluated sensor {external_sensor.name} in {evaluation_seconds:.2f} seconds, "
+            f"close to its evaluation timeout of {evaluation_timeout} seconds"
+        )
+    else:
+        context.logger.debug(
+            f"Evaluated sensor {external_sensor.name} in {evaluation_seconds:.2f} seconds"
+        )
 
     yield
 
@@ -1,4 +1,5 @@
 import sys
+import threading
 import time
 from abc import abstractmethod
 from typing import Dict
@@ -6,7 +7,11 @@
 import dagster._check as check
 from dagster.core.errors import DagsterRepositoryLocationLoadError
 from dagster.core.host_representation.grpc_server_registry import GrpcServerRegistry
-from dagster.core.host_representation.origin import RepositoryLocationOrigin
+from dagster.core.host_representation.external import DEFAULT_MAX_CACHED_PIPELINES
+from dagster.core.host_representation.origin import (
+    GrpcServerRepositoryLocationOrigin,
+    RepositoryLocationOrigin,
+)
 from dagster.core.host_representation.repository_location import (
     GrpcServerRepositoryLocation,
     RepositoryLocation,
@@ -25,34 +30,40 @@ class BaseDaemonWorkspace(IWorkspace):
     Both the list of locations and the RepositoryLocation objects are cached until the daemon
     code calls cleanup() on the DaemonWorkspace - daemons are responsible for doing this
     periodically whenever they might want to check for code updates and workspace.yaml updates.
+
+    Daemons that evaluate on several threads may share their DaemonWorkspace between them: loading
+    the locations is locked, so that they are only loaded once. Since cleanup() tears down the
+    locations, those daemons must only call it once no thread is using them.
     """
 
     def __init__(self):
         self._location_entries = None
+        # INVARIANT: _lock protects _location_entries
+        self._lock = threading.RLock()
 
     def __enter__(self):
         return self
 
     def get_workspace_snapshot(self) -> Dict[str, WorkspaceLocationEntry]:
-        if self._location_entries == None:
-            self._location_entries = self._load_workspace()
-        return self._location_entries
+        with self._lock:
+            if self._location_entries == None:
+                self._location_entries = self._load_workspace()
+            return self._location_entries
 
     @abstractmethod
     def _load_workspace(self) -> Dict[str, WorkspaceLocationEntry]:
         pass
 
     def get_repository_location(self, location_name: str) -> RepositoryLocation:
-        if self._location_entries == None:
-            self._location_entries = self._load_workspace()
+        location_entries = self.get_workspace_snapshot()
 
-        if location_name not in self._location_entries:
+        if location_name not in location_entries:
             raise DagsterRepositoryLocationLoadError(
                 f"Location {location_name} does not exist in workspace",
                 load_error_infos=[],
             )
 
-        location_entry = self._location_entries[location_name]
+        location_entry = location_entries[location_name]
 
         if location_entry.load_error:
             raise DagsterRepositoryLocationLoadError(
@@ -69,11 +80,12 @@ def get_repository_location(self, location_name: str) -> RepositoryLocation:
         return location_entry.repository_location
 
     def cleanup(self) -> None:
-        if self._location_entries != None:
-            for location_entry in self._location_entries.values():
-                if location_entry.repository_location:
-                    location_entry.repository_location.cleanup()
-            self._location_entries = None
+        with self._lock:
+            if self._location_entries != None:
+                for location_entry in self._location_entries.values():
+                    if location_entry.repository_location:
+                        location_entry.repository_location.cleanup()
+                self._location_entries = None
 
     def __exit__(self, exception_type, exception_value, traceback):
         self.cleanup()
@@ -81,11 +93,17 @@ def __exit__(self, exception_type, exception_value, traceback):
 
 class DaemonWorkspace(BaseDaemonWorkspace):
     def __init__(
-        self, grpc_server_registry: GrpcServerRegistry, workspace_load_target: WorkspaceLoadTarget
+        self,
+        grpc_server_registry: GrpcServerRegistry,
+        workspace_load_target: WorkspaceLoadTarget,
+        lazy_load_pipelines: bool = False,
+        max_cached_pipelines: int = DEFAULT_MAX_CACHED_PIPELINES,
     ):
         self._grpc_server_registry = check.inst_param(
             grpc_server_registry, "grpc_server_registry", GrpcServerRegistry
         )
+        self._lazy_load_pipelines = check.bool_param(lazy_load_pipelines, "lazy_load_pipelines")
+        self._max_cached_pipelines = check.int_param(max_cached_pipelines, "max_cached_pipelines")
 
         self._workspace_load_target = check.inst_param(
             workspace_load_target, "workspace_load_target", WorkspaceLoadTarget
@@ -122,7 +140,13 @@ def _load_location(self, origin) -> WorkspaceLocationEntry:
     def _create_location_from_origin(self, origin) -> RepositoryLocation:
         check.inst_param(origin, "origin", RepositoryLocationOrigin)
 
-        if not self._grpc_server_registry.supports_origin(origin):
+        if isinstance(origin, GrpcServerRepositoryLocationOrigin):
+            return GrpcServerRepositoryLocation(
+                origin,
+                lazy_load_pipelines=self._lazy_load_pipelines,
+                max_cached_pipelines=self._max_cached_pipelines,
+            )
+        elif not self._grpc_server_registry.supports_origin(origin):
             return origin.create_location()
         else:
             endpoint = self._grpc_server_registry.get_grpc_endpoint(origin)
@@ -135,4 +159,6 @@ def _create_location_from_origin(self, origin) -> RepositoryLocation:
                 heartbeat=True,
                 watch_server=False,
                 grpc_server_registry=self._grpc_server_registry,
+                lazy_load_pipelines=self._lazy_load_pipelines,
+                max_cached_pipelines=self._max_cached_pipelines,
             )
@@ -26,6 +26,7 @@
     CancelExecutionRequest,
     ExecuteExternalPipelineArgs,
     ExecutionPlanSnapshotArgs,
+    ExternalRepositorySnapshotArgs,
     ExternalScheduleExecutionArgs,
     PartitionArgs,
     PartitionNamesArgs,
@@ -270,6 +271,27 @@ def streaming_external_repository(self, external_repository_origin):
                 "serialized_external_repository_chunk": res.serialized_external_repository_chunk,
             }
 
+    def streaming_external_repository_snapshot_pieces(self, external_repository_snapshot_args):
+        check.inst_param(
+            external_repository_snapshot_args,
+            "external_repository_snapshot_args",
+            ExternalRepositorySnapshotArgs,
+        )
+
+        # Servers that support snapshot pieces accept ExternalRepositorySnapshotArgs in place of
+        # the repository origin, and return a serialized ExternalRepositorySnapshotManifest
+        for res in self._streaming_query(
+            "StreamingExternalRepository",
+            api_pb2.ExternalRepositoryRequest,
+            serialized_repository_python_origin=serialize_dagster_namedtuple(
+                external_repository_snapshot_args
+            ),
+        ):
+            yield {
+                "sequence_number": res.sequence_number,
+                "serialized_external_repository_chunk": res.serialized_external_repository_chunk,
+            }
+
     def external_schedule_execution(self, external_schedule_execution_args):
         check.inst_param(
             external_schedule_execution_args,
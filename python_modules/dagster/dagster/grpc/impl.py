@@ -32,6 +32,8 @@
     ExternalPipelineSubsetResult,
     ExternalScheduleExecutionErrorData,
     ExternalSensorExecutionErrorData,
+    external_pipeline_ref_from_data,
+    external_repository_data_from_def,
 )
 from dagster.core.instance import DagsterInstance
 from dagster.core.snap.execution_plan_snapshot import (
@@ -39,8 +41,9 @@
     snapshot_from_execution_plan,
 )
 from dagster.core.storage.pipeline_run import PipelineRun
-from dagster.grpc.types import ExecutionPlanSnapshotArgs
-from dagster.serdes import deserialize_as
+from dagster.grpc.types import ExecutionPlanSnapshotArgs, ExternalRepositorySnapshotManifest
+from dagster.serdes import deserialize_as, serialize_dagster_namedtuple
+from dagster.serdes.utils import hash_str
 from dagster.serdes.ipc import IPCErrorMessage
 from dagster.seven import nullcontext
 from dagster.utils import start_termination_thread
@@ -376,6 +379,7 @@ def get_external_execution_plan_snapshot(recon_pipeline, args):
                 step_keys_to_execute=args.step_keys_to_execute,
                 known_state=args.known_state,
                 instance_ref=args.instance_ref,
+                pipeline_snapshot_id=args.pipeline_snapshot_id,
             ),
             args.pipeline_snapshot_id,
         )
@@ -385,6 +389,45 @@ def get_external_execution_plan_snapshot(recon_pipeline, args):
         )
 
 
+def get_external_repository_snapshot_manifest(recon_repo, lazy_load_pipelines=False):
+    check.inst_param(recon_repo, "recon_repo", ReconstructableRepository)
+    check.bool_param(lazy_load_pipelines, "lazy_load_pipelines")
+
+    external_repository_data = external_repository_data_from_def(recon_repo.get_definition())
+    serialized_pieces = {}
+
+    def _piece_ids(pieces):
+        piece_ids = []
+        for piece in pieces:
+            serialized_piece = serialize_dagster_namedtuple(piece)
+            piece_id = hash_str(serialized_piece)
+            serialized_pieces[piece_id] = serialized_piece
+            piece_ids.append(piece_id)
+        return piece_ids
+
+    return ExternalRepositorySnapshotManifest(
+        name=external_repository_data.name,
+        pipeline_piece_ids=(
+            []
+            if lazy_load_pipelines
+            else _piece_ids(external_repository_data.external_pipeline_datas)
+        ),
+        schedule_piece_ids=_piece_ids(external_repository_data.external_schedule_datas),
+        partition_set_piece_ids=_piece_ids(external_repository_data.external_partition_set_datas),
+        sensor_piece_ids=_piece_ids(external_repository_data.external_sensor_datas),
+        asset_node_piece_ids=_piece_ids(external_repository_data.external_asset_graph_data),
+        serialized_pieces=serialized_pieces,
+        pipeline_refs=(
+            [
+                external_pipeline_ref_from_data(external_pipeline_data)
+                for external_pipeline_data in external_repository_data.external_pipeline_datas
+            ]
+            if lazy_load_pipelines
+            else None
+        ),
+    )
+
+
 def get_partition_set_execution_param_data(recon_repo, partition_set_name, partition_names):
     repo_definition = recon_repo.get_definition()
     partition_set_def = repo_definition.get_partition_set_def(partition_set_name)
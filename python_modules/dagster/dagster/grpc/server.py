@@ -43,6 +43,7 @@
     StartRunInSubprocessSuccessful,
     get_external_execution_plan_snapshot,
     get_external_pipeline_subset_result,
+    get_external_repository_snapshot_manifest,
     get_external_schedule_execution,
     get_external_sensor_execution,
     get_notebook_data,
@@ -59,6 +60,7 @@
     CancelExecutionResult,
     ExecuteExternalPipelineArgs,
     ExecutionPlanSnapshotArgs,
+    ExternalRepositorySnapshotArgs,
     ExternalScheduleExecutionArgs,
     GetCurrentImageResult,
     ListRepositoriesResponse,
@@ -373,6 +375,7 @@ def ListRepositories(self, request, _context):
             entry_point=self._entry_point,
             container_image=self._container_image,
             container_context=self._container_context,
+            supports_snapshot_pieces=True,
         )
 
         return api_pb2.ListRepositoriesReply(
@@ -475,11 +478,24 @@ def ExternalPipelineSubsetSnapshot(self, request, _context):
 
     def _get_serialized_external_repository_data(self, request):
         try:
-            repository_origin = deserialize_json_to_dagster_namedtuple(
+            # Clients that support snapshot pieces send ExternalRepositorySnapshotArgs in place of
+            # the repository origin
+            repository_origin_or_args = deserialize_json_to_dagster_namedtuple(
                 request.serialized_repository_python_origin
             )
 
-            check.inst_param(repository_origin, "repository_origin", ExternalRepositoryOrigin)
+            if isinstance(repository_origin_or_args, ExternalRepositorySnapshotArgs):
+                manifest = get_external_repository_snapshot_manifest(
+                    self._recon_repository_from_origin(repository_origin_or_args.repository_origin),
+                    lazy_load_pipelines=repository_origin_or_args.lazy_load_pipelines,
+                )
+                return serialize_dagster_namedtuple(
+                    manifest.without_pieces(frozenset(repository_origin_or_args.known_piece_ids))
+                )
+
+            repository_origin = check.inst_param(
+                repository_origin_or_args, "repository_origin", ExternalRepositoryOrigin
+            )
             recon_repo = self._recon_repository_from_origin(repository_origin)
             return serialize_dagster_namedtuple(
                 external_repository_data_from_def(recon_repo.get_definition())
@@ -5,6 +5,7 @@
 from dagster.core.definitions.events import AssetKey
 from dagster.core.execution.plan.state import KnownExecutionState
 from dagster.core.execution.retries import RetryMode
+from dagster.core.host_representation.external_data import ExternalPipelineRef
 from dagster.core.host_representation.origin import (
     ExternalPipelineOrigin,
     ExternalRepositoryOrigin,
@@ -267,6 +268,7 @@ class ListRepositoriesResponse(
             ("entry_point", Optional[List[str]]),
             ("container_image", Optional[str]),
             ("container_context", Optional[Dict[str, Any]]),
+            ("supports_snapshot_pieces", bool),
         ],
     )
 ):
@@ -278,6 +280,7 @@ def __new__(
         entry_point=None,
         container_image=None,
         container_context=None,
+        supports_snapshot_pieces=False,
     ):
         return super(ListRepositoriesResponse, cls).__new__(
             cls,
@@ -302,6 +305,10 @@ def __new__(
                 if container_context != None
                 else None
             ),
+            # Older servers do not set this field, and only return full repository snapshots
+            supports_snapshot_pieces=check.bool_param(
+                supports_snapshot_pieces, "supports_snapshot_pieces"
+            ),
         )
 
 
@@ -364,6 +371,119 @@ def __new__(
         )
 
 
+@whitelist_for_serdes
+class ExternalRepositorySnapshotArgs(
+    NamedTuple(
+        "_ExternalRepositorySnapshotArgs",
+        [
+            ("repository_origin", ExternalRepositoryOrigin),
+            ("known_piece_ids", List[str]),
+            ("lazy_load_pipelines", bool),
+        ],
+    )
+):
+    """Requests the snapshot of a repository as an ExternalRepositorySnapshotManifest, leaving out
+    the pieces that the client already has.
+
+    If lazy_load_pipelines is set, refs to the pipelines of the repository are sent in place of
+    their pieces, and the client loads the data of each pipeline when it is first used.
+    """
+
+    def __new__(
+        cls,
+        repository_origin: ExternalRepositoryOrigin,
+        known_piece_ids: List[str],
+        lazy_load_pipelines: bool = False,
+    ):
+        return super(ExternalRepositorySnapshotArgs, cls).__new__(
+            cls,
+            repository_origin=check.inst_param(
+                repository_origin, "repository_origin", ExternalRepositoryOrigin
+            ),
+            known_piece_ids=check.list_param(known_piece_ids, "known_piece_ids", of_type=str),
+            lazy_load_pipelines=check.bool_param(lazy_load_pipelines, "lazy_load_pipelines"),
+        )
+
+
+@whitelist_for_serdes
+class ExternalRepositorySnapshotManifest(
+    NamedTuple(
+        "_ExternalRepositorySnapshotManifest",
+        [
+            ("name", str),
+            ("pipeline_piece_ids", List[str]),
+            ("schedule_piece_ids", List[str]),
+            ("partition_set_piece_ids", List[str]),
+            ("sensor_piece_ids", List[str]),
+            ("asset_node_piece_ids", List[str]),
+            ("serialized_pieces", Dict[str, str]),
+            ("pipeline_refs", Optional[List[ExternalPipelineRef]]),
+        ],
+    )
+):
+    """An ExternalRepositoryData split into content-addressed pieces: one per pipeline, schedule,
+    partition set, sensor and asset node, identified by the hash of its serialized form.
+
+    The piece id lists hold every piece of the repository, in order. serialized_pieces only holds
+    the pieces that the client did not already have. If pipeline_refs is set, the pipelines of the
+    repository are not sent as pieces.
+    """
+
+    def __new__(
+        cls,
+        name: str,
+        pipeline_piece_ids: List[str],
+        schedule_piece_ids: List[str],
+        partition_set_piece_ids: List[str],
+        sensor_piece_ids: List[str],
+        asset_node_piece_ids: List[str],
+        serialized_pieces: Dict[str, str],
+        pipeline_refs: Optional[List[ExternalPipelineRef]] = None,
+    ):
+        return super(ExternalRepositorySnapshotManifest, cls).__new__(
+            cls,
+            name=check.str_param(name, "name"),
+            pipeline_piece_ids=check.list_param(
+                pipeline_piece_ids, "pipeline_piece_ids", of_type=str
+            ),
+            schedule_piece_ids=check.list_param(
+                schedule_piece_ids, "schedule_piece_ids", of_type=str
+            ),
+            partition_set_piece_ids=check.list_param(
+                partition_set_piece_ids, "partition_set_piece_ids", of_type=str
+            ),
+            sensor_piece_ids=check.list_param(sensor_piece_ids, "sensor_piece_ids", of_type=str),
+            asset_node_piece_ids=check.list_param(
+                asset_node_piece_ids, "asset_node_piece_ids", of_type=str
+            ),
+            serialized_pieces=check.dict_param(
+                serialized_pieces, "serialized_pieces", key_type=str, value_type=str
+            ),
+            pipeline_refs=check.opt_nullable_list_param(
+                pipeline_refs, "pipeline_refs", of_type=ExternalPipelineRef
+            ),
+        )
+
+    @property
+    def piece_ids(self) -> List[str]:
+        return [
+            *self.pipeline_piece_ids,
+            *self.schedule_piece_ids,
+            *self.partition_set_piece_ids,
+            *self.sensor_piece_ids,
+            *self.asset_node_piece_ids,
+        ]
+
+    def without_pieces(self, piece_ids: FrozenSet[str]) -> "ExternalRepositorySnapshotManifest":
+        return self._replace(
+            serialized_pieces={
+                piece_id: serialized_piece
+                for piece_id, serialized_piece in self.serialized_pieces.items()
+                if piece_id not in piece_ids
+            }
+        )
+
+
 @whitelist_for_serdes
 class PartitionNamesArgs(
     NamedTuple(
@@ -21,6 +21,7 @@
     Any,
     Callable,
     Dict,
+    Iterable,
     List,
     Mapping,
     NamedTuple,
@@ -49,11 +50,29 @@
 EnumEntry = Tuple[Type[Enum], Type["EnumSerializer"]]
 
 
+class FieldTable(NamedTuple):
+    """Precomputed per-class metadata used by DefaultNamedTupleSerializer, so that the serializer
+    does not recompute it for every instance it packs."""
+
+    fields: Tuple[str, ...]
+    skip_when_empty: Set[str]
+    serialized_name: str
+    defaults: Mapping[str, Any]
+    # the (index, name, default) of each field that has a `__new__` default
+    default_fields: Tuple[Tuple[int, str, Any], ...]
+    # whether each field with a default may be left out of compact output when it holds the
+    # default, decided the first time an instance of the class holds it
+    omittable: Dict[str, bool]
+
+
 class WhitelistMap(NamedTuple):
     tuples: Dict[str, TupleEntry]
     enums: Dict[str, EnumEntry]
     serialized_names: Dict[str, str]
     deserialized_names: Dict[str, str]
+    field_tables: Dict[Tuple[type, type], FieldTable]
+    # when set, default-valued namedtuple fields are omitted from the serialized output
+    compact: bool = False
 
     def register_tuple(
         self,
@@ -71,6 +90,7 @@ def register_tuple(
             args_for_class: the inspect.signature paramaters for __new__
         """
         self.tuples[name] = (nt, serializer or DefaultNamedTupleSerializer, args_for_class)
+        self.field_tables.clear()
 
     def has_tuple_entry(self, name: str) -> bool:
         return name in self.tuples
@@ -94,6 +114,7 @@ def get_enum_entry(self, name: str) -> EnumEntry:
 
     def register_serialized_name(self, name: str, serialized_name: str):
         self.serialized_names[name] = serialized_name
+        self.field_tables.clear()
 
     def has_serialized_name(self, name: str) -> bool:
         return name in self.serialized_names
@@ -110,9 +131,44 @@ def has_deserialized_name(self, name: str) -> bool:
     def get_deserialized_name(self, name: str) -> str:
         return self.deserialized_names[name]
 
+    def get_field_table(
+        self, serializer: Type["DefaultNamedTupleSerializer"], klass: type
+    ) -> FieldTable:
+        """Returns the field table for the namedtuple class, computing it on first use."""
+        key = (serializer, klass)
+        table = self.field_tables.get(key)
+        if table is None:
+            klass_name = klass.__name__
+            fields = klass._fields  # type: ignore
+            defaults = {
+                param.name: param.default
+                for param in signature(klass.__new__).parameters.values()
+                if param.default is not Parameter.empty
+            }
+            table = FieldTable(
+                fields=fields,
+                skip_when_empty=serializer.skip_when_empty(),
+                serialized_name=(
+                    self.get_serialized_name(klass_name)
+                    if self.has_serialized_name(klass_name)
+                    else klass_name
+                ),
+                defaults=defaults,
+                default_fields=tuple(
+                    (index, field, defaults[field])
+                    for index, field in enumerate(fields)
+                    if field in defaults
+                ),
+                omittable={},
+            )
+            self.field_tables[key] = table
+        return table
+
     @staticmethod
     def create():
-        return WhitelistMap(tuples={}, enums={}, serialized_names={}, deserialized_names={})
+        return WhitelistMap(
+            tuples={}, enums={}, serialized_names={}, deserialized_names={}, field_tables={}
+        )
 
 
 _WHITELIST_MAP = WhitelistMap.create()
@@ -271,6 +327,10 @@ def value_to_storage_dict(
 
 EMPTY_VALUES_TO_SKIP: Tuple[None, List[Any], Dict[Any, Any], Set[Any]] = (None, [], {}, set())
 
+# Values of these exact types are returned as-is by pack_inner_value / unpack_inner_value, so the
+# serializers skip the recursive call (and building the descent path) for them.
+SCALAR_TYPES = frozenset([str, int, float, bool, type(None)])
+
 
 class DefaultNamedTupleSerializer(NamedTupleSerializer):
     @classmethod
@@ -293,7 +353,9 @@ def value_from_storage_dict(
         # the constructor. If a property is present in the serialized object, but doesn't exist in
         # the version of the class loaded into memory, that property will be completely ignored.
         unpacked_dict = {
-            key: unpack_inner_value(value, whitelist_map, f"{descent_path}.{key}")
+            key: value
+            if type(value) in SCALAR_TYPES
+            else unpack_inner_value(value, whitelist_map, f"{descent_path}.{key}")
             for key, value in storage_dict.items()
             if key in args_for_class
         }
@@ -314,43 +376,125 @@ def value_to_storage_dict(
         whitelist_map: WhitelistMap,
         descent_path: str,
     ) -> Dict[str, Any]:
-        skip_when_empty_fields = cls.skip_when_empty()
+        table = whitelist_map.get_field_table(cls, value.__class__)
+        skip_when_empty_fields = table.skip_when_empty
+        fields_to_store = zip(table.fields, value)
+        if whitelist_map.compact:
+            fields_to_store = cls._compact_fields_to_store(value, table)
 
         base_dict = {}
-        for key, inner_value in value._asdict().items():
+        for key, inner_value in fields_to_store:
             if key in skip_when_empty_fields and inner_value in EMPTY_VALUES_TO_SKIP:
                 continue
-            base_dict[key] = pack_inner_value(inner_value, whitelist_map, f"{descent_path}.{key}")
+            base_dict[key] = (
+                inner_value
+                if type(inner_value) in SCALAR_TYPES
+                else pack_inner_value(inner_value, whitelist_map, f"{descent_path}.{key}")
+            )
 
-        klass_name = value.__class__.__name__
-        base_dict["__class__"] = (
-            whitelist_map.get_serialized_name(klass_name)
-            if whitelist_map.has_serialized_name(klass_name)
-            else klass_name
-        )
+        base_dict["__class__"] = table.serialized_name
 
         return base_dict
 
+    @classmethod
+    def _compact_fields_to_store(
+        cls, value: NamedTuple, table: FieldTable
+    ) -> Iterable[Tuple[str, Any]]:
+        default_keys = [
+            key
+            for index, key, default in table.default_fields
+            if _is_default_value(value[index], default)
+        ]
+        if not default_keys:
+            return zip(table.fields, value)
+
+        fields = list(zip(table.fields, value))
+        undecided_keys = [key for key in default_keys if key not in table.omittable]
+        if undecided_keys:
+            cls._decide_omittable(value, fields, undecided_keys, table)
+
+        omitted_keys = {key for key in default_keys if table.omittable[key]}
+        if not omitted_keys:
+            return fields
+        return [(key, inner_value) for key, inner_value in fields if key not in omitted_keys]
+
+    @classmethod
+    def _decide_omittable(
+        cls,
+        value: NamedTuple,
+        fields: List[Tuple[str, Any]],
+        keys: List[str],
+        table: FieldTable,
+    ):
+        # Omitting a field that holds its __new__ default is only safe if __new__ stores that
+        # default unchanged, which is checked once per class by loading the value back without it.
+        if len(keys) > 1 and cls._loads_without(value, fields, keys):
+            table.omittable.update(dict.fromkeys(keys, True))
+            return
+
+        for key in keys:
+            table.omittable[key] = cls._loads_without(value, fields, [key])
+
+    @classmethod
+    def _loads_without(
+        cls, value: NamedTuple, fields: List[Tuple[str, Any]], keys: List[str]
+    ) -> bool:
+        try:
+            loaded = cls.value_from_unpacked(
+                {key: inner_value for key, inner_value in fields if key not in keys},
+                value.__class__,
+            )
+        except Exception:  # pylint: disable=broad-except
+            return False
+        return loaded == value
+
+
+def _is_default_value(value: Any, default: Any) -> bool:
+    # Fields that hold their __new__ default are candidates to be left out, since loading the dict
+    # passes the remaining keys to __new__. Compare types as well, so that e.g. 0 is not mistaken
+    # for False.
+    return type(value) is type(default) and value == default
+
 
 ###################################################################################################
 # Serialize
 ###################################################################################################
 
 
-def serialize_dagster_namedtuple(nt: tuple, **json_kwargs) -> str:
-    """Serialize a whitelisted named tuple to a json encoded string"""
+def serialize_dagster_namedtuple(nt: tuple, compact: bool = False, **json_kwargs) -> str:
+    """Serialize a whitelisted named tuple to a json encoded string
+
+    If `compact` is set, fields that hold the default value of their `__new__` parameter are left
+    out and no whitespace is emitted. The output is still json that any reader of this version
+    can load, since the omitted fields are filled back in from the `__new__` defaults. Namedtuples
+    whose `__new__` does not store the omitted defaults unchanged are serialized with all fields.
+    """
     check.tuple_param(nt, "nt")
-    return _serialize_dagster_namedtuple(nt, whitelist_map=_WHITELIST_MAP, **json_kwargs)
+    return _serialize_dagster_namedtuple(
+        nt, whitelist_map=_WHITELIST_MAP, compact=compact, **json_kwargs
+    )
 
 
-def _serialize_dagster_namedtuple(nt: tuple, whitelist_map: WhitelistMap, **json_kwargs) -> str:
+def _serialize_dagster_namedtuple(
+    nt: tuple, whitelist_map: WhitelistMap, compact: bool = False, **json_kwargs
+) -> str:
+    if compact:
+        whitelist_map = whitelist_map._replace(compact=True)
+        json_kwargs.setdefault("separators", (",", ":"))
     return seven.json.dumps(pack_inner_value(nt, whitelist_map, _root(nt)), **json_kwargs)
 
 
-def serialize_value(val: Any, whitelist_map: WhitelistMap = _WHITELIST_MAP) -> str:
-    """Serialize a value to a json encoded string."""
+def serialize_value(
+    val: Any, whitelist_map: WhitelistMap = _WHITELIST_MAP, compact: bool = False
+) -> str:
+    """Serialize a value to a json encoded string. See `serialize_dagster_namedtuple` for
+    `compact`."""
+    json_kwargs = {}
+    if compact:
+        whitelist_map = whitelist_map._replace(compact=True)
+        json_kwargs["separators"] = (",", ":")
     return seven.json.dumps(
-        pack_inner_value(val, whitelist_map=whitelist_map, descent_path=_root(val))
+        pack_inner_value(val, whitelist_map=whitelist_map, descent_path=_root(val)), **json_kwargs
     )
 
 
@@ -366,9 +510,13 @@ def pack_value(val: Any) -> Any:
 
 
 def pack_inner_value(val: Any, whitelist_map: WhitelistMap, descent_path: str) -> Any:
+    if type(val) in SCALAR_TYPES:
+        return val
     if isinstance(val, list):
         return [
-            pack_inner_value(item, whitelist_map, f"{descent_path}[{idx}]")
+            item
+            if type(item) in SCALAR_TYPES
+            else pack_inner_value(item, whitelist_map, f"{descent_path}[{idx}]")
             for idx, item in enumerate(val)
         ]
     if isinstance(val, tuple):
@@ -406,7 +554,9 @@ def pack_inner_value(val: Any, whitelist_map: WhitelistMap, descent_path: str) -
         }
     if isinstance(val, dict):
         return {
-            key: pack_inner_value(value, whitelist_map, f"{descent_path}.{key}")
+            key: value
+            if type(value) in SCALAR_TYPES
+            else pack_inner_value(value, whitelist_map, f"{descent_path}.{key}")
             for key, value in val.items()
         }
 
@@ -484,12 +634,18 @@ def unpack_value(val: Any) -> Any:
 
 
 def unpack_inner_value(val: Any, whitelist_map: WhitelistMap, descent_path: str) -> Any:
+    if type(val) in SCALAR_TYPES:
+        return val
     if isinstance(val, list):
         return [
-            unpack_inner_value(item, whitelist_map, f"{descent_path}[{idx}]")
+            item
+            if type(item) in SCALAR_TYPES
+            else unpack_inner_value(item, whitelist_map, f"{descent_path}[{idx}]")
             for idx, item in enumerate(val)
         ]
-    if isinstance(val, dict) and val.get("__class__"):
+    if not isinstance(val, dict):
+        return val
+    if val.get("__class__"):
         klass_name = cast(str, val.pop("__class__"))
         lookup_name = (
             whitelist_map.get_deserialized_name(klass_name)
@@ -517,7 +673,7 @@ def unpack_inner_value(val: Any, whitelist_map: WhitelistMap, descent_path: str)
         return serializer.value_from_storage_dict(
             val, klass, args_for_class, whitelist_map, descent_path
         )
-    if isinstance(val, dict) and val.get("__enum__"):
+    if val.get("__enum__"):
         name, member = val["__enum__"].split(".")
         if not whitelist_map.has_enum_entry(name):
             raise DeserializationError(
@@ -527,21 +683,20 @@ def unpack_inner_value(val: Any, whitelist_map: WhitelistMap, descent_path: str)
             )
         enum_class, enum_serializer = whitelist_map.get_enum_entry(name)
         return enum_serializer.value_from_storage_str(member, enum_class)
-    if isinstance(val, dict) and val.get("__set__") is not None:
+    if val.get("__set__") is not None:
         set_path = descent_path + "{}"
         return set([unpack_inner_value(item, whitelist_map, set_path) for item in val["__set__"]])
-    if isinstance(val, dict) and val.get("__frozenset__") is not None:
+    if val.get("__frozenset__") is not None:
         frz_set_path = descent_path + "{}"
         return frozenset(
             [unpack_inner_value(item, whitelist_map, frz_set_path) for item in val["__frozenset__"]]
         )
-    if isinstance(val, dict):
-        return {
-            key: unpack_inner_value(value, whitelist_map, f"{descent_path}.{key}")
-            for key, value in val.items()
-        }
-
-    return val
+    return {
+        key: value
+        if type(value) in SCALAR_TYPES
+        else unpack_inner_value(value, whitelist_map, f"{descent_path}.{key}")
+        for key, value in val.items()
+    }
 
 
 ###################################################################################################
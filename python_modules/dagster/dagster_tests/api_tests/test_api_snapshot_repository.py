@@ -1,17 +1,31 @@
 import sys
 from contextlib import contextmanager
 
+import mock
 import pytest
 
-from dagster import lambda_solid, pipeline, repository
-from dagster.api.snapshot_repository import sync_get_streaming_external_repositories_data_grpc
+import dagster._check as check
+from dagster import AssetKey, lambda_solid, pipeline, repository
+from dagster.api.list_repositories import sync_list_repositories_grpc
+from dagster.api.snapshot_repository import (
+    ExternalRepositorySnapshotPieceCache,
+    clear_external_repository_snapshot_piece_caches,
+    get_external_repository_snapshot_piece_cache,
+    sync_get_streaming_external_repositories_data_grpc,
+)
 from dagster.core.errors import DagsterUserCodeProcessError
 from dagster.core.host_representation import (
+    ExternalPipelineSubsetResult,
     ExternalRepositoryData,
+    ExternalRepositoryOrigin,
     ManagedGrpcPythonEnvRepositoryLocationOrigin,
 )
+from dagster.core.snap import create_pipeline_snapshot_id
 from dagster.core.test_utils import instance_for_test
 from dagster.core.types.loadable_target_origin import LoadableTargetOrigin
+from dagster.grpc.types import ExternalRepositorySnapshotArgs, ExternalRepositorySnapshotManifest
+from dagster.serdes import deserialize_as, serialize_dagster_namedtuple
+from dagster.utils.error import SerializableErrorInfo
 
 from .utils import get_bar_repo_repository_location
 
@@ -43,6 +57,243 @@ def test_streaming_external_repositories_error(instance):
             )
 
 
+def test_streaming_external_repositories_snapshot_pieces(instance):
+    clear_external_repository_snapshot_piece_caches()
+
+    with get_bar_repo_repository_location(instance) as repository_location:
+        assert sync_list_repositories_grpc(repository_location.client).supports_snapshot_pieces
+
+        full_repository_data = sync_get_streaming_external_repositories_data_grpc(
+            repository_location.client, repository_location
+        )["bar_repo"]
+
+        repository_data = sync_get_streaming_external_repositories_data_grpc(
+            repository_location.client, repository_location, use_snapshot_pieces=True
+        )["bar_repo"]
+        assert repository_data == full_repository_data
+
+        piece_cache = get_external_repository_snapshot_piece_cache(
+            ExternalRepositoryOrigin(repository_location.origin, "bar_repo")
+        )
+        assert len(piece_cache.piece_ids()) == len(
+            {
+                serialize_dagster_namedtuple(piece)
+                for piece in [
+                    *full_repository_data.external_pipeline_datas,
+                    *full_repository_data.external_schedule_datas,
+                    *full_repository_data.external_partition_set_datas,
+                    *full_repository_data.external_sensor_datas,
+                    *full_repository_data.external_asset_graph_data,
+                ]
+            }
+        )
+
+        # unchanged pieces are reused instead of transferred and deserialized again
+        reloaded_repository_data = sync_get_streaming_external_repositories_data_grpc(
+            repository_location.client, repository_location, use_snapshot_pieces=True
+        )["bar_repo"]
+        assert reloaded_repository_data == full_repository_data
+        assert all(
+            reloaded is cached
+            for reloaded, cached in zip(
+                reloaded_repository_data.external_pipeline_datas,
+                repository_data.external_pipeline_datas,
+            )
+        )
+
+
+def test_snapshot_pieces_only_transfers_unknown_pieces(instance):
+    with get_bar_repo_repository_location(instance) as repository_location:
+        repository_origin = ExternalRepositoryOrigin(repository_location.origin, "bar_repo")
+
+        manifest = deserialize_as(
+            "".join(
+                chunk["serialized_external_repository_chunk"]
+                for chunk in repository_location.client.streaming_external_repository_snapshot_pieces(
+                    ExternalRepositorySnapshotArgs(repository_origin, known_piece_ids=[])
+                )
+            ),
+            ExternalRepositorySnapshotManifest,
+        )
+        assert set(manifest.serialized_pieces.keys()) == set(manifest.piece_ids)
+
+        known_piece_ids = manifest.pipeline_piece_ids
+        partial_manifest = deserialize_as(
+            "".join(
+                chunk["serialized_external_repository_chunk"]
+                for chunk in repository_location.client.streaming_external_repository_snapshot_pieces(
+                    ExternalRepositorySnapshotArgs(repository_origin, known_piece_ids)
+                )
+            ),
+            ExternalRepositorySnapshotManifest,
+        )
+        assert partial_manifest.piece_ids == manifest.piece_ids
+        assert set(partial_manifest.serialized_pieces.keys()) == set(manifest.piece_ids) - set(
+            known_piece_ids
+        )
+
+
+def test_snapshot_piece_cache_drops_stale_pieces():
+    piece_cache = ExternalRepositorySnapshotPieceCache()
+
+    first_snapshot = ExternalRepositorySnapshotManifest(
+        name="repo",
+        pipeline_piece_ids=["a", "b"],
+        schedule_piece_ids=[],
+        partition_set_piece_ids=[],
+        sensor_piece_ids=[],
+        asset_node_piece_ids=[],
+        serialized_pieces={
+            "a": serialize_dagster_namedtuple(AssetKey("a")),
+            "b": serialize_dagster_namedtuple(AssetKey("b")),
+        },
+    )
+    piece_cache.update(first_snapshot)
+    piece_a = piece_cache.get_piece("a")
+    assert piece_a == AssetKey("a")
+
+    second_snapshot = ExternalRepositorySnapshotManifest(
+        name="repo",
+        pipeline_piece_ids=["a", "c"],
+        schedule_piece_ids=[],
+        partition_set_piece_ids=[],
+        sensor_piece_ids=[],
+        asset_node_piece_ids=[],
+        serialized_pieces={"c": serialize_dagster_namedtuple(AssetKey("c"))},
+    )
+    piece_cache.update(second_snapshot)
+    assert sorted(piece_cache.piece_ids()) == ["a", "c"]
+    assert piece_cache.get_piece("c") == AssetKey("c")
+    # pieces that are still part of the snapshot are not deserialized again
+    assert piece_cache.get_piece("a") is piece_a
+
+    with pytest.raises(check.CheckError, match="missing pieces"):
+        piece_cache.update(second_snapshot._replace(pipeline_piece_ids=["a", "d"]))
+
+
+def test_lazy_load_pipelines():
+    clear_external_repository_snapshot_piece_caches()
+
+    with instance_for_test(
+        overrides={"code_servers": {"lazy_load_pipelines": True, "max_cached_pipelines": 2}}
+    ) as instance:
+        with get_bar_repo_repository_location(instance) as repository_location:
+            full_repository_data = sync_get_streaming_external_repositories_data_grpc(
+                repository_location.client, repository_location
+            )["bar_repo"]
+
+            lazy_repository_data = sync_get_streaming_external_repositories_data_grpc(
+                repository_location.client,
+                repository_location,
+                use_snapshot_pieces=True,
+                lazy_load_pipelines=True,
+            )["bar_repo"]
+            assert lazy_repository_data.external_pipeline_datas == []
+            assert {ref.name for ref in lazy_repository_data.external_pipeline_refs} == {
+                pipeline_data.name for pipeline_data in full_repository_data.external_pipeline_datas
+            }
+
+            external_repo = repository_location.get_repository("bar_repo")
+            assert external_repo.has_external_pipeline("foo")
+            assert not external_repo.has_external_pipeline("does_not_exist")
+            assert external_repo._loaded_pipelines == {}  # pylint: disable=protected-access
+
+            for pipeline_data in full_repository_data.external_pipeline_datas:
+                if pipeline_data.name not in {"foo", "bar", "baz"}:
+                    # registered in bar_repo under a different name than its own
+                    continue
+
+                external_pipeline = external_repo.get_full_external_pipeline(pipeline_data.name)
+                assert external_pipeline.computed_pipeline_snapshot_id == (
+                    create_pipeline_snapshot_id(pipeline_data.pipeline_snapshot)
+                )
+                assert external_pipeline.external_pipeline_data == pipeline_data
+
+            # only the most recently used pipelines are kept
+            assert len(external_repo._loaded_pipelines) == 2  # pylint: disable=protected-access
+            assert external_repo.get_full_external_pipeline("foo").name == "foo"
+
+
+def test_lazy_load_all_pipelines():
+    clear_external_repository_snapshot_piece_caches()
+
+    with instance_for_test(
+        overrides={"code_servers": {"lazy_load_pipelines": True, "max_cached_pipelines": 64}}
+    ) as instance:
+        with get_bar_repo_repository_location(instance) as repository_location:
+            external_repo = repository_location.get_repository("bar_repo")
+            piece_cache = get_external_repository_snapshot_piece_cache(
+                external_repo.handle.get_external_origin()
+            )
+            piece_ids = sorted(piece_cache.piece_ids())
+
+            with mock.patch(
+                "dagster.core.host_representation.repository_location."
+                "sync_get_external_pipeline_subset_grpc"
+            ) as subset_mock:
+                external_pipelines = external_repo.get_all_external_pipelines()
+                assert len(external_pipelines) > 2
+                for external_pipeline in external_pipelines:
+                    assert external_pipeline.solid_names
+
+                assert len(external_repo.get_pipeline_indices()) == len(external_pipelines)
+
+                # every pipeline is loaded at once instead of with one request per pipeline
+                assert not subset_mock.called
+
+            # the bulk loaded pipelines are kept in the LRU, and not in the piece cache
+            # pylint: disable=protected-access
+            assert len(external_repo._loaded_pipelines) == len(external_pipelines)
+            assert sorted(piece_cache.piece_ids()) == piece_ids
+
+
+def test_lazy_load_all_pipelines_bounded():
+    clear_external_repository_snapshot_piece_caches()
+
+    with instance_for_test(
+        overrides={"code_servers": {"lazy_load_pipelines": True, "max_cached_pipelines": 2}}
+    ) as instance:
+        with get_bar_repo_repository_location(instance) as repository_location:
+            external_repo = repository_location.get_repository("bar_repo")
+
+            with mock.patch(
+                "dagster.core.host_representation.repository_location."
+                "sync_get_external_pipeline_datas_grpc"
+            ) as all_pipeline_datas_mock:
+                # pylint: disable=protected-access
+                for pipeline_name in ["foo", "bar", "baz"]:
+                    external_pipeline_data, _ = external_repo._get_external_pipeline_data_and_index(
+                        pipeline_name, load_all=True
+                    )
+                    assert external_pipeline_data.name == pipeline_name
+
+                # the pipelines do not all fit in the LRU, so they are loaded one by one
+                assert not all_pipeline_datas_mock.called
+
+            assert list(external_repo._loaded_pipelines) == ["bar", "baz"]
+
+
+def test_lazy_load_pipeline_error():
+    clear_external_repository_snapshot_piece_caches()
+
+    with instance_for_test(overrides={"code_servers": {"lazy_load_pipelines": True}}) as instance:
+        with get_bar_repo_repository_location(instance) as repository_location:
+            external_pipeline = repository_location.get_repository(
+                "bar_repo"
+            ).get_full_external_pipeline("foo")
+
+            with mock.patch(
+                "dagster.core.host_representation.repository_location."
+                "sync_get_external_pipeline_subset_grpc",
+                return_value=ExternalPipelineSubsetResult(
+                    success=False,
+                    error=SerializableErrorInfo(message="Oops", stack=[], cls_name="Exception"),
+                ),
+            ):
+                with pytest.raises(DagsterUserCodeProcessError, match="Oops"):
+                    assert external_pipeline.external_pipeline_data
+
+
 @lambda_solid
 def do_something():
     return 1
@@ -0,0 +1,120 @@
+"""Scheduling overhead of ActiveExecution on a plan with a wide dynamic fan-out.
+
+Drives the execution plan of a job that maps over tens of thousands of dynamic outputs through
+ActiveExecution the way an executor does -- asking for a bounded number of steps to execute,
+reporting their outputs and completion, and checking for steps to skip or abandon on every tick --
+without executing any step.
+
+Run with:
+
+    python -m dagster_tests.benchmarks.active_execution_benchmark [--steps N] [--concurrency N]
+"""
+import argparse
+import time
+from typing import List
+
+from dagster import DynamicOut, job, op
+from dagster.core.events import DagsterEvent, DagsterEventType
+from dagster.core.execution.api import create_execution_plan
+from dagster.core.execution.plan.outputs import StepOutputData, StepOutputHandle
+from dagster.core.execution.plan.plan import ExecutionPlan
+from dagster.core.execution.retries import RetryMode
+
+from .utils import BenchmarkResult, print_results
+
+DEFAULT_STEPS = 20000
+DEFAULT_CONCURRENCY = 8
+
+
+@op(out=DynamicOut())
+def fan_out():
+    pass
+
+
+@op
+def process(_item):
+    pass
+
+
+@op
+def fan_in(_items):
+    pass
+
+
+@job
+def fan_out_job():
+    fan_in(fan_out().map(process).collect())
+
+
+def _dynamic_output_events(step_key: str, output_name: str, num_outputs: int) -> List[DagsterEvent]:
+    return [
+        DagsterEvent(
+            DagsterEventType.STEP_OUTPUT.value,
+            pipeline_name=fan_out_job.name,
+            step_key=step_key,
+            event_specific_data=StepOutputData(
+                StepOutputHandle(step_key, output_name, mapping_key=str(i))
+            ),
+        )
+        for i in range(num_outputs)
+    ]
+
+
+def drive_plan(
+    plan: ExecutionPlan, dynamic_output_events: List[DagsterEvent], concurrency: int
+) -> int:
+    """Runs the plan through ActiveExecution, marking every step as successful as soon as it is
+    vended, and returns the number of steps that were executed. `dynamic_output_events` are
+    reported for the fan-out step.
+    """
+    executed = 0
+    with plan.start(RetryMode.DISABLED) as active_execution:
+        while not active_execution.is_complete:
+            for step in active_execution.get_steps_to_execute(limit=concurrency):
+                for step_output in step.step_outputs:
+                    if step_output.is_dynamic:
+                        for event in dynamic_output_events:
+                            active_execution.handle_event(event)
+                    else:
+                        active_execution.mark_step_produced_output(
+                            StepOutputHandle(step.key, step_output.name)
+                        )
+                active_execution.mark_success(step.key)
+                executed += 1
+
+            # as in the executors, this also brings the state up to date before is_complete
+            assert not active_execution.get_steps_to_skip()
+            assert not active_execution.get_steps_to_abandon()
+
+    return executed
+
+
+def run_active_execution_benchmark(num_mapped_steps: int, concurrency: int) -> BenchmarkResult:
+    plan = create_execution_plan(fan_out_job)
+    dynamic_output_events = _dynamic_output_events("fan_out", "result", num_mapped_steps)
+
+    start = time.perf_counter()
+    executed = drive_plan(plan, dynamic_output_events, concurrency)
+    total_seconds = time.perf_counter() - start
+
+    # the fan-out and fan-in steps are executed in addition to the mapped steps
+    assert executed == num_mapped_steps + 2
+    return BenchmarkResult(
+        f"{num_mapped_steps} mapped steps, concurrency {concurrency}", executed, total_seconds
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--steps", type=int, default=DEFAULT_STEPS)
+    parser.add_argument("--concurrency", type=int, default=DEFAULT_CONCURRENCY)
+    args = parser.parse_args()
+
+    print_results(
+        "ActiveExecution scheduling overhead (per step)",
+        [run_active_execution_benchmark(args.steps, args.concurrency)],
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+"""Resolve the asset selections of many asset jobs against large synthetic asset graphs.
+
+Each graph is layered: every asset depends on up to two assets of the previous layer, and assets
+are spread over groups. The jobs select groups, their upstream or downstream assets, and
+intersections and unions of those, the way the asset jobs of a repository are defined.
+
+- fresh resolver: every selection is resolved on its own, indexing the assets each time
+- shared resolver: all selections are resolved by one resolver, as when a repository is loaded
+
+Run with:
+
+    python -m dagster_tests.benchmarks.asset_selection_benchmark [--sizes N,N,...] [--jobs N]
+"""
+import argparse
+import random
+from typing import List
+
+from dagster import AssetKey, AssetSelection, In, Nothing, Out, op
+from dagster.core.asset_defs import AssetsDefinition
+from dagster.core.asset_defs.asset_selection import Resolver
+
+from .utils import print_results, run_benchmark
+
+DEFAULT_SIZES = "1000,10000,100000"
+DEFAULT_JOBS = 30
+LAYER_WIDTH = 100
+ASSETS_PER_GROUP = 500
+
+
+@op(ins={"first": In(Nothing), "second": In(Nothing)}, out=Out(Nothing))
+def compute_asset():
+    pass
+
+
+def build_asset_graph(num_assets: int, seed: int = 0) -> List[AssetsDefinition]:
+    # All assets share an op, since only their keys, dependencies and groups are resolved
+    rng = random.Random(seed)
+    assets_defs = []
+    for i in range(num_assets):
+        asset_key = AssetKey(f"asset_{i}")
+        layer_start = (i // LAYER_WIDTH - 1) * LAYER_WIDTH
+        if layer_start >= 0:
+            deps = {
+                "first": AssetKey(f"asset_{layer_start + rng.randrange(LAYER_WIDTH)}"),
+                "second": AssetKey(f"asset_{layer_start + rng.randrange(LAYER_WIDTH)}"),
+            }
+        else:
+            deps = {}
+
+        assets_defs.append(
+            AssetsDefinition(
+                keys_by_input_name=deps,
+                keys_by_output_name={"result": asset_key},
+                node_def=compute_asset,
+                asset_deps={asset_key: set(deps.values())},
+                group_names_by_key={asset_key: f"group_{i // ASSETS_PER_GROUP}"},
+            )
+        )
+    return assets_defs
+
+
+def build_selections(num_assets: int, num_jobs: int, seed: int = 0) -> List[AssetSelection]:
+    rng = random.Random(seed)
+    num_groups = (num_assets + ASSETS_PER_GROUP - 1) // ASSETS_PER_GROUP
+    selections: List[AssetSelection] = []
+    for i in range(num_jobs):
+        group = AssetSelection.groups(f"group_{rng.randrange(num_groups)}")
+        key = AssetSelection.keys(f"asset_{rng.randrange(num_assets)}")
+        kind = i % 5
+        if kind == 0:
+            selections.append(group)
+        elif kind == 1:
+            selections.append(group.downstream())
+        elif kind == 2:
+            selections.append(key.upstream())
+        elif kind == 3:
+            selections.append(group.upstream(depth=2) | key.downstream(depth=2))
+        else:
+            selections.append(group.downstream() & AssetSelection.all())
+    return selections
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=str, default=DEFAULT_SIZES)
+    parser.add_argument("--jobs", type=int, default=DEFAULT_JOBS)
+    parser.add_argument("--iterations", type=int, default=3)
+    args = parser.parse_args()
+
+    results = []
+    for num_assets in [int(size) for size in args.sizes.split(",")]:
+        assets_defs = build_asset_graph(num_assets)
+        selections = build_selections(num_assets, args.jobs)
+
+        def _fresh_resolver(assets_defs=assets_defs, selections=selections):
+            for selection in selections:
+                selection.resolve(assets_defs)
+
+        def _shared_resolver(assets_defs=assets_defs, selections=selections):
+            resolver = Resolver(assets_defs)
+            for selection in selections:
+                resolver.resolve(selection)
+
+        results.extend(
+            [
+                run_benchmark(
+                    f"{num_assets} assets: fresh resolver", _fresh_resolver, args.iterations
+                ),
+                run_benchmark(
+                    f"{num_assets} assets: shared resolver", _shared_resolver, args.iterations
+                ),
+            ]
+        )
+
+    print_results(f"Resolving {args.jobs} asset selections (per repository load)", results)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,155 @@
+"""Run config validation and processing against large synthetic config schemas.
+
+Measures `process_config` for the run config schema of a job with many configured ops and nested
+resource config, and for a deeply nested schema:
+
+- cold: schemas are compiled on every call, as before compiled schemas were cached
+- warm, new value: the compiled schema is reused, but the config value changes on every call
+- warm, same value: the same config is processed again, e.g. on every tick of a schedule, so its
+  validation result is reused
+
+Run with:
+
+    python -m dagster_tests.benchmarks.config_validation_benchmark [--ops N] [--depth N]
+"""
+import argparse
+from typing import Callable, Dict, List
+
+from dagster import Field, Shape, job, op, resource
+from dagster.config.compiled_schema import clear_compiled_config_schemas
+from dagster.config.config_type import ConfigType
+from dagster.config.field import resolve_to_config_type
+from dagster.config.validate import process_config
+
+from .utils import BenchmarkResult, print_results, run_benchmark
+
+DEFAULT_OPS = 1000
+DEFAULT_DEPTH = 50
+
+
+def _op_config_schema():
+    return {
+        "x": int,
+        "y": Field(str, default_value="y"),
+        "z": Field({"w": Field(float, default_value=1.0), "v": [str]}, is_required=False),
+    }
+
+
+@resource(
+    config_schema={
+        "host": str,
+        "port": Field(int, default_value=5432),
+        "options": {
+            "timeout": Field(int, default_value=30),
+            "retries": {
+                "count": Field(int, default_value=3),
+                "backoff": Field(float, default_value=1.5),
+            },
+        },
+    }
+)
+def database(_):
+    return None
+
+
+def build_wide_job(num_ops: int):
+    ops = [
+        op(name=f"op_{i}", config_schema=_op_config_schema())(lambda _context: None)
+        for i in range(num_ops)
+    ]
+
+    @job(name=f"wide_job_{num_ops}", resource_defs={"database": database})
+    def wide_job():
+        for configured_op in ops:
+            configured_op()
+
+    return wide_job
+
+
+def wide_run_config(num_ops: int, value: int) -> Dict[str, object]:
+    return {
+        "ops": {
+            f"op_{i}": {"config": {"x": value, "z": {"v": ["a", "b"]}}} for i in range(num_ops)
+        },
+        "resources": {"database": {"config": {"host": "localhost"}}},
+    }
+
+
+def build_deep_config_type(depth: int) -> ConfigType:
+    schema: Dict[str, object] = {"leaf": Field(int, default_value=0)}
+    for level in range(depth):
+        schema = {f"level_{level}": schema, "name": Field(str, default_value=str(level))}
+    return resolve_to_config_type(Shape(schema))  # type: ignore
+
+
+def deep_config_value(depth: int, value: int) -> Dict[str, object]:
+    config_value: Dict[str, object] = {"leaf": value}
+    for level in range(depth):
+        config_value = {f"level_{level}": config_value}
+    return config_value
+
+
+def _cold(fn: Callable[[], object]) -> Callable[[], object]:
+    def _fn():
+        clear_compiled_config_schemas()
+        return fn()
+
+    return _fn
+
+
+def _with_new_values(config_type: ConfigType, make_value: Callable[[int], object]):
+    counter = iter(range(1 << 30))
+
+    def _fn():
+        return process_config(config_type, make_value(next(counter)))
+
+    return _fn
+
+
+def _benchmarks(
+    name: str, config_type: ConfigType, make_value: Callable[[int], object], iterations: int
+) -> List[BenchmarkResult]:
+    same_value = make_value(0)
+
+    def _process_same_value():
+        assert process_config(config_type, same_value).success
+
+    return [
+        run_benchmark(f"{name}: cold", _cold(_process_same_value), iterations),
+        run_benchmark(
+            f"{name}: warm, new value", _with_new_values(config_type, make_value), iterations
+        ),
+        run_benchmark(f"{name}: warm, same value", _process_same_value, iterations),
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--ops", type=int, default=DEFAULT_OPS)
+    parser.add_argument("--depth", type=int, default=DEFAULT_DEPTH)
+    parser.add_argument("--iterations", type=int, default=10)
+    args = parser.parse_args()
+
+    wide_job = build_wide_job(args.ops)
+    wide_config_type = wide_job.get_run_config_schema("default").config_type
+    deep_config_type = build_deep_config_type(args.depth)
+
+    print_results(
+        "Run config processing (per process_config call)",
+        _benchmarks(
+            f"{args.ops} ops",
+            wide_config_type,
+            lambda value: wide_run_config(args.ops, value),
+            args.iterations,
+        )
+        + _benchmarks(
+            f"depth {args.depth}",
+            deep_config_type,
+            lambda value: deep_config_value(args.depth, value),
+            args.iterations * 100,
+        ),
+    )
+
+
+if __name__ == "__main__":
+    main()
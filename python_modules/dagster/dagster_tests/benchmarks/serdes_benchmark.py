@@ -0,0 +1,77 @@
+"""Round-trip throughput of serdes on event log payloads.
+
+Run with:
+
+    python -m dagster_tests.benchmarks.serdes_benchmark [--iterations N]
+"""
+import argparse
+from typing import List
+
+from dagster.serdes import deserialize_json_to_dagster_namedtuple, serialize_dagster_namedtuple
+
+from ..general_tests.serdes_payloads import build_event_payloads
+from .utils import BenchmarkResult, print_results, run_benchmark
+
+DEFAULT_ITERATIONS = 2000
+
+
+def run_serdes_benchmarks(iterations: int = DEFAULT_ITERATIONS) -> List[BenchmarkResult]:
+    events = build_event_payloads()
+    serialized = [serialize_dagster_namedtuple(event) for event in events]
+    compact_serialized = [serialize_dagster_namedtuple(event, compact=True) for event in events]
+
+    def _serialize():
+        for event in events:
+            serialize_dagster_namedtuple(event)
+
+    def _serialize_compact():
+        for event in events:
+            serialize_dagster_namedtuple(event, compact=True)
+
+    def _deserialize():
+        for event_json in serialized:
+            deserialize_json_to_dagster_namedtuple(event_json)
+
+    def _deserialize_compact():
+        for event_json in compact_serialized:
+            deserialize_json_to_dagster_namedtuple(event_json)
+
+    def _round_trip():
+        for event in events:
+            deserialize_json_to_dagster_namedtuple(serialize_dagster_namedtuple(event))
+
+    # each call handles len(events) entries, so scale the iteration count to report per-event cost
+    return [
+        _per_event(run_benchmark(name, fn, iterations), len(events))
+        for name, fn in [
+            ("serialize", _serialize),
+            ("serialize (compact)", _serialize_compact),
+            ("deserialize", _deserialize),
+            ("deserialize (compact)", _deserialize_compact),
+            ("round trip", _round_trip),
+        ]
+    ]
+
+
+def _per_event(result: BenchmarkResult, num_events: int) -> BenchmarkResult:
+    return result._replace(iterations=result.iterations * num_events)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=DEFAULT_ITERATIONS)
+    args = parser.parse_args()
+
+    events = build_event_payloads()
+    print(
+        "Average payload size: {default} bytes, {compact} bytes compact\n".format(
+            default=sum(len(serialize_dagster_namedtuple(e)) for e in events) // len(events),
+            compact=sum(len(serialize_dagster_namedtuple(e, compact=True)) for e in events)
+            // len(events),
+        )
+    )
+    print_results("serdes (per event)", run_serdes_benchmarks(args.iterations))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+"""Throughput of ``store_event`` on a SQL event log storage, with and without connection pooling.
+
+Without pooling, every ``store_event`` opens (and authenticates) a new database connection. By
+default the benchmark runs against a local stand-in for Postgres: a SQLite database whose
+connections take ``--connect-latency-ms`` to open, approximating the TCP, TLS and authentication
+round trips of a remote database. Pass ``--postgres-url`` to run against a Postgres database
+instead, which requires ``dagster-postgres``.
+
+Run with:
+
+    python -m dagster_tests.benchmarks.sql_pool_benchmark [--events N] [--connect-latency-ms N]
+        [--postgres-url URL]
+"""
+import argparse
+import os
+import sqlite3
+import tempfile
+import time
+from contextlib import contextmanager
+
+from dagster.core.events.log import EventLogEntry
+from dagster.core.storage.event_log import ConsolidatedSqliteEventLogStorage
+from dagster.core.storage.event_log.sqlite.consolidated_sqlite_event_log import (
+    SQLITE_EVENT_LOG_FILENAME,
+)
+from dagster.core.storage.sql import create_pooled_engine
+from dagster.core.utils import make_new_run_id
+
+from .utils import print_results, run_benchmark
+
+DEFAULT_EVENTS = 500
+DEFAULT_CONNECT_LATENCY_MS = 5.0
+POOL_CONFIG = {"pool_size": 5, "max_overflow": 10, "pool_pre_ping": True, "pool_recycle": 3600}
+
+
+class StandInEventLogStorage(ConsolidatedSqliteEventLogStorage):
+    """A consolidated SQLite event log storage whose connections are slow to open."""
+
+    def __init__(self, base_dir, pool_config, connect_latency_seconds):
+        db_path = os.path.join(base_dir, f"{SQLITE_EVENT_LOG_FILENAME}.db")
+
+        def _create_connection():
+            time.sleep(connect_latency_seconds)
+            return sqlite3.connect(db_path, check_same_thread=False)
+
+        self._engine = create_pooled_engine("sqlite://", pool_config, creator=_create_connection)
+        super().__init__(base_dir)
+
+    @contextmanager
+    def _connect(self):
+        with self._engine.connect() as conn:
+            yield conn
+
+
+def _event(run_id: str, i: int) -> EventLogEntry:
+    return EventLogEntry(
+        error_info=None,
+        level=20,
+        user_message=f"message {i}",
+        run_id=run_id,
+        timestamp=time.time(),
+        step_key="my_op",
+        pipeline_name="my_job",
+        dagster_event=None,
+    )
+
+
+def _store_events_benchmark(name, storage, num_events):
+    run_id = make_new_run_id()
+    events = iter(range(num_events + 1))
+    return run_benchmark(
+        name, lambda: storage.store_event(_event(run_id, next(events))), num_events
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--events", type=int, default=DEFAULT_EVENTS)
+    parser.add_argument("--connect-latency-ms", type=float, default=DEFAULT_CONNECT_LATENCY_MS)
+    parser.add_argument("--postgres-url", type=str, default=None)
+    args = parser.parse_args()
+
+    results = []
+    if args.postgres_url:
+        from dagster_postgres import PostgresEventLogStorage
+
+        for name, pool_config in [("unpooled", None), ("pooled", POOL_CONFIG)]:
+            storage = PostgresEventLogStorage(args.postgres_url, pool_config=pool_config)
+            results.append(_store_events_benchmark(f"postgres: {name}", storage, args.events))
+            storage.dispose()
+        title = f"store_event against {args.postgres_url}"
+    else:
+        for name, pool_config in [("unpooled", None), ("pooled", POOL_CONFIG)]:
+            with tempfile.TemporaryDirectory() as base_dir:
+                storage = StandInEventLogStorage(
+                    base_dir, pool_config, args.connect_latency_ms / 1000
+                )
+                results.append(_store_events_benchmark(f"stand-in: {name}", storage, args.events))
+                storage.dispose()
+        title = (
+            f"store_event against a stand-in database with {args.connect_latency_ms}ms "
+            "connection latency"
+        )
+
+    print_results(title, results)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,42 @@
+import time
+from typing import Callable, List, NamedTuple
+
+from tabulate import tabulate
+
+
+class BenchmarkResult(NamedTuple):
+    name: str
+    iterations: int
+    total_seconds: float
+
+    @property
+    def per_second(self) -> float:
+        return self.iterations / self.total_seconds if self.total_seconds else float("inf")
+
+    @property
+    def microseconds_per_op(self) -> float:
+        return self.total_seconds * 1e6 / self.iterations
+
+
+def run_benchmark(name: str, fn: Callable[[], object], iterations: int) -> BenchmarkResult:
+    """Calls `fn` `iterations` times after a single warm-up call, and times the calls."""
+    fn()
+    start = time.perf_counter()
+    for _ in range(iterations):
+        fn()
+    return BenchmarkResult(name, iterations, time.perf_counter() - start)
+
+
+def print_results(title: str, results: List[BenchmarkResult]):
+    print(title)
+    print(
+        tabulate(
+            [
+                (result.name, result.iterations, result.microseconds_per_op, result.per_second)
+                for result in results
+            ],
+            headers=["benchmark", "iterations", "us/op", "ops/s"],
+            floatfmt=".1f",
+        )
+    )
+    print()
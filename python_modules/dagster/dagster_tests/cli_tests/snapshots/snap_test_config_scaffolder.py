@@ -35,6 +35,10 @@
                     },
                     'spawn': {
                     }
+                },
+                'worker_pool': {
+                    'max_steps_per_worker': 0,
+                    'max_worker_memory_mb': 0
                 }
             }
         }
@@ -93,6 +97,10 @@
                     },
                     'spawn': {
                     }
+                },
+                'worker_pool': {
+                    'max_steps_per_worker': 0,
+                    'max_worker_memory_mb': 0
                 }
             }
         }
@@ -151,6 +159,10 @@
                     },
                     'spawn': {
                     }
+                },
+                'worker_pool': {
+                    'max_steps_per_worker': 0,
+                    'max_worker_memory_mb': 0
                 }
             }
         }
@@ -4,7 +4,7 @@
 
 import pytest
 
-from dagster.core.asset_defs.asset_selection import AssetSelection
+from dagster.core.asset_defs.asset_selection import AssetSelection, Resolver
 from dagster.core.asset_defs.decorators import asset
 from dagster.core.definitions.events import AssetKey
 
@@ -112,3 +112,20 @@ def test_asset_selection_upstream(all_assets):
 
     sel_depth_1 = AssetSelection.keys("george").upstream(depth=1)
     assert sel_depth_1.resolve(all_assets) == _asset_keys_of({bob, fiona, george})
+
+
+def test_shared_resolver(all_assets):
+    resolver = Resolver(all_assets)
+
+    sel = AssetSelection.groups("ladies").downstream()
+    assert resolver.resolve(sel) == _asset_keys_of(
+        {alice, bob, candace, danny, edgar, fiona, george}
+    )
+    assert resolver.resolve(sel) == sel.resolve(all_assets)
+
+    sel = AssetSelection.groups("ladies", "does_not_exist").upstream(depth=1)
+    assert resolver.resolve(sel) == _asset_keys_of({alice, candace, danny, fiona})
+    assert resolver.resolve(sel) == sel.resolve(all_assets)
+
+    sel = (AssetSelection.groups("does_not_exist") & AssetSelection.all()).downstream()
+    assert resolver.resolve(sel) == frozenset()
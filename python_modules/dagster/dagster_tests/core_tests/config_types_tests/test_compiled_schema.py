@@ -0,0 +1,107 @@
+from dagster import Any, Array, Field, Shape, StringSource
+from dagster.config import Enum, EnumValue
+from dagster.config.compiled_schema import get_compiled_config_schema
+from dagster.config.field import resolve_to_config_type
+from dagster.config.iterate_types import iterate_config_types
+from dagster.config.snap import snap_from_config_type
+from dagster.config.validate import process_config, validate_config
+from dagster.core.test_utils import environ
+
+
+def _nested_config_type():
+    return resolve_to_config_type(
+        Shape(
+            {
+                "a": Field(int, default_value=1),
+                "b": {"c": Field(str, is_required=False), "d": Array(int)},
+                "e": Field(
+                    {"c": Field(str, is_required=False), "d": Array(int)}, is_required=False
+                ),
+            }
+        )
+    )
+
+
+def test_compiled_snapshot():
+    config_type = _nested_config_type()
+    compiled_schema = get_compiled_config_schema(config_type)
+
+    assert get_compiled_config_schema(config_type) is compiled_schema
+    assert compiled_schema.snapshot.all_config_snaps_by_key == {
+        ct.key: snap_from_config_type(ct) for ct in iterate_config_types(config_type)
+    }
+    assert set(compiled_schema.config_types_by_key.keys()) == {
+        ct.key for ct in iterate_config_types(config_type)
+    }
+
+
+def test_validation_result_cache():
+    config_type = _nested_config_type()
+
+    config_value = {"b": {"d": [1, 2]}}
+    result = validate_config(config_type, config_value)
+    assert result.success
+    compiled_schema = get_compiled_config_schema(config_type)
+    result_key = compiled_schema.get_validation_result_key(config_value)
+    assert compiled_schema.get_validation_result(result_key) is not None
+    assert validate_config(config_type, {"b": {"d": [1, 2]}}).value == result.value
+
+    invalid_result = validate_config(config_type, {"b": {"d": ["1"]}})
+    assert not invalid_result.success
+    assert validate_config(config_type, {"b": {"d": ["1"]}}) is invalid_result
+
+    # equal values of different types do not share results
+    assert not validate_config(config_type, {"b": {"d": (1, 2)}}).success
+    assert not validate_config(config_type, {"b": {"d": [True, 2]}}).success
+    assert validate_config(config_type, {"b": {"d": [1, 2]}}).value == result.value
+
+
+def test_validation_result_cache_isolated_from_callers():
+    config_type = resolve_to_config_type(
+        Shape({"a": Field(int), "b": Field(Shape({"c": Field(Any)}))})
+    )
+
+    config_value = {"a": 1, "b": {"c": 2}}
+    result = process_config(config_type, config_value)
+    assert result.success
+
+    # changing the config or the value of an earlier call does not change later results
+    config_value["b"]["c"] = "bad"
+    validated = validate_config(config_type, {"a": 1, "b": {"c": 2}})
+    assert validated.success
+    assert validated.value == {"a": 1, "b": {"c": 2}}
+    assert process_config(config_type, {"a": 1, "b": {"c": 2}}).value == {"a": 1, "b": {"c": 2}}
+
+    validated.value["b"]["c"] = "bad"
+    assert validate_config(config_type, {"a": 1, "b": {"c": 2}}).value == {"a": 1, "b": {"c": 2}}
+
+
+def test_unhashable_config_value():
+    config_type = resolve_to_config_type(Shape({"a": Field(Array(int))}))
+    config_value = {"a": frozenset([1])}
+
+    result = validate_config(config_type, config_value)
+    assert not result.success
+    assert validate_config(config_type, config_value) is not result
+
+
+def test_same_key_different_types():
+    first_enum = Enum("SameName", [EnumValue("FOO")])
+    second_enum = Enum("SameName", [EnumValue("BAR")])
+    assert first_enum.key == second_enum.key
+
+    assert validate_config(first_enum, "FOO").success
+    assert not validate_config(second_enum, "FOO").success
+    assert validate_config(second_enum, "BAR").success
+    assert not validate_config(first_enum, "BAR").success
+
+
+def test_post_processing_not_cached():
+    config_type = resolve_to_config_type(Shape({"value": StringSource}))
+    config_value = {"value": {"env": "DAGSTER_COMPILED_SCHEMA_TEST_VAR"}}
+
+    with environ({"DAGSTER_COMPILED_SCHEMA_TEST_VAR": "foo"}):
+        assert process_config(config_type, config_value).value == {"value": "foo"}
+
+    with environ({"DAGSTER_COMPILED_SCHEMA_TEST_VAR": "bar"}):
+        assert process_config(config_type, config_value).value == {"value": "bar"}
@@ -2,6 +2,7 @@
 from typing import cast
 
 import pendulum
+import pytest
 
 from dagster import (
     DailyPartitionsDefinition,
@@ -13,7 +14,7 @@
     monthly_partitioned_config,
     weekly_partitioned_config,
 )
-from dagster.core.definitions.time_window_partitions import TimeWindow
+from dagster.core.definitions.time_window_partitions import TimeWindow, TimeWindowPartitions
 from dagster.utils.partitions import DEFAULT_HOURLY_FORMAT_WITHOUT_TIMEZONE
 
 DATE_FORMAT = "%Y-%m-%d"
@@ -275,3 +276,98 @@ def my_partitioned_config(_start, _end):
     assert partitions_def.time_window_for_partition_key("2021-05-01") == time_window(
         "2021-05-05T04:15:00", "2021-05-12T04:15:00"
     )
+
+
+@pytest.mark.parametrize("timezone", ["UTC", "Asia/Kolkata", "America/Los_Angeles"])
+@pytest.mark.parametrize(
+    "partitions_def_fn",
+    [
+        lambda timezone, end_offset: HourlyPartitionsDefinition(
+            start_date=datetime(2021, 3, 1, 13, 47),
+            minute_offset=15,
+            timezone=timezone,
+            end_offset=end_offset,
+        ),
+        lambda timezone, end_offset: DailyPartitionsDefinition(
+            start_date="2021-03-01",
+            hour_offset=3,
+            minute_offset=5,
+            timezone=timezone,
+            end_offset=end_offset,
+        ),
+        lambda timezone, end_offset: WeeklyPartitionsDefinition(
+            start_date="2021-03-01", day_offset=3, timezone=timezone, end_offset=end_offset
+        ),
+        lambda timezone, end_offset: MonthlyPartitionsDefinition(
+            start_date="2021-03-01", day_offset=5, timezone=timezone, end_offset=end_offset
+        ),
+    ],
+)
+@pytest.mark.parametrize("end_offset", [0, 2, -1])
+def test_partitions_match_schedule_iteration(partitions_def_fn, timezone, end_offset):
+    partitions_def = partitions_def_fn(timezone, end_offset)
+
+    for current_time in [
+        datetime(2021, 2, 1),
+        datetime(2021, 3, 1),
+        datetime(2021, 6, 3, 4, 15),
+        datetime(2021, 11, 30, 23, 59, 59),
+    ]:
+        partitions = partitions_def.get_partitions(current_time)
+        iterated_partitions = partitions_def._iterate_partitions(
+            current_time
+        )  # pylint: disable=protected-access
+        assert len(partitions) == len(iterated_partitions)
+        assert partitions == iterated_partitions
+        assert partitions_def.get_num_partitions(current_time) == len(iterated_partitions)
+        assert partitions_def.get_partition_keys(current_time) == [
+            partition.name for partition in iterated_partitions
+        ]
+
+        for partition in iterated_partitions[:2] + iterated_partitions[-2:]:
+            assert partitions_def.time_window_for_partition_key(partition.name) == partition.value
+
+
+def test_lazy_partitions():
+    partitions_def = HourlyPartitionsDefinition(start_date="2015-01-01-00:00")
+    current_time = datetime(2022, 6, 1, 12, 30)
+
+    partitions = partitions_def.get_partitions(current_time)
+    assert isinstance(partitions, TimeWindowPartitions)
+    assert partitions_def.get_partitions(current_time) is partitions
+    assert len(partitions) == 65004
+
+    assert partitions[0].name == "2015-01-01-00:00"
+    assert partitions[-1].name == "2022-06-01-11:00"
+    assert partitions[-1].value == time_window("2022-06-01T11:00:00", "2022-06-01T12:00:00")
+    assert [partition.name for partition in partitions[100:103]] == [
+        "2015-01-05-04:00",
+        "2015-01-05-05:00",
+        "2015-01-05-06:00",
+    ]
+    with pytest.raises(IndexError):
+        partitions[len(partitions)]  # pylint: disable=pointless-statement
+
+    assert partitions.get_partition_index("2015-01-05-05:00") == 101
+    assert partitions.get_partition_index("2022-06-01-12:00") is None
+    assert partitions.get_partition_index("2014-12-31-23:00") is None
+    assert partitions.get_partition_index("not a partition key") is None
+
+
+@pytest.mark.parametrize(
+    "timezone,start_date,has_regular_time_windows",
+    [
+        ("UTC", "2021-03-01", True),
+        ("Asia/Kolkata", "2021-03-01", True),
+        ("US/Central", "2021-03-01", False),
+        # Brazil stopped observing DST in 2019
+        ("America/Sao_Paulo", "2018-03-01", False),
+        ("America/Sao_Paulo", "2020-03-01", True),
+    ],
+)
+def test_regular_time_windows(timezone, start_date, has_regular_time_windows):
+    partitions_def = DailyPartitionsDefinition(start_date=start_date, timezone=timezone)
+    assert (
+        partitions_def._has_regular_time_windows()  # pylint: disable=protected-access
+        == has_regular_time_windows
+    )
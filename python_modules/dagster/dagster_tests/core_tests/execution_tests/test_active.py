@@ -7,6 +7,7 @@
 from dagster.core.execution.plan.objects import StepSuccessData
 from dagster.core.execution.plan.outputs import StepOutputData, StepOutputHandle
 from dagster.core.execution.retries import RetryMode
+from dagster.core.storage.tags import PRIORITY_TAG
 
 
 def define_foo_job():
@@ -148,3 +149,86 @@ def test_recover_in_between_steps():
                 step_key="bar_op",
             )
         )
+
+
+def define_fan_in_job():
+    @op
+    def source():
+        pass
+
+    @op(tags={PRIORITY_TAG: "-1"})
+    def low(_data):
+        pass
+
+    @op(tags={PRIORITY_TAG: "5"})
+    def high(_data):
+        pass
+
+    @op
+    def mid(_data):
+        pass
+
+    @op
+    def sink(_low, _high, _mid):
+        pass
+
+    @job
+    def fan_in_job():
+        data = source()
+        sink(low(data), high(data), mid(data))
+
+    return fan_in_job
+
+
+def test_priority_order_and_incremental_readiness():
+    fan_in_job = define_fan_in_job()
+
+    with create_execution_plan(fan_in_job).start(RetryMode.DISABLED) as active_execution:
+        [source_step] = active_execution.get_steps_to_execute()
+        assert source_step.key == "source"
+        active_execution.mark_step_produced_output(StepOutputHandle("source", "result"))
+        active_execution.mark_success("source")
+
+        steps = active_execution.get_steps_to_execute(limit=2)
+        assert [step.key for step in steps] == ["high", "mid"]
+        assert [step.key for step in active_execution.get_steps_to_execute()] == ["low"]
+
+        for step_key in ["high", "low"]:
+            active_execution.mark_step_produced_output(StepOutputHandle(step_key, "result"))
+            active_execution.mark_success(step_key)
+            # the fan-in step is not ready until all of its dependencies have completed
+            assert not active_execution.get_steps_to_execute()
+
+        active_execution.mark_step_produced_output(StepOutputHandle("mid", "result"))
+        active_execution.mark_success("mid")
+        assert [step.key for step in active_execution.get_steps_to_execute()] == ["sink"]
+        active_execution.mark_success("sink")
+
+
+def test_failure_abandons_dependents():
+    fan_in_job = define_fan_in_job()
+
+    with create_execution_plan(fan_in_job).start(RetryMode.ENABLED) as active_execution:
+        [source_step] = active_execution.get_steps_to_execute()
+        active_execution.mark_step_produced_output(StepOutputHandle("source", "result"))
+        active_execution.mark_success(source_step.key)
+
+        assert len(active_execution.get_steps_to_execute()) == 3
+
+        # a step that is retried immediately becomes executable again
+        active_execution.mark_up_for_retry("high")
+        assert [step.key for step in active_execution.get_steps_to_execute()] == ["high"]
+
+        # the fan-in step is abandoned as soon as any dependency fails
+        active_execution.mark_failed("low")
+        assert not active_execution.get_steps_to_execute()
+        assert [step.key for step in active_execution.get_steps_to_abandon()] == ["sink"]
+        active_execution.mark_abandoned("sink")
+
+        for step_key in ["high", "mid"]:
+            active_execution.mark_step_produced_output(StepOutputHandle(step_key, "result"))
+            active_execution.mark_success(step_key)
+
+        assert not active_execution.get_steps_to_execute()
+        assert not active_execution.get_steps_to_abandon()
+        assert active_execution.is_complete
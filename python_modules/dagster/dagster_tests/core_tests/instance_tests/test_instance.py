@@ -240,6 +240,13 @@ def test_grpc_default_settings():
 def test_grpc_override_settings():
     with instance_for_test(overrides={"code_servers": {"local_startup_timeout": 60}}) as instance:
         assert instance.code_server_process_startup_timeout == 60
+        assert not instance.code_server_lazy_load_pipelines
+
+    with instance_for_test(
+        overrides={"code_servers": {"lazy_load_pipelines": True, "max_cached_pipelines": 8}}
+    ) as instance:
+        assert instance.code_server_lazy_load_pipelines
+        assert instance.code_server_max_cached_pipelines == 8
 
 
 def test_run_monitoring(capsys):  # pylint: disable=unused-argument
@@ -254,6 +254,38 @@
           "scalar_kind": null,
           "type_param_keys": null
         },
+        "Selector.6777945d8ba02cd9ba67e5ca5c2fdb2296e491be": {
+          "__class__": "ConfigTypeSnap",
+          "description": null,
+          "enum_values": null,
+          "fields": [
+            {
+              "__class__": "ConfigFieldSnap",
+              "default_provided": true,
+              "default_value_as_json_str": "{\\"config\\": {\\"retries\\": {\\"enabled\\": {}}}}",
+              "description": null,
+              "is_required": false,
+              "name": "in_process",
+              "type_key": "Shape.ca5906d9a0377218b4ee7d940ad55957afa73d1b"
+            },
+            {
+              "__class__": "ConfigFieldSnap",
+              "default_provided": true,
+              "default_value_as_json_str": "{\\"config\\": {\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}}",
+              "description": null,
+              "is_required": false,
+              "name": "multiprocess",
+              "type_key": "Shape.78c46b6e0cac3e244c4d3c3da3b17f4e25a9ff28"
+            }
+          ],
+          "given_name": null,
+          "key": "Selector.6777945d8ba02cd9ba67e5ca5c2fdb2296e491be",
+          "kind": {
+            "__enum__": "ConfigTypeKind.SELECTOR"
+          },
+          "scalar_kind": null,
+          "type_param_keys": null
+        },
         "Selector.a9799b971d12ace70a2d8803c883c863417d0725": {
           "__class__": "ConfigTypeSnap",
           "description": null,
@@ -491,38 +523,6 @@
           "scalar_kind": null,
           "type_param_keys": null
         },
-        "Selector.fd22b7b986baf6998a8c16e63e78f44dd5e3f78f": {
-          "__class__": "ConfigTypeSnap",
-          "description": null,
-          "enum_values": null,
-          "fields": [
-            {
-              "__class__": "ConfigFieldSnap",
-              "default_provided": true,
-              "default_value_as_json_str": "{\\"config\\": {\\"retries\\": {\\"enabled\\": {}}}}",
-              "description": null,
-              "is_required": false,
-              "name": "in_process",
-              "type_key": "Shape.ca5906d9a0377218b4ee7d940ad55957afa73d1b"
-            },
-            {
-              "__class__": "ConfigFieldSnap",
-              "default_provided": true,
-              "default_value_as_json_str": "{\\"config\\": {\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}}",
-              "description": null,
-              "is_required": false,
-              "name": "multiprocess",
-              "type_key": "Shape.21277960d85eafb5579d7a10d7a715e444c5a1f7"
-            }
-          ],
-          "given_name": null,
-          "key": "Selector.fd22b7b986baf6998a8c16e63e78f44dd5e3f78f",
-          "kind": {
-            "__enum__": "ConfigTypeKind.SELECTOR"
-          },
-          "scalar_kind": null,
-          "type_param_keys": null
-        },
         "Shape.0bb49540f1708dcf5378009c9571eba999502e19": {
           "__class__": "ConfigTypeSnap",
           "description": null,
@@ -546,82 +546,6 @@
           "scalar_kind": null,
           "type_param_keys": null
         },
-        "Shape.1b89f17c57460ee6db612e2a543579b48100564d": {
-          "__class__": "ConfigTypeSnap",
-          "description": null,
-          "enum_values": null,
-          "field_aliases": {
-            "solids": "ops"
-          },
-          "fields": [
-            {
-              "__class__": "ConfigFieldSnap",
-              "default_provided": true,
-              "default_value_as_json_str": "{\\"in_process\\": {}}",
-              "description": null,
-              "is_required": false,
-              "name": "execution",
-              "type_key": "Selector.fd22b7b986baf6998a8c16e63e78f44dd5e3f78f"
-            },
-            {
-              "__class__": "ConfigFieldSnap",
-              "default_provided": true,
-              "default_value_as_json_str": "{}",
-              "description": null,
-              "is_required": false,
-              "name": "loggers",
-              "type_key": "Shape.ebeaf4550c200fb540f2e1f3f2110debd8c4157c"
-            },
-            {
-              "__class__": "ConfigFieldSnap",
-              "default_provided": true,
-              "default_value_as_json_str": "{\\"io_manager\\": {}}",
-              "description": null,
-              "is_required": false,
-              "name": "resources",
-              "type_key": "Shape.0bb49540f1708dcf5378009c9571eba999502e19"
-            },
-            {
-              "__class__": "ConfigFieldSnap",
-              "default_provided": true,
-              "default_value_as_json_str": "{\\"a_solid\\": {}}",
-              "description": null,
-              "is_required": false,
-              "name": "solids",
-              "type_key": "Shape.b25df6ff575a5177ad6130bc61f4d62097c2a29b"
-            }
-          ],
-          "given_name": null,
-          "key": "Shape.1b89f17c57460ee6db612e2a543579b48100564d",
-          "kind": {
-            "__enum__": "ConfigTypeKind.STRICT_SHAPE"
-          },
-          "scalar_kind": null,
-          "type_param_keys": null
-        },
-        "Shape.21277960d85eafb5579d7a10d7a715e444c5a1f7": {
-          "__class__": "ConfigTypeSnap",
-          "description": null,
-          "enum_values": null,
-          "fields": [
-            {
-              "__class__": "ConfigFieldSnap",
-              "default_provided": true,
-              "default_value_as_json_str": "{\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}",
-              "description": null,
-              "is_required": false,
-              "name": "config",
-              "type_key": "Shape.e248cccc2d2206bf427e9bc9c2d22833f2aeb6d4"
-            }
-          ],
-          "given_name": null,
-          "key": "Shape.21277960d85eafb5579d7a10d7a715e444c5a1f7",
-          "kind": {
-            "__enum__": "ConfigTypeKind.STRICT_SHAPE"
-          },
-          "scalar_kind": null,
-          "type_param_keys": null
-        },
         "Shape.241ac489ffa5f718db6444bae7849fb86a62e441": {
           "__class__": "ConfigTypeSnap",
           "description": null,
@@ -804,6 +728,29 @@
           "scalar_kind": null,
           "type_param_keys": null
         },
+        "Shape.78c46b6e0cac3e244c4d3c3da3b17f4e25a9ff28": {
+          "__class__": "ConfigTypeSnap",
+          "description": null,
+          "enum_values": null,
+          "fields": [
+            {
+              "__class__": "ConfigFieldSnap",
+              "default_provided": true,
+              "default_value_as_json_str": "{\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}",
+              "description": null,
+              "is_required": false,
+              "name": "config",
+              "type_key": "Shape.986b9cd0d92f5ac4c553433cb65cc38e01d8b404"
+            }
+          ],
+          "given_name": null,
+          "key": "Shape.78c46b6e0cac3e244c4d3c3da3b17f4e25a9ff28",
+          "kind": {
+            "__enum__": "ConfigTypeKind.STRICT_SHAPE"
+          },
+          "scalar_kind": null,
+          "type_param_keys": null
+        },
         "Shape.979b3d2fece4f3eb92e90f2ec9fb4c85efe9ea5c": {
           "__class__": "ConfigTypeSnap",
           "description": null,
@@ -836,110 +783,136 @@
           "scalar_kind": null,
           "type_param_keys": null
         },
-        "Shape.b25df6ff575a5177ad6130bc61f4d62097c2a29b": {
+        "Shape.986b9cd0d92f5ac4c553433cb65cc38e01d8b404": {
           "__class__": "ConfigTypeSnap",
           "description": null,
           "enum_values": null,
-          "field_aliases": {
-            "solids": "ops"
-          },
           "fields": [
             {
               "__class__": "ConfigFieldSnap",
               "default_provided": true,
-              "default_value_as_json_str": "{}",
+              "default_value_as_json_str": "0",
               "description": null,
               "is_required": false,
-              "name": "a_solid",
-              "type_key": "Shape.69ff9be621991cc7961ea5e667d43edaac9d2339"
+              "name": "max_concurrent",
+              "type_key": "Int"
+            },
+            {
+              "__class__": "ConfigFieldSnap",
+              "default_provided": true,
+              "default_value_as_json_str": "{\\"enabled\\": {}}",
+              "description": null,
+              "is_required": false,
+              "name": "retries",
+              "type_key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2"
+            },
+            {
+              "__class__": "ConfigFieldSnap",
+              "default_provided": false,
+              "default_value_as_json_str": null,
+              "description": "Select how subprocesses are created. Defaults to spawn.\\nWhen forkserver is selected, set_forkserver_preload will be called with either:\\n* the preload_modules list if provided by config\\n* the module containing the Job if it was loaded from a module\\n* dagster\\nhttps://docs.python.org/3/library/multiprocessing.html#contexts-and-start-methods",
+              "is_required": false,
+              "name": "start_method",
+              "type_key": "Selector.0f5471adc2ad814d1c9fd94e2fa73c07217dea47"
+            },
+            {
+              "__class__": "ConfigFieldSnap",
+              "default_provided": false,
+              "default_value_as_json_str": null,
+              "description": "Execute steps in a pool of up to max_concurrent long-lived worker processes instead of starting a new process for each step. Steps executed by the same worker share its Python interpreter.",
+              "is_required": false,
+              "name": "worker_pool",
+              "type_key": "Shape.c7adb72beb279d3db2d5745ecb926f2ce89deacd"
             }
           ],
           "given_name": null,
-          "key": "Shape.b25df6ff575a5177ad6130bc61f4d62097c2a29b",
+          "key": "Shape.986b9cd0d92f5ac4c553433cb65cc38e01d8b404",
           "kind": {
             "__enum__": "ConfigTypeKind.STRICT_SHAPE"
           },
           "scalar_kind": null,
           "type_param_keys": null
         },
-        "Shape.ca5906d9a0377218b4ee7d940ad55957afa73d1b": {
+        "Shape.b25df6ff575a5177ad6130bc61f4d62097c2a29b": {
           "__class__": "ConfigTypeSnap",
           "description": null,
           "enum_values": null,
+          "field_aliases": {
+            "solids": "ops"
+          },
           "fields": [
             {
               "__class__": "ConfigFieldSnap",
               "default_provided": true,
-              "default_value_as_json_str": "{\\"retries\\": {\\"enabled\\": {}}}",
+              "default_value_as_json_str": "{}",
               "description": null,
               "is_required": false,
-              "name": "config",
-              "type_key": "Shape.979b3d2fece4f3eb92e90f2ec9fb4c85efe9ea5c"
+              "name": "a_solid",
+              "type_key": "Shape.69ff9be621991cc7961ea5e667d43edaac9d2339"
             }
           ],
           "given_name": null,
-          "key": "Shape.ca5906d9a0377218b4ee7d940ad55957afa73d1b",
+          "key": "Shape.b25df6ff575a5177ad6130bc61f4d62097c2a29b",
           "kind": {
             "__enum__": "ConfigTypeKind.STRICT_SHAPE"
           },
           "scalar_kind": null,
           "type_param_keys": null
         },
-        "Shape.da39a3ee5e6b4b0d3255bfef95601890afd80709": {
+        "Shape.c5669f096d88c01a2f1b55330266b6717cfeeda9": {
           "__class__": "ConfigTypeSnap",
           "description": null,
           "enum_values": null,
-          "fields": [],
-          "given_name": null,
-          "key": "Shape.da39a3ee5e6b4b0d3255bfef95601890afd80709",
-          "kind": {
-            "__enum__": "ConfigTypeKind.STRICT_SHAPE"
+          "field_aliases": {
+            "solids": "ops"
           },
-          "scalar_kind": null,
-          "type_param_keys": null
-        },
-        "Shape.e248cccc2d2206bf427e9bc9c2d22833f2aeb6d4": {
-          "__class__": "ConfigTypeSnap",
-          "description": null,
-          "enum_values": null,
           "fields": [
             {
               "__class__": "ConfigFieldSnap",
               "default_provided": true,
-              "default_value_as_json_str": "0",
+              "default_value_as_json_str": "{\\"in_process\\": {}}",
               "description": null,
               "is_required": false,
-              "name": "max_concurrent",
-              "type_key": "Int"
+              "name": "execution",
+              "type_key": "Selector.6777945d8ba02cd9ba67e5ca5c2fdb2296e491be"
             },
             {
               "__class__": "ConfigFieldSnap",
               "default_provided": true,
-              "default_value_as_json_str": "{\\"enabled\\": {}}",
+              "default_value_as_json_str": "{}",
               "description": null,
               "is_required": false,
-              "name": "retries",
-              "type_key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2"
+              "name": "loggers",
+              "type_key": "Shape.ebeaf4550c200fb540f2e1f3f2110debd8c4157c"
             },
             {
               "__class__": "ConfigFieldSnap",
-              "default_provided": false,
-              "default_value_as_json_str": null,
-              "description": "Select how subprocesses are created. Defaults to spawn.\\nWhen forkserver is selected, set_forkserver_preload will be called with either:\\n* the preload_modules list if provided by config\\n* the module containing the Job if it was loaded from a module\\n* dagster\\nhttps://docs.python.org/3/library/multiprocessing.html#contexts-and-start-methods",
+              "default_provided": true,
+              "default_value_as_json_str": "{\\"io_manager\\": {}}",
+              "description": null,
               "is_required": false,
-              "name": "start_method",
-              "type_key": "Selector.0f5471adc2ad814d1c9fd94e2fa73c07217dea47"
+              "name": "resources",
+              "type_key": "Shape.0bb49540f1708dcf5378009c9571eba999502e19"
+            },
+            {
+              "__class__": "ConfigFieldSnap",
+              "default_provided": true,
+              "default_value_as_json_str": "{\\"a_solid\\": {}}",
+              "description": null,
+              "is_required": false,
+              "name": "solids",
+              "type_key": "Shape.b25df6ff575a5177ad6130bc61f4d62097c2a29b"
             }
           ],
           "given_name": null,
-          "key": "Shape.e248cccc2d2206bf427e9bc9c2d22833f2aeb6d4",
+          "key": "Shape.c5669f096d88c01a2f1b55330266b6717cfeeda9",
           "kind": {
             "__enum__": "ConfigTypeKind.STRICT_SHAPE"
           },
           "scalar_kind": null,
           "type_param_keys": null
         },
-        "Shape.ebeaf4550c200fb540f2e1f3f2110debd8c4157c": {
+        "Shape.c7adb72beb279d3db2d5745ecb926f2ce89deacd": {
           "__class__": "ConfigTypeSnap",
           "description": null,
           "enum_values": null,
@@ -948,23 +921,91 @@
               "__class__": "ConfigFieldSnap",
               "default_provided": false,
               "default_value_as_json_str": null,
-              "description": null,
+              "description": "Replace a worker process after it has executed this many steps.",
               "is_required": false,
-              "name": "console",
-              "type_key": "Shape.3baab16166bacfaf4705811e64d356112fd733cb"
+              "name": "max_steps_per_worker",
+              "type_key": "Int"
+            },
+            {
+              "__class__": "ConfigFieldSnap",
+              "default_provided": false,
+              "default_value_as_json_str": null,
+              "description": "Replace a worker process after a step once its peak resident memory exceeds this many megabytes. Not supported on Windows.",
+              "is_required": false,
+              "name": "max_worker_memory_mb",
+              "type_key": "Int"
             }
           ],
           "given_name": null,
-          "key": "Shape.ebeaf4550c200fb540f2e1f3f2110debd8c4157c",
+          "key": "Shape.c7adb72beb279d3db2d5745ecb926f2ce89deacd",
           "kind": {
             "__enum__": "ConfigTypeKind.STRICT_SHAPE"
           },
           "scalar_kind": null,
           "type_param_keys": null
         },
-        "String": {
+        "Shape.ca5906d9a0377218b4ee7d940ad55957afa73d1b": {
           "__class__": "ConfigTypeSnap",
-          "description": "",
+          "description": null,
+          "enum_values": null,
+          "fields": [
+            {
+              "__class__": "ConfigFieldSnap",
+              "default_provided": true,
+              "default_value_as_json_str": "{\\"retries\\": {\\"enabled\\": {}}}",
+              "description": null,
+              "is_required": false,
+              "name": "config",
+              "type_key": "Shape.979b3d2fece4f3eb92e90f2ec9fb4c85efe9ea5c"
+            }
+          ],
+          "given_name": null,
+          "key": "Shape.ca5906d9a0377218b4ee7d940ad55957afa73d1b",
+          "kind": {
+            "__enum__": "ConfigTypeKind.STRICT_SHAPE"
+          },
+          "scalar_kind": null,
+          "type_param_keys": null
+        },
+        "Shape.da39a3ee5e6b4b0d3255bfef95601890afd80709": {
+          "__class__": "ConfigTypeSnap",
+          "description": null,
+          "enum_values": null,
+          "fields": [],
+          "given_name": null,
+          "key": "Shape.da39a3ee5e6b4b0d3255bfef95601890afd80709",
+          "kind": {
+            "__enum__": "ConfigTypeKind.STRICT_SHAPE"
+          },
+          "scalar_kind": null,
+          "type_param_keys": null
+        },
+        "Shape.ebeaf4550c200fb540f2e1f3f2110debd8c4157c": {
+          "__class__": "ConfigTypeSnap",
+          "description": null,
+          "enum_values": null,
+          "fields": [
+            {
+              "__class__": "ConfigFieldSnap",
+              "default_provided": false,
+              "default_value_as_json_str": null,
+              "description": null,
+              "is_required": false,
+              "name": "console",
+              "type_key": "Shape.3baab16166bacfaf4705811e64d356112fd733cb"
+            }
+          ],
+          "given_name": null,
+          "key": "Shape.ebeaf4550c200fb540f2e1f3f2110debd8c4157c",
+          "kind": {
+            "__enum__": "ConfigTypeKind.STRICT_SHAPE"
+          },
+          "scalar_kind": null,
+          "type_param_keys": null
+        },
+        "String": {
+          "__class__": "ConfigTypeSnap",
+          "description": "",
           "enum_values": null,
           "fields": null,
           "given_name": "String",
@@ -1121,7 +1162,7 @@
             "name": "io_manager"
           }
         ],
-        "root_config_key": "Shape.1b89f17c57460ee6db612e2a543579b48100564d"
+        "root_config_key": "Shape.c5669f096d88c01a2f1b55330266b6717cfeeda9"
       },
       {
         "__class__": "ModeDefSnap",
@@ -1159,7 +1200,7 @@
             "name": "io_manager"
           }
         ],
-        "root_config_key": "Shape.1b89f17c57460ee6db612e2a543579b48100564d"
+        "root_config_key": "Shape.c5669f096d88c01a2f1b55330266b6717cfeeda9"
       }
     ],
     "name": "a_pipeline",
@@ -1461,6 +1502,38 @@
               "scalar_kind": null,
               "type_param_keys": null
             },
+            "Selector.6777945d8ba02cd9ba67e5ca5c2fdb2296e491be": {
+              "__class__": "ConfigTypeSnap",
+              "description": null,
+              "enum_values": null,
+              "fields": [
+                {
+                  "__class__": "ConfigFieldSnap",
+                  "default_provided": true,
+                  "default_value_as_json_str": "{\\"config\\": {\\"retries\\": {\\"enabled\\": {}}}}",
+                  "description": null,
+                  "is_required": false,
+                  "name": "in_process",
+                  "type_key": "Shape.ca5906d9a0377218b4ee7d940ad55957afa73d1b"
+                },
+                {
+                  "__class__": "ConfigFieldSnap",
+                  "default_provided": true,
+                  "default_value_as_json_str": "{\\"config\\": {\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}}",
+                  "description": null,
+                  "is_required": false,
+                  "name": "multiprocess",
+                  "type_key": "Shape.78c46b6e0cac3e244c4d3c3da3b17f4e25a9ff28"
+                }
+              ],
+              "given_name": null,
+              "key": "Selector.6777945d8ba02cd9ba67e5ca5c2fdb2296e491be",
+              "kind": {
+                "__enum__": "ConfigTypeKind.SELECTOR"
+              },
+              "scalar_kind": null,
+              "type_param_keys": null
+            },
             "Selector.a9799b971d12ace70a2d8803c883c863417d0725": {
               "__class__": "ConfigTypeSnap",
               "description": null,
@@ -1698,38 +1771,6 @@
               "scalar_kind": null,
               "type_param_keys": null
             },
-            "Selector.fd22b7b986baf6998a8c16e63e78f44dd5e3f78f": {
-              "__class__": "ConfigTypeSnap",
-              "description": null,
-              "enum_values": null,
-              "fields": [
-                {
-                  "__class__": "ConfigFieldSnap",
-                  "default_provided": true,
-                  "default_value_as_json_str": "{\\"config\\": {\\"retries\\": {\\"enabled\\": {}}}}",
-                  "description": null,
-                  "is_required": false,
-                  "name": "in_process",
-                  "type_key": "Shape.ca5906d9a0377218b4ee7d940ad55957afa73d1b"
-                },
-                {
-                  "__class__": "ConfigFieldSnap",
-                  "default_provided": true,
-                  "default_value_as_json_str": "{\\"config\\": {\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}}",
-                  "description": null,
-                  "is_required": false,
-                  "name": "multiprocess",
-                  "type_key": "Shape.21277960d85eafb5579d7a10d7a715e444c5a1f7"
-                }
-              ],
-              "given_name": null,
-              "key": "Selector.fd22b7b986baf6998a8c16e63e78f44dd5e3f78f",
-              "kind": {
-                "__enum__": "ConfigTypeKind.SELECTOR"
-              },
-              "scalar_kind": null,
-              "type_param_keys": null
-            },
             "Shape.0bb49540f1708dcf5378009c9571eba999502e19": {
               "__class__": "ConfigTypeSnap",
               "description": null,
@@ -1753,82 +1794,6 @@
               "scalar_kind": null,
               "type_param_keys": null
             },
-            "Shape.1b89f17c57460ee6db612e2a543579b48100564d": {
-              "__class__": "ConfigTypeSnap",
-              "description": null,
-              "enum_values": null,
-              "field_aliases": {
-                "solids": "ops"
-              },
-              "fields": [
-                {
-                  "__class__": "ConfigFieldSnap",
-                  "default_provided": true,
-                  "default_value_as_json_str": "{\\"in_process\\": {}}",
-                  "description": null,
-                  "is_required": false,
-                  "name": "execution",
-                  "type_key": "Selector.fd22b7b986baf6998a8c16e63e78f44dd5e3f78f"
-                },
-                {
-                  "__class__": "ConfigFieldSnap",
-                  "default_provided": true,
-                  "default_value_as_json_str": "{}",
-                  "description": null,
-                  "is_required": false,
-                  "name": "loggers",
-                  "type_key": "Shape.ebeaf4550c200fb540f2e1f3f2110debd8c4157c"
-                },
-                {
-                  "__class__": "ConfigFieldSnap",
-                  "default_provided": true,
-                  "default_value_as_json_str": "{\\"io_manager\\": {}}",
-                  "description": null,
-                  "is_required": false,
-                  "name": "resources",
-                  "type_key": "Shape.0bb49540f1708dcf5378009c9571eba999502e19"
-                },
-                {
-                  "__class__": "ConfigFieldSnap",
-                  "default_provided": true,
-                  "default_value_as_json_str": "{\\"a_solid\\": {}}",
-                  "description": null,
-                  "is_required": false,
-                  "name": "solids",
-                  "type_key": "Shape.b25df6ff575a5177ad6130bc61f4d62097c2a29b"
-                }
-              ],
-              "given_name": null,
-              "key": "Shape.1b89f17c57460ee6db612e2a543579b48100564d",
-              "kind": {
-                "__enum__": "ConfigTypeKind.STRICT_SHAPE"
-              },
-              "scalar_kind": null,
-              "type_param_keys": null
-            },
-            "Shape.21277960d85eafb5579d7a10d7a715e444c5a1f7": {
-              "__class__": "ConfigTypeSnap",
-              "description": null,
-              "enum_values": null,
-              "fields": [
-                {
-                  "__class__": "ConfigFieldSnap",
-                  "default_provided": true,
-                  "default_value_as_json_str": "{\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}",
-                  "description": null,
-                  "is_required": false,
-                  "name": "config",
-                  "type_key": "Shape.e248cccc2d2206bf427e9bc9c2d22833f2aeb6d4"
-                }
-              ],
-              "given_name": null,
-              "key": "Shape.21277960d85eafb5579d7a10d7a715e444c5a1f7",
-              "kind": {
-                "__enum__": "ConfigTypeKind.STRICT_SHAPE"
-              },
-              "scalar_kind": null,
-              "type_param_keys": null
-            },
             "Shape.241ac489ffa5f718db6444bae7849fb86a62e441": {
               "__class__": "ConfigTypeSnap",
               "description": null,
@@ -2011,6 +1976,29 @@
               "scalar_kind": null,
               "type_param_keys": null
             },
+            "Shape.78c46b6e0cac3e244c4d3c3da3b17f4e25a9ff28": {
+              "__class__": "ConfigTypeSnap",
+              "description": null,
+              "enum_values": null,
+              "fields": [
+                {
+                  "__class__": "ConfigFieldSnap",
+                  "default_provided": true,
+                  "default_value_as_json_str": "{\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}",
+                  "description": null,
+                  "is_required": false,
+                  "name": "config",
+                  "type_key": "Shape.986b9cd0d92f5ac4c553433cb65cc38e01d8b404"
+                }
+              ],
+              "given_name": null,
+              "key": "Shape.78c46b6e0cac3e244c4d3c3da3b17f4e25a9ff28",
+              "kind": {
+                "__enum__": "ConfigTypeKind.STRICT_SHAPE"
+              },
+              "scalar_kind": null,
+              "type_param_keys": null
+            },
             "Shape.979b3d2fece4f3eb92e90f2ec9fb4c85efe9ea5c": {
               "__class__": "ConfigTypeSnap",
               "description": null,
@@ -2043,6 +2031,56 @@
               "scalar_kind": null,
               "type_param_keys": null
             },
+            "Shape.986b9cd0d92f5ac4c553433cb65cc38e01d8b404": {
+              "__class__": "ConfigTypeSnap",
+              "description": null,
+              "enum_values": null,
+              "fields": [
+                {
+                  "__class__": "ConfigFieldSnap",
+                  "default_provided": true,
+                  "default_value_as_json_str": "0",
+                  "description": null,
+                  "is_required": false,
+                  "name": "max_concurrent",
+                  "type_key": "Int"
+                },
+                {
+                  "__class__": "ConfigFieldSnap",
+                  "default_provided": true,
+                  "default_value_as_json_str": "{\\"enabled\\": {}}",
+                  "description": null,
+                  "is_required": false,
+                  "name": "retries",
+                  "type_key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2"
+                },
+                {
+                  "__class__": "ConfigFieldSnap",
+                  "default_provided": false,
+                  "default_value_as_json_str": null,
+                  "description": "Select how subprocesses are created. Defaults to spawn.\\nWhen forkserver is selected, set_forkserver_preload will be called with either:\\n* the preload_modules list if provided by config\\n* the module containing the Job if it was loaded from a module\\n* dagster\\nhttps://docs.python.org/3/library/multiprocessing.html#contexts-and-start-methods",
+                  "is_required": false,
+                  "name": "start_method",
+                  "type_key": "Selector.0f5471adc2ad814d1c9fd94e2fa73c07217dea47"
+                },
+                {
+                  "__class__": "ConfigFieldSnap",
+                  "default_provided": false,
+                  "default_value_as_json_str": null,
+                  "description": "Execute steps in a pool of up to max_concurrent long-lived worker processes instead of starting a new process for each step. Steps executed by the same worker share its Python interpreter.",
+                  "is_required": false,
+                  "name": "worker_pool",
+                  "type_key": "Shape.c7adb72beb279d3db2d5745ecb926f2ce89deacd"
+                }
+              ],
+              "given_name": null,
+              "key": "Shape.986b9cd0d92f5ac4c553433cb65cc38e01d8b404",
+              "kind": {
+                "__enum__": "ConfigTypeKind.STRICT_SHAPE"
+              },
+              "scalar_kind": null,
+              "type_param_keys": null
+            },
             "Shape.b25df6ff575a5177ad6130bc61f4d62097c2a29b": {
               "__class__": "ConfigTypeSnap",
               "description": null,
@@ -2069,43 +2107,92 @@
               "scalar_kind": null,
               "type_param_keys": null
             },
-            "Shape.ca5906d9a0377218b4ee7d940ad55957afa73d1b": {
+            "Shape.c5669f096d88c01a2f1b55330266b6717cfeeda9": {
               "__class__": "ConfigTypeSnap",
               "description": null,
               "enum_values": null,
+              "field_aliases": {
+                "solids": "ops"
+              },
               "fields": [
                 {
                   "__class__": "ConfigFieldSnap",
                   "default_provided": true,
-                  "default_value_as_json_str": "{\\"retries\\": {\\"enabled\\": {}}}",
+                  "default_value_as_json_str": "{\\"in_process\\": {}}",
                   "description": null,
                   "is_required": false,
-                  "name": "config",
-                  "type_key": "Shape.979b3d2fece4f3eb92e90f2ec9fb4c85efe9ea5c"
+                  "name": "execution",
+                  "type_key": "Selector.6777945d8ba02cd9ba67e5ca5c2fdb2296e491be"
+                },
+                {
+                  "__class__": "ConfigFieldSnap",
+                  "default_provided": true,
+                  "default_value_as_json_str": "{}",
+                  "description": null,
+                  "is_required": false,
+                  "name": "loggers",
+                  "type_key": "Shape.ebeaf4550c200fb540f2e1f3f2110debd8c4157c"
+                },
+                {
+                  "__class__": "ConfigFieldSnap",
+                  "default_provided": true,
+                  "default_value_as_json_str": "{\\"io_manager\\": {}}",
+                  "description": null,
+                  "is_required": false,
+                  "name": "resources",
+                  "type_key": "Shape.0bb49540f1708dcf5378009c9571eba999502e19"
+                },
+                {
+                  "__class__": "ConfigFieldSnap",
+                  "default_provided": true,
+                  "default_value_as_json_str": "{\\"a_solid\\": {}}",
+                  "description": null,
+                  "is_required": false,
+                  "name": "solids",
+                  "type_key": "Shape.b25df6ff575a5177ad6130bc61f4d62097c2a29b"
                 }
               ],
               "given_name": null,
-              "key": "Shape.ca5906d9a0377218b4ee7d940ad55957afa73d1b",
+              "key": "Shape.c5669f096d88c01a2f1b55330266b6717cfeeda9",
               "kind": {
                 "__enum__": "ConfigTypeKind.STRICT_SHAPE"
               },
               "scalar_kind": null,
               "type_param_keys": null
             },
-            "Shape.da39a3ee5e6b4b0d3255bfef95601890afd80709": {
+            "Shape.c7adb72beb279d3db2d5745ecb926f2ce89deacd": {
               "__class__": "ConfigTypeSnap",
               "description": null,
               "enum_values": null,
-              "fields": [],
+              "fields": [
+                {
+                  "__class__": "ConfigFieldSnap",
+                  "default_provided": false,
+                  "default_value_as_json_str": null,
+                  "description": "Replace a worker process after it has executed this many steps.",
+                  "is_required": false,
+                  "name": "max_steps_per_worker",
+                  "type_key": "Int"
+                },
+                {
+                  "__class__": "ConfigFieldSnap",
+                  "default_provided": false,
+                  "default_value_as_json_str": null,
+                  "description": "Replace a worker process after a step once its peak resident memory exceeds this many megabytes. Not supported on Windows.",
+                  "is_required": false,
+                  "name": "max_worker_memory_mb",
+                  "type_key": "Int"
+                }
+              ],
               "given_name": null,
-              "key": "Shape.da39a3ee5e6b4b0d3255bfef95601890afd80709",
+              "key": "Shape.c7adb72beb279d3db2d5745ecb926f2ce89deacd",
               "kind": {
                 "__enum__": "ConfigTypeKind.STRICT_SHAPE"
               },
               "scalar_kind": null,
               "type_param_keys": null
             },
-            "Shape.e248cccc2d2206bf427e9bc9c2d22833f2aeb6d4": {
+            "Shape.ca5906d9a0377218b4ee7d940ad55957afa73d1b": {
               "__class__": "ConfigTypeSnap",
               "description": null,
               "enum_values": null,
@@ -2113,33 +2200,28 @@
                 {
                   "__class__": "ConfigFieldSnap",
                   "default_provided": true,
-                  "default_value_as_json_str": "0",
-                  "description": null,
-                  "is_required": false,
-                  "name": "max_concurrent",
-                  "type_key": "Int"
-                },
-                {
-                  "__class__": "ConfigFieldSnap",
-                  "default_provided": true,
-                  "default_value_as_json_str": "{\\"enabled\\": {}}",
+                  "default_value_as_json_str": "{\\"retries\\": {\\"enabled\\": {}}}",
                   "description": null,
                   "is_required": false,
-                  "name": "retries",
-                  "type_key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2"
-                },
-                {
-                  "__class__": "ConfigFieldSnap",
-                  "default_provided": false,
-                  "default_value_as_json_str": null,
-                  "description": "Select how subprocesses are created. Defaults to spawn.\\nWhen forkserver is selected, set_forkserver_preload will be called with either:\\n* the preload_modules list if provided by config\\n* the module containing the Job if it was loaded from a module\\n* dagster\\nhttps://docs.python.org/3/library/multiprocessing.html#contexts-and-start-methods",
-                  "is_required": false,
-                  "name": "start_method",
-                  "type_key": "Selector.0f5471adc2ad814d1c9fd94e2fa73c07217dea47"
+                  "name": "config",
+                  "type_key": "Shape.979b3d2fece4f3eb92e90f2ec9fb4c85efe9ea5c"
                 }
               ],
               "given_name": null,
-              "key": "Shape.e248cccc2d2206bf427e9bc9c2d22833f2aeb6d4",
+              "key": "Shape.ca5906d9a0377218b4ee7d940ad55957afa73d1b",
+              "kind": {
+                "__enum__": "ConfigTypeKind.STRICT_SHAPE"
+              },
+              "scalar_kind": null,
+              "type_param_keys": null
+            },
+            "Shape.da39a3ee5e6b4b0d3255bfef95601890afd80709": {
+              "__class__": "ConfigTypeSnap",
+              "description": null,
+              "enum_values": null,
+              "fields": [],
+              "given_name": null,
+              "key": "Shape.da39a3ee5e6b4b0d3255bfef95601890afd80709",
               "kind": {
                 "__enum__": "ConfigTypeKind.STRICT_SHAPE"
               },
@@ -2328,7 +2410,7 @@
                 "name": "io_manager"
               }
             ],
-            "root_config_key": "Shape.1b89f17c57460ee6db612e2a543579b48100564d"
+            "root_config_key": "Shape.c5669f096d88c01a2f1b55330266b6717cfeeda9"
           },
           {
             "__class__": "ModeDefSnap",
@@ -2366,7 +2448,7 @@
                 "name": "io_manager"
               }
             ],
-            "root_config_key": "Shape.1b89f17c57460ee6db612e2a543579b48100564d"
+            "root_config_key": "Shape.c5669f096d88c01a2f1b55330266b6717cfeeda9"
           }
         ],
         "name": "a_pipeline",
@@ -2407,6 +2489,7 @@
       }
     }
   ],
+  "external_pipeline_refs": null,
   "external_schedule_datas": [
     {
       "__class__": "ExternalScheduleData",
@@ -20,7 +20,7 @@
     },
     "step_output_versions": []
   },
-  "pipeline_snapshot_id": "330e31c23c3edacaa7a9224039b53a703f011788",
+  "pipeline_snapshot_id": "26ca467f434c138628587ee176787651603cc967",
   "snapshot_version": 1,
   "step_keys_to_execute": [
     "solid_one",
@@ -154,7 +154,7 @@
     },
     "step_output_versions": []
   },
-  "pipeline_snapshot_id": "7ffd65ba8633d4c172a7b15dfee5927bed301724",
+  "pipeline_snapshot_id": "73227dd287299f1fb1a438b4df12a102d5efbced",
   "snapshot_version": 1,
   "step_keys_to_execute": [
     "noop_solid"
@@ -217,7 +217,7 @@
     },
     "step_output_versions": []
   },
-  "pipeline_snapshot_id": "b96bfd4d61336a6ed2016679d1467c3e1daa3285",
+  "pipeline_snapshot_id": "8cb7dd471c1b42df97e99977345954072daabd30",
   "snapshot_version": 1,
   "step_keys_to_execute": [
     "noop_solid"
@@ -294,7 +294,7 @@
     },
     "step_output_versions": []
   },
-  "pipeline_snapshot_id": "7bb46b4373672e250386288663f7eca81f0a0a02",
+  "pipeline_snapshot_id": "4bdf7caaae49e0b6c0a988eb9ef8a9c54bcc6d86",
   "snapshot_version": 1,
   "step_keys_to_execute": [
     "comp_1.return_one",
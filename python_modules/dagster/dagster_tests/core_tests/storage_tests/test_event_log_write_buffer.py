@@ -0,0 +1,301 @@
+import threading
+import time
+
+import mock
+import pytest
+
+from dagster import execute_pipeline, pipeline, solid
+from dagster.core.events import DagsterEvent, DagsterEventType, EngineEventData
+from dagster.core.events.log import EventLogEntry
+from dagster.core.execution.plan.objects import StepSuccessData
+from dagster.core.storage.event_log import EventLogWriteBuffer, InMemoryEventLogStorage
+from dagster.core.test_utils import instance_for_test
+
+RUN_ID = "foo"
+
+
+def create_event(count: int, event_type=DagsterEventType.ENGINE_EVENT, event_specific_data=None):
+    return EventLogEntry(
+        error_info=None,
+        user_message=str(count),
+        level="debug",
+        run_id=RUN_ID,
+        timestamp=time.time(),
+        dagster_event=DagsterEvent(
+            event_type.value,
+            "nonce",
+            event_specific_data=event_specific_data or EngineEventData.in_process(999),
+        ),
+    )
+
+
+def test_flush_on_size():
+    storage = InMemoryEventLogStorage()
+    buffer = EventLogWriteBuffer(storage, max_buffered_events=3, flush_interval_seconds=60)
+
+    buffer.write(create_event(1))
+    buffer.write(create_event(2))
+    assert buffer.buffered_event_count == 2
+    assert len(storage.get_logs_for_run(RUN_ID)) == 0
+
+    buffer.write(create_event(3))
+    assert buffer.buffered_event_count == 0
+    assert [log.user_message for log in storage.get_logs_for_run(RUN_ID)] == ["1", "2", "3"]
+
+
+def test_flush_on_step_boundary():
+    storage = InMemoryEventLogStorage()
+    buffer = EventLogWriteBuffer(storage, max_buffered_events=100, flush_interval_seconds=60)
+
+    buffer.write(create_event(1))
+    buffer.write(
+        create_event(
+            2,
+            event_type=DagsterEventType.STEP_SUCCESS,
+            event_specific_data=StepSuccessData(duration_ms=1.0),
+        )
+    )
+    assert buffer.buffered_event_count == 0
+    assert len(storage.get_logs_for_run(RUN_ID)) == 2
+
+
+def test_flush_on_interval():
+    storage = InMemoryEventLogStorage()
+    buffer = EventLogWriteBuffer(storage, max_buffered_events=100, flush_interval_seconds=0.1)
+
+    buffer.write(create_event(1))
+    assert len(storage.get_logs_for_run(RUN_ID)) == 0
+
+    start_time = time.time()
+    while buffer.buffered_event_count:
+        assert time.time() - start_time < 5
+        time.sleep(0.05)
+
+    assert len(storage.get_logs_for_run(RUN_ID)) == 1
+
+
+def test_explicit_flush():
+    storage = InMemoryEventLogStorage()
+    buffer = EventLogWriteBuffer(storage, max_buffered_events=100, flush_interval_seconds=60)
+
+    buffer.write(create_event(1))
+    buffer.write(create_event(2))
+    with mock.patch.object(storage, "store_events", wraps=storage.store_events) as store_events:
+        buffer.flush()
+        buffer.flush()
+        assert store_events.call_count == 1
+
+    assert len(storage.get_logs_for_run(RUN_ID)) == 2
+
+
+def test_write_error_keeps_events():
+    storage = InMemoryEventLogStorage()
+    buffer = EventLogWriteBuffer(storage, max_buffered_events=2, flush_interval_seconds=60)
+
+    with mock.patch.object(storage, "store_events", side_effect=Exception("store failed")):
+        buffer.write(create_event(1))
+        with pytest.raises(Exception, match="store failed"):
+            buffer.write(create_event(2))
+    assert buffer.buffered_event_count == 2
+
+    buffer.flush()
+    assert buffer.buffered_event_count == 0
+    assert [log.user_message for log in storage.get_logs_for_run(RUN_ID)] == ["1", "2"]
+
+
+def test_interval_flush_error_is_logged_and_retried(caplog):
+    storage = InMemoryEventLogStorage()
+    buffer = EventLogWriteBuffer(storage, max_buffered_events=100, flush_interval_seconds=0.1)
+
+    store_events = storage.store_events
+    calls = []
+
+    def _store_events(events):
+        calls.append(events)
+        if len(calls) == 1:
+            raise Exception("store failed")
+        store_events(events)
+
+    with mock.patch.object(storage, "store_events", side_effect=_store_events):
+        buffer.write(create_event(1))
+
+        start_time = time.time()
+        while buffer.buffered_event_count:
+            assert time.time() - start_time < 5
+            time.sleep(0.05)
+
+    assert len(calls) == 2
+    assert "store failed" in caplog.text
+    assert [log.user_message for log in storage.get_logs_for_run(RUN_ID)] == ["1"]
+
+
+def test_asynchronous_flush_barrier():
+    storage = InMemoryEventLogStorage()
+    buffer = EventLogWriteBuffer(
+        storage, max_buffered_events=100, flush_interval_seconds=60, asynchronous=True
+    )
+
+    buffer.write(create_event(1))
+    buffer.write(create_event(2))
+    assert len(storage.get_logs_for_run(RUN_ID)) == 0
+
+    # writing a step boundary event blocks until it and the events before it are stored
+    buffer.write(
+        create_event(
+            3,
+            event_type=DagsterEventType.STEP_SUCCESS,
+            event_specific_data=StepSuccessData(duration_ms=1.0),
+        )
+    )
+    assert buffer.buffered_event_count == 0
+    assert [log.user_message for log in storage.get_logs_for_run(RUN_ID)] == ["1", "2", "3"]
+
+    buffer.write(create_event(4))
+    buffer.close()
+    assert len(storage.get_logs_for_run(RUN_ID)) == 4
+
+
+def test_asynchronous_batches_and_listeners():
+    storage = InMemoryEventLogStorage()
+    written = []
+    writer_threads = set()
+
+    def _on_events_written(events):
+        writer_threads.add(threading.current_thread())
+        written.extend(event.user_message for event in events)
+
+    buffer = EventLogWriteBuffer(
+        storage,
+        max_buffered_events=10,
+        flush_interval_seconds=60,
+        asynchronous=True,
+        on_events_written=_on_events_written,
+    )
+
+    with mock.patch.object(storage, "store_events", wraps=storage.store_events) as store_events:
+        for i in range(95):
+            buffer.write(create_event(i))
+        buffer.flush()
+        assert 10 <= store_events.call_count < 95
+
+    assert written == [str(i) for i in range(95)]
+    assert [log.user_message for log in storage.get_logs_for_run(RUN_ID)] == written
+    assert writer_threads and threading.current_thread() not in writer_threads
+    buffer.close()
+
+
+def test_asynchronous_write_error():
+    storage = InMemoryEventLogStorage()
+    buffer = EventLogWriteBuffer(
+        storage, max_buffered_events=100, flush_interval_seconds=60, asynchronous=True
+    )
+
+    with mock.patch.object(storage, "store_events", side_effect=Exception("store failed")):
+        buffer.write(create_event(1))
+        with pytest.raises(Exception, match="store failed"):
+            buffer.flush()
+
+        # the error is raised by the flush that owns the failed batch, not by later writers
+        buffer.write(create_event(2))
+        assert buffer.buffered_event_count == 2
+
+    # the failed batch is retried by the next flush
+    buffer.flush()
+    assert buffer.buffered_event_count == 0
+    assert [log.user_message for log in storage.get_logs_for_run(RUN_ID)] == ["1", "2"]
+    buffer.close()
+
+
+def test_asynchronous_write_error_is_retried():
+    storage = InMemoryEventLogStorage()
+    buffer = EventLogWriteBuffer(
+        storage, max_buffered_events=100, flush_interval_seconds=0.1, asynchronous=True
+    )
+
+    store_events = storage.store_events
+    calls = []
+
+    def _store_events(events):
+        calls.append(events)
+        if len(calls) == 1:
+            raise Exception("store failed")
+        store_events(events)
+
+    with mock.patch.object(storage, "store_events", side_effect=_store_events):
+        buffer.write(create_event(1))
+
+        start_time = time.time()
+        while buffer.buffered_event_count:
+            assert time.time() - start_time < 5
+            time.sleep(0.05)
+
+    assert len(calls) == 2
+    assert [log.user_message for log in storage.get_logs_for_run(RUN_ID)] == ["1"]
+    buffer.close()
+
+
+def test_instance_event_log_buffering():
+    @solid
+    def chatty_solid(context):
+        for i in range(20):
+            context.log.info(f"message {i}")
+
+    @pipeline
+    def chatty_pipeline():
+        chatty_solid()
+
+    with instance_for_test() as instance:
+        unbuffered_result = execute_pipeline(chatty_pipeline, instance=instance)
+        unbuffered_logs = instance.all_logs(unbuffered_result.run_id)
+
+    with instance_for_test(
+        overrides={"event_log_buffering": {"enabled": True, "max_buffered_events": 10}}
+    ) as instance:
+        assert instance.event_log_buffering_enabled
+        storage = instance.event_log_storage
+        with mock.patch.object(
+            storage, "store_events", wraps=storage.store_events
+        ) as store_events, mock.patch.object(
+            storage, "store_event", wraps=storage.store_event
+        ) as store_event:
+            result = execute_pipeline(chatty_pipeline, instance=instance)
+            assert result.success
+            assert store_event.call_count == 0
+            assert 0 < store_events.call_count < len(unbuffered_logs)
+
+        logs = instance.all_logs(result.run_id)
+        assert [log.user_message for log in logs if not log.is_dagster_event] == [
+            log.user_message for log in unbuffered_logs if not log.is_dagster_event
+        ]
+        assert instance.get_run_stats(result.run_id).steps_succeeded == 1
+
+
+def test_instance_asynchronous_event_log_buffering():
+    @solid
+    def chatty_solid(context):
+        for i in range(50):
+            context.log.info(f"message {i}")
+
+    @pipeline
+    def chatty_pipeline():
+        chatty_solid()
+
+    with instance_for_test(
+        overrides={
+            "event_log_buffering": {
+                "enabled": True,
+                "max_buffered_events": 10,
+                "asynchronous": True,
+            }
+        }
+    ) as instance:
+        assert instance.event_log_buffering_asynchronous
+        result = execute_pipeline(chatty_pipeline, instance=instance)
+        assert result.success
+
+        logs = instance.all_logs(result.run_id)
+        assert [log.user_message for log in logs if not log.is_dagster_event] == [
+            f"message {i}" for i in range(50)
+        ]
+        assert instance.get_run_stats(result.run_id).steps_succeeded == 1
+        assert instance.get_run_by_id(result.run_id).is_success
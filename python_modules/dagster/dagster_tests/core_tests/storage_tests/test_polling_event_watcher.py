@@ -3,6 +3,8 @@
 from contextlib import contextmanager
 from typing import Callable, Union
 
+import mock
+
 import dagster._check as check
 from dagster.core.events import DagsterEvent, DagsterEventType, EngineEventData
 from dagster.core.events.log import EventLogEntry
@@ -129,3 +131,69 @@ def watch_two(event, _cursor):
 
         assert [int(evt.message) for evt in watched_1] == [2, 3, 4]
         assert [int(evt.message) for evt in watched_2] == [4, 5]
+
+
+def test_multiple_runs_share_one_query():
+    with create_sqlite_run_event_logstorage() as storage:
+        run_ids = ["foo", "bar", "baz"]
+        watched = {run_id: [] for run_id in run_ids}
+
+        def _make_callback(run_id):
+            def _callback(event, _cursor):
+                watched[run_id].append(event)
+
+            return _callback
+
+        callbacks = {run_id: _make_callback(run_id) for run_id in run_ids}
+        for run_id in run_ids:
+            storage.store_event(create_event(0, run_id=run_id))
+            storage.watch(run_id, str(EventLogCursor.from_storage_id(1)), callbacks[run_id])
+
+        assert storage._watcher.has_run_id("foo")  # pylint: disable=protected-access
+
+        with mock.patch.object(
+            storage, "get_records_for_runs", wraps=storage.get_records_for_runs
+        ) as get_records_for_runs:
+            for i in range(1, 3):
+                for run_id in run_ids:
+                    storage.store_event(create_event(i, run_id=run_id))
+
+            attempts = 20
+            while any(len(events) < 2 for events in watched.values()) and attempts > 0:
+                time.sleep(0.1)
+                attempts -= 1
+
+            assert get_records_for_runs.call_count >= 1
+            for call in get_records_for_runs.call_args_list:
+                assert set(call[0][0].keys()) == set(run_ids)
+
+        for run_id in run_ids:
+            assert [int(evt.message) for evt in watched[run_id]] == [1, 2]
+            storage.end_watch(run_id, callbacks[run_id])
+
+        assert not storage._watcher.has_run_id("foo")  # pylint: disable=protected-access
+
+
+def test_callback_exception_does_not_stop_watcher():
+    with create_sqlite_run_event_logstorage() as storage:
+        watched = []
+
+        def bad_callback(_event, _cursor):
+            raise Exception("oops")
+
+        def good_callback(event, _cursor):
+            watched.append(event)
+
+        storage.watch(RUN_ID, None, bad_callback)
+        storage.watch(RUN_ID, None, good_callback)
+        storage.store_event(create_event(1))
+        storage.store_event(create_event(2))
+
+        attempts = 20
+        while len(watched) < 2 and attempts > 0:
+            time.sleep(0.1)
+            attempts -= 1
+
+        assert [int(evt.message) for evt in watched] == [1, 2]
+        storage.end_watch(RUN_ID, bad_callback)
+        storage.end_watch(RUN_ID, good_callback)
@@ -1,5 +1,6 @@
 import datetime
 import logging  # pylint: disable=unused-import; used by mock in string form
+import math
 import re
 import time
 from collections import Counter
@@ -9,6 +10,7 @@
 import mock
 import pendulum
 import pytest
+import sqlalchemy as db
 
 from dagster import (
     AssetGroup,
@@ -40,8 +42,16 @@
 from dagster.core.execution.api import execute_run
 from dagster.core.execution.plan.handle import StepHandle
 from dagster.core.execution.plan.objects import StepFailureData, StepSuccessData
-from dagster.core.execution.stats import StepEventStatus
-from dagster.core.storage.event_log import InMemoryEventLogStorage, SqlEventLogStorage
+from dagster.core.execution.stats import (
+    StepEventStatus,
+    build_run_stats_from_events,
+    build_run_step_stats_from_events,
+)
+from dagster.core.storage.event_log import (
+    InMemoryEventLogStorage,
+    SqlEventLogStorage,
+    sql_event_log,
+)
 from dagster.core.storage.event_log.base import (
     EventLogRecord,
     EventRecordsFilter,
@@ -49,8 +59,10 @@
 )
 from dagster.core.storage.event_log.migration import (
     EVENT_LOG_DATA_MIGRATIONS,
+    SECONDARY_INDEX_RUN_STATS,
     migrate_asset_key_data,
 )
+from dagster.core.storage.event_log.schema import SqlEventLogStorageTable
 from dagster.core.storage.event_log.sqlite.sqlite_event_log import SqliteEventLogStorage
 from dagster.core.test_utils import create_run_for_test, instance_for_test
 from dagster.core.utils import make_new_run_id
@@ -403,6 +415,91 @@ def test_event_log_storage_store_with_multiple_runs(self, instance, storage):
             for run in runs:
                 instance.delete_run(run)
 
+    def test_event_log_storage_store_events_batch(self, instance, storage):
+        run_ids = [make_new_run_id(), make_new_run_id()]
+        asset_key = AssetKey(["path", "to", "batched_asset"])
+        with create_and_delete_test_runs(instance, run_ids):
+            run_id_one, run_id_two = run_ids
+            events = [
+                create_test_event_log_record("one", run_id_one),
+                create_test_event_log_record("two", run_id_one),
+                create_test_event_log_record("three", run_id_two),
+                _event_record(
+                    run_id_two,
+                    "A",
+                    time.time(),
+                    DagsterEventType.ASSET_MATERIALIZATION,
+                    StepMaterializationData(AssetMaterialization(asset_key=asset_key)),
+                ),
+                create_test_event_log_record("four", run_id_one),
+            ]
+            storage.store_events(events)
+
+            assert [log.user_message for log in storage.get_logs_for_run(run_id_one)] == [
+                "one",
+                "two",
+                "four",
+            ]
+            assert len(storage.get_logs_for_run(run_id_two)) == 2
+            assert storage.has_asset_key(asset_key)
+            records = storage.get_event_records(
+                EventRecordsFilter(
+                    event_type=DagsterEventType.ASSET_MATERIALIZATION, asset_key=asset_key
+                )
+            )
+            assert len(records) == 1
+            assert records[0].event_log_entry.run_id == run_id_two
+
+            storage.store_events([])
+            assert len(storage.get_logs_for_run(run_id_one)) == 3
+
+    def test_get_records_for_runs(self, instance, storage):
+        if not isinstance(storage, SqlEventLogStorage):
+            pytest.skip("This test is for SQL-backed Event Log behavior")
+
+        run_ids = [make_new_run_id(), make_new_run_id()]
+        with create_and_delete_test_runs(instance, run_ids):
+            run_id_one, run_id_two = run_ids
+            for i in range(3):
+                storage.store_event(create_test_event_log_record(str(i), run_id_one))
+                storage.store_event(create_test_event_log_record(str(i), run_id_two))
+
+            records_by_run_id = storage.get_records_for_runs({run_id_one: -1, run_id_two: -1})
+            assert [
+                record.event_log_entry.user_message for record in records_by_run_id[run_id_one]
+            ] == ["0", "1", "2"]
+            assert len(records_by_run_id[run_id_two]) == 3
+
+            cursor = records_by_run_id[run_id_one][1].storage_id
+            records_by_run_id = storage.get_records_for_runs({run_id_one: cursor, run_id_two: -1})
+            assert [
+                record.event_log_entry.user_message for record in records_by_run_id[run_id_one]
+            ] == ["2"]
+            assert len(records_by_run_id[run_id_two]) == 3
+
+            # a run with no new records does not pull its old records into the query, even if
+            # another run has an earlier cursor
+            records_by_run_id = storage.get_records_for_runs({run_id_one: -1, run_id_two: -1})
+            first_cursor = records_by_run_id[run_id_one][0].storage_id
+            last_cursor = records_by_run_id[run_id_two][-1].storage_id
+            with mock.patch(
+                "dagster.core.storage.event_log.sql_event_log._records_by_run_id",
+                wraps=sql_event_log._records_by_run_id,  # pylint: disable=protected-access
+            ) as records_by_run_id_fn:
+                records_by_run_id = storage.get_records_for_runs(
+                    {run_id_one: first_cursor, run_id_two: last_cursor}
+                )
+                assert [
+                    record.event_log_entry.user_message for record in records_by_run_id[run_id_one]
+                ] == ["1", "2"]
+                assert records_by_run_id[run_id_two] == []
+                # sharded storages query each run separately
+                if records_by_run_id_fn.called:
+                    rows = records_by_run_id_fn.call_args[0][0]
+                    assert {row[1] for row in rows} == {run_id_one}
+
+            assert storage.get_records_for_runs({}) == {}
+
     def test_event_log_storage_watch(self, test_run_id, storage):
         if not self.can_watch():
             pytest.skip("storage cannot watch runs")
@@ -581,6 +678,22 @@ def test_secondary_index(self, storage):
         assert storage.has_secondary_index("_A")
         assert storage.has_secondary_index("_B")
 
+    def test_secondary_index_built_elsewhere(self, storage):
+        if not isinstance(storage, SqlEventLogStorage):
+            pytest.skip("This test is for SQL-backed Event Log behavior")
+
+        assert not storage.has_secondary_index("_C")
+
+        # another process builds the index, which this storage does not see until it checks again
+        SqlEventLogStorage.enable_secondary_index(storage, "_C")
+        assert not storage.has_secondary_index("_C")
+
+        with mock.patch(
+            "dagster.core.storage.event_log.sql_event_log.SECONDARY_INDEX_RECHECK_INTERVAL_SECONDS",
+            0,
+        ):
+            assert storage.has_secondary_index("_C")
+
     def test_basic_event_store(self, test_run_id, storage):
         if not isinstance(storage, SqlEventLogStorage):
             pytest.skip("This test is for SQL-backed Event Log behavior")
@@ -1149,6 +1262,105 @@ def _pipeline():
         assert len(step_stats[0].markers) == 1
         assert step_stats[0].markers[0].end_time >= step_stats[0].markers[0].start_time + 0.1
 
+    def test_run_stats_tables(self, storage, test_run_id):
+        if not isinstance(storage, SqlEventLogStorage):
+            pytest.skip("This test is for SQL-backed Event Log behavior")
+
+        # newly initialized DBs maintain the run stats and step stats tables as events are stored
+        assert storage.has_secondary_index(SECONDARY_INDEX_RUN_STATS)
+
+        @solid(input_defs=[InputDefinition("_input", str)])
+        def should_retry(context, _input):
+            raise RetryRequested(max_retries=2)
+
+        @solid(required_resource_keys={"foo"})
+        def foo_solid():
+            pass
+
+        def _retry_pipeline():
+            should_retry(should_succeed())
+
+        def _marker_pipeline():
+            foo_solid()
+
+        retry_events, result = _synthesize_events(_retry_pipeline, check_success=False)
+        marker_events, marker_result = _synthesize_events(_marker_pipeline)
+        events_by_run_id = {
+            test_run_id: _stats_records(run_id=test_run_id),
+            result.run_id: retry_events,
+            marker_result.run_id: marker_events,
+        }
+
+        def _assert_stats_match_events(run_id, events):
+            run_stats = storage.get_stats_for_run(run_id)
+            expected_run_stats = build_run_stats_from_events(run_id, events)
+            assert run_stats.steps_succeeded == expected_run_stats.steps_succeeded
+            assert run_stats.steps_failed == expected_run_stats.steps_failed
+            assert run_stats.materializations == expected_run_stats.materializations
+            assert run_stats.expectations == expected_run_stats.expectations
+            for field in ["enqueued_time", "launch_time", "start_time", "end_time"]:
+                expected_time = getattr(expected_run_stats, field)
+                if expected_time is None:
+                    assert getattr(run_stats, field) is None
+                else:
+                    assert math.isclose(getattr(run_stats, field), expected_time, abs_tol=1e-3)
+
+            step_stats = sorted(storage.get_step_stats_for_run(run_id), key=lambda x: x.step_key)
+            expected_step_stats = sorted(
+                build_run_step_stats_from_events(run_id, events), key=lambda x: x.step_key
+            )
+            assert step_stats == expected_step_stats
+
+        for run_id, events in events_by_run_id.items():
+            # exercise both the batched and single event write paths
+            storage.store_events(events[:3])
+            for event in events[3:]:
+                storage.store_event(event)
+            _assert_stats_match_events(run_id, events)
+
+        retry_stats = [
+            stats
+            for stats in storage.get_step_stats_for_run(result.run_id)
+            if stats.step_key == "should_retry"
+        ][0]
+        assert retry_stats.attempts == 3
+        [marker_stats] = storage.get_step_stats_for_run(marker_result.run_id)
+        assert len(marker_stats.markers) == 1
+
+        # rebuilding the stats from the event log replaces, rather than adds to, the stored stats
+        for run_id, events in events_by_run_id.items():
+            storage.rebuild_stats_for_run(run_id)
+            _assert_stats_match_events(run_id, events)
+
+        storage.delete_events(test_run_id)
+        assert storage.get_stats_for_run(test_run_id).steps_succeeded == 0
+        assert storage.get_step_stats_for_run(test_run_id) == []
+        assert storage.get_stats_for_run(result.run_id).steps_succeeded == 1
+
+    def test_run_stats_maintained_before_index_is_marked(self, storage, test_run_id):
+        if not isinstance(storage, SqlEventLogStorage):
+            pytest.skip("This test is for SQL-backed Event Log behavior")
+
+        events = _stats_records(run_id=test_run_id)
+
+        # a process that still has the stats index cached as unbuilt (e.g. while a reindex runs in
+        # another process) keeps the stats tables up to date as it stores events
+        with mock.patch.object(storage, "has_secondary_index", return_value=False):
+            storage.store_events(events[:3])
+            for event in events[3:]:
+                storage.store_event(event)
+
+        assert storage.has_secondary_index(SECONDARY_INDEX_RUN_STATS)
+        run_stats = storage.get_stats_for_run(test_run_id)
+        expected_run_stats = build_run_stats_from_events(test_run_id, events)
+        assert run_stats.steps_succeeded == expected_run_stats.steps_succeeded
+        assert run_stats.steps_failed == expected_run_stats.steps_failed
+        assert run_stats.materializations == expected_run_stats.materializations
+        assert run_stats.expectations == expected_run_stats.expectations
+        assert sorted(
+            storage.get_step_stats_for_run(test_run_id), key=lambda x: x.step_key
+        ) == sorted(build_run_step_stats_from_events(test_run_id, events), key=lambda x: x.step_key)
+
     @pytest.mark.parametrize(
         "cursor_dt", cursor_datetime_args()
     )  # test both tz-aware and naive datetimes
@@ -1865,6 +2077,155 @@ def _fetch_counts(storage):
                     assert materialization_count_by_partition.get(c)["a"] == 1
                     assert materialization_count_by_partition.get(d)["x"] == 2
 
+    def test_get_latest_materialization_events_by_partition(self, storage, instance):
+        a = AssetKey("no_materializations_asset")
+        b = AssetKey("no_partitions_asset")
+        c = AssetKey("two_partitions_asset")
+
+        @op
+        def materialize():
+            yield AssetMaterialization(b)
+            yield AssetMaterialization(c, partition="a", metadata={"run": 1})
+            yield Output(None)
+
+        @op
+        def materialize_two():
+            yield AssetMaterialization(c, partition="a", metadata={"run": 2})
+            yield AssetMaterialization(c, partition="b", metadata={"run": 2})
+            yield Output(None)
+
+        def _latest_runs(storage):
+            latest_by_partition = storage.get_latest_materialization_events_by_partition([a, b, c])
+            assert latest_by_partition[a] == {}
+            assert latest_by_partition[b] == {}
+            materializations = {
+                partition: event.dagster_event.step_materialization_data.materialization
+                for partition, event in latest_by_partition[c].items()
+            }
+            return {
+                partition: materialization.metadata_entries[0].entry_data.value
+                for partition, materialization in materializations.items()
+            }
+
+        with instance_for_test() as created_instance:
+            if not storage._instance:  # pylint: disable=protected-access
+                storage.register_instance(created_instance)
+
+            run_id_1 = make_new_run_id()
+            run_id_2 = make_new_run_id()
+            run_id_3 = make_new_run_id()
+
+            with create_and_delete_test_runs(instance, [run_id_1, run_id_2, run_id_3]):
+                events_one, _ = _synthesize_events(
+                    lambda: materialize(), instance=created_instance, run_id=run_id_1
+                )
+                for event in events_one:
+                    storage.store_event(event)
+
+                assert _latest_runs(storage) == {"a": 1}
+
+                events_two, _ = _synthesize_events(
+                    lambda: materialize_two(), instance=created_instance, run_id=run_id_2
+                )
+                for event in events_two:
+                    storage.store_event(event)
+
+                assert _latest_runs(storage) == {"a": 2, "b": 2}
+
+                if self.can_wipe():
+                    storage.wipe_asset(c)
+                    assert _latest_runs(storage) == {}
+
+                    events, _ = _synthesize_events(
+                        lambda: materialize(), instance=created_instance, run_id=run_id_3
+                    )
+                    for event in events:
+                        storage.store_event(event)
+
+                    assert _latest_runs(storage) == {"a": 1}
+
+    def test_get_latest_materialization_events_by_partition_filtered(self, storage, instance):
+        a = AssetKey("filtered_asset")
+
+        @op
+        def materialize():
+            yield AssetMaterialization(a, partition="x")
+            yield AssetMaterialization(a, partition="y")
+            yield AssetMaterialization(a, partition="z")
+            yield Output(None)
+
+        with instance_for_test() as created_instance:
+            if not storage._instance:  # pylint: disable=protected-access
+                storage.register_instance(created_instance)
+
+            run_id = make_new_run_id()
+            with create_and_delete_test_runs(instance, [run_id]):
+                events, _ = _synthesize_events(
+                    lambda: materialize(), instance=created_instance, run_id=run_id
+                )
+                for event in events:
+                    storage.store_event(event)
+
+                assert set(storage.get_latest_materialization_events_by_partition([a])[a]) == {
+                    "x",
+                    "y",
+                    "z",
+                }
+                latest_by_partition = storage.get_latest_materialization_events_by_partition(
+                    [a], partitions=["x", "z", "missing"]
+                )
+                assert set(latest_by_partition[a]) == {"x", "z"}
+
+    def test_get_latest_materialization_events_by_partition_legacy_keys(self, storage, instance):
+        if not isinstance(storage, SqlEventLogStorage):
+            pytest.skip("This test is for SQL-backed Event Log behavior")
+
+        c = AssetKey(["legacy", "partitioned_asset"])
+
+        @op
+        def materialize():
+            yield AssetMaterialization(c, partition="a")
+            yield AssetMaterialization(c, partition="b")
+            yield Output(None)
+
+        def _use_legacy_key(run_id, partition):
+            # rewrite the stored events to the legacy asset key format, as written by old versions
+            with storage.index_connection() as conn:
+                conn.execute(
+                    SqlEventLogStorageTable.update()  # pylint: disable=no-value-for-parameter
+                    .where(
+                        db.and_(
+                            SqlEventLogStorageTable.c.run_id == run_id,
+                            SqlEventLogStorageTable.c.partition == partition,
+                        )
+                    )
+                    .values(asset_key=c.to_string(legacy=True))
+                )
+
+        with instance_for_test() as created_instance:
+            if not storage._instance:  # pylint: disable=protected-access
+                storage.register_instance(created_instance)
+
+            run_id_1 = make_new_run_id()
+            run_id_2 = make_new_run_id()
+            with create_and_delete_test_runs(instance, [run_id_1, run_id_2]):
+                for run_id in [run_id_1, run_id_2]:
+                    events, _ = _synthesize_events(
+                        lambda: materialize(), instance=created_instance, run_id=run_id
+                    )
+                    for event in events:
+                        storage.store_event(event)
+
+                # each partition has a latest event in both formats, the newer one in a different
+                # format for each partition
+                _use_legacy_key(run_id_1, "b")
+                _use_legacy_key(run_id_2, "a")
+
+                latest_by_partition = storage.get_latest_materialization_events_by_partition([c])
+                assert {
+                    partition: event.run_id for partition, event in latest_by_partition[c].items()
+                } == {"a": run_id_2, "b": run_id_2}
+
     def test_get_observation(self, storage, test_run_id):
         a = AssetKey(["key_a"])
 
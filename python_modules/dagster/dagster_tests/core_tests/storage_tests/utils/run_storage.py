@@ -25,13 +25,16 @@
 from dagster.core.storage.event_log import InMemoryEventLogStorage
 from dagster.core.storage.noop_compute_log_manager import NoOpComputeLogManager
 from dagster.core.storage.pipeline_run import (
+    IN_PROGRESS_RUN_STATUSES,
     DagsterRun,
     JobBucket,
     PipelineRunStatus,
     RunsFilter,
+    RunSummaryRecord,
     TagBucket,
 )
 from dagster.core.storage.root import LocalArtifactStorage
+from dagster.core.storage.runs import sql_run_storage
 from dagster.core.storage.runs.migration import REQUIRED_DATA_MIGRATIONS
 from dagster.core.storage.runs.sql_run_storage import SqlRunStorage
 from dagster.core.storage.tags import (
@@ -1339,6 +1342,129 @@ def test_run_record_stats(self, storage):
         assert run_record.end_time is not None
         assert run_record.end_time >= run_record.start_time
 
+    def test_get_runs_by_ids(self, storage, monkeypatch):
+        assert storage
+        # exercises the batching of run ids in sql storages
+        monkeypatch.setattr(sql_run_storage, "RUN_ID_BATCH_SIZE", 2)
+
+        run_ids = [make_new_run_id() for _ in range(5)]
+        for run_id in run_ids:
+            storage.add_run(TestRunStorage.build_run(run_id=run_id, pipeline_name="foo_pipeline"))
+
+        assert storage.get_runs_by_ids([]) == {}
+        assert storage.get_run_records_by_ids([]) == {}
+
+        missing_run_id = make_new_run_id()
+        requested = run_ids[:4] + [run_ids[0], missing_run_id]
+
+        runs = storage.get_runs_by_ids(requested)
+        assert set(runs.keys()) == set(run_ids[:4])
+        assert all(runs[run_id].run_id == run_id for run_id in runs)
+
+        records = storage.get_run_records_by_ids(requested)
+        assert set(records.keys()) == set(run_ids[:4])
+        assert all(records[run_id].pipeline_run == runs[run_id] for run_id in records)
+        assert records == {
+            record.pipeline_run.run_id: record
+            for record in storage.get_run_records(RunsFilter(run_ids=run_ids[:4]))
+        }
+
+    def test_get_run_summary_records(self, storage):
+        assert storage
+
+        one, two, three = [make_new_run_id() for _ in range(3)]
+        storage.add_run(
+            TestRunStorage.build_run(run_id=one, pipeline_name="some_pipeline", tags={"foo": "bar"})
+        )
+        storage.add_run(
+            TestRunStorage.build_run(
+                run_id=two,
+                pipeline_name="some_pipeline",
+                tags={"foo": "baz"},
+                status=PipelineRunStatus.FAILURE,
+            )
+        )
+        storage.add_run(TestRunStorage.build_run(run_id=three, pipeline_name="other_pipeline"))
+
+        storage.handle_run_event(
+            one,
+            DagsterEvent(
+                message="a message",
+                event_type_value=DagsterEventType.PIPELINE_SUCCESS.value,
+                pipeline_name="some_pipeline",
+            ),
+        )
+        storage.add_run_tags(three, {"new": "tag"})
+
+        summaries = storage.get_run_summary_records()
+        assert [summary.run_id for summary in summaries] == [three, two, one]
+        assert summaries == [
+            RunSummaryRecord.from_run_record(record) for record in storage.get_run_records()
+        ]
+
+        summaries_by_id = {summary.run_id: summary for summary in summaries}
+        assert summaries_by_id[one].status == PipelineRunStatus.SUCCESS
+        assert summaries_by_id[one].is_finished
+        assert summaries_by_id[one].tags == {"foo": "bar"}
+        assert summaries_by_id[two].status == PipelineRunStatus.FAILURE
+        assert summaries_by_id[three].status == PipelineRunStatus.NOT_STARTED
+        assert not summaries_by_id[three].is_finished
+        assert summaries_by_id[three].tags == {"new": "tag"}
+        assert summaries_by_id[three].pipeline_name == "other_pipeline"
+
+        filtered = storage.get_run_summary_records(
+            filters=RunsFilter(pipeline_name="some_pipeline", tags={"foo": "baz"})
+        )
+        assert [summary.run_id for summary in filtered] == [two]
+
+        limited = storage.get_run_summary_records(limit=2)
+        assert [summary.run_id for summary in limited] == [three, two]
+
+    def test_claim_queued_run(self, storage):
+        assert storage
+
+        queued_run_id, started_run_id = make_new_run_id(), make_new_run_id()
+        storage.add_run(
+            TestRunStorage.build_run(
+                run_id=queued_run_id,
+                pipeline_name="some_pipeline",
+                status=PipelineRunStatus.QUEUED,
+                external_pipeline_origin=self.fake_job_origin("some_pipeline"),
+            )
+        )
+        storage.add_run(
+            TestRunStorage.build_run(
+                run_id=started_run_id,
+                pipeline_name="some_pipeline",
+                status=PipelineRunStatus.STARTED,
+            )
+        )
+
+        assert not storage.claim_queued_run(started_run_id)
+        assert not storage.claim_queued_run(make_new_run_id())
+
+        assert storage.claim_queued_run(queued_run_id)
+        assert storage.get_run_by_id(queued_run_id).status == PipelineRunStatus.STARTING
+        assert storage.get_run_records(RunsFilter(run_ids=[queued_run_id]))[
+            0
+        ].pipeline_run.status == (PipelineRunStatus.STARTING)
+
+        # the claimed run keeps counting as in progress once it is dequeued
+        storage.handle_run_event(
+            queued_run_id,
+            DagsterEvent(
+                event_type_value=DagsterEventType.PIPELINE_DEQUEUED.value,
+                pipeline_name="some_pipeline",
+            ),
+        )
+        assert storage.get_run_by_id(queued_run_id).status == PipelineRunStatus.STARTING
+        assert queued_run_id in {
+            run.run_id for run in storage.get_runs(RunsFilter(statuses=IN_PROGRESS_RUN_STATUSES))
+        }
+
+        # a run can only be claimed once
+        assert not storage.claim_queued_run(queued_run_id)
+
     def test_by_job(self, storage):
         if not storage.supports_bucket_queries:
             pytest.skip("storage cannot bucket")
@@ -33,7 +33,13 @@
 from dagster.core.definitions.version_strategy import VersionStrategy
 from dagster.core.execution.api import create_execution_plan
 from dagster.core.execution.plan.outputs import StepOutputHandle
-from dagster.core.execution.resolve_versions import join_and_hash, resolve_config_version
+from dagster.core.execution.plan.plan import ExecutionPlan
+from dagster.core.execution.resolve_versions import (
+    join_and_hash,
+    resolve_config_version,
+    resolve_step_output_versions,
+)
+from dagster.core.snap import snapshot_from_execution_plan
 from dagster.core.storage.memoizable_io_manager import MemoizableIOManager
 from dagster.core.storage.tags import MEMOIZED_RUN_TAG
 from dagster.core.system_config.objects import ResolvedRunConfig
@@ -944,3 +950,89 @@ def call_the_op():
 
         memoized_plan = create_execution_plan(call_the_op, instance_ref=instance.get_ref())
         assert len(memoized_plan.step_keys_to_execute) == 0
+
+
+class CountingVersionStrategy(VersionStrategy):
+    def __init__(self):
+        self.op_version_calls = []
+
+    def get_op_version(self, context):
+        self.op_version_calls.append(context.op_def.name)
+        return "v1"
+
+    def get_resource_version(self, context):
+        return "v1"
+
+
+def get_counting_version_strategy_job(version_strategy):
+    @op(config_schema={"value": int})
+    def configured_op(context, upstream=None):
+        return (upstream or 0) + context.op_config["value"]
+
+    @job(
+        version_strategy=version_strategy,
+        resource_defs={
+            "io_manager": IOManagerDefinition.hardcoded_io_manager(VersionedInMemoryIOManager())
+        },
+        config={
+            "ops": {
+                **{f"first_{i}": {"config": {"value": 1}} for i in range(5)},
+                **{f"second_{i}": {"config": {"value": 2}} for i in range(5)},
+            }
+        },
+    )
+    def counting_job():
+        for i in range(5):
+            configured_op.alias(f"second_{i}")(configured_op.alias(f"first_{i}")())
+
+    return counting_job
+
+
+def test_op_versions_shared_between_invocations():
+    version_strategy = CountingVersionStrategy()
+    counting_job = get_counting_version_strategy_job(version_strategy)
+
+    with instance_for_test() as instance:
+        memoized_plan = create_execution_plan(counting_job, instance_ref=instance.get_ref())
+
+    # the op version is resolved once for each distinct config of the op
+    assert version_strategy.op_version_calls == ["configured_op", "configured_op"]
+
+    step_output_versions = memoized_plan.step_output_versions
+    assert len(step_output_versions) == 10
+    first_versions = {
+        step_output_versions[StepOutputHandle(f"first_{i}", "result")] for i in range(5)
+    }
+    second_versions = {
+        step_output_versions[StepOutputHandle(f"second_{i}", "result")] for i in range(5)
+    }
+    assert len(first_versions) == 1
+    assert len(second_versions) == 1
+    assert first_versions != second_versions
+
+
+def test_step_output_versions_from_known_state():
+    version_strategy = CountingVersionStrategy()
+    counting_job = get_counting_version_strategy_job(version_strategy)
+
+    with instance_for_test() as instance:
+        memoized_plan = create_execution_plan(counting_job, instance_ref=instance.get_ref())
+        version_strategy.op_version_calls.clear()
+
+        # the versions persisted in the known state of the memoized plan are reused, e.g. when
+        # its steps are executed, instead of being resolved again for each step output
+        resolved_run_config = ResolvedRunConfig.build(counting_job)
+        assert (
+            resolve_step_output_versions(counting_job, memoized_plan, resolved_run_config)
+            == memoized_plan.step_output_versions
+        )
+        assert version_strategy.op_version_calls == []
+
+        rebuilt_plan = ExecutionPlan.rebuild_from_snapshot(
+            counting_job.name, snapshot_from_execution_plan(memoized_plan, "fake_snapshot_id")
+        )
+        assert (
+            resolve_step_output_versions(counting_job, rebuilt_plan, resolved_run_config)
+            == memoized_plan.step_output_versions
+        )
+        assert version_strategy.op_version_calls == []
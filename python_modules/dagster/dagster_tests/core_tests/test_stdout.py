@@ -208,6 +208,100 @@ def test_compute_log_manager_subscription_updates():
         assert last_chunk.cursor > 0
 
 
+@pytest.mark.skipif(
+    should_disable_io_stream_redirect(), reason="compute logs disabled for win / py3.6+"
+)
+@pytest.mark.parametrize("use_polling", [False, True])
+def test_compute_log_manager_shared_tail(use_polling):
+    from dagster.core.storage.local_compute_log_manager import LocalComputeLogManager
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        compute_log_manager = LocalComputeLogManager(
+            temp_dir, polling_timeout=0.5, use_polling=use_polling
+        )
+        run_id = "fake_run_id"
+        step_key = "spew"
+        stdout_path = compute_log_manager.get_local_path(run_id, step_key, ComputeIOType.STDOUT)
+        ensure_dir(os.path.dirname(stdout_path))
+        with open(stdout_path, "w", encoding="utf8") as f:
+            f.write("before\n")
+
+        first_messages = []
+        second_messages = []
+        compute_log_manager.observable(run_id, step_key, ComputeIOType.STDOUT).subscribe(
+            first_messages.append
+        )
+        compute_log_manager.observable(run_id, step_key, ComputeIOType.STDOUT).subscribe(
+            second_messages.append
+        )
+
+        # both subscribers are served from the one tail of the file
+        subscription_manager = (
+            compute_log_manager._subscription_manager
+        )  # pylint: disable=protected-access
+        tail = subscription_manager.get_tail(stdout_path)
+        assert tail
+
+        with open(stdout_path, "a", encoding="utf8") as f:
+            f.write("after\n")
+
+        time.sleep(1)
+        for messages in [first_messages, second_messages]:
+            assert "".join(chunk.data or "" for chunk in messages) == "before\nafter\n"
+            assert messages[-1].cursor == len("before\nafter\n")
+
+        # bytes written before the tail was opened are read from the file
+        assert (
+            compute_log_manager.read_logs_file(
+                run_id, step_key, ComputeIOType.STDOUT, cursor=2
+            ).data
+            == "fore\nafter\n"
+        )
+        assert (
+            compute_log_manager.read_logs_file(
+                run_id, step_key, ComputeIOType.STDOUT, cursor=len("before\n")
+            ).data
+            == "after\n"
+        )
+
+        subscription_manager.remove_all_subscriptions(run_id, step_key)
+        assert subscription_manager.get_tail(stdout_path) is None
+        compute_log_manager.dispose()
+
+
+def test_compute_log_file_tail_bounded():
+    from dagster.core.storage.local_compute_log_manager import LocalComputeLogFileTail
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = os.path.join(temp_dir, "compute.out")
+        with open(path, "wb") as f:
+            f.write(b"0123")
+
+        tail = LocalComputeLogFileTail(path, max_bytes=8)
+        assert tail.read(4, 100) == (b"", 4)
+        # cursors before the tail of the file are left to range reads
+        assert tail.read(0, 100) is None
+
+        with open(path, "ab") as f:
+            f.write(b"456789")
+        assert tail.read(4, 100) == (b"456789", 10)
+        assert tail.read(6, 2) == (b"67", 10)
+
+        with open(path, "ab") as f:
+            f.write(b"abcdefghij")
+        # only the last max_bytes of the file are kept
+        assert tail.read(10, 100) is None
+        assert tail.read(12, 100) == (b"cdefghij", 20)
+
+        # truncation resets the tail
+        with open(path, "wb") as f:
+            f.write(b"xy")
+        assert tail.read(2, 100) == (b"", 2)
+
+        tail.close()
+        assert tail.read(2, 100) is None
+
+
 def gen_solid_name(length):
     return "".join(random.choice(string.ascii_lowercase) for x in range(length))
 
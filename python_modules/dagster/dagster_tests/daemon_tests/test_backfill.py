@@ -29,6 +29,7 @@
 from dagster.core.storage.pipeline_run import PipelineRunStatus, RunsFilter
 from dagster.core.storage.tags import BACKFILL_ID_TAG, PARTITION_NAME_TAG, PARTITION_SET_TAG
 from dagster.core.test_utils import (
+    create_run_for_test,
     create_test_daemon_workspace,
     instance_for_test,
     step_did_not_run,
@@ -38,7 +39,7 @@
 from dagster.core.types.loadable_target_origin import LoadableTargetOrigin
 from dagster.core.workspace.load_target import PythonFileTarget
 from dagster.daemon import get_default_daemon_logger
-from dagster.daemon.backfill import execute_backfill_iteration
+from dagster.daemon.backfill import _get_partitions_chunk, execute_backfill_iteration
 from dagster.seven import IS_WINDOWS, get_system_temp_directory
 from dagster.utils import touch_file
 from dagster.utils.error import SerializableErrorInfo
@@ -584,6 +585,57 @@ def test_large_backfill():
         assert instance.get_runs_count() == 3
 
 
+def test_partitions_chunk_from_checkpoint():
+    partition_names = [f"partition_{i}" for i in range(1000)]
+    backfill = PartitionBackfill(
+        backfill_id="chunked",
+        partition_set_origin=_unloadable_partition_set_origin(),
+        status=BulkActionStatus.REQUESTED,
+        partition_names=partition_names,
+        from_failure=False,
+        reexecution_steps=None,
+        tags=None,
+        backfill_timestamp=pendulum.now().timestamp(),
+    )
+    logger = get_default_daemon_logger("BackfillDaemon")
+
+    with instance_for_test() as instance:
+        for partition_name in ["partition_3", "partition_502"]:
+            create_run_for_test(
+                instance, tags={BACKFILL_ID_TAG: "chunked", PARTITION_NAME_TAG: partition_name}
+            )
+
+        chunk, checkpoint, checkpoint_index, has_more = _get_partitions_chunk(
+            instance, logger, backfill, 10
+        )
+        assert chunk == [f"partition_{i}" for i in range(10) if i != 3]
+        assert (checkpoint, checkpoint_index, has_more) == ("partition_9", 9, True)
+
+        backfill = backfill.with_partition_checkpoint("partition_499", 499)
+        assert backfill.partition_checkpoint_index == 499
+        chunk, checkpoint, checkpoint_index, has_more = _get_partitions_chunk(
+            instance, logger, backfill, 10
+        )
+        assert chunk == [f"partition_{i}" for i in range(500, 510) if i != 502]
+        assert (checkpoint, checkpoint_index, has_more) == ("partition_509", 509, True)
+
+        # checkpoints stored without an index, or with a stale one, are looked up by name
+        for stale_index in [None, 3, 5000]:
+            assert (
+                backfill.with_partition_checkpoint(
+                    "partition_989", stale_index
+                ).partition_checkpoint_index
+                == 989
+            )
+
+        backfill = backfill.with_partition_checkpoint("partition_989", 989)
+        chunk, checkpoint, checkpoint_index, has_more = _get_partitions_chunk(
+            instance, logger, backfill, 10
+        )
+        assert chunk == [f"partition_{i}" for i in range(990, 1000)]
+        assert (checkpoint, checkpoint_index, has_more) == ("partition_999", 999, False)
+
+
 def test_unloadable_backfill():
     with instance_for_context(default_repo) as (
         instance,
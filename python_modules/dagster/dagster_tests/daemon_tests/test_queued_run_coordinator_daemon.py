@@ -18,18 +18,23 @@
 
 
 @contextmanager
-def instance_for_queued_run_coordinator(max_concurrent_runs=None, tag_concurrency_limits=None):
+def instance_for_queued_run_coordinator(
+    max_concurrent_runs=None, tag_concurrency_limits=None, dequeue_use_threads=False
+):
     max_concurrent_runs = (
         {"max_concurrent_runs": max_concurrent_runs} if max_concurrent_runs else {}
     )
     tag_concurrency_limits = (
         {"tag_concurrency_limits": tag_concurrency_limits} if tag_concurrency_limits else {}
     )
+    dequeue_use_threads = (
+        {"dequeue_use_threads": True, "dequeue_num_workers": 2} if dequeue_use_threads else {}
+    )
     overrides = {
         "run_coordinator": {
             "module": "dagster.core.run_coordinator",
             "class": "QueuedRunCoordinator",
-            "config": {**max_concurrent_runs, **tag_concurrency_limits},
+            "config": {**max_concurrent_runs, **tag_concurrency_limits, **dequeue_use_threads},
         },
         "run_launcher": {
             "module": "dagster.core.test_utils",
@@ -563,3 +568,102 @@ def test_key_limit_with_extra_tags(workspace, daemon):
 
         list(daemon.run_iteration(instance, workspace))
         assert get_run_ids(instance.run_launcher.queue()) == ["run-1"]
+
+
+def test_threaded_max_runs(workspace, daemon):
+    with instance_for_queued_run_coordinator(
+        max_concurrent_runs=4, dequeue_use_threads=True
+    ) as instance:
+        create_run(instance, run_id="in-progress-run", status=PipelineRunStatus.STARTED)
+        for i in range(5):
+            create_run(instance, run_id=f"queued-run-{i}", status=PipelineRunStatus.QUEUED)
+
+        list(daemon.run_iteration(instance, workspace))
+
+        # launched in parallel, so the launch order is not deterministic
+        assert set(get_run_ids(instance.run_launcher.queue())) == {
+            "queued-run-0",
+            "queued-run-1",
+            "queued-run-2",
+        }
+        assert daemon.last_iteration_stats.num_queued == 5
+        assert daemon.last_iteration_stats.num_launched == 3
+
+
+def test_threaded_tag_limits(workspace, daemon):
+    with instance_for_queued_run_coordinator(
+        max_concurrent_runs=10,
+        tag_concurrency_limits=[
+            {"key": "database", "value": "tiny", "limit": 1},
+            {"key": "user", "value": {"applyLimitPerUniqueValue": True}, "limit": 2},
+        ],
+        dequeue_use_threads=True,
+    ) as instance:
+        create_run(
+            instance, run_id="tiny-1", status=PipelineRunStatus.QUEUED, tags={"database": "tiny"}
+        )
+        create_run(
+            instance, run_id="tiny-2", status=PipelineRunStatus.QUEUED, tags={"database": "tiny"}
+        )
+        create_run(
+            instance, run_id="large-1", status=PipelineRunStatus.QUEUED, tags={"database": "large"}
+        )
+        for i in range(3):
+            create_run(
+                instance,
+                run_id=f"johann-{i}",
+                status=PipelineRunStatus.QUEUED,
+                tags={"user": "johann"},
+            )
+
+        list(daemon.run_iteration(instance, workspace))
+
+        assert set(get_run_ids(instance.run_launcher.queue())) == {
+            "tiny-1",
+            "large-1",
+            "johann-0",
+            "johann-1",
+        }
+
+
+def test_threaded_skip_error_runs(workspace, daemon):
+    with instance_for_queued_run_coordinator(
+        max_concurrent_runs=10, dequeue_use_threads=True
+    ) as instance:
+        create_run(instance, run_id="bad-run", status=PipelineRunStatus.QUEUED)
+        create_run(instance, run_id="good-run", status=PipelineRunStatus.QUEUED)
+
+        errors = [error for error in daemon.run_iteration(instance, workspace) if error]
+
+        assert len(errors) == 1
+        assert "Bad run bad-run" in errors[0].message
+
+        assert get_run_ids(instance.run_launcher.queue()) == ["good-run"]
+        assert instance.get_run_by_id("bad-run").status == PipelineRunStatus.FAILURE
+        assert daemon.last_iteration_stats.num_launched == 1
+        assert daemon.last_iteration_stats.num_errors == 1
+
+
+@pytest.mark.parametrize("dequeue_use_threads", [False, True])
+def test_skip_runs_claimed_elsewhere(dequeue_use_threads, monkeypatch, workspace, daemon):
+    with instance_for_queued_run_coordinator(
+        max_concurrent_runs=10, dequeue_use_threads=dequeue_use_threads
+    ) as instance:
+        create_run(instance, run_id="claimed-run", status=PipelineRunStatus.QUEUED)
+        create_run(instance, run_id="queued-run", status=PipelineRunStatus.QUEUED)
+
+        original_get_queued_runs = daemon._get_queued_runs  # pylint: disable=protected-access
+
+        def _get_queued_runs_and_claim(instance):
+            queued_runs = original_get_queued_runs(instance)
+            # simulates another daemon claiming the run after it was fetched
+            assert instance.claim_queued_run("claimed-run")
+            return queued_runs
+
+        monkeypatch.setattr(daemon, "_get_queued_runs", _get_queued_runs_and_claim)
+
+        list(daemon.run_iteration(instance, workspace))
+
+        assert get_run_ids(instance.run_launcher.queue()) == ["queued-run"]
+        assert daemon.last_iteration_stats.num_launched == 1
+        assert daemon.last_iteration_stats.num_skipped == 1
@@ -2,9 +2,11 @@
 import random
 import string
 import tempfile
+import threading
 import time
 from contextlib import contextmanager
 
+import mock
 import pendulum
 import pytest
 
@@ -41,7 +43,12 @@
 )
 from dagster.core.workspace.load_target import PythonFileTarget
 from dagster.daemon import get_default_daemon_logger
-from dagster.daemon.sensor import execute_sensor_iteration, execute_sensor_iteration_loop
+from dagster.daemon.workspace import BaseDaemonWorkspace
+from dagster.daemon.sensor import (
+    SensorEvaluationPool,
+    execute_sensor_iteration,
+    execute_sensor_iteration_loop,
+)
 from dagster.seven.compat.pendulum import create_pendulum_time, to_timezone
 
 
@@ -376,12 +383,13 @@ def workspace_load_target(attribute="the_repo"):
     )
 
 
-def evaluate_sensors(instance, workspace):
-    list(
+def evaluate_sensors(instance, workspace, sensor_evaluation_pool=None):
+    return list(
         execute_sensor_iteration(
             instance,
             get_default_daemon_logger("SensorDaemon"),
             workspace,
+            sensor_evaluation_pool=sensor_evaluation_pool,
         )
     )
 
@@ -531,6 +539,36 @@ def test_simple_sensor(capfd):
             )
 
 
+def test_slow_sensor_evaluation_logged(capfd):
+    freeze_datetime = to_timezone(
+        create_pendulum_time(year=2019, month=2, day=27, hour=23, minute=59, second=59, tz="UTC"),
+        "US/Central",
+    )
+    with instance_with_sensors() as (
+        instance,
+        workspace,
+        external_repo,
+    ):
+        with pendulum.test(freeze_datetime):
+            external_sensor = external_repo.get_external_sensor("simple_sensor")
+            instance.add_instigator_state(
+                InstigatorState(
+                    external_sensor.get_external_origin(),
+                    InstigatorType.SENSOR,
+                    InstigatorStatus.RUNNING,
+                )
+            )
+
+            with mock.patch("dagster.daemon.sensor.SLOW_SENSOR_EVALUATION_TIMEOUT_FRACTION", 0):
+                evaluate_sensors(instance, workspace)
+
+            output = get_logger_output_from_capfd(capfd, "dagster.daemon.SensorDaemon")
+            assert (
+                "dagster.daemon.SensorDaemon - INFO - Evaluated sensor simple_sensor in " in output
+            )
+            assert "close to its evaluation timeout of 60 seconds" in output
+
+
 def test_sensors_keyed_on_selector_not_origin():
     freeze_datetime = to_timezone(
         create_pendulum_time(year=2019, month=2, day=27, hour=23, minute=59, second=59, tz="UTC"),
@@ -2340,3 +2378,127 @@ def test_run_request_list_sensor():
                 external_sensor.get_external_origin_id(), external_sensor.selector_id
             )
             assert len(ticks) == 1
+
+
+def test_sensor_evaluation_pool():
+    freeze_datetime = to_timezone(
+        create_pendulum_time(year=2019, month=2, day=27, hour=23, minute=59, second=59, tz="UTC"),
+        "US/Central",
+    )
+    with instance_with_sensors() as (
+        instance,
+        workspace,
+        external_repo,
+    ):
+        with pendulum.test(freeze_datetime):
+            external_sensors = [
+                external_repo.get_external_sensor(sensor_name)
+                for sensor_name in ["always_on_sensor", "run_key_sensor", "error_sensor"]
+            ]
+            for external_sensor in external_sensors:
+                instance.add_instigator_state(
+                    InstigatorState(
+                        external_sensor.get_external_origin(),
+                        InstigatorType.SENSOR,
+                        InstigatorStatus.RUNNING,
+                    )
+                )
+
+            with SensorEvaluationPool(max_workers=3) as sensor_evaluation_pool:
+                evaluate_sensors(instance, workspace, sensor_evaluation_pool)
+                while sensor_evaluation_pool.in_flight_count:
+                    time.sleep(0.1)
+
+                wait_for_all_runs_to_start(instance)
+                assert instance.get_runs_count() == 2
+
+                always_on_sensor, run_key_sensor, error_sensor = external_sensors
+                for external_sensor, expected_status in [
+                    (always_on_sensor, TickStatus.SUCCESS),
+                    (run_key_sensor, TickStatus.SUCCESS),
+                    (error_sensor, TickStatus.FAILURE),
+                ]:
+                    ticks = instance.get_ticks(
+                        external_sensor.get_external_origin_id(), external_sensor.selector_id
+                    )
+                    assert len(ticks) == 1
+                    validate_tick(ticks[0], external_sensor, freeze_datetime, expected_status)
+
+                # the error from the failed tick is reported on the next iteration
+                errors = [
+                    error_info
+                    for error_info in evaluate_sensors(instance, workspace, sensor_evaluation_pool)
+                    if error_info
+                ]
+                assert len(errors) == 1
+                assert "womp womp" in errors[0].to_string()
+
+
+def test_sensor_evaluation_pool_limits():
+    release = threading.Event()
+
+    def _blocking_tick():
+        release.wait(10)
+        yield None
+
+    with SensorEvaluationPool(max_workers=4, max_workers_per_location=1) as pool:
+        pool.submit("sensor_a", "location_1", _blocking_tick)
+        assert pool.in_flight_count == 1
+
+        # a sensor is not evaluated again while its previous tick is in flight
+        assert not pool.can_submit("sensor_a", "location_2")
+        # other sensors in the same location wait for the per-location limit
+        assert not pool.can_submit("sensor_b", "location_1")
+        assert pool.can_submit("sensor_b", "location_2")
+
+        release.set()
+
+    assert pool.in_flight_count == 0
+    assert pool.can_submit("sensor_a", "location_1")
+    assert pool.pop_errors() == []
+
+
+def test_sensor_loop_cleans_up_workspace_after_in_flight_ticks():
+    release = threading.Event()
+
+    def _blocking_tick():
+        release.wait(10)
+        yield None
+
+    workspace = mock.MagicMock()
+    with SensorEvaluationPool(max_workers=2) as pool:
+        pool.submit("sensor_a", "location_1", _blocking_tick)
+
+        with mock.patch("dagster.daemon.sensor.RELOAD_WORKSPACE", -1), mock.patch(
+            "dagster.daemon.sensor.execute_sensor_iteration", return_value=iter([None])
+        ):
+            loop = execute_sensor_iteration_loop(None, workspace, None, sensor_evaluation_pool=pool)
+            # the workspace is not cleaned up while the tick is still using it
+            next(loop)
+            next(loop)
+            assert workspace.cleanup.call_count == 0
+
+            release.set()
+            start_time = time.time()
+            while not workspace.cleanup.call_count:
+                assert time.time() - start_time < 5
+                next(loop)
+
+
+def test_daemon_workspace_loads_once_across_threads():
+    load_count = []
+
+    class _SlowWorkspace(BaseDaemonWorkspace):
+        def _load_workspace(self):
+            load_count.append(1)
+            time.sleep(0.1)
+            return {}
+
+    workspace = _SlowWorkspace()
+    threads = [threading.Thread(target=workspace.get_workspace_snapshot) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(load_count) == 1
@@ -11,6 +11,8 @@
     ChildProcessEvent,
     ChildProcessStartEvent,
     ChildProcessSystemErrorEvent,
+    ChildProcessWorkerCommand,
+    ChildProcessWorkerPool,
     execute_child_process_command,
 )
 from dagster.utils import segfault
@@ -106,3 +108,96 @@ def test_child_process_segfault():
 @pytest.mark.skip("too long")
 def test_long_running_command():
     list(execute_child_process_command(multiprocessing, LongRunningCommand()))
+
+
+class EchoPidWorkerCommand(ChildProcessWorkerCommand):  # pylint: disable=no-init
+    def execute_task(self, worker_state, task):
+        if task == "raise":
+            raise AnError("Oh noes!")
+        if task == "crash":
+            os._exit(1)  # pylint: disable=protected-access
+        yield (task, os.getpid())
+
+
+def _execute_worker_task(pool, task):
+    return [event for event in pool.execute_task(pool.acquire_worker(), task) if event]
+
+
+def _task_results(events):
+    return [event for event in events if not isinstance(event, ChildProcessEvent)]
+
+
+def test_worker_pool_reuses_worker():
+    with ChildProcessWorkerPool(multiprocessing, EchoPidWorkerCommand(), max_workers=2) as pool:
+        first = _execute_worker_task(pool, "a")
+        assert isinstance(first[0], ChildProcessStartEvent)
+        assert isinstance(first[-1], ChildProcessDoneEvent)
+        [(task, worker_pid)] = _task_results(first)
+        assert task == "a"
+        assert worker_pid != os.getpid()
+
+        assert _task_results(_execute_worker_task(pool, "b")) == [("b", worker_pid)]
+        assert len(pool.workers) == 1
+
+        # a second worker is started while the first one is busy
+        first_worker = pool.acquire_worker()
+        second_worker = pool.acquire_worker()
+        assert first_worker.pid == worker_pid
+        assert second_worker.pid != worker_pid
+        assert [
+            event
+            for event in pool.execute_task(second_worker, "c")
+            if event and not isinstance(event, ChildProcessEvent)
+        ] == [("c", second_worker.pid)]
+        list(pool.execute_task(first_worker, "d"))
+
+    assert not first_worker.process.is_alive()
+    assert not second_worker.process.is_alive()
+
+
+def test_worker_pool_max_tasks_per_worker():
+    with ChildProcessWorkerPool(
+        multiprocessing, EchoPidWorkerCommand(), max_workers=1, max_tasks_per_worker=2
+    ) as pool:
+        pids = [_task_results(_execute_worker_task(pool, task))[0][1] for task in "abcd"]
+
+    assert pids[0] == pids[1]
+    assert pids[2] == pids[3]
+    assert pids[0] != pids[2]
+
+
+def test_worker_pool_max_worker_memory():
+    with ChildProcessWorkerPool(
+        multiprocessing, EchoPidWorkerCommand(), max_workers=1, max_worker_memory_bytes=1
+    ) as pool:
+        pids = [_task_results(_execute_worker_task(pool, task))[0][1] for task in "ab"]
+
+    if os.name == "nt":
+        # memory usage is not measured on windows
+        assert pids[0] == pids[1]
+    else:
+        assert pids[0] != pids[1]
+
+
+def test_worker_pool_uncaught_exception_retires_worker():
+    with ChildProcessWorkerPool(multiprocessing, EchoPidWorkerCommand(), max_workers=1) as pool:
+        [(_, worker_pid)] = _task_results(_execute_worker_task(pool, "a"))
+
+        events = _execute_worker_task(pool, "raise")
+        assert isinstance(events[-1], ChildProcessSystemErrorEvent)
+        assert events[-1].pid == worker_pid
+        assert "AnError" in str(events[-1].error_info.message)
+
+        [(_, next_worker_pid)] = _task_results(_execute_worker_task(pool, "b"))
+        assert next_worker_pid != worker_pid
+
+
+def test_worker_pool_crashy_worker():
+    with ChildProcessWorkerPool(multiprocessing, EchoPidWorkerCommand(), max_workers=1) as pool:
+        with pytest.raises(ChildProcessCrashException) as exc:
+            _execute_worker_task(pool, "crash")
+        assert exc.value.exit_code == 1
+        assert not pool.workers
+
+        # the crashed worker is replaced
+        assert _task_results(_execute_worker_task(pool, "a"))[0][0] == "a"
@@ -511,3 +511,130 @@ def test_crash_hard_multiprocessing():
         #     ).data
         #     is None
         # )
+
+
+def _get_step_worker_pids(result):
+    return {
+        event.step_key: next(
+            entry.entry_data.text
+            for entry in event.engine_event_data.metadata_entries
+            if entry.label == "pid"
+        )
+        for event in result.event_list
+        if event.is_engine_event and event.message.endswith("in worker process")
+    }
+
+
+def test_worker_pool_execution():
+    with instance_for_test() as instance:
+        result = execute_pipeline(
+            reconstructable(define_diamond_pipeline),
+            run_config={
+                "execution": {"multiprocess": {"config": {"max_concurrent": 1, "worker_pool": {}}}},
+            },
+            instance=instance,
+        )
+        assert result.success
+        assert result.result_for_solid("adder").output_value() == 11
+
+        worker_pids = _get_step_worker_pids(result)
+        assert len(worker_pids) == 4
+        assert len(set(worker_pids.values())) == 1
+        assert str(os.getpid()) not in worker_pids.values()
+
+
+def test_worker_pool_max_steps_per_worker():
+    with instance_for_test() as instance:
+        result = execute_pipeline(
+            reconstructable(define_diamond_pipeline),
+            run_config={
+                "execution": {
+                    "multiprocess": {
+                        "config": {
+                            "max_concurrent": 1,
+                            "worker_pool": {"max_steps_per_worker": 2},
+                        }
+                    }
+                },
+            },
+            instance=instance,
+        )
+        assert result.success
+
+        worker_pids = _get_step_worker_pids(result)
+        assert len(worker_pids) == 4
+        assert len(set(worker_pids.values())) == 2
+
+
+_steps_executed_in_process = []
+
+
+@lambda_solid
+def count_steps_in_process():
+    _steps_executed_in_process.append(1)
+    return len(_steps_executed_in_process)
+
+
+@lambda_solid(input_defs=[InputDefinition("_previous")])
+def count_steps_in_process_after(_previous):
+    _steps_executed_in_process.append(1)
+    return len(_steps_executed_in_process)
+
+
+@pipeline(mode_defs=[default_mode_def_for_test])
+def count_steps_pipeline():
+    count_steps_in_process_after(count_steps_in_process())
+
+
+@pytest.mark.parametrize("worker_pool", [True, False])
+def test_worker_pool_shares_interpreter_state(worker_pool):
+    execution_config = {"max_concurrent": 1}
+    if worker_pool:
+        execution_config["worker_pool"] = {}
+
+    with instance_for_test() as instance:
+        result = execute_pipeline(
+            reconstructable(count_steps_pipeline),
+            run_config={"execution": {"multiprocess": {"config": execution_config}}},
+            instance=instance,
+        )
+        assert result.success
+
+        # module-level state set by the first step is visible to the second step only when both
+        # steps are executed by the same worker process
+        output = result.result_for_solid("count_steps_in_process_after").output_value()
+        assert output == (2 if worker_pool else 1)
+
+
+def test_worker_pool_failure():
+    with instance_for_test() as instance:
+        result = execute_pipeline(
+            reconstructable(failure),
+            run_config={
+                "execution": {"multiprocess": {"config": {"worker_pool": {}}}},
+            },
+            instance=instance,
+            raise_on_error=False,
+        )
+        assert not result.success
+        failure_data = result.result_for_solid("throw").failure_data
+        assert failure_data
+        assert failure_data.error.cls_name == "Failure"
+        assert failure_data.user_failure_data.description == "it Failure"
+
+
+@pytest.mark.skipif(os.name == "nt", reason="Different crash output on Windows: See issue #2791")
+def test_worker_pool_crash():
+    with instance_for_test() as instance:
+        result = execute_pipeline(
+            reconstructable(sys_exit_pipeline),
+            run_config={
+                "execution": {"multiprocess": {"config": {"worker_pool": {}}}},
+            },
+            instance=instance,
+            raise_on_error=False,
+        )
+        assert not result.success
+        failure_data = result.result_for_solid("sys_exit").failure_data
+        assert failure_data
+        assert failure_data.error.cls_name == "ChildProcessCrashException"
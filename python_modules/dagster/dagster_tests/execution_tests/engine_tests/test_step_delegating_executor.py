@@ -1,7 +1,10 @@
 import subprocess
+import threading
 import time
 from typing import List
 
+import mock
+
 from dagster import executor, job, op, reconstructable
 from dagster.config.field_utils import Permissive
 from dagster.core.definitions.executor_definition import multiple_process_executor_requirements
@@ -9,7 +12,10 @@
 from dagster.core.execution.api import execute_pipeline
 from dagster.core.execution.retries import RetryMode
 from dagster.core.executor.step_delegating import StepDelegatingExecutor, StepHandler
-from dagster.core.test_utils import instance_for_test
+from dagster.core.instance import DagsterInstance
+from dagster.core.storage.event_log.base import EventLogCursor
+from dagster.core.storage.event_log.polling_event_watcher import SqlPollingEventWatcher
+from dagster.core.test_utils import create_run_for_test, instance_for_test
 
 
 class TestStepHandler(StepHandler):
@@ -271,3 +277,213 @@ def test_execute_verify_step():
     )
     assert result.success
     assert TestStepHandler.verify_step_count == 3
+
+
+def test_pop_events_storage_id_cursor():
+    TestStepHandler.reset()
+    with instance_for_test() as instance:
+        result = execute_pipeline(
+            reconstructable(foo_job),
+            instance=instance,
+            run_config={"execution": {"config": {}}},
+        )
+        TestStepHandler.wait_for_processes()
+        assert result.success
+
+        step_delegating_executor = StepDelegatingExecutor(
+            TestStepHandler(), retries=RetryMode.DISABLED
+        )
+        step_delegating_executor._event_cursor = None  # pylint: disable=protected-access
+        events = step_delegating_executor._pop_events(  # pylint: disable=protected-access
+            instance, result.run_id
+        )
+        assert [event.event_type_value for event in events] == [
+            record.dagster_event.event_type_value
+            for record in instance.all_logs(result.run_id)
+            if record.is_dagster_event
+        ]
+
+        cursor = step_delegating_executor._event_cursor  # pylint: disable=protected-access
+        assert EventLogCursor.parse(cursor).is_id_cursor()
+
+        # only new events are returned after the cursor
+        assert not step_delegating_executor._pop_events(  # pylint: disable=protected-access
+            instance, result.run_id
+        )
+        instance.report_engine_event("new event", instance.get_run_by_id(result.run_id))
+        new_events = step_delegating_executor._pop_events(  # pylint: disable=protected-access
+            instance, result.run_id
+        )
+        assert [event.message for event in new_events] == ["new event"]
+
+
+def _step_success_keys(result):
+    return sorted(
+        event.step_key
+        for event in result.event_list
+        if event.event_type_value == DagsterEventType.STEP_SUCCESS.value
+    )
+
+
+def test_execute_wakes_on_new_events():
+    TestStepHandler.reset()
+    with instance_for_test() as instance:
+        # watch the sqlite event log by polling it, like the event log storages that can not be
+        # watched with file system notifications
+        watcher = SqlPollingEventWatcher(instance.event_log_storage)
+        try:
+            with mock.patch.object(
+                instance, "watch_event_logs", side_effect=watcher.watch_run
+            ) as watch_event_logs, mock.patch.object(
+                instance, "end_watch_event_logs", side_effect=watcher.unwatch_run
+            ) as end_watch_event_logs:
+                start_time = time.time()
+                result = execute_pipeline(
+                    reconstructable(foo_job),
+                    instance=instance,
+                    run_config={"execution": {"config": {"sleep_seconds": 60.0}}},
+                )
+                elapsed = time.time() - start_time
+                TestStepHandler.wait_for_processes()
+        finally:
+            watcher.close()
+
+    assert result.success
+    # each step is launched after the executor is woken by the events of the previous one,
+    # instead of after sleeping for sleep_seconds
+    assert elapsed < 30
+    # the events of each step are yielded once, since each poll reads past the previous one
+    assert _step_success_keys(result) == ["bar_op", "bar_op_2", "baz_op"]
+
+    assert watch_event_logs.call_count == 1
+    run_id, _cursor, callback = watch_event_logs.call_args[0]
+    assert run_id == result.run_id
+    end_watch_event_logs.assert_called_once_with(result.run_id, callback)
+
+
+def test_execute_polls_when_watch_fails():
+    TestStepHandler.reset()
+    with instance_for_test() as instance:
+        with mock.patch.object(
+            instance, "watch_event_logs", side_effect=Exception("can not watch")
+        ), mock.patch.object(instance, "end_watch_event_logs") as end_watch_event_logs:
+            result = execute_pipeline(
+                reconstructable(foo_job),
+                instance=instance,
+                run_config={"execution": {"config": {"sleep_seconds": 0.1}}},
+            )
+            TestStepHandler.wait_for_processes()
+
+    assert result.success
+    assert _step_success_keys(result) == ["bar_op", "bar_op_2", "baz_op"]
+    assert not end_watch_event_logs.called
+
+
+class FailingStepHandler(TestStepHandler):
+    def launch_step(self, step_handler_context):
+        raise Exception("can not launch")
+
+
+@executor(
+    name="failing_step_delegating_executor",
+    requirements=multiple_process_executor_requirements(),
+    config_schema=Permissive(),
+)
+def failing_step_delegating_executor(exc_init):
+    return StepDelegatingExecutor(
+        FailingStepHandler(), retries=RetryMode.DISABLED, **exc_init.executor_config
+    )
+
+
+@job(executor_def=failing_step_delegating_executor)
+def failing_launch_job():
+    bar_op()
+
+
+def test_execute_ends_watch_on_failure():
+    with instance_for_test() as instance:
+        with mock.patch.object(instance, "watch_event_logs") as watch_event_logs, mock.patch.object(
+            instance, "end_watch_event_logs"
+        ) as end_watch_event_logs:
+            result = execute_pipeline(
+                reconstructable(failing_launch_job), instance=instance, raise_on_error=False
+            )
+
+    assert not result.success
+    _run_id, _cursor, callback = watch_event_logs.call_args[0]
+    end_watch_event_logs.assert_called_once_with(result.run_id, callback)
+
+
+def test_pop_events_in_memory():
+    instance = DagsterInstance.ephemeral()
+    run = create_run_for_test(instance, pipeline_name="foo_job")
+
+    step_delegating_executor = StepDelegatingExecutor(TestStepHandler(), retries=RetryMode.DISABLED)
+    step_delegating_executor._event_cursor = None  # pylint: disable=protected-access
+
+    instance.report_engine_event("first event", run)
+    instance.report_engine_event("second event", run)
+    events = step_delegating_executor._pop_events(  # pylint: disable=protected-access
+        instance, run.run_id
+    )
+    assert [event.message for event in events] == ["first event", "second event"]
+
+    # the events before the cursor are not returned again
+    assert not step_delegating_executor._pop_events(  # pylint: disable=protected-access
+        instance, run.run_id
+    )
+    instance.report_engine_event("third event", run)
+    events = step_delegating_executor._pop_events(  # pylint: disable=protected-access
+        instance, run.run_id
+    )
+    assert [event.message for event in events] == ["third event"]
+
+
+def test_watch_wakes_before_sleep_seconds():
+    instance = DagsterInstance.ephemeral()
+    run = create_run_for_test(instance, pipeline_name="foo_job")
+
+    step_delegating_executor = StepDelegatingExecutor(
+        TestStepHandler(), retries=RetryMode.DISABLED, sleep_seconds=60.0
+    )
+    step_delegating_executor._event_cursor = None  # pylint: disable=protected-access
+    new_events = threading.Event()
+    watch_callback = (
+        step_delegating_executor._watch_for_new_events(  # pylint: disable=protected-access
+            instance, run.run_id, new_events
+        )
+    )
+    assert watch_callback
+
+    timer = threading.Timer(0.1, lambda: instance.report_engine_event("new event", run))
+    timer.start()
+    try:
+        start_time = time.time()
+        assert new_events.wait(60.0)
+        assert time.time() - start_time < 30
+    finally:
+        timer.join()
+        instance.end_watch_event_logs(run.run_id, watch_callback)
+
+
+def test_watch_for_new_events():
+    instance = DagsterInstance.ephemeral()
+    run = create_run_for_test(instance, pipeline_name="foo_job")
+
+    step_delegating_executor = StepDelegatingExecutor(TestStepHandler(), retries=RetryMode.DISABLED)
+    step_delegating_executor._event_cursor = None  # pylint: disable=protected-access
+    new_events = threading.Event()
+    watch_callback = (
+        step_delegating_executor._watch_for_new_events(  # pylint: disable=protected-access
+            instance, run.run_id, new_events
+        )
+    )
+    assert watch_callback
+
+    instance.report_engine_event("new event", run)
+    assert new_events.is_set()
+
+    new_events.clear()
+    instance.end_watch_event_logs(run.run_id, watch_callback)
+    instance.report_engine_event("another event", run)
+    assert not new_events.is_set()
@@ -0,0 +1,223 @@
+import os
+
+import mock
+import pytest
+
+from dagster import In, Out, SourceHashVersionStrategy, fs_io_manager, job, op
+from dagster.core.definitions.pipeline_base import InMemoryPipeline
+from dagster.core.execution.api import create_execution_plan
+from dagster.core.execution.plan.cache import ExecutionPlanCache, get_execution_plan_cache
+from dagster.core.execution.plan.plan import ExecutionPlan
+from dagster.core.snap import snapshot_from_execution_plan
+from dagster.core.system_config.objects import ResolvedRunConfig
+from dagster.core.test_utils import instance_for_test
+
+
+@op(config_schema={"value": int}, out=Out(int))
+def emit(context):
+    return context.op_config["value"]
+
+
+@op(ins={"num": In(int)})
+def add_one(num):
+    return num + 1
+
+
+@op
+def adder(left, right):
+    return left + right
+
+
+@job
+def diamond_job():
+    num = emit()
+    adder(add_one.alias("left")(num), add_one.alias("right")(num))
+
+
+def _run_config(value=1):
+    return {"ops": {"emit": {"config": {"value": value}}}}
+
+
+def _build(run_config, plan_cache_dir=None, step_keys_to_execute=None, tags=None):
+    return create_execution_plan(
+        diamond_job,
+        run_config=run_config,
+        step_keys_to_execute=step_keys_to_execute,
+        tags=tags,
+        pipeline_snapshot_id=diamond_job.get_pipeline_snapshot_id(),
+        plan_cache_dir=plan_cache_dir,
+    )
+
+
+def _plan_snapshot(plan):
+    return snapshot_from_execution_plan(plan, diamond_job.get_pipeline_snapshot_id())
+
+
+def test_memory_cache_hit():
+    get_execution_plan_cache().clear()
+
+    full_plan = _build(_run_config())
+    subset_plan = _build(_run_config(), step_keys_to_execute=["left"])
+
+    assert subset_plan.step_keys_to_execute == ["left"]
+    # the steps of the subset plan were taken from the cached full plan
+    assert subset_plan.get_step_by_key("left") is full_plan.get_step_by_key("left")
+
+    uncached_plan = create_execution_plan(
+        diamond_job, run_config=_run_config(), step_keys_to_execute=["left"]
+    )
+    assert uncached_plan.get_step_by_key("left") is not full_plan.get_step_by_key("left")
+    assert _plan_snapshot(uncached_plan) == _plan_snapshot(subset_plan)
+
+
+def test_run_config_in_key():
+    get_execution_plan_cache().clear()
+
+    plan = _build(_run_config(1))
+    other_plan = _build(_run_config(2))
+
+    assert plan.get_step_by_key("emit") is not other_plan.get_step_by_key("emit")
+
+
+def test_disk_cache_hit(tmpdir):
+    cache_dir = str(tmpdir)
+    get_execution_plan_cache().clear()
+
+    plan = _build(_run_config(), plan_cache_dir=cache_dir)
+    assert len(os.listdir(cache_dir)) == 1
+
+    # simulates a new process, e.g. a step subprocess of the run
+    get_execution_plan_cache().clear()
+    subset_plan = _build(_run_config(), plan_cache_dir=cache_dir, step_keys_to_execute=["adder"])
+    assert subset_plan.get_step_by_key("adder") is not plan.get_step_by_key("adder")
+    assert _plan_snapshot(subset_plan) == _plan_snapshot(
+        create_execution_plan(diamond_job, run_config=_run_config(), step_keys_to_execute=["adder"])
+    )
+
+    get_execution_plan_cache().clear()
+    assert _plan_snapshot(_build(_run_config(), plan_cache_dir=cache_dir)) == _plan_snapshot(plan)
+
+
+def test_corrupt_disk_cache_entry(tmpdir):
+    cache_dir = str(tmpdir)
+    get_execution_plan_cache().clear()
+
+    plan = _build(_run_config(), plan_cache_dir=cache_dir)
+    (cache_file,) = os.listdir(cache_dir)
+    with open(os.path.join(cache_dir, cache_file), "wb") as f:
+        f.write(b"not a pickle")
+
+    get_execution_plan_cache().clear()
+    rebuilt_plan = _build(_run_config(), plan_cache_dir=cache_dir)
+    assert _plan_snapshot(rebuilt_plan) == _plan_snapshot(plan)
+
+    # the corrupt entry was replaced
+    get_execution_plan_cache().clear()
+    assert _plan_snapshot(_build(_run_config(), plan_cache_dir=cache_dir)) == _plan_snapshot(plan)
+
+
+@pytest.mark.parametrize("error", [TypeError("cannot pickle"), AttributeError("no attribute")])
+def test_unpicklable_steps_skip_disk_cache(tmpdir, error):
+    cache_dir = str(tmpdir)
+    get_execution_plan_cache().clear()
+
+    with mock.patch("pickle.Pickler") as pickler:
+        pickler.return_value.dump.side_effect = error
+        plan = _build(_run_config(), plan_cache_dir=cache_dir)
+    assert os.listdir(cache_dir) == []
+
+    get_execution_plan_cache().clear()
+    assert _plan_snapshot(_build(_run_config(), plan_cache_dir=cache_dir)) == _plan_snapshot(plan)
+
+
+def test_unhashable_run_config_skips_cache():
+    @op
+    def passthrough(num):
+        return num
+
+    @job
+    def input_job():
+        passthrough()
+
+    get_execution_plan_cache().clear()
+
+    # python objects can be passed as input values, and can not be used in the cache key
+    run_config = {"ops": {"passthrough": {"inputs": {"num": {"value": object()}}}}}
+    plan = ExecutionPlan.build(
+        InMemoryPipeline(input_job),
+        ResolvedRunConfig.build(input_job, run_config),
+        pipeline_snapshot_id=input_job.get_pipeline_snapshot_id(),
+    )
+    assert plan.step_keys_to_execute == ["passthrough"]
+    assert not get_execution_plan_cache()._entries  # pylint: disable=protected-access
+
+
+def test_memoized_plan_skips_cache(tmpdir):
+    memoized_job = diamond_job.graph.to_job(
+        name="memoized_diamond_job",
+        resource_defs={"io_manager": fs_io_manager.configured({"base_dir": str(tmpdir)})},
+        version_strategy=SourceHashVersionStrategy(),
+    )
+    get_execution_plan_cache().clear()
+
+    with instance_for_test() as instance:
+        plan = create_execution_plan(
+            memoized_job,
+            run_config=_run_config(),
+            instance_ref=instance.get_ref(),
+            pipeline_snapshot_id=memoized_job.get_pipeline_snapshot_id(),
+        )
+        assert plan.step_keys_to_execute
+
+    assert not get_execution_plan_cache()._entries  # pylint: disable=protected-access
+
+
+def test_lru_eviction():
+    cache = ExecutionPlanCache(max_entries=2)
+    plan = create_execution_plan(diamond_job, run_config=_run_config())
+    steps = list(plan.step_dict.values())
+
+    cache.set_steps("a", steps)
+    cache.set_steps("b", steps)
+    assert cache.get_steps("a")
+    cache.set_steps("c", steps)
+
+    assert cache.get_steps("a")
+    assert cache.get_steps("b") is None
+    assert cache.get_steps("c")
+
+
+def test_instance_cache_dir(tmpdir):
+    with instance_for_test(temp_dir=str(tmpdir)) as instance:
+        assert instance.execution_plan_cache_dir is None
+
+    with instance_for_test(
+        temp_dir=str(tmpdir), overrides={"execution_plan_cache": {"local_disk": True}}
+    ) as instance:
+        assert instance.execution_plan_cache_dir == os.path.join(
+            instance.root_directory, "execution_plans"
+        )
+
+
+def test_disk_cache_pruning(tmpdir):
+    cache_dir = str(tmpdir)
+    cache = ExecutionPlanCache()
+    plan = create_execution_plan(diamond_job, run_config=_run_config())
+    steps = list(plan.step_dict.values())
+
+    def _set_mtime(key, mtime):
+        os.utime(os.path.join(cache_dir, f"{key}.pkl"), (mtime, mtime))
+
+    with mock.patch("dagster.core.execution.plan.cache.MAX_DISK_CACHED_PLANS", 2):
+        cache.set_steps("a", steps, cache_dir=cache_dir)
+        _set_mtime("a", 1000)
+        cache.set_steps("b", steps, cache_dir=cache_dir)
+        _set_mtime("b", 2000)
+
+        # reading an entry marks it as recently used
+        cache.clear()
+        assert cache.get_steps("a", cache_dir=cache_dir)
+
+        cache.set_steps("c", steps, cache_dir=cache_dir)
+
+    assert sorted(os.listdir(cache_dir)) == ["a.pkl", "c.pkl"]
@@ -0,0 +1,90 @@
+"""Event log entries with the payloads that make up most of a run's event log, shared by the
+serdes tests and benchmark."""
+import time
+from typing import List
+
+from dagster import AssetKey, AssetMaterialization, MetadataEntry
+from dagster.core.definitions.dependency import NodeHandle
+from dagster.core.events import (
+    DagsterEvent,
+    DagsterEventType,
+    EngineEventData,
+    StepMaterializationData,
+)
+from dagster.core.events.log import EventLogEntry
+from dagster.core.execution.plan.handle import StepHandle
+from dagster.core.execution.plan.outputs import StepOutputData, StepOutputHandle
+
+
+def _entry(dagster_event: DagsterEvent) -> EventLogEntry:
+    return EventLogEntry(
+        error_info=None,
+        level=10,
+        user_message="",
+        run_id="f5b4a5c1-0d0a-4b51-8f0e-6f2bd7b9a3c4",
+        timestamp=time.time(),
+        step_key=dagster_event.step_key,
+        pipeline_name=dagster_event.pipeline_name,
+        dagster_event=dagster_event,
+    )
+
+
+def build_event_payloads() -> List[EventLogEntry]:
+    """A step start, an output, a materialization with metadata and an engine event - the kinds
+    of entries that make up most of a run's event log."""
+    handle = NodeHandle("compute_orders", None)
+    step_handle = StepHandle(handle)
+    common = dict(
+        pipeline_name="orders_job",
+        step_handle=step_handle,
+        solid_handle=handle,
+        step_kind_value="COMPUTE",
+        logging_tags={"pipeline_name": "orders_job", "step_key": "compute_orders"},
+        pid=4242,
+    )
+    return [
+        _entry(
+            DagsterEvent(
+                DagsterEventType.STEP_START.value,
+                message='Started execution of step "compute_orders".',
+                **common,
+            )
+        ),
+        _entry(
+            DagsterEvent(
+                DagsterEventType.STEP_OUTPUT.value,
+                event_specific_data=StepOutputData(
+                    StepOutputHandle("compute_orders", "result"),
+                    metadata_entries=[MetadataEntry("row_count", value=1000)],
+                ),
+                message='Yielded output "result" of type "Any".',
+                **common,
+            )
+        ),
+        _entry(
+            DagsterEvent(
+                DagsterEventType.ASSET_MATERIALIZATION.value,
+                event_specific_data=StepMaterializationData(
+                    AssetMaterialization(
+                        asset_key=AssetKey(["warehouse", "orders"]),
+                        metadata={
+                            "path": "s3://bucket/orders/2022-07-01",
+                            "rows": 1000,
+                            "columns": {"id": "int", "amount": "float"},
+                        },
+                        partition="2022-07-01",
+                    )
+                ),
+                message="Materialized value warehouse orders.",
+                **common,
+            )
+        ),
+        _entry(
+            DagsterEvent(
+                DagsterEventType.ENGINE_EVENT.value,
+                event_specific_data=EngineEventData.in_process(4242, ["compute_orders"]),
+                message="Executing steps in process (pid: 4242)",
+                **common,
+            )
+        ),
+    ]
@@ -22,11 +22,14 @@
     pack_inner_value,
     register_serdes_enum_fallbacks,
     register_serdes_tuple_fallbacks,
+    serialize_dagster_namedtuple,
     serialize_value,
     unpack_inner_value,
 )
 from dagster.serdes.utils import hash_str
 
+from .serdes_payloads import build_event_payloads
+
 
 def test_deserialize_value_ok():
     unpacked_tuple = deserialize_value('{"foo": "bar"}')
@@ -718,3 +721,131 @@ class Thing(NamedTuple):  # pylint: disable=unused-variable
 
     assert wmap.get_serialized_name("Thing") == "SerializedThing"
     assert wmap.get_deserialized_name("SerializedThing") == "Thing"
+
+
+def test_compact_serialization():
+    wmap = WhitelistMap.create()
+
+    @_whitelist_for_serdes(whitelist_map=wmap)
+    class Thing(NamedTuple("_Thing", [("name", str), ("count", int), ("tag", str)])):
+        def __new__(cls, name, count=0, tag=None):
+            return super(Thing, cls).__new__(cls, name, count, tag)
+
+    thing = Thing("foo")
+    compact_serialized = _serialize_dagster_namedtuple(thing, wmap, compact=True)
+    assert seven.json.loads(compact_serialized) == {"name": "foo", "__class__": "Thing"}
+    assert " " not in compact_serialized
+    assert _deserialize_json(compact_serialized, wmap) == thing
+
+    # values that differ from the default, including in type, are kept
+    other = Thing("foo", count=False, tag="bar")
+    assert seven.json.loads(_serialize_dagster_namedtuple(other, wmap, compact=True)) == {
+        "name": "foo",
+        "count": False,
+        "tag": "bar",
+        "__class__": "Thing",
+    }
+
+    # the default encoding is unchanged, and both load side by side
+    serialized = _serialize_dagster_namedtuple(thing, wmap)
+    assert seven.json.loads(serialized) == {
+        "name": "foo",
+        "count": 0,
+        "tag": None,
+        "__class__": "Thing",
+    }
+    assert _deserialize_json(serialized, wmap) == _deserialize_json(compact_serialized, wmap)
+    assert deserialize_value(serialize_value(thing, wmap, compact=True), wmap) == thing
+
+
+def test_compact_serialization_transformed_defaults():
+    wmap = WhitelistMap.create()
+
+    @_whitelist_for_serdes(whitelist_map=wmap)
+    class Replaced(NamedTuple("_Replaced", [("name", str), ("tags", dict)])):
+        def __new__(cls, name, tags=None):
+            return super(Replaced, cls).__new__(cls, name, tags if tags is not None else {})
+
+    # the stored value differs from the default, so it is kept
+    replaced = Replaced("foo")
+    assert seven.json.loads(_serialize_dagster_namedtuple(replaced, wmap, compact=True)) == {
+        "name": "foo",
+        "tags": {},
+        "__class__": "Replaced",
+    }
+    assert _deserialize_json(_serialize_dagster_namedtuple(replaced, wmap, compact=True), wmap) == (
+        replaced
+    )
+
+    @_whitelist_for_serdes(whitelist_map=wmap)
+    class Offset(NamedTuple("_Offset", [("name", str), ("offset", int)])):
+        def __new__(cls, name, offset=0):
+            return super(Offset, cls).__new__(cls, name, offset + 1)
+
+    # the stored value equals the default, but __new__ would not load it back unchanged
+    offset = Offset("foo", offset=-1)
+    assert offset.offset == 0
+    compact_serialized = _serialize_dagster_namedtuple(offset, wmap, compact=True)
+    assert seven.json.loads(compact_serialized) == {
+        "name": "foo",
+        "offset": 0,
+        "__class__": "Offset",
+    }
+    # so it loads the same as the default encoding
+    assert _deserialize_json(compact_serialized, wmap) == _deserialize_json(
+        _serialize_dagster_namedtuple(offset, wmap), wmap
+    )
+
+
+def test_compact_serialization_decided_once_per_class():
+    wmap = WhitelistMap.create()
+    new_calls = []
+
+    @_whitelist_for_serdes(whitelist_map=wmap)
+    class Thing(NamedTuple("_Thing", [("name", str), ("count", int), ("tag", str)])):
+        def __new__(cls, name, count=0, tag=None):
+            new_calls.append(name)
+            return super(Thing, cls).__new__(cls, name, count, tag)
+
+    things = [Thing(str(i)) for i in range(10)] + [Thing("tagged", tag="bar")]
+    del new_calls[:]
+
+    for thing in things:
+        compact_serialized = _serialize_dagster_namedtuple(thing, wmap, compact=True)
+        assert _deserialize_json(compact_serialized, wmap) == thing
+    assert seven.json.loads(_serialize_dagster_namedtuple(things[0], wmap, compact=True)) == {
+        "name": "0",
+        "__class__": "Thing",
+    }
+
+    # only the first instance is loaded back to decide that its default fields can be left out,
+    # in addition to the instances loaded by the test
+    assert len(new_calls) == 1 + len(things)
+
+
+def test_field_table_cache():
+    wmap = WhitelistMap.create()
+
+    @_whitelist_for_serdes(whitelist_map=wmap)
+    class Thing(NamedTuple):
+        name: str
+
+    assert seven.json.loads(_serialize_dagster_namedtuple(Thing("foo"), wmap)) == {
+        "name": "foo",
+        "__class__": "Thing",
+    }
+    assert wmap.field_tables
+
+    # registering a storage name after first use is reflected in the output
+    wmap.register_serialized_name("Thing", "SerializedThing")
+    assert seven.json.loads(_serialize_dagster_namedtuple(Thing("foo"), wmap)) == {
+        "name": "foo",
+        "__class__": "SerializedThing",
+    }
+
+
+def test_compact_event_log_entries():
+    for event in build_event_payloads():
+        compact_serialized = serialize_dagster_namedtuple(event, compact=True)
+        assert len(compact_serialized) < len(serialize_dagster_namedtuple(event))
+        assert deserialize_json_to_dagster_namedtuple(compact_serialized) == event
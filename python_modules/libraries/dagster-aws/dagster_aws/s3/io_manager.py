@@ -1,12 +1,24 @@
 import io
 import pickle
-from typing import Union
+from typing import Optional, Union
 
-from dagster import Field, InputContext, MemoizableIOManager, OutputContext, StringSource
+from dagster import Enum, EnumValue, Field, InputContext, MemoizableIOManager, OutputContext
+from dagster import StringSource
 from dagster import _check as check
 from dagster import io_manager
 from dagster.utils import PICKLE_PROTOCOL
 
+from .streaming import (
+    COMPRESSION_CODECS,
+    DEFAULT_MAX_CONCURRENCY,
+    DEFAULT_PART_SIZE,
+    S3MultipartUploadWriter,
+    S3RangedDownloadReader,
+    dump_to_stream,
+    load_from_bytes,
+    load_from_stream,
+)
+
 
 class PickledObjectS3IOManager(MemoizableIOManager):
     def __init__(
@@ -14,10 +26,22 @@ def __init__(
         s3_bucket,
         s3_session,
         s3_prefix=None,
+        streaming: bool = False,
+        compression: Optional[str] = None,
+        part_size: int = DEFAULT_PART_SIZE,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
     ):
         self.bucket = check.str_param(s3_bucket, "s3_bucket")
         self.s3_prefix = check.str_param(s3_prefix, "s3_prefix")
         self.s3 = s3_session
+        self.streaming = check.bool_param(streaming, "streaming")
+        self.compression = check.opt_str_param(compression, "compression")
+        check.param_invariant(self.compression in COMPRESSION_CODECS, "compression")
+        check.invariant(
+            self.streaming or not self.compression, "Compression requires streaming to be enabled"
+        )
+        self.part_size = check.int_param(part_size, "part_size")
+        self.max_concurrency = check.int_param(max_concurrency, "max_concurrency")
         self.s3.list_objects(Bucket=self.bucket, Prefix=self.s3_prefix, MaxKeys=1)
 
     def _get_path(self, context: Union[InputContext, OutputContext]) -> str:
@@ -32,13 +56,6 @@ def has_output(self, context):
         key = self._get_path(context)
         return self._has_object(key)
 
-    def _rm_object(self, key):
-        check.str_param(key, "key")
-        check.param_invariant(len(key) > 0, "key")
-
-        # delete_object wont fail even if the item has been deleted.
-        self.s3.delete_object(Bucket=self.bucket, Key=key)
-
     def _has_object(self, key):
         check.str_param(key, "key")
         check.param_invariant(len(key) > 0, "key")
@@ -60,17 +77,33 @@ def _uri_for_key(self, key):
     def load_input(self, context):
         key = self._get_path(context)
         context.log.debug(f"Loading S3 object from: {self._uri_for_key(key)}")
-        obj = pickle.loads(self.s3.get_object(Bucket=self.bucket, Key=key)["Body"].read())
 
-        return obj
+        if not self.streaming:
+            # objects may have been written with streaming enabled
+            return load_from_bytes(self.s3.get_object(Bucket=self.bucket, Key=key)["Body"].read())
+
+        with io.BufferedReader(
+            S3RangedDownloadReader(self.s3, self.bucket, key, self.part_size, self.max_concurrency),
+            buffer_size=self.part_size,
+        ) as reader:
+            return load_from_stream(reader, self.part_size)
 
     def handle_output(self, context, obj):
         key = self._get_path(context)
         context.log.debug(f"Writing S3 object at: {self._uri_for_key(key)}")
 
-        if self._has_object(key):
-            context.log.warning(f"Removing existing S3 key: {key}")
-            self._rm_object(key)
+        # existing objects are overwritten by the upload
+        if self.streaming:
+            writer = S3MultipartUploadWriter(
+                self.s3, self.bucket, key, self.part_size, self.max_concurrency
+            )
+            try:
+                dump_to_stream(obj, writer, self.compression)
+            except Exception:
+                writer.abort()
+                raise
+            writer.close()
+            return
 
         pickled_obj = pickle.dumps(obj, PICKLE_PROTOCOL)
         pickled_obj_bytes = io.BytesIO(pickled_obj)
@@ -81,6 +114,17 @@ def handle_output(self, context, obj):
     config_schema={
         "s3_bucket": Field(StringSource),
         "s3_prefix": Field(StringSource, is_required=False, default_value="dagster"),
+        "streaming": Field(bool, is_required=False, default_value=False),
+        "compression": Field(
+            Enum(
+                "S3PickleCompression",
+                [EnumValue("none"), EnumValue("zstd"), EnumValue("lz4")],
+            ),
+            is_required=False,
+            default_value="none",
+        ),
+        "part_size": Field(int, is_required=False, default_value=DEFAULT_PART_SIZE),
+        "max_concurrency": Field(int, is_required=False, default_value=DEFAULT_MAX_CONCURRENCY),
     },
     required_resource_keys={"s3"},
 )
@@ -117,9 +161,34 @@ def my_job():
                 config:
                     s3_bucket: my-cool-bucket
                     s3_prefix: good/prefix-for-files-
+
+    To transfer large objects without holding them in memory twice, set ``streaming``. Objects are
+    then pickled with protocol 5, optionally compressed with ``zstd`` or ``lz4`` (which require the
+    ``zstandard`` and ``lz4`` packages), and uploaded as concurrent multipart uploads of
+    ``part_size`` bytes as they are pickled. They are loaded with concurrent ranged downloads.
+    Objects written without streaming can still be loaded with streaming enabled.
+
+    .. code-block:: YAML
+
+        resources:
+            io_manager:
+                config:
+                    s3_bucket: my-cool-bucket
+                    streaming: true
+                    compression: zstd
+                    max_concurrency: 10
     """
     s3_session = init_context.resources.s3
     s3_bucket = init_context.resource_config["s3_bucket"]
     s3_prefix = init_context.resource_config.get("s3_prefix")  # s3_prefix is optional
-    pickled_io_manager = PickledObjectS3IOManager(s3_bucket, s3_session, s3_prefix=s3_prefix)
+    compression = init_context.resource_config["compression"]
+    pickled_io_manager = PickledObjectS3IOManager(
+        s3_bucket,
+        s3_session,
+        s3_prefix=s3_prefix,
+        streaming=init_context.resource_config["streaming"],
+        compression=None if compression == "none" else compression,
+        part_size=init_context.resource_config["part_size"],
+        max_concurrency=init_context.resource_config["max_concurrency"],
+    )
     return pickled_io_manager
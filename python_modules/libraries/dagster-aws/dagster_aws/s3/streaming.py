@@ -0,0 +1,460 @@
+"""Streaming transfer of pickled objects to and from S3.
+
+Objects are pickled with protocol 5, so that large buffers (e.g. numpy arrays) are written out of
+band instead of being copied into the pickle, optionally compressed, and written to S3 as a
+concurrent multipart upload while they are being pickled. They are read back with concurrent
+ranged downloads.
+
+Writing holds up to ``max_concurrency`` parts of ``part_size`` bytes that are being uploaded, and
+one partially filled part, in addition to the object itself. Reading holds up to
+``max_concurrency`` parts that are downloaded ahead of the reader, and the in-band pickle data,
+in addition to the loaded object, whose out-of-band buffers are read directly into their final
+memory.
+"""
+import io
+import pickle
+import struct
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import IO, Optional
+
+from botocore.exceptions import ClientError
+
+from dagster import _check as check
+
+# Objects written in the streaming format start with this header, followed by a format version
+# and compression byte. Plain pickles start with the PROTO opcode (0x80) instead.
+STREAMING_PICKLE_MAGIC = b"DGS3PK"
+# Version 1 prefixes the in-band pickle data with its length. Version 2 writes it as a sequence of
+# length-prefixed chunks ending with an empty chunk, so that it can be written while pickling.
+STREAMING_PICKLE_VERSION = 2
+STREAMING_PICKLE_PROTOCOL = 5
+
+# S3 requires every part of a multipart upload except the last to be at least 5 MiB
+MIN_PART_SIZE = 5 * 1024 * 1024
+DEFAULT_PART_SIZE = 8 * 1024 * 1024
+DEFAULT_MAX_CONCURRENCY = 10
+
+COMPRESSION_CODECS = {None: 0, "zstd": 1, "lz4": 2}
+_COMPRESSIONS_BY_CODEC = {codec: compression for compression, codec in COMPRESSION_CODECS.items()}
+
+_LENGTH = struct.Struct(">Q")
+
+
+class S3MultipartUploadWriter(io.RawIOBase):
+    """A writable stream that uploads to an S3 key as it is written to.
+
+    Parts of ``part_size`` bytes are cut from the written data, and uploaded concurrently as parts
+    of a multipart upload. Only the data that does not yet fill a part is buffered. Objects smaller than a single part are uploaded with one ``put_object``.
+    The upload completes when the stream is closed; call ``abort`` instead to discard it.
+    """
+
+    def __init__(
+        self,
+        s3_session,
+        bucket: str,
+        key: str,
+        part_size: int = DEFAULT_PART_SIZE,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    ):
+        super().__init__()
+        self._s3 = s3_session
+        self._bucket = check.str_param(bucket, "bucket")
+        self._key = check.str_param(key, "key")
+        self._part_size = check.int_param(part_size, "part_size")
+        check.param_invariant(self._part_size >= MIN_PART_SIZE, "part_size")
+        self._max_concurrency = check.int_param(max_concurrency, "max_concurrency")
+
+        self._buffer = bytearray()
+        self._upload_id: Optional[str] = None
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._in_flight = threading.BoundedSemaphore(self._max_concurrency)
+        self._parts = []
+
+    def writable(self):
+        return True
+
+    def write(self, b):
+        view = memoryview(b).cast("B")
+        nbytes = view.nbytes
+
+        if self._buffer:
+            # complete the partially filled part first
+            count = min(self._part_size - len(self._buffer), view.nbytes)
+            self._buffer += view[:count]
+            view = view[count:]
+            if len(self._buffer) < self._part_size:
+                return nbytes
+            self._upload_part(bytes(self._buffer))
+            self._buffer = bytearray()
+
+        while view.nbytes >= self._part_size:
+            self._upload_part(bytes(view[: self._part_size]))
+            view = view[self._part_size :]
+
+        self._buffer = bytearray(view)
+        return nbytes
+
+    def _upload_part(self, data: bytes):
+        if self._upload_id is None:
+            self._upload_id = self._s3.create_multipart_upload(Bucket=self._bucket, Key=self._key)[
+                "UploadId"
+            ]
+            self._executor = ThreadPoolExecutor(
+                max_workers=self._max_concurrency, thread_name_prefix="s3-upload"
+            )
+
+        # bound the number of parts held in memory while they are uploaded
+        self._in_flight.acquire()
+        part_number = len(self._parts) + 1
+        future = self._executor.submit(
+            self._s3.upload_part,
+            Bucket=self._bucket,
+            Key=self._key,
+            UploadId=self._upload_id,
+            PartNumber=part_number,
+            Body=data,
+        )
+        future.add_done_callback(lambda _: self._in_flight.release())
+        self._parts.append((part_number, future))
+
+    def close(self):
+        if self.closed:
+            return
+
+        try:
+            if self._upload_id is None:
+                self._s3.put_object(Bucket=self._bucket, Key=self._key, Body=bytes(self._buffer))
+            else:
+                if self._buffer:
+                    self._upload_part(bytes(self._buffer))
+                parts = [
+                    {"PartNumber": part_number, "ETag": future.result()["ETag"]}
+                    for part_number, future in self._parts
+                ]
+                self._s3.complete_multipart_upload(
+                    Bucket=self._bucket,
+                    Key=self._key,
+                    UploadId=self._upload_id,
+                    MultipartUpload={"Parts": parts},
+                )
+        except Exception:
+            self.abort()
+            raise
+        finally:
+            self._buffer = bytearray()
+            if self._executor:
+                self._executor.shutdown()
+            super().close()
+
+    def abort(self):
+        """Discard the upload, without writing the object."""
+        for _, future in self._parts:
+            future.cancel()
+        if self._executor:
+            self._executor.shutdown()
+        if self._upload_id is not None:
+            self._s3.abort_multipart_upload(
+                Bucket=self._bucket, Key=self._key, UploadId=self._upload_id
+            )
+            self._upload_id = None
+        self._buffer = bytearray()
+        super().close()
+
+
+class S3RangedDownloadReader(io.RawIOBase):
+    """A readable stream of the contents of an S3 key, downloaded as concurrent ranged requests.
+
+    The size of the object is read from the response to the request for its first part, and up to
+    ``max_concurrency`` parts of ``part_size`` bytes are fetched ahead of the reader.
+    """
+
+    def __init__(
+        self,
+        s3_session,
+        bucket: str,
+        key: str,
+        part_size: int = DEFAULT_PART_SIZE,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    ):
+        super().__init__()
+        self._s3 = s3_session
+        self._bucket = check.str_param(bucket, "bucket")
+        self._key = check.str_param(key, "key")
+        self._part_size = check.int_param(part_size, "part_size")
+        self._max_concurrency = check.int_param(max_concurrency, "max_concurrency")
+
+        self._part = memoryview(self._get_first_part())
+        self._position = 0
+
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._pending = []
+        self._next_start = len(self._part)
+        if self._next_start < self._size:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self._max_concurrency, thread_name_prefix="s3-download"
+            )
+            for _ in range(self._max_concurrency):
+                self._fetch_next_part()
+
+    def _get_first_part(self) -> bytes:
+        try:
+            response = self._s3.get_object(
+                Bucket=self._bucket, Key=self._key, Range=f"bytes=0-{self._part_size - 1}"
+            )
+        except ClientError as e:
+            # empty objects can not be requested by range
+            if e.response.get("Error", {}).get("Code") != "InvalidRange":
+                raise
+            self._size = 0
+            return b""
+
+        content_range = response.get("ContentRange")
+        body = response["Body"].read()
+        self._size = int(content_range.split("/")[-1]) if content_range else len(body)
+        return body
+
+    def _fetch_next_part(self):
+        if self._next_start >= self._size:
+            return
+        end = min(self._next_start + self._part_size, self._size) - 1
+        self._pending.append(
+            self._executor.submit(
+                lambda byte_range: self._s3.get_object(
+                    Bucket=self._bucket, Key=self._key, Range=byte_range
+                )["Body"].read(),
+                f"bytes={self._next_start}-{end}",
+            )
+        )
+        self._next_start = end + 1
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    def readable(self):
+        return True
+
+    def readinto(self, b):
+        view = memoryview(b).cast("B")
+        if self._position >= len(self._part):
+            if not self._pending:
+                return 0
+            self._part = memoryview(self._pending.pop(0).result())
+            self._position = 0
+            self._fetch_next_part()
+
+        count = min(view.nbytes, len(self._part) - self._position)
+        view[:count] = self._part[self._position : self._position + count]
+        self._position += count
+        return count
+
+    def close(self):
+        for future in self._pending:
+            future.cancel()
+        self._pending = []
+        if self._executor:
+            self._executor.shutdown()
+        super().close()
+
+
+class _CompressingWriter:
+    def __init__(self, fileobj: IO[bytes], compression: Optional[str]):
+        self._fileobj = fileobj
+        if compression == "zstd":
+            import zstandard  # pylint: disable=import-error
+
+            self._compressor = zstandard.ZstdCompressor().compressobj()
+        elif compression == "lz4":
+            import lz4.frame  # pylint: disable=import-error
+
+            self._compressor = lz4.frame.LZ4FrameCompressor()
+            self._fileobj.write(self._compressor.begin())
+        else:
+            self._compressor = None
+
+    def write(self, data):
+        if self._compressor:
+            data = self._compressor.compress(data)
+        self._fileobj.write(data)
+
+    def flush(self):
+        if self._compressor:
+            self._fileobj.write(self._compressor.flush())
+
+
+class _DecompressingReader:
+    def __init__(self, fileobj: IO[bytes], compression: Optional[str], chunk_size: int):
+        self._fileobj = fileobj
+        self._chunk_size = chunk_size
+        # decompressed data that has not been read yet, starting at _position
+        self._buffer = b""
+        self._position = 0
+        if compression == "zstd":
+            import zstandard  # pylint: disable=import-error
+
+            self._decompressor = zstandard.ZstdDecompressor().decompressobj()
+        elif compression == "lz4":
+            import lz4.frame  # pylint: disable=import-error
+
+            self._decompressor = lz4.frame.LZ4FrameDecompressor()
+        else:
+            self._decompressor = None
+
+    def readinto(self, b) -> int:
+        view = memoryview(b).cast("B")
+        count = 0
+        while count < view.nbytes:
+            if self._position < len(self._buffer):
+                n = min(len(self._buffer) - self._position, view.nbytes - count)
+                view[count : count + n] = self._buffer[self._position : self._position + n]
+                self._position += n
+                count += n
+            elif not self._decompressor:
+                n = self._fileobj.readinto(view[count:])
+                if not n:
+                    break
+                count += n
+            else:
+                chunk = self._fileobj.read(self._chunk_size)
+                if not chunk:
+                    break
+                self._buffer = self._decompressor.decompress(chunk)
+                self._position = 0
+        return count
+
+    def read_exactly(self, size: int) -> bytearray:
+        data = bytearray(size)
+        if self.readinto(data) != size:
+            raise EOFError("Unexpected end of streamed pickle")
+        return data
+
+
+class _ChunkWriter:
+    # writes each chunk of pickle data with its length, since the length of the whole pickle is not
+    # known until it has been written
+    def __init__(self, writer: _CompressingWriter):
+        self._writer = writer
+
+    def write(self, data):
+        nbytes = memoryview(data).nbytes
+        if nbytes:
+            self._writer.write(_LENGTH.pack(nbytes))
+            self._writer.write(data)
+        return nbytes
+
+    def close(self):
+        self._writer.write(_LENGTH.pack(0))
+
+
+def dump_to_stream(obj, fileobj: IO[bytes], compression: Optional[str] = None):
+    """Pickle ``obj`` to ``fileobj`` in the streaming format, writing the pickle as it is produced
+    and its out-of-band buffers without copying them into the pickle.
+    """
+    check.param_invariant(compression in COMPRESSION_CODECS, "compression")
+
+    fileobj.write(
+        STREAMING_PICKLE_MAGIC + bytes([STREAMING_PICKLE_VERSION, COMPRESSION_CODECS[compression]])
+    )
+    writer = _CompressingWriter(fileobj, compression)
+
+    buffers = []
+    chunk_writer = _ChunkWriter(writer)
+    pickle.Pickler(
+        chunk_writer, protocol=STREAMING_PICKLE_PROTOCOL, buffer_callback=buffers.append
+    ).dump(obj)
+    chunk_writer.close()
+
+    writer.write(_LENGTH.pack(len(buffers)))
+    for buffer in buffers:
+        raw = buffer.raw()
+        writer.write(_LENGTH.pack(raw.nbytes))
+        writer.write(raw)
+    writer.flush()
+
+
+class _PrefixedReader:
+    """Reads ``prefix``, the bytes already read from ``fileobj`` to detect its format, followed by
+    the rest of ``fileobj``.
+    """
+
+    def __init__(self, prefix: bytes, fileobj: IO[bytes]):
+        self._prefix = prefix
+        self._fileobj = fileobj
+
+    def read(self, size: int = -1) -> bytes:
+        if not self._prefix:
+            return self._fileobj.read(size)
+        if size is None or size < 0:
+            data, self._prefix = self._prefix + self._fileobj.read(), b""
+            return data
+        data, self._prefix = self._prefix[:size], self._prefix[size:]
+        if len(data) < size:
+            data += self._fileobj.read(size - len(data))
+        return data
+
+    def readinto(self, b) -> int:
+        view = memoryview(b).cast("B")
+        count = min(len(self._prefix), view.nbytes)
+        view[:count] = self._prefix[:count]
+        self._prefix = self._prefix[count:]
+        while count < view.nbytes:
+            read = self._fileobj.readinto(view[count:])
+            if not read:
+                break
+            count += read
+        return count
+
+    def readline(self) -> bytes:
+        if not self._prefix:
+            return self._fileobj.readline()
+        end = self._prefix.find(b"\n") + 1
+        if end:
+            line, self._prefix = self._prefix[:end], self._prefix[end:]
+            return line
+        line, self._prefix = self._prefix, b""
+        return line + self._fileobj.readline()
+
+
+def load_from_bytes(data: bytes):
+    """Unpickle an object from ``data``, which holds either the streaming format or a plain pickle.
+    Plain pickles are loaded from ``data`` without copying it.
+    """
+    if data[: len(STREAMING_PICKLE_MAGIC)] != STREAMING_PICKLE_MAGIC:
+        return pickle.loads(data)
+    return load_from_stream(io.BytesIO(data))
+
+
+def load_from_stream(fileobj: IO[bytes], chunk_size: int = DEFAULT_PART_SIZE):
+    """Unpickle an object from ``fileobj``, which holds either the streaming format or a plain
+    pickle.
+    """
+    header = fileobj.read(len(STREAMING_PICKLE_MAGIC) + 2)
+    if not header.startswith(STREAMING_PICKLE_MAGIC):
+        # unpickle the rest of the stream as it is read, instead of reading it into one more copy
+        return pickle.load(_PrefixedReader(header, fileobj))
+
+    version, codec = header[len(STREAMING_PICKLE_MAGIC) :]
+    check.invariant(
+        version in (1, STREAMING_PICKLE_VERSION), f"Unsupported streamed pickle version {version}"
+    )
+    check.invariant(
+        codec in _COMPRESSIONS_BY_CODEC, f"Unsupported streamed pickle compression {codec}"
+    )
+
+    reader = _DecompressingReader(fileobj, _COMPRESSIONS_BY_CODEC[codec], chunk_size)
+    if version == 1:
+        data = reader.read_exactly(_LENGTH.unpack(reader.read_exactly(_LENGTH.size))[0])
+    else:
+        data = bytearray()
+        while True:
+            chunk_size = _LENGTH.unpack(reader.read_exactly(_LENGTH.size))[0]
+            if not chunk_size:
+                break
+            data += reader.read_exactly(chunk_size)
+    num_buffers = _LENGTH.unpack(reader.read_exactly(_LENGTH.size))[0]
+    buffers = [
+        reader.read_exactly(_LENGTH.unpack(reader.read_exactly(_LENGTH.size))[0])
+        for _ in range(num_buffers)
+    ]
+    return pickle.loads(data, buffers=buffers)
@@ -0,0 +1,121 @@
+"""Throughput of the S3 pickle IO manager, with and without streaming.
+
+Each benchmark writes an output of ``--size-mb`` megabytes with ``handle_output`` and reads it back
+with ``load_input``. Half of the output is random bytes, and half is a repeated pattern, so that
+compression has something to compress.
+
+By default the benchmark runs against an in-process moto S3 stand-in, which measures the cost of
+pickling, compressing and chunking the output rather than network throughput. Pass
+``--endpoint-url`` (e.g. of a local MinIO server) and ``--bucket`` to run against a real S3 API.
+
+Run with:
+
+    python -m dagster_aws_tests.benchmarks.s3_io_manager_benchmark [--size-mb N] [--iterations N]
+        [--endpoint-url URL --bucket BUCKET]
+"""
+import argparse
+import os
+import time
+from contextlib import ExitStack
+
+import boto3
+from dagster_aws.s3.io_manager import PickledObjectS3IOManager
+from dagster_aws.s3.streaming import DEFAULT_MAX_CONCURRENCY, DEFAULT_PART_SIZE
+from tabulate import tabulate
+
+from dagster import build_input_context, build_output_context
+
+DEFAULT_SIZE_MB = 64
+DEFAULT_ITERATIONS = 3
+BENCHMARK_BUCKET = "dagster-benchmark"
+
+MODES = [
+    ("plain", {}),
+    ("streaming", {"streaming": True}),
+    ("streaming, zstd", {"streaming": True, "compression": "zstd"}),
+    ("streaming, lz4", {"streaming": True, "compression": "lz4"}),
+]
+
+
+def _build_output(size_bytes: int):
+    random_bytes = bytearray(os.urandom(size_bytes // 2))
+    pattern = bytearray(b"dagster " * (size_bytes // 16))
+    return {"random": random_bytes, "pattern": pattern}
+
+
+def _time(fn, iterations):
+    start = time.perf_counter()
+    for _ in range(iterations):
+        fn()
+    return (time.perf_counter() - start) / iterations
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--size-mb", type=int, default=DEFAULT_SIZE_MB)
+    parser.add_argument("--iterations", type=int, default=DEFAULT_ITERATIONS)
+    parser.add_argument("--part-size-mb", type=int, default=DEFAULT_PART_SIZE // (1024 * 1024))
+    parser.add_argument("--max-concurrency", type=int, default=DEFAULT_MAX_CONCURRENCY)
+    parser.add_argument("--endpoint-url", type=str, default=None)
+    parser.add_argument("--bucket", type=str, default=BENCHMARK_BUCKET)
+    args = parser.parse_args()
+
+    obj = _build_output(args.size_mb * 1024 * 1024)
+    output_context = build_output_context(step_key="benchmark", name="result", run_id="benchmark")
+    input_context = build_input_context(upstream_output=output_context)
+
+    with ExitStack() as stack:
+        if not args.endpoint_url:
+            from moto import mock_s3
+
+            os.environ.setdefault("AWS_ACCESS_KEY_ID", "benchmark")
+            os.environ.setdefault("AWS_SECRET_ACCESS_KEY", "benchmark")
+            stack.enter_context(mock_s3())
+            s3 = boto3.client("s3", region_name="us-east-1")
+            s3.create_bucket(Bucket=args.bucket)
+        else:
+            s3 = boto3.client("s3", endpoint_url=args.endpoint_url)
+
+        rows = []
+        for name, kwargs in MODES:
+            io_manager = PickledObjectS3IOManager(
+                args.bucket,
+                s3,
+                s3_prefix="benchmark",
+                part_size=args.part_size_mb * 1024 * 1024,
+                max_concurrency=args.max_concurrency,
+                **kwargs,
+            )
+            write_seconds = _time(
+                lambda io_manager=io_manager: io_manager.handle_output(output_context, obj),
+                args.iterations,
+            )
+            read_seconds = _time(
+                lambda io_manager=io_manager: io_manager.load_input(input_context),
+                args.iterations,
+            )
+            stored_bytes = s3.head_object(
+                Bucket=args.bucket,
+                Key=io_manager._get_path(output_context),  # pylint: disable=protected-access
+            )["ContentLength"]
+            rows.append(
+                (
+                    name,
+                    stored_bytes / (1024 * 1024),
+                    args.size_mb / write_seconds,
+                    args.size_mb / read_seconds,
+                )
+            )
+
+    print(f"Writing and reading a {args.size_mb}MB output ({args.iterations} iterations)")
+    print(
+        tabulate(
+            rows,
+            headers=["mode", "stored MB", "write MB/s", "read MB/s"],
+            floatfmt=".1f",
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,4 +1,18 @@
-from dagster_aws.s3.io_manager import s3_pickle_io_manager
+import io
+import pickle
+import struct
+from unittest import mock
+
+import pytest
+from dagster_aws.s3.io_manager import PickledObjectS3IOManager, s3_pickle_io_manager
+from dagster_aws.s3.streaming import (
+    MIN_PART_SIZE,
+    STREAMING_PICKLE_MAGIC,
+    S3MultipartUploadWriter,
+    dump_to_stream,
+    load_from_bytes,
+    load_from_stream,
+)
 from dagster_aws.s3.utils import construct_s3_client
 
 from dagster import (
@@ -12,6 +26,8 @@
     VersionStrategy,
     asset,
     build_assets_job,
+    build_input_context,
+    build_output_context,
     graph,
     job,
     op,
@@ -185,3 +201,143 @@ def test_s3_pickle_io_manager_asset_execution(mock_s3_bucket):
             "/".join(["dagster", "storage", result.run_id, "graph_asset.first_op", "result"]),
         ),
     }
+
+
+def define_large_output_job():
+    @op
+    def return_large():
+        # a bytearray is pickled out of band, so that it is not copied into the pickle
+        return {"bytes": bytes(range(256)) * 20000, "buffer": bytearray(b"x" * 12 * 1024 * 1024)}
+
+    @op
+    def check_large(large):
+        assert large["bytes"] == bytes(range(256)) * 20000
+        assert large["buffer"] == bytearray(b"x" * 12 * 1024 * 1024)
+        return len(large["buffer"])
+
+    @job(resource_defs={"io_manager": s3_pickle_io_manager, "s3": s3_test_resource})
+    def large_output_job():
+        check_large(return_large())
+
+    return large_output_job
+
+
+@pytest.mark.parametrize("compression", ["none", "zstd", "lz4"])
+def test_s3_pickle_io_manager_streaming(mock_s3_bucket, compression):
+    run_config = {
+        "resources": {
+            "io_manager": {
+                "config": {
+                    "s3_bucket": mock_s3_bucket.name,
+                    "streaming": True,
+                    "compression": compression,
+                    "part_size": MIN_PART_SIZE,
+                    "max_concurrency": 4,
+                }
+            }
+        }
+    }
+
+    result = define_large_output_job().execute_in_process(run_config)
+    assert result.success
+    assert result.output_for_node("check_large") == 12 * 1024 * 1024
+
+    objects = {obj.key: obj for obj in mock_s3_bucket.objects.all()}
+    large_key = "/".join(["dagster", "storage", result.run_id, "return_large", "result"])
+    if compression == "none":
+        assert objects[large_key].size > 12 * 1024 * 1024
+    with mock_s3_bucket.Object(large_key).get()["Body"] as body:
+        assert body.read(len(STREAMING_PICKLE_MAGIC)) == STREAMING_PICKLE_MAGIC
+
+
+def test_s3_pickle_io_manager_streaming_compatibility(mock_s3_bucket):
+    s3 = construct_s3_client(max_attempts=5)
+    plain = PickledObjectS3IOManager(mock_s3_bucket.name, s3, s3_prefix="plain")
+    streaming = PickledObjectS3IOManager(
+        mock_s3_bucket.name, s3, s3_prefix="streaming", streaming=True, compression="zstd"
+    )
+
+    for writer, reader in [(plain, streaming), (streaming, plain)]:
+        output_context = build_output_context(step_key="my_op", name="result", run_id="my_run")
+        writer.handle_output(output_context, {"value": 1})
+        writer.handle_output(output_context, {"value": 2})  # overwrites the existing object
+
+        reader.s3_prefix = writer.s3_prefix
+        input_context = build_input_context(upstream_output=output_context)
+        assert reader.load_input(input_context) == {"value": 2}
+
+
+def test_s3_pickle_io_manager_streaming_failure(mock_s3_bucket):
+    s3 = construct_s3_client(max_attempts=5)
+    io_manager = PickledObjectS3IOManager(
+        mock_s3_bucket.name, s3, s3_prefix="dagster", streaming=True, part_size=MIN_PART_SIZE
+    )
+
+    class Unpicklable:
+        def __reduce__(self):
+            raise Exception("unpicklable")
+
+    output_context = build_output_context(step_key="my_op", name="result", run_id="my_run")
+    with pytest.raises(Exception, match="unpicklable"):
+        io_manager.handle_output(output_context, [bytes(MIN_PART_SIZE * 2), Unpicklable()])
+
+    assert not list(mock_s3_bucket.objects.all())
+    assert not s3.list_multipart_uploads(Bucket=mock_s3_bucket.name).get("Uploads")
+
+
+def test_s3_multipart_upload_writer(mock_s3_bucket):
+    s3 = construct_s3_client(max_attempts=5)
+    data = bytes(range(256)) * (MIN_PART_SIZE * 3 // 256 + 7)
+
+    # writes smaller than, equal to and larger than a part
+    sizes = [1, MIN_PART_SIZE - 1, MIN_PART_SIZE, 100, MIN_PART_SIZE * 2]
+    writer = S3MultipartUploadWriter(s3, mock_s3_bucket.name, "key", part_size=MIN_PART_SIZE)
+    position = 0
+    for size in sizes:
+        chunk = data[position : position + size]
+        assert writer.write(chunk) == len(chunk)
+        position += size
+    writer.close()
+
+    assert mock_s3_bucket.Object("key").get()["Body"].read() == data
+
+
+@pytest.mark.parametrize("compression", [None, "zstd"])
+def test_stream_format(compression):
+    obj = {"buffer": pickle.PickleBuffer(bytearray(b"x" * 1000)), "value": list(range(100000))}
+
+    stream = io.BytesIO()
+    dump_to_stream(obj, stream, compression)
+    stream.seek(0)
+    loaded = load_from_stream(stream, chunk_size=1024)
+    assert bytes(loaded["buffer"]) == b"x" * 1000
+    assert loaded["value"] == obj["value"]
+
+
+def test_stream_format_version_1():
+    data = pickle.dumps({"value": 1}, protocol=5)
+    length = struct.Struct(">Q")
+    stream = io.BytesIO(
+        STREAMING_PICKLE_MAGIC + bytes([1, 0]) + length.pack(len(data)) + data + length.pack(0)
+    )
+    assert load_from_stream(stream) == {"value": 1}
+
+
+@pytest.mark.parametrize("protocol", [0, 2, 4, 5])
+def test_stream_format_plain_pickle(protocol):
+    obj = {"value": list(range(100000)), "text": "line\nbreak"}
+    assert load_from_stream(io.BytesIO(pickle.dumps(obj, protocol=protocol))) == obj
+
+
+def test_load_from_bytes():
+    obj = {"value": list(range(100000))}
+
+    data = pickle.dumps(obj, protocol=4)
+    with mock.patch("pickle.loads", wraps=pickle.loads) as loads:
+        assert load_from_bytes(data) == obj
+    # plain pickles are loaded from the downloaded bytes, rather than from a copy
+    assert loads.call_args[0][0] is data
+
+    stream = io.BytesIO()
+    dump_to_stream(obj, stream, "zstd")
+    assert load_from_bytes(stream.getvalue()) == obj
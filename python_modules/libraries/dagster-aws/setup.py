@@ -41,6 +41,8 @@ def get_version() -> str:
         ],
         extras_require={
             "redshift": ["psycopg2-binary"],
+            "zstd": ["zstandard"],
+            "lz4": ["lz4"],
             "pyspark": ["dagster-pyspark"],
             "test": [
                 "moto>=2.2.8",
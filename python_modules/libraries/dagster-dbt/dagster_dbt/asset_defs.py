@@ -1,8 +1,21 @@
 import hashlib
 import json
 import os
+import tempfile
 import textwrap
-from typing import AbstractSet, Any, Callable, Dict, Mapping, Optional, Sequence, Set, Tuple
+from typing import (
+    AbstractSet,
+    Any,
+    Callable,
+    Dict,
+    List,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+)
 
 from dagster_dbt.cli.types import DbtCliOutput
 from dagster_dbt.cli.utils import execute_cli
@@ -28,11 +41,17 @@
 from dagster.core.definitions.events import CoercibleToAssetKeyPrefix
 from dagster.core.definitions.metadata import RawMetadataValue
 from dagster.core.errors import DagsterInvalidSubsetError
+from dagster.utils import mkdir_p
+
+# included in the cache keys of persisted manifest indexes, bump it when their contents change
+MANIFEST_INDEX_VERSION = 1
+# the most manifest indexes kept in a cache directory, the least recently used are removed first
+MAX_CACHED_MANIFEST_INDEXES = 32
 
 
 def _load_manifest_for_project(
     project_dir: str, profiles_dir: str, target_dir: str, select: str
-) -> Tuple[Mapping[str, Any], DbtCliOutput]:
+) -> Tuple[str, DbtCliOutput]:
     # running "dbt ls" regenerates the manifest.json, which includes a superset of the actual
     # "dbt ls" output
     cli_output = execute_cli(
@@ -50,9 +69,7 @@ def _load_manifest_for_project(
         ignore_handled_error=False,
         target_path=target_dir,
     )
-    manifest_path = os.path.join(target_dir, "manifest.json")
-    with open(manifest_path, "r", encoding="utf8") as f:
-        return json.load(f), cli_output
+    return os.path.join(target_dir, "manifest.json"), cli_output
 
 
 def _select_unique_ids_from_manifest_json(
@@ -99,6 +116,180 @@ def __getattr__(self, item):
     return selected
 
 
+class _DbtManifestIndex(NamedTuple):
+    """The parts of a manifest.json that a selection of its models is loaded into assets from."""
+
+    select: str
+    # the selected models, in the order of the selection
+    selected_unique_ids: List[str]
+    # the selected models and the nodes that they depend on
+    dbt_nodes: Mapping[str, Mapping[str, Any]]
+
+
+def _build_manifest_index(
+    manifest_json: Mapping[str, Any],
+    select: Optional[str],
+    selected_unique_ids: Optional[AbstractSet[str]],
+) -> _DbtManifestIndex:
+    dbt_nodes = {**manifest_json["nodes"], **manifest_json["sources"]}
+
+    if select is None:
+        if selected_unique_ids:
+            # generate selection string from unique ids
+            select = " ".join(".".join(dbt_nodes[uid]["fqn"]) for uid in selected_unique_ids)
+        else:
+            # if no selection specified, default to "*"
+            select = "*"
+            selected_unique_ids = manifest_json["nodes"].keys()
+
+    if selected_unique_ids is None:
+        # must resolve the selection string using the existing manifest.json data (hacky)
+        selected_unique_ids = _select_unique_ids_from_manifest_json(manifest_json, select)
+
+    selected_model_ids = []
+    index_nodes: Dict[str, Mapping[str, Any]] = {}
+    for unique_id in selected_unique_ids:
+        node_info = dbt_nodes[unique_id]
+        if node_info["resource_type"] != "model":
+            continue
+        selected_model_ids.append(unique_id)
+        index_nodes[unique_id] = node_info
+        for dep_name in node_info["depends_on"]["nodes"]:
+            dep_info = dbt_nodes[dep_name]
+            # only the resource type of seeds/snapshots/tests is needed
+            if dep_info["resource_type"] in ["source", "model"]:
+                index_nodes.setdefault(dep_name, dep_info)
+            else:
+                index_nodes.setdefault(dep_name, {"resource_type": dep_info["resource_type"]})
+
+    return _DbtManifestIndex(select, selected_model_ids, index_nodes)
+
+
+def _get_manifest_index_cache_key(
+    manifest_hash: str, select: Optional[str], selected_unique_ids: Optional[AbstractSet[str]]
+) -> str:
+    return hashlib.sha256(
+        json.dumps(
+            [
+                MANIFEST_INDEX_VERSION,
+                manifest_hash,
+                select,
+                sorted(selected_unique_ids) if selected_unique_ids is not None else None,
+            ]
+        ).encode()
+    ).hexdigest()
+
+
+def _get_manifest_content_hash(manifest_json: Mapping[str, Any]) -> str:
+    # only the parts of the manifest that indexes are built from, since e.g. `dbt ls` rewrites the
+    # metadata of the manifest every time it runs
+    return hashlib.sha256(
+        json.dumps(
+            [manifest_json["nodes"], manifest_json["sources"], manifest_json.get("child_map")],
+            sort_keys=True,
+        ).encode()
+    ).hexdigest()
+
+
+def _read_manifest_index(index_path: str) -> Optional[_DbtManifestIndex]:
+    if not os.path.exists(index_path):
+        return None
+
+    try:
+        with open(index_path, "r", encoding="utf8") as f:
+            manifest_index = _DbtManifestIndex(**json.load(f))
+        # mark the index as recently used
+        os.utime(index_path)
+        return manifest_index
+    except (OSError, ValueError, TypeError):
+        # rebuild unreadable indexes
+        get_dagster_logger().warning(f"Could not read dbt manifest index {index_path}")
+        return None
+
+
+def _write_manifest_index(index_path: str, manifest_index: _DbtManifestIndex):
+    # write to a temporary file first, so that concurrent loads never read a partial index
+    with tempfile.NamedTemporaryFile(
+        "w", encoding="utf8", dir=os.path.dirname(index_path), suffix=".tmp", delete=False
+    ) as f:
+        json.dump(manifest_index._asdict(), f)
+    os.replace(f.name, index_path)
+
+
+def _prune_manifest_indexes(manifest_cache_dir: str):
+    index_paths = [
+        os.path.join(manifest_cache_dir, file_name)
+        for file_name in os.listdir(manifest_cache_dir)
+        if file_name.endswith(".json")
+    ]
+    if len(index_paths) <= MAX_CACHED_MANIFEST_INDEXES:
+        return
+
+    for index_path in sorted(index_paths, key=_get_mtime)[:-MAX_CACHED_MANIFEST_INDEXES]:
+        try:
+            os.remove(index_path)
+        except FileNotFoundError:
+            # removed by a concurrent load
+            pass
+
+
+def _get_mtime(path: str) -> float:
+    try:
+        return os.path.getmtime(path)
+    except FileNotFoundError:
+        return 0
+
+
+def _load_manifest_index(
+    manifest_path: str,
+    select: Optional[str],
+    selected_unique_ids: Optional[AbstractSet[str]],
+    manifest_cache_dir: Optional[str],
+) -> _DbtManifestIndex:
+    """Loads the index of a selection of a manifest.json from the cache directory, or builds it
+    from the manifest.json and persists it to the cache directory if it is not there.
+
+    Indexes are looked up by the hash of the manifest file, which does not require parsing the
+    manifest, and then by the hash of the parts of the manifest that they are built from, which
+    still matches after its metadata is rewritten.
+    """
+    with open(manifest_path, "rb") as f:
+        manifest_bytes = f.read()
+
+    if manifest_cache_dir is None:
+        return _build_manifest_index(json.loads(manifest_bytes), select, selected_unique_ids)
+
+    file_index_path = os.path.join(
+        manifest_cache_dir,
+        _get_manifest_index_cache_key(
+            hashlib.sha256(manifest_bytes).hexdigest(), select, selected_unique_ids
+        )
+        + ".json",
+    )
+    manifest_index = _read_manifest_index(file_index_path)
+    if manifest_index is not None:
+        return manifest_index
+
+    manifest_json = json.loads(manifest_bytes)
+    content_index_path = os.path.join(
+        manifest_cache_dir,
+        _get_manifest_index_cache_key(
+            _get_manifest_content_hash(manifest_json), select, selected_unique_ids
+        )
+        + ".json",
+    )
+    manifest_index = _read_manifest_index(content_index_path)
+
+    mkdir_p(manifest_cache_dir)
+    if manifest_index is None:
+        manifest_index = _build_manifest_index(manifest_json, select, selected_unique_ids)
+        _write_manifest_index(content_index_path, manifest_index)
+    _write_manifest_index(file_index_path, manifest_index)
+    _prune_manifest_indexes(manifest_cache_dir)
+
+    return manifest_index
+
+
 def _get_node_name(node_info: Mapping[str, Any]):
     return "__".join([node_info["resource_type"], node_info["package_name"], node_info["name"]])
 
@@ -143,7 +334,7 @@ def _get_node_description(node_info):
 def _dbt_nodes_to_assets(
     dbt_nodes: Mapping[str, Any],
     select: str,
-    selected_unique_ids: AbstractSet[str],
+    selected_unique_ids: Sequence[str],
     runtime_metadata_fn: Optional[
         Callable[[SolidExecutionContext, Mapping[str, Any]], Mapping[str, RawMetadataValue]]
     ] = None,
@@ -316,6 +507,7 @@ def load_assets_from_dbt_project(
     io_manager_key: Optional[str] = None,
     node_info_to_asset_key: Callable[[Mapping[str, Any]], AssetKey] = _get_node_asset_key,
     use_build_command: bool = False,
+    manifest_cache_dir: Optional[str] = None,
 ) -> Sequence[AssetsDefinition]:
     """
     Loads a set of DBT models from a DBT project into Dagster assets.
@@ -346,6 +538,9 @@ def load_assets_from_dbt_project(
             default, the asset key will simply be the name of the dbt model.
         use_build_command: (bool): Flag indicating if you want to use `dbt build` as the core computation
             for this asset, rather than `dbt run`.
+        manifest_cache_dir (Optional[str]): A directory in which to cache an index of the models
+            selected from the manifest.json that `dbt ls` generates. See
+            :py:func:`load_assets_from_dbt_manifest`.
 
     """
     project_dir = check.str_param(project_dir, "project_dir")
@@ -355,14 +550,15 @@ def load_assets_from_dbt_project(
     target_dir = check.opt_str_param(target_dir, "target_dir", os.path.join(project_dir, "target"))
     select = check.opt_str_param(select, "select", "*")
 
-    manifest_json, cli_output = _load_manifest_for_project(
+    manifest_path, cli_output = _load_manifest_for_project(
         project_dir, profiles_dir, target_dir, select
     )
     selected_unique_ids: Set[str] = set(
         filter(None, (line.get("unique_id") for line in cli_output.logs))
     )
     return load_assets_from_dbt_manifest(
-        manifest_json=manifest_json,
+        manifest_path=manifest_path,
+        manifest_cache_dir=manifest_cache_dir,
         key_prefix=key_prefix,
         source_key_prefix=source_key_prefix,
         runtime_metadata_fn=runtime_metadata_fn,
@@ -375,7 +571,7 @@ def load_assets_from_dbt_project(
 
 
 def load_assets_from_dbt_manifest(
-    manifest_json: Mapping[str, Any],
+    manifest_json: Optional[Mapping[str, Any]] = None,
     key_prefix: Optional[CoercibleToAssetKeyPrefix] = None,
     source_key_prefix: Optional[CoercibleToAssetKeyPrefix] = None,
     runtime_metadata_fn: Optional[
@@ -386,6 +582,8 @@ def load_assets_from_dbt_manifest(
     select: Optional[str] = None,
     node_info_to_asset_key: Callable[[Mapping[str, Any]], AssetKey] = _get_node_asset_key,
     use_build_command: bool = False,
+    manifest_path: Optional[str] = None,
+    manifest_cache_dir: Optional[str] = None,
 ) -> Sequence[AssetsDefinition]:
     """
     Loads a set of dbt models, described in a manifest.json, into Dagster assets.
@@ -413,29 +611,44 @@ def load_assets_from_dbt_manifest(
             default, the asset key will simply be the name of the dbt model.
         use_build_command: (bool): Flag indicating if you want to use `dbt build` as the core computation
             for this asset, rather than `dbt run`.
+        manifest_path (Optional[str]): The path to a manifest.json, to load instead of passing its
+            contents as manifest_json.
+        manifest_cache_dir (Optional[str]): A directory in which to cache an index of the models
+            selected from the manifest.json at manifest_path, keyed by the contents of the manifest
+            and the selection. Later loads of the same selection of the same manifest, e.g. by run
+            workers, read the index instead of resolving the selection against the manifest, and
+            also skip parsing the manifest if the file is unchanged. Changes to the metadata of
+            the manifest alone, e.g. by `dbt ls`, do not invalidate the index. The directory holds
+            up to 32 indexes, and the least recently used are removed first.
     """
-    check.dict_param(manifest_json, "manifest_json", key_type=str)
-    dbt_nodes = {**manifest_json["nodes"], **manifest_json["sources"]}
-
-    if select is None:
-        if selected_unique_ids:
-            # generate selection string from unique ids
-            select = " ".join(".".join(dbt_nodes[uid]["fqn"]) for uid in selected_unique_ids)
-        else:
-            # if no selection specified, default to "*"
-            select = "*"
-            selected_unique_ids = manifest_json["nodes"].keys()
-
-    if selected_unique_ids is None:
-        # must resolve the selection string using the existing manifest.json data (hacky)
-        selected_unique_ids = _select_unique_ids_from_manifest_json(manifest_json, select)
+    check.invariant(
+        (manifest_json is None) != (manifest_path is None),
+        "Exactly one of manifest_json and manifest_path must be provided",
+    )
+    check.invariant(
+        manifest_cache_dir is None or manifest_path is not None,
+        "manifest_cache_dir can only be used with manifest_path",
+    )
+    if manifest_path is not None:
+        manifest_index = _load_manifest_index(
+            check.str_param(manifest_path, "manifest_path"),
+            select,
+            selected_unique_ids,
+            check.opt_str_param(manifest_cache_dir, "manifest_cache_dir"),
+        )
+    else:
+        manifest_index = _build_manifest_index(
+            check.dict_param(manifest_json, "manifest_json", key_type=str),
+            select,
+            selected_unique_ids,
+        )
 
     dbt_assets_def = _dbt_nodes_to_assets(
-        dbt_nodes,
+        manifest_index.dbt_nodes,
         runtime_metadata_fn=runtime_metadata_fn,
         io_manager_key=io_manager_key,
-        select=select,
-        selected_unique_ids=selected_unique_ids,
+        select=manifest_index.select,
+        selected_unique_ids=manifest_index.selected_unique_ids,
         node_info_to_asset_key=node_info_to_asset_key,
         use_build_command=use_build_command,
     )
@@ -1,9 +1,11 @@
 import json
+import os
+from unittest import mock
 from unittest.mock import MagicMock
 
 import psycopg2
 import pytest
-from dagster_dbt import dbt_cli_resource
+from dagster_dbt import asset_defs, dbt_cli_resource
 from dagster_dbt.asset_defs import load_assets_from_dbt_manifest, load_assets_from_dbt_project
 from dagster_dbt.errors import DagsterDbtCliFatalRuntimeError
 from dagster_dbt.types import DbtOutput
@@ -19,6 +21,7 @@
     io_manager,
     repository,
 )
+from dagster import _check as check
 from dagster.core.asset_defs import build_assets_job
 from dagster.utils import file_relative_path
 
@@ -56,6 +59,132 @@ def test_load_from_manifest_json(prefix):
     assert assets_job.execute_in_process().success
 
 
+@pytest.mark.parametrize(
+    "selection",
+    [
+        {},
+        {"select": "sort_by_calories+"},
+        {
+            "selected_unique_ids": {
+                "model.dagster_dbt_test_project.sort_by_calories",
+                "model.dagster_dbt_test_project.least_caloric",
+            }
+        },
+    ],
+)
+def test_load_from_manifest_path_cached(tmp_path, selection):
+    manifest_path = file_relative_path(__file__, "sample_manifest.json")
+    with open(manifest_path, "r", encoding="utf8") as f:
+        manifest_json = json.load(f)
+    cache_dir = str(tmp_path / "dbt_manifest_cache")
+
+    with mock.patch.object(
+        asset_defs,
+        "_build_manifest_index",
+        wraps=asset_defs._build_manifest_index,  # pylint: disable=protected-access
+    ) as build_manifest_index:
+        expected = load_assets_from_dbt_manifest(manifest_json, **selection)
+        first = load_assets_from_dbt_manifest(
+            manifest_path=manifest_path, manifest_cache_dir=cache_dir, **selection
+        )
+        # indexed both by the manifest file and by the parts of the manifest it is built from
+        assert len(os.listdir(cache_dir)) == 2
+        second = load_assets_from_dbt_manifest(
+            manifest_path=manifest_path, manifest_cache_dir=cache_dir, **selection
+        )
+        # the manifest is only indexed the first time it is loaded from the cache directory
+        assert build_manifest_index.call_count == 2
+
+    for assets in [first, second]:
+        assert len(assets) == len(expected) == 1
+        assert assets[0].keys == expected[0].keys
+        assert assets[0].asset_deps == expected[0].asset_deps
+        assert assets[0].op.ins.keys() == expected[0].op.ins.keys()
+        assert assets[0].op.outs.keys() == expected[0].op.outs.keys()
+
+    # a corrupt index is rebuilt
+    for index_file in os.listdir(cache_dir):
+        with open(os.path.join(cache_dir, index_file), "w", encoding="utf8") as f:
+            f.write("{")
+    assets = load_assets_from_dbt_manifest(
+        manifest_path=manifest_path, manifest_cache_dir=cache_dir, **selection
+    )
+    assert assets[0].keys == expected[0].keys
+
+
+def test_load_from_manifest_path_cached_metadata_changed(tmp_path):
+    with open(file_relative_path(__file__, "sample_manifest.json"), "r", encoding="utf8") as f:
+        manifest_json = json.load(f)
+    manifest_path = str(tmp_path / "manifest.json")
+    cache_dir = str(tmp_path / "dbt_manifest_cache")
+
+    with mock.patch.object(
+        asset_defs,
+        "_build_manifest_index",
+        wraps=asset_defs._build_manifest_index,  # pylint: disable=protected-access
+    ) as build_manifest_index:
+        for i in range(3):
+            # e.g. `dbt ls` rewrites the metadata of the manifest every time it runs
+            manifest_json["metadata"]["generated_at"] = f"2022-07-0{i + 1}T00:00:00.000000Z"
+            manifest_json["metadata"]["invocation_id"] = f"invocation-{i}"
+            with open(manifest_path, "w", encoding="utf8") as f:
+                json.dump(manifest_json, f)
+
+            assets = load_assets_from_dbt_manifest(
+                manifest_path=manifest_path, manifest_cache_dir=cache_dir
+            )
+            assert len(assets) == 1
+
+        assert build_manifest_index.call_count == 1
+
+        # changing the models themselves does invalidate the index
+        manifest_json["nodes"].pop("model.dagster_dbt_test_project.least_caloric")
+        for node in manifest_json["nodes"].values():
+            node["depends_on"]["nodes"] = [
+                dep
+                for dep in node["depends_on"]["nodes"]
+                if dep != "model.dagster_dbt_test_project.least_caloric"
+            ]
+        manifest_json["child_map"].pop("model.dagster_dbt_test_project.least_caloric", None)
+        for children in manifest_json["child_map"].values():
+            if "model.dagster_dbt_test_project.least_caloric" in children:
+                children.remove("model.dagster_dbt_test_project.least_caloric")
+        with open(manifest_path, "w", encoding="utf8") as f:
+            json.dump(manifest_json, f)
+
+        assets = load_assets_from_dbt_manifest(
+            manifest_path=manifest_path, manifest_cache_dir=cache_dir
+        )
+        assert build_manifest_index.call_count == 2
+        assert AssetKey(["least_caloric"]) not in assets[0].keys
+
+
+def test_load_from_manifest_path_cache_pruned(tmp_path):
+    with open(file_relative_path(__file__, "sample_manifest.json"), "r", encoding="utf8") as f:
+        manifest_json = json.load(f)
+    manifest_path = str(tmp_path / "manifest.json")
+    cache_dir = str(tmp_path / "dbt_manifest_cache")
+
+    with mock.patch.object(asset_defs, "MAX_CACHED_MANIFEST_INDEXES", 3):
+        for i in range(5):
+            manifest_json["metadata"]["invocation_id"] = f"invocation-{i}"
+            with open(manifest_path, "w", encoding="utf8") as f:
+                json.dump(manifest_json, f)
+            load_assets_from_dbt_manifest(manifest_path=manifest_path, manifest_cache_dir=cache_dir)
+
+            assert len(os.listdir(cache_dir)) == min(i + 2, 3)
+
+
+def test_load_from_manifest_path_invalid_args():
+    manifest_path = file_relative_path(__file__, "sample_manifest.json")
+    with pytest.raises(check.CheckError, match="Exactly one of"):
+        load_assets_from_dbt_manifest()
+    with pytest.raises(check.CheckError, match="Exactly one of"):
+        load_assets_from_dbt_manifest({"nodes": {}, "sources": {}}, manifest_path=manifest_path)
+    with pytest.raises(check.CheckError, match="manifest_cache_dir"):
+        load_assets_from_dbt_manifest({"nodes": {}, "sources": {}}, manifest_cache_dir="cache")
+
+
 def test_runtime_metadata_fn():
     manifest_path = file_relative_path(__file__, "sample_manifest.json")
     with open(manifest_path, "r", encoding="utf8") as f:
@@ -13,6 +13,7 @@
 from dagster.core.storage.sql import (
     check_alembic_revision,
     create_engine,
+    create_pooled_engine,
     run_alembic_upgrade,
     stamp_alembic_rev,
 )
@@ -46,18 +47,18 @@ class MySQLEventLogStorage(SqlEventLogStorage, ConfigurableClass):
 
     """
 
-    def __init__(self, mysql_url, inst_data=None):
+    def __init__(self, mysql_url, inst_data=None, pool_config=None):
         self._inst_data = check.opt_inst_param(inst_data, "inst_data", ConfigurableClassData)
         self.mysql_url = check.str_param(mysql_url, "mysql_url")
+        self._pool_config = check.opt_mapping_param(pool_config, "pool_config")
         self._disposed = False
 
         self._event_watcher = SqlPollingEventWatcher(self)
 
-        # Default to not holding any connections open to prevent accumulating connections per DagsterInstance
-        self._engine = create_engine(
-            self.mysql_url,
-            isolation_level="AUTOCOMMIT",
-            poolclass=db.pool.NullPool,
+        # Default to not holding any connections open to prevent accumulating connections per
+        # DagsterInstance, unless pooling is configured
+        self._engine = create_pooled_engine(
+            self.mysql_url, self._pool_config, isolation_level="AUTOCOMMIT"
         )
         self._secondary_index_cache = {}
 
@@ -82,6 +83,9 @@ def _init_db(self):
     def optimize_for_dagit(self, statement_timeout):
         # When running in dagit, hold an open connection
         # https://github.com/dagster-io/dagster/issues/3719
+        if self._pool_config:
+            # the configured pool of connections is already held open
+            return
         self._engine = create_engine(
             self.mysql_url,
             isolation_level="AUTOCOMMIT",
@@ -105,7 +109,9 @@ def config_type(cls):
     @staticmethod
     def from_config_value(inst_data, config_value):
         return MySQLEventLogStorage(
-            inst_data=inst_data, mysql_url=mysql_url_from_config(config_value)
+            inst_data=inst_data,
+            mysql_url=mysql_url_from_config(config_value),
+            pool_config=config_value.get("pool"),
         )
 
     @staticmethod
@@ -158,11 +164,7 @@ def index_connection(self):
         return self._connect()
 
     def has_secondary_index(self, name):
-        if name not in self._secondary_index_cache:
-            self._secondary_index_cache[name] = super(
-                MySQLEventLogStorage, self
-            ).has_secondary_index(name)
-        return self._secondary_index_cache[name]
+        return self._has_cached_secondary_index(self._secondary_index_cache, name)
 
     def enable_secondary_index(self, name):
         super(MySQLEventLogStorage, self).enable_secondary_index(name)
@@ -188,6 +190,8 @@ def dispose(self):
         if not self._disposed:
             self._disposed = True
             self._event_watcher.close()
+            if self._pool_config:
+                self._engine.dispose()
 
     def alembic_version(self):
         alembic_config = mysql_alembic_config(__file__)
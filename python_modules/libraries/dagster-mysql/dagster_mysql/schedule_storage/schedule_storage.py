@@ -8,6 +8,7 @@
 from dagster.core.storage.sql import (
     check_alembic_revision,
     create_engine,
+    create_pooled_engine,
     run_alembic_upgrade,
     stamp_alembic_rev,
 )
@@ -40,15 +41,15 @@ class MySQLScheduleStorage(SqlScheduleStorage, ConfigurableClass):
     :py:class:`~dagster.IntSource` and can be configured from environment variables.
     """
 
-    def __init__(self, mysql_url, inst_data=None):
+    def __init__(self, mysql_url, inst_data=None, pool_config=None):
         self._inst_data = check.opt_inst_param(inst_data, "inst_data", ConfigurableClassData)
         self.mysql_url = mysql_url
+        self._pool_config = check.opt_mapping_param(pool_config, "pool_config")
 
-        # Default to not holding any connections open to prevent accumulating connections per DagsterInstance
-        self._engine = create_engine(
-            self.mysql_url,
-            isolation_level="AUTOCOMMIT",
-            poolclass=db.pool.NullPool,
+        # Default to not holding any connections open to prevent accumulating connections per
+        # DagsterInstance, unless pooling is configured
+        self._engine = create_pooled_engine(
+            self.mysql_url, self._pool_config, isolation_level="AUTOCOMMIT"
         )
 
         # Stamp and create tables if the main table does not exist (we can't check alembic
@@ -72,6 +73,9 @@ def _init_db(self):
     def optimize_for_dagit(self, statement_timeout):
         # When running in dagit, hold an open connection
         # https://github.com/dagster-io/dagster/issues/3719
+        if self._pool_config:
+            # the configured pool of connections is already held open
+            return
         self._engine = create_engine(
             self.mysql_url,
             isolation_level="AUTOCOMMIT",
@@ -90,7 +94,9 @@ def config_type(cls):
     @staticmethod
     def from_config_value(inst_data, config_value):
         return MySQLScheduleStorage(
-            inst_data=inst_data, mysql_url=mysql_url_from_config(config_value)
+            inst_data=inst_data,
+            mysql_url=mysql_url_from_config(config_value),
+            pool_config=config_value.get("pool"),
         )
 
     @staticmethod
@@ -109,6 +115,11 @@ def create_clean_storage(mysql_url):
     def connect(self, run_id=None):  # pylint: disable=arguments-differ, unused-argument
         return create_mysql_connection(self._engine, __file__, "schedule")
 
+    def dispose(self):
+        # close the connections held by a configured pool
+        if self._pool_config:
+            self._engine.dispose()
+
     def upgrade(self):
         alembic_config = mysql_alembic_config(__file__)
         run_alembic_upgrade(alembic_config, self._engine)
@@ -32,12 +32,13 @@ class DagsterMySQLStorage(DagsterStorage, ConfigurableClass):
     :py:class:`~dagster.IntSource` and can be configured from environment variables.
     """
 
-    def __init__(self, mysql_url, inst_data=None):
+    def __init__(self, mysql_url, inst_data=None, pool_config=None):
         self.mysql_url = mysql_url
         self._inst_data = check.opt_inst_param(inst_data, "inst_data", ConfigurableClassData)
-        self._run_storage = MySQLRunStorage(mysql_url)
-        self._event_log_storage = MySQLEventLogStorage(mysql_url)
-        self._schedule_storage = MySQLScheduleStorage(mysql_url)
+        self._pool_config = check.opt_mapping_param(pool_config, "pool_config")
+        self._run_storage = MySQLRunStorage(mysql_url, pool_config=self._pool_config)
+        self._event_log_storage = MySQLEventLogStorage(mysql_url, pool_config=self._pool_config)
+        self._schedule_storage = MySQLScheduleStorage(mysql_url, pool_config=self._pool_config)
         super().__init__()
 
     @property
@@ -53,6 +54,7 @@ def from_config_value(inst_data, config_value):
         return DagsterMySQLStorage(
             inst_data=inst_data,
             mysql_url=mysql_url_from_config(config_value),
+            pool_config=config_value.get("pool"),
         )
 
     @property
@@ -33,9 +33,18 @@ def get_conn(conn_string):
 
 def mysql_url_from_config(config_value):
     if config_value.get("mysql_url"):
+        check.invariant(
+            "mysql_db" not in config_value,
+            "mysql storage config must have exactly one of `mysql_url` or `mysql_db`",
+        )
         return config_value["mysql_url"]
+    else:
+        check.invariant(
+            "mysql_db" in config_value,
+            "mysql storage config must have exactly one of `mysql_url` or `mysql_db`",
+        )
 
-    return get_conn_string(**config_value["mysql_db"])
+        return get_conn_string(**config_value["mysql_db"])
 
 
 def get_conn_string(username, password, hostname, db_name, port="3306"):
@@ -3,6 +3,7 @@
 from datetime import datetime
 from functools import wraps
 
+import numpy as np
 import pandas as pd
 from pandas import DataFrame
 
@@ -10,6 +11,9 @@
 from dagster import _check as check
 from dagster.utils.backcompat import experimental_class_warning
 
+# the number of offending rows or values reported for each column that violates a constraint
+DEFAULT_MAX_OFFENDING_SAMPLES = 100
+
 
 class ConstraintViolationException(Exception):
     """Indicates that a constraint has been violated."""
@@ -157,12 +161,20 @@ class ConstraintWithMetadata:
         raise_or_typecheck (Optional[bool]): whether to raise an exception (if set to True) or emit a failed typecheck event
                     (if set to False) when validation fails
         name (Optional[str]): what to call the constraint, defaults to the class name.
+        max_offending_samples (Optional[int]): for constraints that report offending rows or values, the maximum
+                    number of them to report per column. Defaults to 100, None reports all of them.
     """
 
     # TODO:  validation_fn returning metadata is sorta broken.  maybe have it yield typecheck events and grab metadata?
 
     def __init__(
-        self, description, validation_fn, resulting_exception, raise_or_typecheck=True, name=None
+        self,
+        description,
+        validation_fn,
+        resulting_exception,
+        raise_or_typecheck=True,
+        name=None,
+        max_offending_samples=DEFAULT_MAX_OFFENDING_SAMPLES,
     ):
         experimental_class_warning(self.__class__.__name__)
         if name is None:
@@ -174,6 +186,9 @@ def __init__(
         self.validation_fn = validation_fn
         self.resulting_exception = resulting_exception
         self.raise_or_typecheck = raise_or_typecheck
+        self.max_offending_samples = check.opt_int_param(
+            max_offending_samples, "max_offending_samples"
+        )
 
     def validate(self, data, *args, **kwargs):
         res = self.validation_fn(data, *args, **kwargs)
@@ -394,6 +409,68 @@ def apply_ignore_missing_data_to_mask(mask, column):
     return mask & ~column.isnull()
 
 
+def offending_positions(invalid, max_offending_samples=DEFAULT_MAX_OFFENDING_SAMPLES):
+    """The positions of (at most ``max_offending_samples``) rows for which ``invalid`` is True."""
+    positions = np.flatnonzero(np.asarray(invalid, dtype=bool))
+    if max_offending_samples is not None:
+        positions = positions[:max_offending_samples]
+    return positions
+
+
+def with_validation_mask(mask_fn):
+    """
+    decorator attaching a vectorized implementation to a column validation function, which is used
+    instead of calling the validation function on every value of the column
+    Usage:
+        decorate column validators that are passed to
+        :py:class:'~dagster_pandas.constraints.ColumnConstraintWithMetadata'
+        or :py:class:'~dagster_pandas.constraints.MultiColumnConstraintWithMetadata'
+    Args:
+        mask_fn (Callable[[pd.Series], Union[pd.Series, np.ndarray]]):
+            a function that takes a column and returns a boolean mask that is True for each value the
+            decorated function succeeds on
+    Example:
+        .. code-block:: python
+            @with_validation_mask(lambda column: column > 0)
+            def positive_validation_fn(x):
+                \"\"\"checks whether values are positive\"\"\"
+                return x > 0, {}
+    """
+
+    def _decorator(validation_fn):
+        validation_fn.mask_fn = mask_fn
+        return validation_fn
+
+    return _decorator
+
+
+def column_validation_mask(validation_fn, column):
+    """
+    Returns a boolean array that is True for each value of ``column`` that ``validation_fn``
+    succeeds on, using its vectorized implementation if it has one.
+    """
+    mask_fn = getattr(validation_fn, "mask_fn", None)
+    if mask_fn is not None:
+        return np.asarray(mask_fn(column), dtype=bool)
+    return _elementwise_validation_mask(validation_fn, column)
+
+
+def _elementwise_validation_mask(validation_fn, column):
+    # values are passed as python objects, and categorical columns value by value rather than
+    # category by category
+    return np.fromiter(
+        (bool(validation_fn(x)[0]) for x in column.astype(object)), dtype=bool, count=len(column)
+    )
+
+
+def _column_value_type(column):
+    # the python type that the values of numpy numeric and boolean columns are passed to column
+    # validation functions as, or None if their types may differ from value to value
+    if isinstance(column.dtype, np.dtype) and column.dtype.kind in "biuf":
+        return type(column.dtype.type(0).item())
+    return None
+
+
 class ColumnAggregateConstraintWithMetadata(ConstraintWithMetadata):
     """
     Similar to the base class, but now your validation functions should take in columns (pd.Series) not Dataframes.
@@ -414,19 +491,19 @@ def validate(self, data, *columns, **kwargs):
         if len(columns) == 0:
             columns = data.columns
         columns = [column for column in columns if column in data.columns]
-        relevant_data = data[list(columns)]
 
         offending_columns = set()
         offending_values = {}
         for column in columns:
             # TODO: grab extra metadata
-            res = self.validation_fn(relevant_data[column])
+            res = self.validation_fn(data[column])
             if not res[0]:
                 offending_columns.add(column)
                 if not res[1].get("actual") is None:
-                    offending_values[column] = [x.item() for x in res[1].get("actual").to_numpy()]
+                    values = res[1].get("actual").to_numpy()
                 else:
-                    offending_values[column] = [x.item() for x in relevant_data[column].to_numpy()]
+                    values = data[column].to_numpy()
+                offending_values[column] = [x.item() for x in values[: self.max_offending_samples]]
         if len(offending_columns) == 0 and not self.raise_or_typecheck:
             return TypeCheck(success=True)
         elif len(offending_columns) > 0:
@@ -451,6 +528,10 @@ class ColumnConstraintWithMetadata(ConstraintWithMetadata):
     you want to apply to multiple columns of your dataframe
     The main difference from the base class in terms of construction is that now, your validation_fns should operate on
     individual values.
+    Validation functions with a vectorized implementation (see
+    :py:func:`~dagster_pandas.constraints.with_validation_mask`) are evaluated over whole columns
+    at once, which is much faster on large dataframes. The built-in validation function factories
+    all provide one.
     args:
         description (str): description of the constraint
         validation_fn (Callable[[Any], Tuple[bool, dict[str, Union[dict,list, str, set]]]]:
@@ -462,6 +543,8 @@ class ColumnConstraintWithMetadata(ConstraintWithMetadata):
         raise_or_typecheck (Optional[bool]): whether to raise an exception (if set to True) or emit a failed typecheck event
                     (if set to False) when validation fails
         name (Optional[str]): what to call the constraint, defaults to the class name.
+        max_offending_samples (Optional[int]): the maximum number of offending rows to report per column.
+                    Defaults to 100, None reports all of them.
     """
 
     def validate(self, data, *columns, **kwargs):
@@ -469,16 +552,17 @@ def validate(self, data, *columns, **kwargs):
             columns = data.columns
 
         columns = [column for column in columns if column in data.columns]
-        relevant_data = data[list(columns)]
         offending = {}
         offending_values = {}
         # TODO:  grab metadata from here
-        inverse_validation = lambda x: not self.validation_fn(x)[0]
         for column in columns:
-            results = relevant_data[relevant_data[column].apply(inverse_validation)]
-            if len(results.index.tolist()) > 0:
-                offending[column] = ["row " + str(i) for i in (results.index.tolist())]
-                offending_values[column] = results[column].tolist()
+            invalid = ~column_validation_mask(self.validation_fn, data[column])
+            if invalid.any():
+                results = data[column].iloc[
+                    offending_positions(invalid, self.max_offending_samples)
+                ]
+                offending[column] = ["row " + str(i) for i in results.index.tolist()]
+                offending_values[column] = results.tolist()
         if len(offending) == 0:
             if not self.raise_or_typecheck:
                 return TypeCheck(success=True)
@@ -517,6 +601,8 @@ class MultiColumnConstraintWithMetadata(ColumnConstraintWithMetadata):
         type_for_internal (Optional[type]): what type to use for internal validators.  Subclass of
                                             ConstraintWithMetadata
         name (Optional[str]): what to call the constraint, defaults to the class name.
+        max_offending_samples (Optional[int]): the maximum number of offending rows to report per column and
+                                    function. Defaults to 100, None reports all of them.
     """
 
     def __init__(
@@ -527,23 +613,37 @@ def __init__(
         raise_or_typecheck=True,
         type_for_internal=ColumnConstraintWithMetadata,
         name=None,
+        max_offending_samples=DEFAULT_MAX_OFFENDING_SAMPLES,
     ):
         # TODO:  support multiple descriptions
         self.column_to_fn_dict = check.dict_param(
             fn_and_columns_dict, "fn_and_columns_dict", key_type=str
         )
+        # the internal validators are built once, rather than for each column on every validation
+        self._column_to_validators = {
+            column: [
+                (
+                    fn,
+                    type_for_internal(
+                        fn.__doc__,
+                        fn,
+                        ColumnWithMetadataException,
+                        raise_or_typecheck=False,
+                        max_offending_samples=max_offending_samples,
+                    ),
+                )
+                for fn in fn_arr
+            ]
+            for column, fn_arr in self.column_to_fn_dict.items()
+        }
 
         def validation_fn(data, *args, **kwargs):
             metadict = defaultdict(dict)
             truthparam = True
-            for column, fn_arr in self.column_to_fn_dict.items():
+            for column, validators in self._column_to_validators.items():
                 if column not in data.columns:
                     continue
-                for fn in fn_arr:
-                    # TODO:  do this more effectively
-                    new_validator = type_for_internal(
-                        fn.__doc__, fn, ColumnWithMetadataException, raise_or_typecheck=False
-                    )
+                for fn, new_validator in validators:
                     result = new_validator.validate(
                         DataFrame(data[column]), column, *args, **kwargs
                     )
@@ -575,6 +675,7 @@ def validation_fn(data, *args, **kwargs):
             resulting_exception,
             raise_or_typecheck=raise_or_typecheck,
             name=name,
+            max_offending_samples=max_offending_samples,
         )
 
     def validate(self, data, *args, **kwargs):
@@ -599,6 +700,8 @@ class MultiAggregateConstraintWithMetadata(MultiColumnConstraintWithMetadata):
         type_for_internal (Optional[type]): what type to use for internal validators.  Subclass of
                                             ConstraintWithMetadata
         name (Optional[str]): what to call the constraint, defaults to the class name.
+        max_offending_samples (Optional[int]): the maximum number of offending values to report per column and
+                                    function. Defaults to 100, None reports all of them.
     """
 
     def __init__(
@@ -608,6 +711,7 @@ def __init__(
         resulting_exception,
         raise_or_typecheck=True,
         name=None,
+        max_offending_samples=DEFAULT_MAX_OFFENDING_SAMPLES,
     ):
         super(MultiAggregateConstraintWithMetadata, self).__init__(
             description,
@@ -616,9 +720,11 @@ def __init__(
             raise_or_typecheck=raise_or_typecheck,
             type_for_internal=ColumnAggregateConstraintWithMetadata,
             name=name,
+            max_offending_samples=max_offending_samples,
         )
 
 
+@with_validation_mask(lambda column: column.notnull())
 def non_null_validation(x):
     """
     validates that a particular value in a column is not null
@@ -690,6 +796,12 @@ def nvalidator(val):
 
     nvalidator.__doc__ += " and ensures no values are null"
 
+    def nmask_fn(column):
+        return column_validation_mask(func, column) & column.notnull().to_numpy()
+
+    # replaces the vectorized implementation of func copied by wraps
+    nvalidator.mask_fn = nmask_fn
+
     return nvalidator
 
 
@@ -741,6 +853,19 @@ def create_dataframe(_):
         else:
             maxim = sys.maxsize
 
+    def in_range_mask_fn(column):
+        value_type = _column_value_type(column)
+        if value_type is None:
+            return _elementwise_validation_mask(in_range_validation_fn, column)
+        if issubclass(value_type, (type(minim), type(maxim))):
+            mask = ((column <= maxim) & (column >= minim)).to_numpy()
+        else:
+            mask = np.zeros(len(column), dtype=bool)
+        if ignore_missing_vals:
+            mask = mask | column.isnull().to_numpy()
+        return mask
+
+    @with_validation_mask(in_range_mask_fn)
     def in_range_validation_fn(x):
         if ignore_missing_vals and pd.isnull(x):
             return True, {}
@@ -796,6 +921,13 @@ def create_dataframe(_):
 
     categories = set(categories)
 
+    def categorical_mask_fn(column):
+        mask = column.isin(categories).to_numpy()
+        if ignore_missing_vals:
+            mask = mask | column.isnull().to_numpy()
+        return mask
+
+    @with_validation_mask(categorical_mask_fn)
     def categorical_validation_fn(x):
         if ignore_missing_vals and pd.isnull(x):
             return True, {}
@@ -849,6 +981,16 @@ def create_dataframe(_):
 
     """
 
+    def dtype_in_set_mask_fn(column):
+        value_type = _column_value_type(column)
+        if value_type is None:
+            return _elementwise_validation_mask(dtype_in_set_validation_fn, column)
+        mask = np.full(len(column), issubclass(value_type, datatypes))
+        if ignore_missing_vals:
+            mask = mask | column.isnull().to_numpy()
+        return mask
+
+    @with_validation_mask(dtype_in_set_mask_fn)
     def dtype_in_set_validation_fn(x):
         if ignore_missing_vals and pd.isnull(x):
             return True, {}
@@ -864,7 +1006,14 @@ def dtype_in_set_validation_fn(x):
 
 
 class ColumnRangeConstraintWithMetadata(ColumnConstraintWithMetadata):
-    def __init__(self, minim=None, maxim=None, columns=None, raise_or_typecheck=True):
+    def __init__(
+        self,
+        minim=None,
+        maxim=None,
+        columns=None,
+        raise_or_typecheck=True,
+        max_offending_samples=DEFAULT_MAX_OFFENDING_SAMPLES,
+    ):
         self.name = self.__class__.__name__
 
         description = "Confirms values are between {} and {}".format(minim, maxim)
@@ -873,6 +1022,7 @@ def __init__(self, minim=None, maxim=None, columns=None, raise_or_typecheck=True
             validation_fn=column_range_validation_factory(minim=minim, maxim=maxim),
             resulting_exception=ColumnWithMetadataException,
             raise_or_typecheck=raise_or_typecheck,
+            max_offending_samples=max_offending_samples,
         )
         self.columns = columns
 
@@ -900,11 +1050,33 @@ def __init__(self, error_description=None, markdown_description=None):
         )
 
     def validate(self, dataframe, column_name):
-        pass
+        invalid = self.get_invalid_mask(dataframe, column_name)
+        if invalid is not None and invalid.any():
+            self.raise_violation(dataframe, column_name, invalid)
+
+    def get_invalid_mask(self, dataframe, column_name):
+        """
+        Returns a boolean mask that is True for each row of the column that violates the
+        constraint, or None if the constraint does not validate the column row by row.
+        """
+        return None
+
+    def raise_violation(self, dataframe, column_name, invalid):
+        raise ColumnConstraintViolationException(
+            constraint_name=self.name,
+            constraint_description=self.error_description,
+            column_name=column_name,
+            offending_rows=self.get_offending_rows(dataframe, invalid),
+        )
 
     @staticmethod
     def get_offending_row_pairs(dataframe, column_name):
-        return zip(dataframe.index.tolist(), dataframe[column_name].tolist())
+        return list(zip(dataframe.index.tolist(), dataframe[column_name].tolist()))
+
+    @staticmethod
+    def get_offending_rows(dataframe, invalid):
+        # only the reported rows are copied out of the dataframe
+        return dataframe.iloc[offending_positions(invalid)]
 
 
 class ColumnDTypeFnConstraint(ColumnConstraint):
@@ -973,15 +1145,18 @@ def __init__(self):
             error_description=description, markdown_description=description
         )
 
-    def validate(self, dataframe, column_name):
-        rows_with_null_columns = dataframe[dataframe[column_name].isna()]
-        if not rows_with_null_columns.empty:
-            raise ColumnConstraintViolationException(
-                constraint_name=self.name,
-                constraint_description=self.error_description,
-                column_name=column_name,
-                offending_rows=self.get_offending_row_pairs(rows_with_null_columns, column_name),
-            )
+    def get_invalid_mask(self, dataframe, column_name):
+        return dataframe[column_name].isna()
+
+    def raise_violation(self, dataframe, column_name, invalid):
+        raise ColumnConstraintViolationException(
+            constraint_name=self.name,
+            constraint_description=self.error_description,
+            column_name=column_name,
+            offending_rows=self.get_offending_row_pairs(
+                self.get_offending_rows(dataframe, invalid), column_name
+            ),
+        )
 
 
 class UniqueColumnConstraint(ColumnConstraint):
@@ -999,18 +1174,11 @@ def __init__(self, ignore_missing_vals):
             error_description=description, markdown_description=description
         )
 
-    def validate(self, dataframe, column_name):
+    def get_invalid_mask(self, dataframe, column_name):
         invalid = dataframe[column_name].duplicated()
         if self.ignore_missing_vals:
             invalid = apply_ignore_missing_data_to_mask(invalid, dataframe[column_name])
-        rows_with_duplicated_values = dataframe[invalid]
-        if not rows_with_duplicated_values.empty:
-            raise ColumnConstraintViolationException(
-                constraint_name=self.name,
-                constraint_description=self.error_description,
-                column_name=column_name,
-                offending_rows=rows_with_duplicated_values,
-            )
+        return invalid
 
 
 class CategoricalColumnConstraint(ColumnConstraint):
@@ -1030,18 +1198,11 @@ def __init__(self, categories, ignore_missing_vals):
             markdown_description="Category examples are {}...".format(self.categories[:5]),
         )
 
-    def validate(self, dataframe, column_name):
+    def get_invalid_mask(self, dataframe, column_name):
         invalid = ~dataframe[column_name].isin(self.categories)
         if self.ignore_missing_vals:
             invalid = apply_ignore_missing_data_to_mask(invalid, dataframe[column_name])
-        rows_with_unexpected_buckets = dataframe[invalid]
-        if not rows_with_unexpected_buckets.empty:
-            raise ColumnConstraintViolationException(
-                constraint_name=self.name,
-                constraint_description=self.error_description,
-                column_name=column_name,
-                offending_rows=rows_with_unexpected_buckets,
-            )
+        return invalid
 
 
 class MinValueColumnConstraint(ColumnConstraint):
@@ -1062,18 +1223,11 @@ def __init__(self, min_value, ignore_missing_vals):
             error_description="Column must have values > {}".format(self.min_value),
         )
 
-    def validate(self, dataframe, column_name):
+    def get_invalid_mask(self, dataframe, column_name):
         invalid = dataframe[column_name] < self.min_value
         if self.ignore_missing_vals:
             invalid = apply_ignore_missing_data_to_mask(invalid, dataframe[column_name])
-        out_of_bounds_rows = dataframe[invalid]
-        if not out_of_bounds_rows.empty:
-            raise ColumnConstraintViolationException(
-                constraint_name=self.name,
-                constraint_description=self.error_description,
-                column_name=column_name,
-                offending_rows=out_of_bounds_rows,
-            )
+        return invalid
 
 
 class MaxValueColumnConstraint(ColumnConstraint):
@@ -1094,18 +1248,11 @@ def __init__(self, max_value, ignore_missing_vals):
             error_description="Column must have values < {}".format(self.max_value),
         )
 
-    def validate(self, dataframe, column_name):
+    def get_invalid_mask(self, dataframe, column_name):
         invalid = dataframe[column_name] > self.max_value
         if self.ignore_missing_vals:
             invalid = apply_ignore_missing_data_to_mask(invalid, dataframe[column_name])
-        out_of_bounds_rows = dataframe[invalid]
-        if not out_of_bounds_rows.empty:
-            raise ColumnConstraintViolationException(
-                constraint_name=self.name,
-                constraint_description=self.error_description,
-                column_name=column_name,
-                offending_rows=out_of_bounds_rows,
-            )
+        return invalid
 
 
 class InRangeColumnConstraint(ColumnConstraint):
@@ -1131,15 +1278,8 @@ def __init__(self, min_value, max_value, ignore_missing_vals):
             ),
         )
 
-    def validate(self, dataframe, column_name):
+    def get_invalid_mask(self, dataframe, column_name):
         invalid = ~dataframe[column_name].between(self.min_value, self.max_value)
         if self.ignore_missing_vals:
             invalid = apply_ignore_missing_data_to_mask(invalid, dataframe[column_name])
-        out_of_bounds_rows = dataframe[invalid]
-        if not out_of_bounds_rows.empty:
-            raise ColumnConstraintViolationException(
-                constraint_name=self.name,
-                constraint_description=self.error_description,
-                column_name=column_name,
-                offending_rows=out_of_bounds_rows,
-            )
+        return invalid
@@ -4,7 +4,7 @@
     ColumnDTypeInSetConstraint,
     ConstraintViolationException,
 )
-from dagster_pandas.validation import PandasColumn, validate_constraints
+from dagster_pandas.validation import PandasColumn, sample_rows, validate_constraints
 
 from dagster import (
     AssetMaterialization,
@@ -161,6 +161,7 @@ def create_dagster_pandas_dataframe_type(
     dataframe_constraints=None,
     loader=None,
     materializer=None,
+    sample_size=None,
 ):
     """
     Constructs a custom pandas dataframe dagster type.
@@ -181,12 +182,16 @@ def create_dagster_pandas_dataframe_type(
         materializer (Optional[DagsterTypeMaterializer]): An instance of a class
             that inherits from :py:class:`~dagster.DagsterTypeMaterializer`. If None, we will
             default to using `dataframe_materializer`.
+        sample_size (Optional[int]): If set, column constraints are only checked against a random
+            sample of this many rows, which is much faster for large dataframes but may miss
+            violations. Dataframe constraints are always checked against the whole dataframe.
     """
     # We allow for the plugging in of dagster_type_loaders/materializers so that
     # Users can load and materialize their custom dataframes via configuration their own way if the default
     # configs don't suffice. This is purely optional.
     check.str_param(name, "name")
     event_metadata_fn = check.opt_callable_param(event_metadata_fn, "event_metadata_fn")
+    sample_size = check.opt_int_param(sample_size, "sample_size")
     description = create_dagster_pandas_dataframe_description(
         check.opt_str_param(description, "description", default=""),
         check.opt_list_param(columns, "columns", of_type=PandasColumn),
@@ -203,7 +208,10 @@ def _dagster_type_check(_, value):
 
         try:
             validate_constraints(
-                value, pandas_columns=columns, dataframe_constraints=dataframe_constraints
+                value,
+                pandas_columns=columns,
+                dataframe_constraints=dataframe_constraints,
+                sample_size=sample_size,
             )
         except ConstraintViolationException as e:
             return TypeCheck(success=False, description=str(e))
@@ -233,6 +241,7 @@ def create_structured_dataframe_type(
     dataframe_validator=None,
     loader=None,
     materializer=None,
+    sample_size=None,
 ):
     """
 
@@ -255,6 +264,9 @@ def create_structured_dataframe_type(
         materializer (Optional[DagsterTypeMaterializer]): An instance of a class
             that inherits from :py:class:`~dagster.DagsterTypeMaterializer`. If None, we will
             default to using `dataframe_materializer`.
+        sample_size (Optional[int]): If set, the columns_validator is only run against a random
+            sample of this many rows, which is much faster for large dataframes but may miss
+            violations. Aggregate and dataframe-wide validation always sees the whole dataframe.
 
     Returns:
         a DagsterType with the corresponding name and packaged validation.
@@ -274,7 +286,9 @@ def _dagster_type_check(_, value):
         if dataframe_validator is not None:
             individual_result_dict["dataframe"] = dataframe_validator.validate(value)
         if columns_validator is not None:
-            individual_result_dict["columns"] = columns_validator.validate(value)
+            individual_result_dict["columns"] = columns_validator.validate(
+                sample_rows(value, sample_size) if sample_size is not None else value
+            )
 
         if columns_aggregate_validator is not None:
             individual_result_dict["column-aggregates"] = columns_aggregate_validator.validate(
@@ -306,6 +320,7 @@ def _dagster_type_check(_, value):
         )
 
     description = check.opt_str_param(description, "description", default="")
+    sample_size = check.opt_int_param(sample_size, "sample_size")
     return DagsterType(
         name=name,
         type_check_fn=_dagster_type_check,
@@ -1,3 +1,4 @@
+import numpy as np
 from dagster_pandas.constraints import (
     CategoricalColumnConstraint,
     ColumnDTypeFnConstraint,
@@ -377,7 +378,62 @@ def categorical_column(
         )
 
 
-def validate_constraints(dataframe, pandas_columns=None, dataframe_constraints=None):
+def sample_rows(dataframe, sample_size, seed=None):
+    """
+    Returns a uniformly random sample of ``sample_size`` rows of the dataframe, in their original
+    order, or the dataframe itself if it does not have more rows than that.
+    """
+    dataframe = check.inst_param(dataframe, "dataframe", DataFrame)
+    sample_size = check.int_param(sample_size, "sample_size")
+    if len(dataframe) <= sample_size:
+        return dataframe
+    positions = np.random.default_rng(seed).choice(len(dataframe), size=sample_size, replace=False)
+    return dataframe.iloc[np.sort(positions)]
+
+
+def _validate_columns(dataframe, pandas_columns):
+    # the row by row constraints of all of the columns are evaluated in one pass, accumulating
+    # their masks into one, so that a valid dataframe costs a single reduction and no mask is kept
+    invalid_rows = np.zeros(len(dataframe), dtype=bool)
+    try:
+        for column in pandas_columns:
+            if column.name not in dataframe.columns:
+                column.validate(dataframe)
+                continue
+            for constraint in column.constraints:
+                invalid = constraint.get_invalid_mask(dataframe, column.name)
+                if invalid is None:
+                    constraint.validate(dataframe, column.name)
+                else:
+                    invalid_rows |= np.asarray(invalid, dtype=bool)
+    except Exception:  # pylint: disable=broad-except
+        if not invalid_rows.any():
+            raise
+    else:
+        if not invalid_rows.any():
+            return
+
+    # some constraint is violated, so validate the columns constraint by constraint to raise the
+    # first violation in order
+    for column in pandas_columns:
+        column.validate(dataframe)
+
+
+def validate_constraints(
+    dataframe, pandas_columns=None, dataframe_constraints=None, sample_size=None
+):
+    """
+    Validates a dataframe against column and dataframe constraints, raising a
+    ConstraintViolationException for the first violated constraint.
+
+    The constraints of all columns that are checked row by row are evaluated in a single pass over
+    the columns, and the offending rows are only extracted for the first violated constraint.
+
+    If ``sample_size`` is set, column constraints are only validated against a random sample of
+    that many rows, which makes validating large dataframes much cheaper at the cost of missing
+    violations outside of the sample (including duplicates that are not both in the sample).
+    Dataframe constraints always see the whole dataframe.
+    """
     dataframe = check.inst_param(dataframe, "dataframe", DataFrame)
     pandas_columns = check.opt_list_param(
         pandas_columns, "column_constraints", of_type=PandasColumn
@@ -385,10 +441,13 @@ def validate_constraints(dataframe, pandas_columns=None, dataframe_constraints=N
     dataframe_constraints = check.opt_list_param(
         dataframe_constraints, "dataframe_constraints", of_type=DataFrameConstraint
     )
+    sample_size = check.opt_int_param(sample_size, "sample_size")
 
     if pandas_columns:
-        for column in pandas_columns:
-            column.validate(dataframe)
+        column_dataframe = (
+            sample_rows(dataframe, sample_size) if sample_size is not None else dataframe
+        )
+        _validate_columns(column_dataframe, pandas_columns)
 
     if dataframe_constraints:
         for dataframe_constraint in dataframe_constraints:
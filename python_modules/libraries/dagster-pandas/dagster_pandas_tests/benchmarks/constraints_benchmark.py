@@ -0,0 +1,147 @@
+"""Time taken to validate a large dataframe against dagster-pandas constraints.
+
+Compares three ways of running the same ``MultiColumnConstraintWithMetadata``:
+
+- per value: the validation functions are called on every value of their columns, and every
+  offending row is reported. This is how column validators ran before they were vectorized, and
+  how custom validation functions without a vectorized implementation still run.
+- vectorized: the built-in validation functions are evaluated over whole columns at once, and up
+  to 100 offending rows are reported per column and function.
+- sampled: as vectorized, but only against a random sample of ``--sample-size`` rows.
+
+It also times ``validate_constraints`` with ``PandasColumn`` constraints, with and without
+sampling.
+
+Run with:
+
+    python -m dagster_pandas_tests.benchmarks.constraints_benchmark [--rows N] [--iterations N]
+        [--sample-size N]
+"""
+import argparse
+import time
+import warnings
+
+import numpy as np
+import pandas as pd
+from dagster_pandas.constraints import (
+    ColumnWithMetadataException,
+    MultiColumnConstraintWithMetadata,
+    categorical_column_validator_factory,
+    column_range_validation_factory,
+    dtype_in_set_validation_factory,
+    nonnull,
+)
+from dagster_pandas.validation import PandasColumn, sample_rows, validate_constraints
+from tabulate import tabulate
+
+from dagster import ExperimentalWarning
+
+DEFAULT_ROWS = 1_000_000
+DEFAULT_ITERATIONS = 3
+DEFAULT_SAMPLE_SIZE = 10_000
+CATEGORIES = ["a", "b", "c", "d"]
+
+
+def _build_dataframe(num_rows: int) -> pd.DataFrame:
+    rng = np.random.default_rng(0)
+    return pd.DataFrame(
+        {
+            # about 1% of values are out of range, so that offending rows are reported
+            "amount": rng.integers(0, 10_100, size=num_rows),
+            "score": rng.random(size=num_rows),
+            "category": rng.choice(CATEGORIES, size=num_rows),
+        }
+    )
+
+
+def _elementwise(validation_fn):
+    # the same validation function, without its vectorized implementation
+    def _validation_fn(value):
+        return validation_fn(value)
+
+    _validation_fn.__name__ = validation_fn.__name__
+    _validation_fn.__doc__ = validation_fn.__doc__
+    return _validation_fn
+
+
+def _build_column_validator(vectorized: bool) -> MultiColumnConstraintWithMetadata:
+    fn_and_columns_dict = {
+        "amount": [column_range_validation_factory(0, 10_000)],
+        "score": [nonnull(dtype_in_set_validation_factory(float))],
+        "category": [categorical_column_validator_factory(CATEGORIES)],
+    }
+    if not vectorized:
+        fn_and_columns_dict = {
+            column: [_elementwise(fn) for fn in fns] for column, fns in fn_and_columns_dict.items()
+        }
+    return MultiColumnConstraintWithMetadata(
+        "Benchmark validation",
+        fn_and_columns_dict,
+        ColumnWithMetadataException,
+        raise_or_typecheck=False,
+        max_offending_samples=100 if vectorized else None,
+    )
+
+
+def _time(fn, iterations):
+    start = time.perf_counter()
+    for _ in range(iterations):
+        fn()
+    return (time.perf_counter() - start) / iterations
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=DEFAULT_ROWS)
+    parser.add_argument("--iterations", type=int, default=DEFAULT_ITERATIONS)
+    parser.add_argument("--sample-size", type=int, default=DEFAULT_SAMPLE_SIZE)
+    args = parser.parse_args()
+
+    warnings.filterwarnings("ignore", category=ExperimentalWarning)
+    dataframe = _build_dataframe(args.rows)
+    per_value_validator = _build_column_validator(vectorized=False)
+    vectorized_validator = _build_column_validator(vectorized=True)
+    pandas_columns = [
+        PandasColumn.integer_column("amount", min_value=0, max_value=20_000, non_nullable=True),
+        PandasColumn.float_column("score", min_value=0, max_value=1, non_nullable=True),
+        PandasColumn.categorical_column("category", set(CATEGORIES), non_nullable=True),
+    ]
+
+    cases = [
+        (
+            "MultiColumnConstraintWithMetadata: per value",
+            lambda: per_value_validator.validate(dataframe),
+        ),
+        (
+            "MultiColumnConstraintWithMetadata: vectorized",
+            lambda: vectorized_validator.validate(dataframe),
+        ),
+        (
+            "MultiColumnConstraintWithMetadata: sampled",
+            lambda: vectorized_validator.validate(sample_rows(dataframe, args.sample_size)),
+        ),
+        (
+            "validate_constraints",
+            lambda: validate_constraints(dataframe, pandas_columns=pandas_columns),
+        ),
+        (
+            "validate_constraints: sampled",
+            lambda: validate_constraints(
+                dataframe, pandas_columns=pandas_columns, sample_size=args.sample_size
+            ),
+        ),
+    ]
+    rows = []
+    for name, fn in cases:
+        seconds = _time(fn, args.iterations)
+        rows.append((name, seconds, args.rows / seconds / 1_000_000))
+
+    print(
+        f"Validating a {args.rows} row dataframe ({args.iterations} iterations, "
+        f"samples of {args.sample_size} rows)"
+    )
+    print(tabulate(rows, headers=["case", "seconds", "M rows/s"], floatfmt=".3f"))
+
+
+if __name__ == "__main__":
+    main()
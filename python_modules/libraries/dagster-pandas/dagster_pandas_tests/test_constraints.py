@@ -208,3 +208,14 @@ def test_row_count_constraint():
         assert RowCountConstraint(5, error_tolerance=1).validate(
             DataFrame({"foo": [1, 2, 3, 4, 5, 6, 7]})
         )
+
+
+def test_column_constraint_offending_rows():
+    test_dataframe = DataFrame({"foo": [None] * 1000, "bar": list(range(1000))})
+    with pytest.raises(ConstraintViolationException) as exc_info:
+        NonNullableColumnConstraint().validate(test_dataframe, "foo")
+    assert exc_info.value.offending_rows == [(i, None) for i in range(100)]
+
+    with pytest.raises(ConstraintViolationException) as exc_info:
+        InRangeColumnConstraint(0, 10, ignore_missing_vals=False).validate(test_dataframe, "bar")
+    assert exc_info.value.offending_rows.index.tolist() == list(range(11, 111))
@@ -10,6 +10,10 @@
     MultiColumnConstraintWithMetadata,
     MultiConstraintWithMetadata,
     StrictColumnsWithMetadata,
+    categorical_column_validator_factory,
+    column_range_validation_factory,
+    nonnull,
+    with_validation_mask,
 )
 from pandas import DataFrame
 
@@ -201,3 +205,74 @@ def test_range_constraint():
     assert {"bar": [3], "baz": [4]} == val["actual"]
     range_val = ColumnRangeConstraintWithMetadata(raise_or_typecheck=False)
     assert range_val.validate(df).success
+
+
+def test_vectorized_column_constraint():
+    in_range = column_range_validation_factory(0, 10)
+
+    def elementwise_in_range(value):
+        return in_range(value)
+
+    df = DataFrame({"foo": [1, 20, 3, -4, 5] * 20, "bar": [1.5, 2.0, 2.5, 3.0, 4.5] * 20})
+    results = [
+        ColumnConstraintWithMetadata(
+            "Confirms values are in range",
+            validation_fn,
+            ColumnWithMetadataException,
+            raise_or_typecheck=False,
+            max_offending_samples=None,
+        )
+        .validate(df, *df.columns)
+        .metadata_entries[0]
+        .entry_data.data
+        for validation_fn in [in_range, elementwise_in_range]
+    ]
+    assert results[0]["offending"] == results[1]["offending"]
+    assert results[0]["actual"] == results[1]["actual"]
+    assert len(results[0]["offending"]["foo"]) == 40
+    # float values are not of the type of the int bounds
+    assert len(results[0]["offending"]["bar"]) == 100
+
+
+def test_with_validation_mask():
+    calls = []
+
+    def mask_fn(column):
+        calls.append(column.name)
+        return column.isin(["a", "b"])
+
+    @with_validation_mask(mask_fn)
+    def a_or_b(value):
+        """checks that values are a or b"""
+        return value in {"a", "b"}, {}
+
+    df = DataFrame({"foo": ["a", "b", "c"], "bar": ["a", "a", "a"]})
+    column_val = MultiColumnConstraintWithMetadata(
+        "Confirms values are a or b",
+        {"foo": [a_or_b, nonnull(a_or_b)], "bar": [a_or_b]},
+        ColumnWithMetadataException,
+        raise_or_typecheck=False,
+    )
+    val = column_val.validate(df).metadata_entries[0].entry_data.data
+    assert val["offending"] == {"foo": {"a_or_b": ["row 2"]}}
+    assert calls == ["foo", "foo", "bar"]
+
+
+def test_max_offending_samples():
+    df = DataFrame({"foo": list(range(1000))})
+    column_val = MultiColumnConstraintWithMetadata(
+        "Confirms values are categories",
+        {"foo": [categorical_column_validator_factory([0, 1])]},
+        ColumnWithMetadataException,
+        raise_or_typecheck=False,
+        max_offending_samples=5,
+    )
+    val = column_val.validate(df).metadata_entries[0].entry_data.data
+    assert val["offending"] == {
+        "foo": {"categorical_validation_fn": ["row 2", "row 3", "row 4", "row 5", "row 6"]}
+    }
+    assert val["actual"] == {"foo": {"categorical_validation_fn": [2, 3, 4, 5, 6]}}
+
+    range_val = ColumnRangeConstraintWithMetadata(0, 10, raise_or_typecheck=False)
+    val = range_val.validate(df).metadata_entries[0].entry_data.data
+    assert len(val["offending"]["foo"]) == 100
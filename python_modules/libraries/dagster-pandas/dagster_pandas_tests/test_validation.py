@@ -1,3 +1,5 @@
+from unittest import mock
+
 import pytest
 from dagster_pandas.constraints import (
     CategoricalColumnConstraint,
@@ -9,7 +11,7 @@
     RowCountConstraint,
     UniqueColumnConstraint,
 )
-from dagster_pandas.validation import PandasColumn, validate_constraints
+from dagster_pandas.validation import PandasColumn, sample_rows, validate_constraints
 from pandas import DataFrame, Timestamp
 
 
@@ -220,3 +222,82 @@ def test_datetime_column_with_tz_validation_fails_when_incorrect_tz():
                 PandasColumn.datetime_column("datetime_utc", tz="UTC"),
             ],
         )
+
+
+def test_validate_constraints_sample_size():
+    dataframe = DataFrame({"foo": list(range(1000))})
+    dataframe.loc[500, "foo"] = -1
+
+    sample = sample_rows(dataframe, 100, seed=0)
+    assert len(sample) == 100
+    assert sample.index.is_monotonic_increasing
+    assert sample_rows(dataframe, 2000) is dataframe
+
+    column_constraints = [PandasColumn.integer_column("foo", min_value=0)]
+    with pytest.raises(ConstraintViolationException):
+        validate_constraints(dataframe, pandas_columns=column_constraints)
+    with pytest.raises(ConstraintViolationException):
+        validate_constraints(dataframe, pandas_columns=column_constraints, sample_size=1000)
+
+    dataframe.loc[500, "foo"] = 500
+    assert (
+        validate_constraints(dataframe, pandas_columns=column_constraints, sample_size=10) is None
+    )
+    # dataframe constraints are checked against all rows
+    with pytest.raises(ConstraintViolationException):
+        validate_constraints(
+            dataframe, dataframe_constraints=[RowCountConstraint(10)], sample_size=10
+        )
+
+
+def test_validate_constraints_first_violation():
+    dataframe = DataFrame({"foo": [1, -1, 2], "bar": ["a", "b", "c"], "baz": [None, 1.0, 2.0]})
+
+    # a value violation in an earlier column is raised before a dtype violation in a later one
+    with pytest.raises(ConstraintViolationException, match='for column "foo"') as exc_info:
+        validate_constraints(
+            dataframe,
+            pandas_columns=[
+                PandasColumn.integer_column("foo", min_value=0),
+                PandasColumn.integer_column("bar"),
+                PandasColumn.float_column("baz", non_nullable=True),
+            ],
+        )
+    assert exc_info.value.offending_rows.index.tolist() == [1]
+
+    with pytest.raises(ConstraintViolationException, match='for column "bar"'):
+        validate_constraints(
+            dataframe,
+            pandas_columns=[
+                PandasColumn.integer_column("foo"),
+                PandasColumn.integer_column("bar"),
+                PandasColumn.float_column("baz", non_nullable=True),
+            ],
+        )
+
+    with pytest.raises(ConstraintViolationException, match='for column "baz"'):
+        validate_constraints(
+            dataframe,
+            pandas_columns=[
+                PandasColumn.integer_column("foo"),
+                PandasColumn.string_column("bar"),
+                PandasColumn.float_column("baz", non_nullable=True),
+            ],
+        )
+
+
+def test_validate_constraints_masks_evaluated_once():
+    column_constraints = [
+        PandasColumn.integer_column("foo", min_value=0, unique=True),
+        PandasColumn.categorical_column("bar", {"a", "b", "c"}, non_nullable=True),
+    ]
+    dataframe = DataFrame({"foo": [1, 2, 3], "bar": ["a", "b", "c"]})
+
+    with mock.patch.object(
+        InRangeColumnConstraint,
+        "get_invalid_mask",
+        autospec=True,
+        side_effect=InRangeColumnConstraint.get_invalid_mask,
+    ) as get_invalid_mask:
+        assert validate_constraints(dataframe, pandas_columns=column_constraints) is None
+        assert get_invalid_mask.call_count == 1
@@ -1,3 +1,4 @@
+from itertools import groupby
 from typing import Optional
 
 import sqlalchemy as db
@@ -16,6 +17,7 @@
 from dagster.core.storage.sql import (
     check_alembic_revision,
     create_engine,
+    create_pooled_engine,
     run_alembic_upgrade,
     stamp_alembic_rev,
 )
@@ -54,18 +56,22 @@ class PostgresEventLogStorage(SqlEventLogStorage, ConfigurableClass):
 
     """
 
-    def __init__(self, postgres_url, should_autocreate_tables=True, inst_data=None):
+    def __init__(
+        self, postgres_url, should_autocreate_tables=True, inst_data=None, pool_config=None
+    ):
         self._inst_data = check.opt_inst_param(inst_data, "inst_data", ConfigurableClassData)
         self.postgres_url = check.str_param(postgres_url, "postgres_url")
         self.should_autocreate_tables = check.bool_param(
             should_autocreate_tables, "should_autocreate_tables"
         )
+        self._pool_config = check.opt_mapping_param(pool_config, "pool_config")
 
         self._disposed = False
 
-        # Default to not holding any connections open to prevent accumulating connections per DagsterInstance
-        self._engine = create_engine(
-            self.postgres_url, isolation_level="AUTOCOMMIT", poolclass=db.pool.NullPool
+        # Default to not holding any connections open to prevent accumulating connections per
+        # DagsterInstance, unless pooling is configured
+        self._engine = create_pooled_engine(
+            self.postgres_url, self._pool_config, isolation_level="AUTOCOMMIT"
         )
 
         # lazy init
@@ -92,12 +98,23 @@ def _init_db(self):
 
     def optimize_for_dagit(self, statement_timeout):
         # When running in dagit, hold an open connection and set statement_timeout
-        self._engine = create_engine(
-            self.postgres_url,
-            isolation_level="AUTOCOMMIT",
-            pool_size=1,
-            connect_args={"options": pg_statement_timeout(statement_timeout)},
-        )
+        # (or the configured pool of connections)
+        connect_args = {"options": pg_statement_timeout(statement_timeout)}
+        self._engine.dispose()
+        if self._pool_config:
+            self._engine = create_pooled_engine(
+                self.postgres_url,
+                self._pool_config,
+                isolation_level="AUTOCOMMIT",
+                connect_args=connect_args,
+            )
+        else:
+            self._engine = create_engine(
+                self.postgres_url,
+                isolation_level="AUTOCOMMIT",
+                pool_size=1,
+                connect_args=connect_args,
+            )
 
     def upgrade(self):
         alembic_config = pg_alembic_config(__file__)
@@ -118,6 +135,7 @@ def from_config_value(inst_data, config_value):
             inst_data=inst_data,
             postgres_url=pg_url_from_config(config_value),
             should_autocreate_tables=config_value.get("should_autocreate_tables", True),
+            pool_config=config_value.get("pool"),
         )
 
     @staticmethod
@@ -147,6 +165,8 @@ def store_event(self, event):
             )
             res = result.fetchone()
             result.close()
+            if self.has_run_stats_tables(conn):
+                self.update_stats_for_run(conn, event.run_id, [event])
             conn.execute(
                 """NOTIFY {channel}, %s; """.format(channel=CHANNEL_NAME),
                 (res[0] + "_" + str(res[1]),),
@@ -163,6 +183,46 @@ def store_event(self, event):
         ):
             self.store_asset_event(event)
 
+    def store_events(self, events):
+        """Store a batch of events in a single multi-row insert, notifying watchers of each new
+        row over the same connection.
+        Args:
+            events (List[EventLogEntry]): The events to store.
+        """
+        check.list_param(events, "events", of_type=EventLogEntry)
+        if not events:
+            return
+
+        insert_events_statement = (
+            SqlEventLogStorageTable.insert()  # pylint: disable=no-value-for-parameter
+            .values([self._get_event_insert_values(event) for event in events])
+            .returning(SqlEventLogStorageTable.c.run_id, SqlEventLogStorageTable.c.id)
+        )
+        with self._connect() as conn:
+            result = conn.execute(insert_events_statement)
+            rows = result.fetchall()
+            result.close()
+            if self.has_run_stats_tables(conn):
+                for run_id, run_events in groupby(events, key=lambda event: event.run_id):
+                    self.update_stats_for_run(conn, run_id, list(run_events))
+            for run_id, record_id in rows:
+                conn.execute(
+                    """NOTIFY {channel}, %s; """.format(channel=CHANNEL_NAME),
+                    (run_id + "_" + str(record_id),),
+                )
+
+        for event in events:
+            if (
+                event.is_dagster_event
+                and (
+                    event.dagster_event.is_step_materialization
+                    or event.dagster_event.is_asset_observation
+                    or event.dagster_event.is_asset_materialization_planned
+                )
+                and event.dagster_event.asset_key
+            ):
+                self.store_asset_event(event)
+
     def store_asset_event(self, event):
         check.inst_param(event, "event", EventLogEntry)
         if not event.is_dagster_event or not event.dagster_event.asset_key:
@@ -223,11 +283,7 @@ def index_connection(self):
         return self._connect()
 
     def has_secondary_index(self, name):
-        if name not in self._secondary_index_cache:
-            self._secondary_index_cache[name] = super(
-                PostgresEventLogStorage, self
-            ).has_secondary_index(name)
-        return self._secondary_index_cache[name]
+        return self._has_cached_secondary_index(self._secondary_index_cache, name)
 
     def enable_secondary_index(self, name):
         super(PostgresEventLogStorage, self).enable_secondary_index(name)
@@ -271,6 +327,8 @@ def dispose(self):
             self._disposed = True
             if self._event_watcher:
                 self._event_watcher.close()
+            if self._pool_config:
+                self._engine.dispose()
 
     def alembic_version(self):
         alembic_config = pg_alembic_config(__file__)
@@ -47,10 +47,7 @@ def watcher_thread(
 
             for callback_with_cursor in handlers:
                 try:
-                    if (
-                        callback_with_cursor.cursor is None
-                        or EventLogCursor.parse(callback_with_cursor.cursor).storage_id() < index
-                    ):
+                    if callback_with_cursor.storage_id < index:
                         callback_with_cursor.callback(
                             dagster_event, str(EventLogCursor.from_storage_id(index))
                         )
@@ -112,7 +109,7 @@ def watch_run(
                 raise Exception("Watcher thread never started")
 
         with self._dict_lock:
-            self._handlers_dict[run_id].append(CallbackAfterCursor(cursor, callback))
+            self._handlers_dict[run_id].append(CallbackAfterCursor.from_cursor(cursor, callback))
 
     def unwatch_run(self, run_id: str, handler: Callable[[EventLogEntry, str], None]):
         check.str_param(run_id, "run_id")
@@ -14,6 +14,7 @@
 from dagster.core.storage.sql import (
     check_alembic_revision,
     create_engine,
+    create_pooled_engine,
     run_alembic_upgrade,
     stamp_alembic_rev,
 )
@@ -49,18 +50,20 @@ class PostgresRunStorage(SqlRunStorage, ConfigurableClass):
     :py:class:`~dagster.IntSource` and can be configured from environment variables.
     """
 
-    def __init__(self, postgres_url, should_autocreate_tables=True, inst_data=None):
+    def __init__(
+        self, postgres_url, should_autocreate_tables=True, inst_data=None, pool_config=None
+    ):
         self._inst_data = check.opt_inst_param(inst_data, "inst_data", ConfigurableClassData)
         self.postgres_url = postgres_url
         self.should_autocreate_tables = check.bool_param(
             should_autocreate_tables, "should_autocreate_tables"
         )
+        self._pool_config = check.opt_mapping_param(pool_config, "pool_config")
 
-        # Default to not holding any connections open to prevent accumulating connections per DagsterInstance
-        self._engine = create_engine(
-            self.postgres_url,
-            isolation_level="AUTOCOMMIT",
-            poolclass=db.pool.NullPool,
+        # Default to not holding any connections open to prevent accumulating connections per
+        # DagsterInstance, unless pooling is configured
+        self._engine = create_pooled_engine(
+            self.postgres_url, self._pool_config, isolation_level="AUTOCOMMIT"
         )
 
         self._index_migration_cache = {}
@@ -87,12 +90,23 @@ def _init_db(self):
 
     def optimize_for_dagit(self, statement_timeout):
         # When running in dagit, hold 1 open connection and set statement_timeout
-        self._engine = create_engine(
-            self.postgres_url,
-            isolation_level="AUTOCOMMIT",
-            pool_size=1,
-            connect_args={"options": pg_statement_timeout(statement_timeout)},
-        )
+        # (or the configured pool of connections)
+        connect_args = {"options": pg_statement_timeout(statement_timeout)}
+        self._engine.dispose()
+        if self._pool_config:
+            self._engine = create_pooled_engine(
+                self.postgres_url,
+                self._pool_config,
+                isolation_level="AUTOCOMMIT",
+                connect_args=connect_args,
+            )
+        else:
+            self._engine = create_engine(
+                self.postgres_url,
+                isolation_level="AUTOCOMMIT",
+                pool_size=1,
+                connect_args=connect_args,
+            )
 
     @property
     def inst_data(self):
@@ -108,6 +122,7 @@ def from_config_value(inst_data, config_value):
             inst_data=inst_data,
             postgres_url=pg_url_from_config(config_value),
             should_autocreate_tables=config_value.get("should_autocreate_tables", True),
+            pool_config=config_value.get("pool"),
         )
 
     @staticmethod
@@ -124,6 +139,11 @@ def create_clean_storage(postgres_url, should_autocreate_tables=True):
     def connect(self):
         return create_pg_connection(self._engine)
 
+    def dispose(self):
+        # close the connections held by a configured pool
+        if self._pool_config:
+            self._engine.dispose()
+
     def upgrade(self):
         with self.connect() as conn:
             run_alembic_upgrade(pg_alembic_config(__file__), conn)
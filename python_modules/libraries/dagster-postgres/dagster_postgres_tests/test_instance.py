@@ -60,6 +60,22 @@ def unified_pg_config(hostname):
     """
 
 
+def pooled_pg_config(hostname):
+    return f"""
+      storage:
+        postgres:
+          postgres_db:
+            username: test
+            password: test
+            hostname: {hostname}
+            db_name: test
+          pool:
+            pool_size: 2
+            max_overflow: 0
+
+    """
+
+
 def skip_autocreate_pg_config(hostname):
     return """
       run_storage:
@@ -187,6 +203,31 @@ def test_connection_leak(hostname, conn_string):
     tempdir.cleanup()
 
 
+def test_pooled_connections(hostname):
+    with instance_for_test(overrides=yaml.safe_load(pooled_pg_config(hostname))) as instance:
+        # pylint: disable=protected-access
+        storages = [instance._run_storage, instance._event_storage, instance._schedule_storage]
+        for storage in storages:
+            assert isinstance(storage._engine.pool, db.pool.QueuePool)
+            assert storage._engine.pool.size() == 2
+        # pylint: enable=protected-access
+
+        for _ in range(10):
+            instance.get_runs()
+            instance.all_asset_keys()
+
+        instance.optimize_for_dagit(statement_timeout=500)
+        instance.get_runs()
+        instance.all_instigator_state()
+
+        # pylint: disable=protected-access
+        pools = [storage._engine.pool for storage in storages]
+        assert all(pool.checkedin() > 0 for pool in pools)
+
+    # disposing the instance closes the connections held by each pool
+    assert all(pool.checkedin() == 0 for pool in pools)
+
+
 def test_statement_timeouts(hostname):
     with instance_for_test(overrides=yaml.safe_load(full_pg_config(hostname))) as instance:
         instance.optimize_for_dagit(statement_timeout=500)  # 500ms